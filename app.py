@@ -1,15 +1,33 @@
 import os
 import json
+import mimetypes
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from template_generator import GENERATED_TEMPLATES
-from flask import Flask, request, jsonify, send_from_directory, redirect
+from scene_generators import GENERATORS
+from template_registry import TemplateRegistry
+from flask import Flask, Response, g, request, jsonify, send_from_directory, redirect
 from flask_cors import CORS
-from intent_parser import RuleBasedIntentParser
+import instrumentation
+from instrumentation import timed
+from intent_parser import PriorityMatcher, RuleBasedIntentParser
+from scene_cache import SceneCache, DEFAULT_BUDGET as SCENE_CACHE_BUDGET
+from scene_binary import BINARY_FORMAT, BINARY_MIMETYPE, encode_binary
+from scene_codec import COMPACT_FORMAT, JSON_MIMETYPE, EncodedScene, encode_compact, encode_json
+from scene_compaction import compact_scene
+from scene_paths import compact_paths
+from scene_patch import diff_scenes
+from scene_stream import NDJSON_FORMAT, NDJSON_MIMETYPE, assemble
+from static_assets import IMMUTABLE, REVALIDATE, AssetManifest
+from scene_snapshot import SceneSnapshot, DEFAULT_PATH as SNAPSHOT_PATH, snapshot_path
+from compression import ENCODINGS, MIN_SIZE, compress_stream, etag_for, negotiate, precompressed_path
 
 intent_parser = RuleBasedIntentParser()
 
-app = Flask(__name__, static_folder='public', static_url_path='')
+# public/ is served by serve_static (which knows about precompressed copies)
+app = Flask(__name__, static_folder=None)
 CORS(app)
+instrumentation.init_app(app)
 
 # --- 1. TEMPLATE LIBRARY (Advanced) ---
 
@@ -1258,7 +1276,12 @@ TEMPLATE_ELECTROLYSIS = {
     ]
 }
 
-TEMPLATES = {
+def compact_template(scene):
+    """Library scenes are compacted like generated ones: their actions, then their paths."""
+    return compact_paths(compact_scene(scene))
+
+
+TEMPLATES = TemplateRegistry({
     "bubble": TEMPLATE_BUBBLE_SORT,
     "selection": TEMPLATE_SELECTION_SORT,
     "sine": TEMPLATE_SINE_WAVE,
@@ -1296,67 +1319,272 @@ TEMPLATES = {
     "mitosis": TEMPLATE_MITOSIS,
     "electrolysis": TEMPLATE_ELECTROLYSIS,
     "bernoulli": TEMPLATE_BERNOULLI
-}
+}, transform=compact_template)
 
 
-# Merge Generated Templates
+# Merge Generated Templates (registered lazily, built on first lookup)
 TEMPLATES.update(GENERATED_TEMPLATES)
 
+# Pre-serialized static scenes written by `python build.py` (None if not built),
+# plus their precompressed copies by content encoding
+SNAPSHOT_BASE = os.environ.get('SCENE_SNAPSHOT', SNAPSHOT_PATH)
+SNAPSHOT = SceneSnapshot.open(SNAPSHOT_BASE)
+COMPRESSED_SNAPSHOTS = {}
+if SNAPSHOT:
+    for _encoding in ENCODINGS:
+        COMPRESSED_SNAPSHOTS[_encoding] = SceneSnapshot.open(snapshot_path(_encoding, SNAPSHOT_BASE))
+
+# Library scenes serialized (and hashed) on first use when there is no snapshot
+ENCODED_TEMPLATES = {}
+
+def encoded_response(data, etag, encoding=None, mimetype=JSON_MIMETYPE):
+    """Scene bytes with their ETag; a matching If-None-Match on GET gets a 304."""
+    response = Response(data, mimetype=mimetype)
+    response.set_etag(etag_for(etag, encoding))
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+def scene_response(encoded, cache_key=None):
+    """
+    Serves an EncodedScene, compressed if the client accepts it (variant kept
+    with the scene, and charged to its SCENE_CACHE entry under cache_key).
+    """
+    encoding = negotiate(request) if len(encoded.data) >= MIN_SIZE else None
+    if encoding:
+        with timed('compress'):
+            data = encoded.compressed(encoding)
+        if cache_key is not None:
+            SCENE_CACHE.recharge(cache_key)
+        return encoded_response(data, encoded.etag, encoding, encoded.mimetype)
+    return encoded_response(encoded.data, encoded.etag, mimetype=encoded.mimetype)
+
+# Wire formats a client can ask for with options.format ('json' unless it opts in).
+# 'ndjson' streams scenes whose generator has a streaming variant while they are
+# generated; anything already built (library scenes, cache hits) comes back as JSON.
+SCENE_FORMATS = ('json', COMPACT_FORMAT, BINARY_FORMAT, NDJSON_FORMAT)
+
+def scene_format():
+    return g.get('scene_format', 'json')
+
+def serialize_scene(scene, fmt='json'):
+    if fmt == BINARY_FORMAT:
+        return EncodedScene(encode_binary(scene), mimetype=BINARY_MIMETYPE)
+    return EncodedScene.from_scene(encode_compact(scene) if fmt == COMPACT_FORMAT else scene)
+
+def template_response(key, default=None):
+    """Serves a library scene, straight from the snapshot maps when it is there."""
+    fmt = scene_format()
+    if fmt not in ('json', NDJSON_FORMAT):
+        if key not in TEMPLATES:
+            return scene_response(serialize_scene(default, fmt))
+        encoded = ENCODED_TEMPLATES.get((key, fmt))
+        if encoded is None:
+            encoded = ENCODED_TEMPLATES[(key, fmt)] = serialize_scene(TEMPLATES[key], fmt)
+        return scene_response(encoded)
+    encoding = negotiate(request)
+    snapshot = COMPRESSED_SNAPSHOTS.get(encoding)
+    if snapshot and key in snapshot:
+        return encoded_response(snapshot.get(key), snapshot.etag(key), encoding)
+    return scene_response(encoded_template(key, default))
+
+def encoded_template(key, default=None):
+    """A library scene as plain JSON: from the snapshot, else serialized once and kept."""
+    encoded = SNAPSHOT.get_encoded(key) if SNAPSHOT else None
+    if encoded is None:
+        encoded = ENCODED_TEMPLATES.get(key)
+    if encoded is None:
+        if key not in TEMPLATES:
+            return EncodedScene.from_scene(default)
+        encoded = ENCODED_TEMPLATES[key] = EncodedScene.from_scene(TEMPLATES[key])
+    return encoded
+
+# Serialized generated scenes, LRU within a byte budget
+SCENE_CACHE = SceneCache(int(os.environ.get('SCENE_CACHE_BYTES', SCENE_CACHE_BUDGET)))
+
+# Content encodings compress_stream can flush part by part
+STREAM_ENCODINGS = ('gzip',)
+
+def streamed_response(spec, args, kwargs, cache_key=None):
+    """
+    Chunked NDJSON, one line per scene part as the generator yields it. The
+    assembled scene is cached as JSON once the stream completes.
+    """
+    def lines():
+        parts = []
+        for part in spec.parts(args, kwargs):
+            parts.append(part)
+            yield encode_json(part) + b'\n'
+        if cache_key is not None:
+            SCENE_CACHE.put(cache_key, serialize_scene(assemble(parts)))
+
+    encoding = negotiate(request, STREAM_ENCODINGS)
+    body = compress_stream(lines(), encoding) if encoding else lines()
+    response = Response(body, mimetype=NDJSON_MIMETYPE)
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+def generated_response(spec, description, level='beginner', language='python', arg=None, seed=None):
+    """
+    Runs a registered generator; cacheable scenes are served from SCENE_CACHE.
+    X-Scene-Key names the generator, for /generate/scenes/delta.
+    """
+    response = _generated_response(spec, *spec.inputs(description, level, language, arg, seed))
+    response.headers['X-Scene-Key'] = spec.key if arg is None else spec.key + arg
+    return response
+
+def _generated_response(spec, args, kwargs):
+    fmt = scene_format()
+    stream = fmt == NDJSON_FORMAT and spec.stream is not None
+    if fmt == NDJSON_FORMAT:
+        fmt = 'json'
+    if not spec.cacheable:
+        if stream:
+            return streamed_response(spec, args, kwargs)
+        with timed('generate'):
+            return scene_response(serialize_scene(spec.generate(args, kwargs), fmt))
+    key = (spec.cache_key(args, kwargs), fmt)
+    encoded = SCENE_CACHE.get(key)
+    status = 'HIT'
+    if encoded is None and stream:
+        response = streamed_response(spec, args, kwargs, key)
+        response.headers['X-Cache'] = 'MISS'
+        return response
+    if encoded is None:
+        status = 'MISS'
+        with timed('generate'):
+            encoded = serialize_scene(spec.generate(args, kwargs), fmt)
+        SCENE_CACHE.put(key, encoded)
+    response = scene_response(encoded, key)
+    response.headers['X-Cache'] = status
+    return response
+
+def cached_scene(spec, args, kwargs):
+    """The scene for canonical inputs as the client parsed it, via SCENE_CACHE."""
+    key = (spec.cache_key(args, kwargs), 'json')
+    encoded = SCENE_CACHE.get(key) if spec.cacheable else None
+    if encoded is None:
+        with timed('generate'):
+            encoded = serialize_scene(spec.generate(args, kwargs))
+        if spec.cacheable:
+            SCENE_CACHE.put(key, encoded)
+    return json.loads(encoded.data)
+
+def parse_seed(seed):
+    """Validated options.seed (digit strings allowed, for query strings); raises ValueError."""
+    if seed is None:
+        return None
+    # Same seed + same options -> same scene (and a cache hit)
+    if isinstance(seed, str) and seed.isdigit():
+        seed = int(seed)
+    if not isinstance(seed, int) or isinstance(seed, bool) or seed < 0:
+        raise ValueError("options.seed must be a non-negative integer")
+    return seed
+
+def normalize(s):
+    s = s.replace('ö', 'o').replace('ä', 'a').replace('ü', 'u').replace('é', 'e')
+    return re.sub(r'[^a-z0-9]', '', s.lower())
+
+# Formula fallback index: normalized names of the formula_* scenes, in TEMPLATES
+# order, compiled into one keyword automaton (first registered name wins)
+FORMULA_KEYS = [key for key in TEMPLATES if key.startswith('formula_')]
+FORMULA_MATCHER = PriorityMatcher.from_keywords(
+    normalize(key.replace('formula_', '').replace('_', ' ')) for key in FORMULA_KEYS)
+
+def match_formula(description):
+    """Key of the first formula scene whose name appears in the description, or None."""
+    index = FORMULA_MATCHER.first(normalize(description))
+    return FORMULA_KEYS[index] if index is not None else None
+
 # --- 2. ROUTES ---
 
+PUBLIC_DIR = os.path.join(app.root_path, 'public')
+PRECOMPRESSED_DIR = os.path.join(app.root_path, 'build', 'public')
+# Fingerprinted copy of public/ (static_assets.py), when build.py has made one
+ASSETS = AssetManifest.open(PUBLIC_DIR, os.path.join(app.root_path, 'build', 'assets'))
+
+def send_public(source_dir, precompressed_dir, filename):
+    """Sends source_dir/<filename>, from its precompressed copy when the client accepts one."""
+    encoding = negotiate(request)
+    path = precompressed_path(source_dir, precompressed_dir, filename, encoding) if encoding else None
+    if path is None:
+        response = send_from_directory(source_dir, filename)
+    else:
+        mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        response = send_from_directory(precompressed_dir, os.path.relpath(path, precompressed_dir), mimetype=mimetype)
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    return response
+
+def public_file(filename):
+    """
+    Serves a public/ file. With an asset build, pages come with fingerprinted
+    references and hashed names are cached for a year; pages (and the plain
+    names, still served from public/) are revalidated on every use.
+    """
+    if ASSETS and (filename in ASSETS.hashed or filename in ASSETS.pages):
+        response = send_public(ASSETS.directory, ASSETS.directory, filename)
+        immutable = filename in ASSETS.hashed
+    else:
+        response = send_public(PUBLIC_DIR, PRECOMPRESSED_DIR, filename)
+        immutable = False
+    response.headers['Cache-Control'] = IMMUTABLE if immutable else REVALIDATE
+    return response
+
 @app.route('/<path:filename>')
 def serve_static(filename):
-    return send_from_directory('public', filename)
+    return public_file(filename)
 
 @app.route('/')
 def home():
-    return send_from_directory('public', 'home.html')
+    return public_file('home.html')
 
 @app.route('/login')
 def login():
-    return send_from_directory('public', 'login.html')
+    return public_file('login.html')
 
 @app.route('/signup')
 def signup():
-    return send_from_directory('public', 'signup.html')
+    return public_file('signup.html')
     
 @app.route('/gallery')
 def gallery():
-    return send_from_directory('public', 'gallery.html')
+    return public_file('gallery.html')
 
 @app.route('/dashboard')
 def dashboard():
-    return send_from_directory('public', 'dashboard.html')
+    return public_file('dashboard.html')
 
 @app.route('/app')
 def app_page():
-    return send_from_directory('public', 'app.html')
+    return public_file('app.html')
 
 @app.route('/tutorial')
 def tutorial_page():
-    return send_from_directory('public', 'tutorial.html')
+    return public_file('tutorial.html')
 
 @app.route('/auth/google')
 def google_auth():
     # Placeholder for Google Auth - redirects to dashboard for demo
     return redirect('/dashboard')
 
-@app.route('/generate/scenes', methods=['POST'])
-def generate_scenes():
-    data = request.json
-    description = data.get('description', '').lower()
-    options = data.get('options', {})
-    language = options.get('language', 'python')
-    level = options.get('level', 'beginner')
-    
+def resolve_scene(description):
+    """
+    What a (lowercased) prompt asks for: ('generator', spec, arg) for generated
+    scenes, ('template', key, default) for library scenes, or None.
+    """
     # Rule-based Parser
     
     # Rule-based Parser (Updated)
     
     # 0. Full Course Check
     if 'full length' in description or 'full video' in description or 'all topics' in description or 'full course' in description:
-        import template_generator
-        return jsonify(template_generator.generate_full_course_template())
+        return ('generator', GENERATORS['full_course'], None)
 
     # 1. Specific Dynamic Handlers (Regex)
     
@@ -1365,214 +1593,225 @@ def generate_scenes():
     if poly_match:
         n = int(poly_match.group(1) or poly_match.group(2))
         key = f"poly_{n}"
-        if key in TEMPLATES: return jsonify(TEMPLATES[key])
-    if 'triangle' in description: return jsonify(TEMPLATES.get('poly_3', TEMPLATE_PYTHAGORAS))
-    if 'square' in description: return jsonify(TEMPLATES.get('poly_4', TEMPLATE_GEOMETRY_SHAPES))
-    if 'pentagon' in description: return jsonify(TEMPLATES.get('poly_5', TEMPLATE_GEOMETRY_SHAPES))
-    if 'hexagon' in description: return jsonify(TEMPLATES.get('poly_6', TEMPLATE_GEOMETRY_SHAPES))
+        if key in TEMPLATES: return ('template', key, None)
+    if 'triangle' in description: return ('template', 'poly_3', TEMPLATE_PYTHAGORAS)
+    if 'square' in description: return ('template', 'poly_4', TEMPLATE_GEOMETRY_SHAPES)
+    if 'pentagon' in description: return ('template', 'poly_5', TEMPLATE_GEOMETRY_SHAPES)
+    if 'hexagon' in description: return ('template', 'poly_6', TEMPLATE_GEOMETRY_SHAPES)
     
     # Atoms: "atom 6", "element 1"
     atom_match = re.search(r'atom (\d+)|element (\d+)', description)
     if atom_match:
         n = int(atom_match.group(1) or atom_match.group(2))
         key = f"atom_{n}"
-        if key in TEMPLATES: return jsonify(TEMPLATES[key])
-
-    # Matrix Operations - Dynamic
-    matrix_match = re.search(r'(\d+)[\*x](\d+)', description)
-    if matrix_match and ('matrix' in description or 'multiplication' in description):
-        rows = min(int(matrix_match.group(1)), 6)
-        cols = min(int(matrix_match.group(2)), 6)
-        op = "mult"
-        if "exponentiation" in description or "power" in description: op = "exp"
-        elif "add" in description or "sum" in description: op = "add"
-        import template_generator
-        return jsonify(template_generator.generate_matrix_template(rows, cols, op))
+        if key in TEMPLATES: return ('template', key, None)
+
+    # Matrix Operations - Dynamic (size and operation are read from the prompt)
+    if re.search(r'(\d+)[\*x](\d+)', description) and ('matrix' in description or 'multiplication' in description):
+        return ('generator', GENERATORS['matrix_op'], None)
 
     # 2. General Intent Parsing
-    intent = intent_parser.parse(description)
+    with timed('intent'):
+        intent = intent_parser.parse(description)
     key = intent['template_key']
-    difficulty = intent.get('difficulty', 'beginner')
 
     if key:
-        if key == "bubble":
-            import template_generator
-            import random
-            return jsonify(template_generator.generate_algo_template(random.randint(0, 99), difficulty=level, language=language))
-            
-        if key == "binary":
-            import template_generator
-            import random
-            return jsonify(template_generator.generate_search_template(random.randint(0, 99), difficulty=level, language=language))
-            
-        if key == "selection":
-            import template_generator
-            import random
-            return jsonify(template_generator.generate_algo_template(random.randint(0, 99), difficulty=level, language=language, algo_type="selection"))
-        
-        if key == "quicksort": # Assuming intent parser might give this
-            import template_generator
-            import random
-            return jsonify(template_generator.generate_quicksort_template(random.randint(0, 99), difficulty=level, language=language))
-
-        if key == "merge_sort":
-            import template_generator
-            import random
-            return jsonify(template_generator.generate_mergesort_template(random.randint(0, 99), difficulty=level, language=language))
-
-        if key == "dfs":
-            import template_generator
-            import random
-            return jsonify(template_generator.generate_dfs_bfs_template(random.randint(0, 99), algo_type="dfs", difficulty=level, language=language))
-
-        if key == "bfs":
-            import template_generator
-            import random
-            return jsonify(template_generator.generate_dfs_bfs_template(random.randint(0, 99), algo_type="bfs", difficulty=level, language=language))
-
-        if key == "bellman_ford":
-            import template_generator
-            import random
-            return jsonify(template_generator.generate_bellman_ford_template(random.randint(0, 99), difficulty=level, language=language))
-
-        if key == "floyd_warshall":
-            import template_generator
-            import random
-            return jsonify(template_generator.generate_floyd_warshall_template(random.randint(0, 99), difficulty=level, language=language))
-
-        if key == "bst":
-            import template_generator
-            import random
-            return jsonify(template_generator.generate_bst_template(random.randint(0, 99), difficulty=level, language=language))
-
-        if key == "linked_list":
-            import template_generator
-            import random
-            return jsonify(template_generator.generate_linked_list_template(random.randint(0, 99), difficulty=level, language=language))
-
-        if key == "stack":
-            import template_generator
-            import random
-            return jsonify(template_generator.generate_stack_template(random.randint(0, 99), difficulty=level, language=language))
-
-        if key == "queue":
-            import template_generator
-            import random
-            return jsonify(template_generator.generate_queue_template(random.randint(0, 99), difficulty=level, language=language))
-
-        if key == "radix_sort":
-            import template_generator
-            import random
-            return jsonify(template_generator.generate_radix_sort_template(random.randint(0, 99), difficulty=level, language=language))
-
-        if key == "astar":
-            import template_generator
-            import random
-            return jsonify(template_generator.generate_astar_template(random.randint(0, 99), difficulty=level, language=language))
-
-        # --- Phase 1 Algorithms ---
-        if key == "fibonacci":
-            import template_generator
-            return jsonify(template_generator.generate_fibonacci_template(0, difficulty=level, language=language))
-            
-        if key == "counting_sort":
-            import template_generator
-            return jsonify(template_generator.generate_counting_sort_template(0, difficulty=level, language=language))
-            
-        if key == "bucket_sort":
-            import template_generator
-            return jsonify(template_generator.generate_bucket_sort_template(0, difficulty=level, language=language))
-            
-        if key == "knapsack":
-            import template_generator
-            return jsonify(template_generator.generate_knapsack_template(0, difficulty=level, language=language))
-            
-        if key == "lcs":
-            import template_generator
-            return jsonify(template_generator.generate_lcs_template(0, difficulty=level, language=language))
-            
-        if key == "edit_distance":
-            import template_generator
-            return jsonify(template_generator.generate_edit_distance_template(0, difficulty=level, language=language))
-            
-        if key == "nqueens":
-            import template_generator
-            n_val = 4 # Default to 4-queens
-            if "5" in description: n_val = 5
-            return jsonify(template_generator.generate_nqueens_template(0, n=n_val, difficulty=level, language=language))
-            
-        if key == "kruskal_mst":
-            import template_generator
-            return jsonify(template_generator.generate_kruskal_mst_template(0, difficulty=level, language=language))
-            
-        if key == "prim_mst":
-            import template_generator
-            return jsonify(template_generator.generate_prim_mst_template(0, difficulty=level, language=language))
-            
-        if key == "max_subarray":
-            import template_generator
-            return jsonify(template_generator.generate_max_subarray_template(0, difficulty=level, language=language))
-
-        # Dynamic Advanced Topics
-        if key.startswith("dynamic:"):
-            topic = key.split(":")[1]
-            import template_generator
-            if topic == "quicksort":
-                return jsonify(template_generator.generate_quicksort_template(random.randint(0, 99), difficulty=level, language=language))
-            if topic == "dijkstra":
-                return jsonify(template_generator.generate_graph_algo_template(random.randint(0, 99), algo="dijkstra", difficulty=level, language=language))
-            return jsonify(template_generator.generate_advanced_math_template(topic))
-        
-        # Static Templates - Check if template supports difficulty levels
-        # If it does, regenerate dynamically; otherwise return static version
+        # Generators (algorithms, data structures, dynamic topics): one table lookup
+        spec, arg = GENERATORS.resolve(key)
+        if spec:
+            return ('generator', spec, arg)
+
+        # Static Templates
         if key in TEMPLATES:
-            # Map of template keys to their dynamic generator functions
-            # These algorithms support difficulty levels and should be regenerated
-            dynamic_generators = {
-                'sort_bubble': lambda: template_generator.generate_algo_template(random.randint(0, 99), difficulty=level, language=language, algo_type='bubble'),
-                'sort_selection': lambda: template_generator.generate_algo_template(random.randint(0, 99), difficulty=level, language=language, algo_type='selection'),
-                'search_binary': lambda: template_generator.generate_search_template(random.randint(0, 99), difficulty=level, language=language),
-                'sort_quick': lambda: template_generator.generate_quicksort_template(random.randint(0, 99), difficulty=level, language=language),
-                'sort_merge': lambda: template_generator.generate_mergesort_template(random.randint(0, 99), difficulty=level, language=language),
-                'graph_dfs': lambda: template_generator.generate_dfs_bfs_template(random.randint(0, 99), algo_type='dfs', difficulty=level, language=language),
-                'graph_bfs': lambda: template_generator.generate_dfs_bfs_template(random.randint(0, 99), algo_type='bfs', difficulty=level, language=language),
-                'graph_bellman_ford': lambda: template_generator.generate_bellman_ford_template(random.randint(0, 99), difficulty=level, language=language),
-                'graph_floyd_warshall': lambda: template_generator.generate_floyd_warshall_template(random.randint(0, 99), difficulty=level, language=language),
-                'ds_bst': lambda: template_generator.generate_bst_template(random.randint(0, 99), difficulty=level, language=language),
-                'ds_linked_list': lambda: template_generator.generate_linked_list_template(random.randint(0, 99), difficulty=level, language=language),
-                'ds_stack': lambda: template_generator.generate_stack_template(random.randint(0, 99), difficulty=level, language=language),
-                'ds_queue': lambda: template_generator.generate_queue_template(random.randint(0, 99), difficulty=level, language=language),
-                'sort_radix': lambda: template_generator.generate_radix_sort_template(random.randint(0, 99), difficulty=level, language=language),
-                'search_astar': lambda: template_generator.generate_astar_template(random.randint(0, 99), difficulty=level, language=language),
-            }
-            
-            # If this template supports dynamic generation, regenerate it
-            if key in dynamic_generators:
-                import template_generator
-                import random
-                return jsonify(dynamic_generators[key]())
-            
-            # Otherwise, return the static template
-            return jsonify(TEMPLATES[key])
+            return ('template', key, None)
 
     # 3. Fallback / Advanced Formula Search (Legacy support)
-    def normalize(s): 
-        s = s.replace('ö', 'o').replace('ä', 'a').replace('ü', 'u').replace('é', 'e')
-        return re.sub(r'[^a-z0-9]', '', s.lower())
-    
-    norm_desc = normalize(description)
-    for t_key in TEMPLATES:
-        if t_key.startswith('formula_'):
-            raw_name = t_key.replace('formula_', '').replace('_', ' ')
-            if normalize(raw_name) in norm_desc:
-                return jsonify(TEMPLATES[t_key])
-
-    # Error / Suggestion
-    return jsonify({
-        "error": "Could not parse description",
-        "suggestedPrompt": "Try: 'Bubble sort', 'Solar system', 'DNA Helix', 'BFS Graph', 'Binary search', 'Atom model', 'Quadratic roots', 'Dot product', 'Pie chart', 'Photosynthesis', 'Calculus Limit', 'Matrix 3x3', 'Polygon 5'",
-        "exampleSceneSchema": TEMPLATE_BUBBLE_SORT
-    }), 400
+    with timed('formula_match'):
+        formula_key = match_formula(description)
+    if formula_key:
+        return ('template', formula_key, None)
+    return None
+
+def scene_options(data):
+    """(description, level, language, seed) of a request body; raises ValueError."""
+    if not isinstance(data, dict):
+        raise ValueError("The request body must be an object")
+    description = data.get('description', '')
+    if not isinstance(description, str):
+        raise ValueError("description must be a string")
+    description = description.lower()
+    options = data.get('options', {})
+    if not isinstance(options, dict):
+        raise ValueError("options must be an object")
+    language = options.get('language', 'python')
+    level = options.get('level', 'beginner')
+    return description, level, language, parse_seed(options.get('seed'))
+
+PARSE_ERROR = {
+    "error": "Could not parse description",
+    "suggestedPrompt": "Try: 'Bubble sort', 'Solar system', 'DNA Helix', 'BFS Graph', 'Binary search', 'Atom model', 'Quadratic roots', 'Dot product', 'Pie chart', 'Photosynthesis', 'Calculus Limit', 'Matrix 3x3', 'Polygon 5'",
+    "exampleSceneSchema": TEMPLATE_BUBBLE_SORT
+}
+
+@app.route('/generate/scenes', methods=['GET', 'POST'])
+def generate_scenes():
+    # GET /generate/scenes?description=...&level=...&language=...&seed=... is the
+    # cacheable form (browsers and CDNs revalidate it with If-None-Match)
+    if request.method == 'GET':
+        options = {k: request.args[k] for k in ('language', 'level', 'seed', 'format') if k in request.args}
+        data = {'description': request.args.get('description', ''), 'options': options}
+    else:
+        data = request.json
+    try:
+        description, level, language, seed = scene_options(data)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    g.scene_format = data.get('options', {}).get('format', 'json')
+    if g.scene_format not in SCENE_FORMATS:
+        return jsonify({"error": f"options.format must be one of {', '.join(SCENE_FORMATS)}"}), 400
+
+    target = resolve_scene(description)
+    if target is None:
+        # Error / Suggestion
+        return jsonify(PARSE_ERROR), 400
+    kind, what, extra = target
+    if kind == 'template':
+        return template_response(what, extra)
+    return generated_response(what, description, level, language, extra, seed)
+
+# Batch generation: at most BATCH_LIMIT prompts per request; misses are generated
+# on a shared pool of BATCH_WORKERS threads
+BATCH_LIMIT = 64
+BATCH_WORKERS = int(os.environ.get('BATCH_WORKERS', min(4, os.cpu_count() or 1)))
+BATCH_POOL = ThreadPoolExecutor(max_workers=BATCH_WORKERS, thread_name_prefix='batch')
+
+def batch_line(indices, status, encoded=None, **fields):
+    """One NDJSON result line; the scene bytes are spliced in as they are."""
+    line = encode_json({"indices": indices, "status": status, **fields})
+    if encoded is not None:
+        line = line[:-1] + b',"scene":' + encoded.data + b'}'
+    return line + b'\n'
+
+def generate_encoded(spec, args, kwargs, key):
+    encoded = serialize_scene(spec.generate(args, kwargs))
+    if spec.cacheable:
+        SCENE_CACHE.put(key, encoded)
+    return encoded
+
+@app.route('/generate/scenes/batch', methods=['POST'])
+def generate_scenes_batch():
+    # POST {"requests": [{"description": ..., "options": {...}}, ...]} -> NDJSON,
+    # one line per distinct scene as soon as it is ready:
+    #   {"indices": [0, 3], "status": 200, "cache": "HIT", "key": "bubble", "scene": {...}}
+    #   {"indices": [1], "status": 400, "error": "..."}
+    # indices point into "requests"; requests for the same scene share a line.
+    # key is the generator (as X-Scene-Key on /generate/scenes) for generated scenes.
+    # Library scenes and cache hits come first, then misses as the pool finishes
+    # them. Scenes are always JSON (options.format is ignored).
+    body = request.get_json(silent=True)
+    items = body.get('requests') if isinstance(body, dict) else None
+    if not isinstance(items, list) or not items:
+        return jsonify({"error": "requests must be a non-empty list"}), 400
+    if len(items) > BATCH_LIMIT:
+        return jsonify({"error": f"At most {BATCH_LIMIT} requests per batch"}), 400
+
+    # Identical requests are resolved once (so they also share a random seed)
+    by_request = {}
+    for index, item in enumerate(items):
+        by_request.setdefault(encode_json(item), []).append(index)
+
+    indices = {}   # scene identity -> request indices
+    ready = {}     # scene identity -> (status, encoded, fields)
+    pending = {}   # scene identity -> (spec, args, kwargs)
+    for raw, group in by_request.items():
+        item = items[group[0]]
+        try:
+            if not isinstance(item, dict):
+                raise ValueError("Each request must be an object")
+            description, level, language, seed = scene_options(item)
+        except ValueError as e:
+            ready[raw] = (400, None, {"error": str(e)})
+            indices[raw] = group
+            continue
+        target = resolve_scene(description)
+        if target is None:
+            identity = raw
+            ready[identity] = (400, None, {"error": PARSE_ERROR["error"]})
+        elif target[0] == 'template':
+            identity = ('template', target[1])
+            ready[identity] = (200, encoded_template(target[1], target[2]), {"cache": "HIT"})
+        else:
+            spec, arg = target[1], target[2]
+            args, kwargs = spec.inputs(description, level, language, arg, seed)
+            identity = (spec.cache_key(args, kwargs), 'json')
+            if identity not in ready and identity not in pending:
+                encoded = SCENE_CACHE.get(identity) if spec.cacheable else None
+                fields = {"cache": "HIT", "key": spec.key if arg is None else spec.key + arg}
+                if encoded is not None:
+                    ready[identity] = (200, encoded, fields)
+                else:
+                    pending[identity] = (spec, args, kwargs, fields)
+        indices.setdefault(identity, []).extend(group)
+
+    futures = {BATCH_POOL.submit(generate_encoded, spec, args, kwargs, identity): identity
+               for identity, (spec, args, kwargs, _) in pending.items()}
+
+    def lines():
+        for identity, (status, encoded, fields) in ready.items():
+            yield batch_line(sorted(indices[identity]), status, encoded, **fields)
+        for future in as_completed(futures):
+            identity = futures[future]
+            try:
+                encoded = future.result()
+            except Exception as e:
+                app.logger.exception("Batch generation failed")
+                yield batch_line(sorted(indices[identity]), 500, error=f"Generation failed: {e}")
+            else:
+                yield batch_line(sorted(indices[identity]), 200, encoded, **{**pending[identity][3], "cache": "MISS"})
+
+    response = Response(lines(), mimetype=NDJSON_MIMETYPE)
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+# A patch is only sent when it is at most this fraction of the scene it builds
+# (level switches that re-time every action change nearly all of it)
+PATCH_MAX_RATIO = 0.25
+
+@app.route('/generate/scenes/delta')
+def generate_scene_delta():
+    # GET /generate/scenes/delta?key=...&seed=...&description=...&from_level=...
+    #     &from_language=...&level=...&language=...
+    # key/seed identify a generated scene the client already has (key is its
+    # X-Scene-Key); the answer is {"patch": ...} (scene_patch.py) turning it into
+    # the scene for the new level/language, or the whole new scene when its
+    # objects/actions don't line up with the old one or the patch would be
+    # over PATCH_MAX_RATIO of it.
+    spec, arg = GENERATORS.resolve(request.args.get('key', ''))
+    if spec is None:
+        return jsonify({"error": "Unknown scene key"}), 404
+    try:
+        seed = parse_seed(request.args.get('seed'))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    if spec.seeded and seed is None:
+        return jsonify({"error": "seed is required for this scene"}), 400
+    description = request.args.get('description', '').lower()
+    old = spec.inputs(description, request.args.get('from_level', 'beginner'),
+                      request.args.get('from_language', 'python'), arg, seed)
+    new = spec.inputs(description, request.args.get('level', 'beginner'),
+                      request.args.get('language', 'python'), arg, seed)
+
+    key = ('delta', spec.cache_key(*old), spec.cache_key(*new))
+    encoded = SCENE_CACHE.get(key)
+    if encoded is None:
+        scene = cached_scene(spec, *new)
+        patch = diff_scenes(cached_scene(spec, *old), scene)
+        if patch is not None:
+            encoded = EncodedScene.from_scene({"patch": patch})
+        if patch is None or len(encoded.data) > PATCH_MAX_RATIO * len(encode_json(scene)):
+            return _generated_response(spec, *new)
+        SCENE_CACHE.put(key, encoded)
+    return scene_response(encoded, key)
 
 @app.route('/render/video', methods=['POST'])
 def render_video():
@@ -1586,6 +1825,10 @@ def get_templates():
     # Return keys only to avoid massive payload
     return jsonify(list(TEMPLATES.keys()))
 
+@app.route('/api/cache', methods=['GET'])
+def get_cache_stats():
+    return jsonify(SCENE_CACHE.stats())
+
 @app.route('/api/library', methods=['GET'])
 def get_library():
     # Sort library by domain then name
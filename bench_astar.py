@@ -0,0 +1,49 @@
+"""
+A* search speed and scene size against grid size.
+
+    python bench_astar.py [max side]
+
+Grids are the random ones "a* NxN" asks for (a quarter walls, corners
+joined). Search is astar_grid alone, in nodes expanded per second, for
+each heuristic; scene is the whole generated scene: its objects, actions
+and compact JSON size, and the time to build it.
+"""
+import json
+import sys
+import time
+
+from graph_model import HEURISTICS, astar_grid
+from scene_generators import GENERATORS
+from template_generator import _astar_board
+
+SIDES = (10, 20, 50, 100, 200, 500, 1000)
+
+
+def search_rate(board, heuristic):
+    rows, cols, walls, start, goal = board
+    t0 = time.perf_counter()
+    _, _, expanded = astar_grid(walls, cols, start, goal, heuristic)
+    elapsed = time.perf_counter() - t0
+    return len(expanded), len(expanded) / elapsed
+
+
+def main():
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    print(f"{'grid':>9} {'heuristic':>10} {'expanded':>9} {'nodes/s':>9}   {'objects':>7} {'actions':>7} {'KB':>8} {'build ms':>8}")
+    for side in SIDES:
+        if side > largest:
+            break
+        board = _astar_board(None, (side, side))
+        t0 = time.perf_counter()
+        scene = GENERATORS["astar"].build(f"a* {side}x{side}")
+        build = (time.perf_counter() - t0) * 1e3
+        size = len(json.dumps(scene, separators=(",", ":"))) / 1024
+        for n, heuristic in enumerate(HEURISTICS):
+            expanded, rate = search_rate(board, heuristic)
+            scene_columns = (f"   {len(scene['objects']):7d} {len(scene['actions']):7d} {size:8.1f} {build:8.1f}"
+                             if n == 0 else "")
+            print(f"{f'{side}x{side}':>9} {heuristic:>10} {expanded:9d} {rate:9.0f}{scene_columns}")
+
+
+if __name__ == "__main__":
+    main()
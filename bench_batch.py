@@ -0,0 +1,88 @@
+"""
+Throughput of POST /generate/scenes/batch vs one request per prompt.
+
+    python bench_batch.py
+
+Serves the app on a local port (threaded werkzeug server) and fetches the
+browse-library topics (public/browse-library.js) both ways, with a cold
+scene cache (every generated scene is a miss) and a warm one (fixed seeds,
+so the second pass hits). Reported as scenes per second.
+"""
+import json
+import logging
+import os
+import re
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from werkzeug.serving import make_server
+
+import app
+
+ROUNDS = 5
+LIBRARY_JS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "public", "browse-library.js")
+
+
+def library_prompts():
+    with open(LIBRARY_JS) as f:
+        return re.findall(r'prompt: "([^"]+)"', f.read())
+
+
+def post(url, body):
+    request = urllib.request.Request(url, json.dumps(body).encode(), {"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.read()
+    except urllib.error.HTTPError as e:  # prompts the parser doesn't know still cost a round trip
+        return e.read()
+
+
+def sequential(base, requests):
+    for item in requests:
+        post(f"{base}/generate/scenes", item)
+
+
+def batch(base, requests):
+    lines = post(f"{base}/generate/scenes/batch", {"requests": requests}).splitlines()
+    assert sum(len(json.loads(line)["indices"]) for line in lines) == len(requests)
+
+
+def best_rate(fn, base, requests, warm):
+    best = float("inf")
+    for _ in range(ROUNDS):
+        app.SCENE_CACHE.clear()
+        if warm:
+            fn(base, requests)
+        t0 = time.perf_counter()
+        fn(base, requests)
+        best = min(best, time.perf_counter() - t0)
+    return len(requests) / best
+
+
+def main():
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    server = make_server("127.0.0.1", 0, app.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    prompts = library_prompts()
+    try:
+        print(f"{len(prompts)} library prompts, {app.BATCH_WORKERS} batch workers, {os.cpu_count()} CPUs")
+        print(f"{'cache':<7}{'sequential/s':>14}{'batch/s':>10}{'speedup':>9}")
+        for warm in (False, True):
+            requests = [{"description": p, "options": {"seed": i}} for i, p in enumerate(prompts)]
+            seq = best_rate(sequential, base, requests, warm)
+            bat = best_rate(batch, base, requests, warm)
+            print(f"{'warm' if warm else 'cold':<7}{seq:>14.0f}{bat:>10.0f}{bat / seq:>8.1f}x")
+        # The same topics requested twice (e.g. two widgets on one page)
+        requests = [{"description": p, "options": {"seed": 1}} for p in prompts] * 2
+        seq = best_rate(sequential, base, requests, False)
+        bat = best_rate(batch, base, requests, False)
+        print(f"{'dup x2':<7}{seq:>14.0f}{bat:>10.0f}{bat / seq:>8.1f}x")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
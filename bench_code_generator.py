@@ -0,0 +1,54 @@
+"""
+Micro-benchmark: CodeGenerator.get_code per-call latency.
+
+    python bench_code_generator.py [rounds]
+
+"rebuild per call" reproduces the old implementation, which evaluated the
+whole nested implementations literal on every call before looking it up.
+"""
+import sys
+import time
+
+from code_generator import CODE_TABLE, IMPLEMENTATIONS, LANGUAGES, LEVELS, CodeGenerator
+
+LEGACY_SOURCE = f'''
+def legacy_get_code(topic, language="python", level="beginner"):
+    topic = topic.lower()
+    language = language.lower()
+    level = level.lower()
+    implementations = {IMPLEMENTATIONS!r}
+    topic_impl = implementations.get(topic, implementations.get("bubble_sort"))
+    lang_impl = topic_impl.get(language, topic_impl.get("python"))
+    return lang_impl.get(level, lang_impl.get("beginner"))
+'''
+namespace = {}
+exec(LEGACY_SOURCE, namespace)
+legacy_get_code = namespace["legacy_get_code"]
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    calls = [(topic, language, level) for topic in IMPLEMENTATIONS for language in LANGUAGES for level in LEVELS]
+    calls.append(("no_such_topic", "rust", "expert"))
+    for args in calls:
+        assert legacy_get_code(*args) == CodeGenerator.get_code(*args), args
+
+    def run(fn):
+        best = float("inf")
+        for _ in range(5):
+            t0 = time.perf_counter()
+            for _ in range(rounds):
+                for args in calls:
+                    fn(*args)
+            best = min(best, time.perf_counter() - t0)
+        return best / (rounds * len(calls)) * 1e6
+
+    old = run(legacy_get_code)
+    new = run(CodeGenerator.get_code)
+    print(f"{len(calls)} (topic, language, level) lookups x {rounds} rounds, {len(CODE_TABLE)} table entries")
+    print(f"rebuild per call : {old:8.3f} us/call")
+    print(f"indexed table    : {new:8.3f} us/call  ({old / new:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
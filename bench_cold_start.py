@@ -0,0 +1,51 @@
+"""
+Cold-start benchmark: eager vs lazy template library.
+
+Each run happens in a fresh interpreter so import time and resident memory are
+measured exactly as a new worker / serverless cold start would see them.
+"Eager" builds every registered scene right after import, which is what
+importing template_generator used to do; "lazy" only registers the keys.
+
+    python bench_cold_start.py [runs]
+"""
+import json
+import subprocess
+import sys
+
+PROBE = """
+import json, resource, sys, time
+t0 = time.perf_counter()
+import {module}
+registry = {registry}
+if {eager}:
+    registry.materialize()
+elapsed = time.perf_counter() - t0
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"seconds": elapsed, "rss_kb": rss_kb, "keys": len(registry)}}))
+"""
+
+TARGETS = [
+    ("template_generator", "template_generator.GENERATED_TEMPLATES"),
+    ("app", "app.TEMPLATES"),
+]
+
+
+def probe(module, registry, eager):
+    code = PROBE.format(module=module, registry=registry, eager=eager)
+    out = subprocess.check_output([sys.executable, "-c", code], text=True)
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"{'module':<20} {'mode':<6} {'keys':>5} {'import ms':>10} {'max RSS MB':>11}")
+    for module, registry in TARGETS:
+        for mode, eager in (("eager", True), ("lazy", False)):
+            samples = [probe(module, registry, eager) for _ in range(runs)]
+            best = min(s["seconds"] for s in samples) * 1000
+            rss = min(s["rss_kb"] for s in samples) / 1024
+            print(f"{module:<20} {mode:<6} {samples[0]['keys']:>5} {best:>10.1f} {rss:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
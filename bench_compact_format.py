@@ -0,0 +1,101 @@
+"""
+Payload size and parse time: plain scene JSON vs the opt-in compact and
+binary formats.
+
+    python bench_compact_format.py
+
+Per template family: raw and gzip bytes of both encodings, and the time to
+turn the payload back into a scene, in Python (json.loads [+ decode_compact])
+and, when node is installed, in JavaScript with the decoder from
+public/main.js (JSON.parse [+ expandCompactScene]). Binary is measured in
+Python only (decode_binary).
+"""
+import gzip
+import json
+import os
+import shutil
+import subprocess
+import time
+
+from bench_compression import collect
+from scene_binary import decode_binary, encode_binary
+from scene_codec import decode_compact, encode_compact, encode_json
+
+MAIN_JS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "public", "main.js")
+
+NODE_TIMER = """
+let input = ""; process.stdin.on("data", c => input += c);
+process.stdin.on("end", () => {
+    const families = JSON.parse(input), out = {};
+    const time = (fn, texts) => {
+        let best = Infinity;
+        for (let r = 0; r < 5; r++) {
+            const t0 = process.hrtime.bigint();
+            for (let k = 0; k < 20; k++) texts.forEach(fn);
+            best = Math.min(best, Number(process.hrtime.bigint() - t0) / 20 / texts.length / 1000);
+        }
+        return best;
+    };
+    for (const [family, { plain, compact }] of Object.entries(families)) {
+        out[family] = [time(t => JSON.parse(t), plain), time(t => expandCompactScene(JSON.parse(t)), compact)];
+    }
+    process.stdout.write(JSON.stringify(out));
+});
+"""
+
+
+def best_of(fn, payloads, rounds=5, repeat=20):
+    best = float("inf")
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            for payload in payloads:
+                fn(payload)
+        best = min(best, (time.perf_counter() - t0) / repeat / len(payloads) * 1e6)
+    return best
+
+
+def node_parse_times(texts):
+    if not shutil.which("node"):
+        return None
+    with open(MAIN_JS) as f:
+        source = f.read()
+    start = source.index("// --- COMPACT SCENE FORMAT ---")
+    decoder = source[start:source.index("// --- SCENE MANAGEMENT ---", start)]
+    out = subprocess.run(["node", "-e", decoder + NODE_TIMER], input=json.dumps(texts),
+                         capture_output=True, text=True, check=True)
+    return json.loads(out.stdout)
+
+
+def main():
+    families = collect()
+    rows = {}
+    texts = {}
+    for family, payloads in sorted(families.items()):
+        compact = [encode_json(encode_compact(json.loads(p))) for p in payloads]
+        binary = [encode_binary(json.loads(p)) for p in payloads]
+        rows[family] = (
+            len(payloads),
+            sum(map(len, payloads)), sum(map(len, compact)), sum(map(len, binary)),
+            sum(len(gzip.compress(p)) for p in payloads), sum(len(gzip.compress(p)) for p in compact),
+            sum(len(gzip.compress(p)) for p in binary),
+            best_of(json.loads, payloads), best_of(lambda p: decode_compact(json.loads(p)), compact),
+            best_of(decode_binary, binary),
+        )
+        texts[family] = {"plain": [p.decode() for p in payloads], "compact": [p.decode() for p in compact]}
+    js = node_parse_times(texts)
+
+    print(f"{'family':<26}{'scenes':>7}{'json KB':>9}{'compact':>9}{'binary':>8}"
+          f"{'gz json':>9}{'gz cmp':>8}{'gz bin':>8}{'py json us':>12}{'py cmp us':>11}{'py bin us':>11}"
+          + (f"{'js json us':>12}{'js cmp us':>11}" if js else ""))
+    for family, (n, raw, cmp, bin_, graw, gcmp, gbin, py_raw, py_cmp, py_bin) in rows.items():
+        line = (f"{family:<26}{n:>7}{raw / 1024:>9.1f}{cmp / 1024:>9.1f}{bin_ / 1024:>8.1f}"
+                f"{graw / 1024:>9.1f}{gcmp / 1024:>8.1f}{gbin / 1024:>8.1f}"
+                f"{py_raw:>12.0f}{py_cmp:>11.0f}{py_bin:>11.0f}")
+        if js:
+            line += f"{js[family][0]:>12.0f}{js[family][1]:>11.0f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
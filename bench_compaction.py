@@ -0,0 +1,65 @@
+"""
+Action counts before and after timeline compaction, and what compacting costs.
+
+    python bench_compaction.py [rounds]
+
+Generators are built at the advanced level with seed 7; library templates
+are grouped by family (poly_3 ... poly_53 count as "poly"). Time is the
+best per-scene time of compact_scene over 5 runs of `rounds` calls.
+full_course compacts each topic while it streams, so it shows nothing
+left to remove here.
+"""
+import sys
+import time
+
+import app
+from scene_compaction import compact_scene
+from scene_generators import GENERATORS
+from template_generator import GENERATED_TEMPLATES
+
+LIBRARY = {"bubble": app.TEMPLATE_BUBBLE_SORT, "selection": app.TEMPLATE_SELECTION_SORT, "bfs": app.TEMPLATE_ALGO_BFS,
+           "dna": app.TEMPLATE_DNA, "bar_race": app.TEMPLATE_BAR_RACE, "bernoulli": app.TEMPLATE_BERNOULLI,
+           "derivation": app.TEMPLATE_DERIVATION}
+
+
+def compact_time(scene, rounds):
+    best = float("inf")
+    for _ in range(5):
+        t0 = time.perf_counter()
+        for _ in range(rounds):
+            compact_scene(scene)
+        best = min(best, (time.perf_counter() - t0) / rounds * 1e6)
+    return best
+
+
+def rows(rounds):
+    for key in GENERATORS:
+        spec = GENERATORS[key]
+        if key.endswith(":") or key == "matrix_op":
+            continue
+        args, kwargs = spec.inputs(key, "advanced", "python", None, 7)
+        scene = spec.func(*args, **kwargs)
+        yield key, [scene], rounds
+    families = {}
+    for key, scene in [*LIBRARY.items(), *GENERATED_TEMPLATES.items()]:
+        family = "formula" if key.startswith("formula_") else key if key in LIBRARY else key.rsplit("_", 1)[0]
+        families.setdefault(family, []).append(scene)
+    for family, scenes in families.items():
+        yield "template " + family, scenes, max(1, rounds // len(scenes))
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print(f"{'scenes':24} {'before':>7} {'after':>7} {'removed':>8}  {'compact us':>10}")
+    totals = [0, 0]
+    for name, scenes, n in rows(rounds):
+        before = sum(len(scene["actions"]) for scene in scenes)
+        after = sum(len(compact_scene(scene)["actions"]) for scene in scenes)
+        cost = sum(compact_time(scene, n) for scene in scenes)
+        totals = [totals[0] + before, totals[1] + after]
+        print(f"{name:24} {before:7d} {after:7d} {1 - after / before:8.1%}  {cost:10.1f}")
+    print(f"{'total':24} {totals[0]:7d} {totals[1]:7d} {1 - totals[1] / totals[0]:8.1%}")
+
+
+if __name__ == "__main__":
+    main()
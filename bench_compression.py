@@ -0,0 +1,72 @@
+"""
+Size and CPU cost of compressing scene JSON, per template family.
+
+    python bench_compression.py
+
+For each family: total raw bytes, compressed bytes and ratio, and the mean
+time to compress one scene at the request-path (FAST) and build-step (BEST)
+levels of every available encoding.
+"""
+import re
+import time
+from collections import defaultdict
+
+import compression
+from app import TEMPLATES
+from scene_codec import encode_json
+from scene_generators import GENERATORS
+
+GENERATED_FAMILIES = {
+    "sorting": ["bubble", "selection", "quicksort", "merge_sort", "counting_sort", "bucket_sort", "radix_sort"],
+    "search": ["binary", "astar"],
+    "graph": ["bfs", "dfs", "bellman_ford", "floyd_warshall", "kruskal_mst", "prim_mst", "dynamic:dijkstra"],
+    "dp": ["fibonacci", "knapsack", "lcs", "edit_distance", "max_subarray", "nqueens"],
+    "data_structures": ["bst", "linked_list", "stack", "queue"],
+    "full_course": ["full_course"],
+}
+
+
+def library_family(key):
+    match = re.match(r"(poly|formula|graph|deriv|atom)_", key)
+    return f"library:{match.group(1)}" if match else "library:static"
+
+
+def collect():
+    families = defaultdict(list)
+    for key in TEMPLATES.static_keys():
+        families[library_family(key)].append(encode_json(TEMPLATES[key]))
+    for family, keys in GENERATED_FAMILIES.items():
+        for key in keys:
+            for level in ("beginner", "advanced"):
+                families[f"generated:{family}"].append(encode_json(GENERATORS[key].build(key, level=level, seed=1)))
+    return families
+
+
+def timed_compress(payloads, encoding, level):
+    t0 = time.perf_counter()
+    sizes = [len(compression.compress(p, encoding, level)) for p in payloads]
+    return sum(sizes), (time.perf_counter() - t0) / len(payloads) * 1e6
+
+
+def main():
+    families = collect()
+    columns = [(encoding, name, levels[encoding]) for encoding in compression.ENCODINGS
+               for name, levels in (("fast", compression.FAST), ("best", compression.BEST))]
+    header = f"{'family':<26}{'scenes':>7}{'raw KB':>9}"
+    for encoding, name, level in columns:
+        header += f"{f'{encoding}-{level} KB':>13}{'ratio':>7}{'us/scene':>10}"
+    print(header)
+    for family in sorted(families):
+        payloads = families[family]
+        raw = sum(len(p) for p in payloads)
+        row = f"{family:<26}{len(payloads):>7}{raw / 1024:>9.1f}"
+        for encoding, _, level in columns:
+            size, us = timed_compress(payloads, encoding, level)
+            row += f"{size / 1024:>13.1f}{raw / size:>6.1f}x{us:>10.0f}"
+        print(row)
+    if not compression.brotli:
+        print("(brotli not installed: `pip install brotli` to include br)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Floyd-Warshall with NumPy against the pure-Python loops, and the scenes it
+feeds.
+
+    python bench_floyd.py [max vertices]
+
+Graphs are the random ones "floyd warshall N nodes" asks for (3 arcs per
+vertex). Times are the best of 3 runs of floyd_warshall to the last k;
+scene is the generated scene's action count, diff cells and JSON size.
+"""
+import json
+import sys
+import time
+
+import graph_model
+from graph_model import floyd_warshall
+from scene_generators import GENERATORS
+from template_generator import _floyd_matrix
+
+SIZES = (25, 50, 100, 200, 300)
+
+
+def best_time(matrix, vectorized):
+    best = float("inf")
+    for _ in range(3):
+        t0 = time.perf_counter()
+        for _ in floyd_warshall(matrix, vectorized):
+            pass
+        best = min(best, time.perf_counter() - t0)
+    return best * 1e3
+
+
+def main():
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    if graph_model.np is None:
+        print("NumPy is not installed: only the loops are timed")
+    print(f"{'V':>4} {'loops ms':>9} {'numpy ms':>9} {'speedup':>8}   {'actions':>7} {'diff cells':>10} {'KB':>8}")
+    for size in SIZES:
+        if size > largest:
+            break
+        _, matrix = _floyd_matrix(None, False, size)
+        loops = best_time(matrix, False)
+        if graph_model.np is not None:
+            vectorized = best_time(matrix, True)
+            numbers = f"{vectorized:9.1f} {loops / vectorized:7.1f}x"
+        else:
+            numbers = f"{'-':>9} {'-':>8}"
+        scene = GENERATORS["floyd_warshall"].build(f"floyd warshall {size} nodes")
+        kb = len(json.dumps(scene, separators=(",", ":"))) / 1024
+        print(f"{size:4d} {loops:9.1f} {numbers}   {len(scene['actions']):7d} "
+              f"{scene['metadata']['diffCells']:10d} {kb:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+followPath cost per frame on atom_50, with and without arc-length tables.
+
+    python bench_follow_path.py [scene key]
+
+Plays the scene at 60 fps and places every object a followPath action
+moves, the way render() in public/main.js does:
+
+    per frame   the path is read, flattened and measured again for every
+                action on every frame (what a fresh SVG path element and
+                getTotalLength/getPointAtLength have to do)
+    table       a binary search in the track the server attached
+
+Times are per frame, mean and worst, in Python; the browser's absolute
+numbers differ, the ratio is the point. Bytes are the tracks in compact
+JSON.
+"""
+import json
+import sys
+import time
+
+import app
+from scene_paths import followed_paths, path_track, point_along
+
+FPS = 60
+
+
+def per_frame(path, p):
+    return point_along(path_track.__wrapped__(path["d"]), p)
+
+
+def table(path, p):
+    return point_along(path["track"], p)
+
+
+def play(scene, place):
+    paths = {obj["id"]: obj["props"] for obj in scene["objects"] if obj["type"] == "path"}
+    moves = [a for a in scene["actions"] if a["type"] == "followPath"]
+    frames = []
+    for frame in range(int(scene["duration"] * FPS) + 1):
+        t = frame / FPS
+        t0 = time.perf_counter()
+        for action in moves:
+            if t >= action["start"]:
+                p = min(1, (t - action["start"]) / (action["end"] - action["start"]))
+                place(paths[action["params"]["pathId"]], p)
+        frames.append(time.perf_counter() - t0)
+    return len(moves), frames
+
+
+def main():
+    key = sys.argv[1] if len(sys.argv) > 1 else "atom_50"
+    scene = app.TEMPLATES[key]
+    followed = followed_paths(scene["actions"])
+    tracks = [obj["props"]["track"] for obj in scene["objects"] if obj["id"] in followed]
+    size = sum(len(json.dumps(track, separators=(",", ":"))) for track in tracks)
+    print(f"{key}: {len(tracks)} followed paths, {sum(len(t) // 3 for t in tracks)} track points, {size} bytes")
+    print(f"{'placing':>9} {'moves':>6} {'frames':>7} {'mean ms':>8} {'worst ms':>9}")
+    for name, place in (("per frame", per_frame), ("table", table)):
+        moves, frames = play(scene, place)
+        print(f"{name:>9} {moves:6d} {len(frames):7d} {sum(frames) / len(frames) * 1e3:8.3f} {max(frames) * 1e3:9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Micro-benchmark: sequential re.search loop vs the compiled single-pass matcher.
+
+    python bench_intent_parser.py [rounds]
+"""
+import re
+import sys
+import time
+
+from intent_parser import RuleBasedIntentParser
+
+PROMPT_CORPUS = [
+    "triangle", "square", "pentagon", "hexagon", "polygon 8",
+    "atom 1", "element 6",
+    "graph sin(x)", "plot quadratic", "graph linear",
+    "Newton's Laws", "Friction", "Work Energy Principle",
+    "Solar System", "Life Cycle of Star",
+    "Carbon Cycle", "Nitrogen Cycle",
+    "Greenhouse Effect", "Global Warming",
+    "Water Cycle",
+    "Photosynthesis", "Respiration",
+    "Digestive System", "Human Heart", "Nervous System",
+    "Electricity Basics", "Ohm's Law",
+    "Reflection Refraction", "Sound Propagation",
+    "States of Matter", "Force and Pressure",
+    "Capillary Action",
+    "Schrodinger Equation", "Heisenberg Uncertainty",
+    "Doppler Effect", "Wave Equation", "Gravitation", "Time Dilation",
+    "Bubble sort", "Selection sort", "Merge sort",
+    "Binary search", "BFS Graph",
+    "Stack operations", "Queue operations",
+    "Matrix multiplication 3x3", "Determinant", "Gradient Descent",
+    "Fourier Transform", "Riemann Sum", "Taylor Series",
+    "Chain Rule", "Integral", "Limit", "Derivation",
+    "Vector addition", "Vector subtraction",
+    "Cross product", "Dot product",
+    "Pie chart", "Bar race", "Scatter plot",
+    "DNA Helix", "Mitosis",
+    "Electrolysis",
+    "Full course",
+    "Show me bubble sort", "Binary search algo", "Plot a sine wave", "Explain BFS like I'm 5",
+    "Advanced matrix multiplication", "Show me bernoulli principle", "vector addition",
+    "Show me bubble sort for kids", "Visualize selection sort advanced", "Binary search beginner",
+    "Graph x squared", "Show DNA helix", "Random nonsense",
+    "depth first search on a tree", "breadth first traversal", "counting sort for kids",
+    "radix sort with buckets", "a* pathfinding on a grid", "a star search", "n-queens backtracking",
+    "kruskal minimum spanning tree", "prim's algorithm", "floyd-warshall all pairs",
+    "bellman ford negative edges", "levenshtein edit distance", "longest common subsequence",
+    "kadane max subarray", "0/1 knapsack dynamic programming", "fibonacci with memoization",
+    "binary search tree insertion", "push and pop on a stack", "enqueue dequeue",
+    "how does a heart pump blood", "carbon emissions and the greenhouse", "work done by friction",
+    "ohm resistor circuit", "sound waves in air", "states of matter: solid liquid gas",
+    "",
+]
+
+
+def sequential_match(parser, text):
+    """The original matcher: re.search per pattern in order, then a substring scan."""
+    text_lower = text.lower()
+    for pattern, key in parser.patterns:
+        if re.search(pattern, text_lower):
+            return key
+    for keyword, topic_key in parser.advanced_topics.items():
+        if keyword in text_lower:
+            return f"dynamic:{topic_key}"
+    return None
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    parser = RuleBasedIntentParser()
+    prompts = [p.lower() for p in PROMPT_CORPUS]
+
+    def run(fn):
+        best = float("inf")
+        for _ in range(5):
+            t0 = time.perf_counter()
+            for _ in range(rounds):
+                for p in prompts:
+                    fn(p)
+            best = min(best, time.perf_counter() - t0)
+        return best / (rounds * len(prompts)) * 1e6
+
+    old = run(lambda p: sequential_match(parser, p))
+    new = run(lambda p: parser.parse(p)["template_key"])
+    print(f"{len(prompts)} prompts x {rounds} rounds")
+    print(f"sequential re.search : {old:8.2f} us/prompt")
+    print(f"compiled automaton   : {new:8.2f} us/prompt  ({old / new:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
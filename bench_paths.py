@@ -0,0 +1,56 @@
+"""
+Path data before and after scene_paths, and what rewriting it costs.
+
+    python bench_paths.py
+
+Library templates are grouped by family (poly_3 ... poly_53 count as
+"poly"); "plot" is a few user functions. Bytes are the path data alone and
+the whole scene as compact JSON, gzipped; commands are the drawing
+commands the client's Path2D parses (a stand-in for its parse time, which
+grows with both). Time is the best of 5 uncached compact_path runs over
+the family's paths.
+"""
+import gzip
+import json
+import time
+
+from scene_paths import compact_path, compact_paths, parse_path
+from template_generator import GENERATED_TEMPLATES, generate_graph_template
+
+PLOTS = ("sin(x^2)", "x^3 - x", "tan(x)", "exp(-x^2)", "x*cos(x)/4")
+
+
+def families():
+    grouped = {}
+    for key in GENERATED_TEMPLATES.static_keys():
+        family = "formula" if key.startswith("formula_") else key.rsplit("_", 1)[0]
+        grouped.setdefault(family, []).append(GENERATED_TEMPLATES[key])
+    grouped["plot"] = [generate_graph_template(e, e) for e in PLOTS]
+    return grouped
+
+
+def gzipped(scenes):
+    return sum(len(gzip.compress(json.dumps(s, separators=(",", ":")).encode())) for s in scenes)
+
+
+def main():
+    print(f"{'family':>8} {'paths':>6} {'bytes':>9} {'after':>9} {'commands':>9} {'after':>8} "
+          f"{'scene gz':>9} {'after':>8} {'ms':>7}")
+    for family, scenes in families().items():
+        paths = [obj["props"]["d"] for scene in scenes for obj in scene["objects"] if obj["type"] == "path"]
+        if not paths:
+            continue
+        compact = [compact_path(d) for d in paths]
+        best = float("inf")
+        for _ in range(5):
+            t0 = time.perf_counter()
+            for d in paths:
+                compact_path.__wrapped__(d)
+            best = min(best, time.perf_counter() - t0)
+        print(f"{family:>8} {len(paths):6d} {sum(map(len, paths)):9d} {sum(map(len, compact)):9d} "
+              f"{sum(len(parse_path(d)) for d in paths):9d} {sum(len(parse_path(d)) for d in compact):8d} "
+              f"{gzipped(scenes):9d} {gzipped(compact_paths(s) for s in scenes):8d} {best * 1e3:7.1f}")
+
+
+if __name__ == "__main__":
+    main()
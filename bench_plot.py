@@ -0,0 +1,72 @@
+"""
+Plotting the 50 library functions: eval per point against compiled,
+vectorized, adaptively sampled expressions.
+
+    python bench_plot.py [rounds]
+
+"eval" is the old way, eval() of the expression at 201 points with a
+try/except around each. "compile" is the first plot of an expression
+(parse, check and compile, then sample); "cached" plots it again with the
+compiled expression reused. Times are the best of 5 runs of `rounds` plots
+of all 50 functions; points are the curves' total on-screen points.
+"""
+import math
+import sys
+import time
+
+from function_plot import compile_expression, sample_function
+from template_generator import FUNCTIONS, PLOT_X_RANGE
+
+NAMESPACE = {"sin": math.sin, "cos": math.cos, "tan": math.tan, "exp": math.exp, "sqrt": math.sqrt,
+             "log": math.log, "math": math}
+
+
+def to_screen(xs, ys):
+    return 400 + xs * 40, 225 - ys * 40
+
+
+def on_screen(points):
+    return sum(1 for px, py in points if 0 <= px <= 800 and 0 <= py <= 450)
+
+
+def plot_eval(expr):
+    points = []
+    for i in range(-100, 101):
+        x = i / 10.0
+        try:
+            points.append((400 + x * 40, 225 - eval(expr, dict(NAMESPACE, x=x)) * 40))
+        except Exception:
+            pass
+    return points
+
+
+def plot_compiled(expr):
+    xs, ys = sample_function(compile_expression(expr), PLOT_X_RANGE, to_screen)
+    return list(zip(*(v.tolist() for v in to_screen(xs, ys))))
+
+
+def best(rounds, plot, cold=False):
+    times = []
+    for _ in range(5):
+        t0 = time.perf_counter()
+        for _ in range(rounds):
+            if cold:
+                compile_expression.cache_clear()
+            for _, expr in FUNCTIONS:
+                plot(expr)
+        times.append((time.perf_counter() - t0) / rounds * 1e3)
+    return min(times)
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    rows = [("eval", best(rounds, plot_eval), sum(on_screen(plot_eval(e)) for _, e in FUNCTIONS)),
+            ("compile", best(rounds, plot_compiled, cold=True), sum(on_screen(plot_compiled(e)) for _, e in FUNCTIONS)),
+            ("cached", best(rounds, plot_compiled), None)]
+    print(f"{'':8} {'ms / 50 plots':>14} {'points':>7}")
+    for name, ms, points in rows:
+        print(f"{name:8} {ms:14.1f} {points if points is not None else '':>7}")
+
+
+if __name__ == "__main__":
+    main()
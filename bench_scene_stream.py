@@ -0,0 +1,45 @@
+"""
+Time to first frame: the full course as one JSON body vs streamed NDJSON.
+
+    python bench_scene_stream.py
+
+Through the Flask test client with the scene cache cleared before every
+request. For JSON the first frame needs the whole body; for NDJSON it needs
+the header, the first objects and the first complete actions window.
+"""
+import json
+import time
+
+import app
+
+ROUNDS = 5
+QUERY = {"description": "full course"}
+
+
+def timed_request(fmt, seed):
+    app.SCENE_CACHE.clear()
+    client = app.app.test_client()
+    t0 = time.perf_counter()
+    response = client.get("/generate/scenes", query_string={**QUERY, "seed": seed, "format": fmt}, buffered=False)
+    first_frame = None
+    size = 0
+    for chunk in response.response:
+        size += len(chunk)
+        if first_frame is None and fmt == "ndjson" and json.loads(chunk)["kind"] == "actions":
+            first_frame = time.perf_counter() - t0
+    total = time.perf_counter() - t0
+    response.close()
+    return first_frame or total, total, size
+
+
+def main():
+    print(f"{'format':<8}{'first frame ms':>16}{'complete ms':>13}{'KB':>8}")
+    for fmt in ("json", "ndjson"):
+        runs = [timed_request(fmt, seed) for seed in range(ROUNDS)]
+        first = min(r[0] for r in runs) * 1e3
+        total = min(r[1] for r in runs) * 1e3
+        print(f"{fmt:<8}{first:>16.1f}{total:>13.1f}{runs[0][2] / 1024:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
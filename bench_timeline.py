@@ -0,0 +1,81 @@
+"""
+Generation time and peak memory of the sort/search/graph generators:
+hand-written action dicts vs the Timeline builder.
+
+    python bench_timeline.py [rounds]
+
+The hand-written versions are the generators as they were before the
+Timeline migration, loaded from git into their own registry. Time is the
+best per-build time over 9 rounds (alternating old and new); peak is
+tracemalloc's peak while building one scene (advanced level, seed 7).
+"""
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import scene_generators
+import template_generator  # registers the current generators
+from scene_generators import GENERATORS, GeneratorRegistry
+
+KEYS = ["bubble", "selection", "quicksort", "merge_sort", "counting_sort", "bucket_sort", "radix_sort",
+        "binary", "astar", "bfs", "dfs", "bellman_ford", "floyd_warshall", "kruskal_mst", "prim_mst",
+        "dynamic:dijkstra"]
+
+
+def legacy_registry():
+    """GENERATORS as registered by template_generator.py before timeline.py was added."""
+    added = subprocess.run(["git", "log", "--diff-filter=A", "--format=%H", "--", "timeline.py"],
+                           capture_output=True, text=True, check=True).stdout.split()[-1]
+    source = subprocess.run(["git", "show", f"{added}^:template_generator.py"],
+                            capture_output=True, text=True, check=True).stdout
+    registry = GeneratorRegistry()
+    scene_generators.GENERATORS = registry
+    try:
+        exec(compile(source, "legacy_template_generator.py", "exec"), {"__name__": "legacy_template_generator"})
+    finally:
+        scene_generators.GENERATORS = GENERATORS
+    return registry
+
+
+def build_times(specs, key, rounds):
+    """Best per-build time of each spec; the rounds alternate between them so both see the same machine."""
+    best = [float("inf")] * len(specs)
+    for _ in range(9):
+        for n, spec in enumerate(specs):
+            t0 = time.perf_counter()
+            for _ in range(rounds):
+                spec.build(key, "advanced", "python", None, 7)
+            best[n] = min(best[n], (time.perf_counter() - t0) / rounds * 1e6)
+    return best
+
+
+def build_peak(spec, key):
+    tracemalloc.start()
+    scene = spec.build(key, "advanced", "python", None, 7)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del scene
+    return peak
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    legacy = legacy_registry()
+    print(f"{'generator':18} {'actions':>7}  {'dicts us':>9} {'timeline us':>11}  {'dicts KB':>8} {'timeline KB':>11}")
+    totals = [0, 0, 0, 0]
+    for key in KEYS:
+        old_spec, _ = legacy.resolve(key)
+        new_spec, _ = GENERATORS.resolve(key)
+        old_scene = old_spec.build(key, "advanced", "python", None, 7)
+        new_scene = new_spec.build(key, "advanced", "python", None, 7)
+        assert [a["id"] for a in old_scene["actions"]] == [a["id"] for a in new_scene["actions"]], key
+        row = [*build_times([old_spec, new_spec], key, rounds),
+               build_peak(old_spec, key) / 1024, build_peak(new_spec, key) / 1024]
+        totals = [t + r for t, r in zip(totals, row)]
+        print(f"{key:18} {len(new_scene['actions']):7d}  {row[0]:9.1f} {row[1]:11.1f}  {row[2]:8.1f} {row[3]:11.1f}")
+    print(f"{'total':18} {'':7}  {totals[0]:9.1f} {totals[1]:11.1f}  {totals[2]:8.1f} {totals[3]:11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Build step, run once per deploy before starting the server:
+
+    python build.py
+
+Writes build/scenes.snap, the memory-mapped snapshot of every static scene,
+one precompressed copy of it per supported content encoding, precompressed
+copies of the public/ text assets under build/public/, and the fingerprinted
+build of public/ (hashed asset names, rewritten pages, all precompressed)
+under build/assets/.
+"""
+import os
+import time
+
+import compression
+import scene_snapshot
+import static_assets
+from scene_codec import encode_json
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PUBLIC_DIR = os.path.join(ROOT, "public")
+PRECOMPRESSED_DIR = os.path.join(ROOT, "build", "public")
+ASSET_DIR = os.path.join(ROOT, "build", "assets")
+
+
+def build_snapshot():
+    from app import TEMPLATES
+    t0 = time.perf_counter()
+    payloads = {key: encode_json(TEMPLATES[key]) for key in TEMPLATES.static_keys()}
+    for encoding in (None,) + compression.ENCODINGS:
+        path = scene_snapshot.snapshot_path(encoding)
+        count, size = scene_snapshot.write_snapshot(TEMPLATES, path, encoding, payloads)
+        print(f"Wrote {count} scenes ({size / 1024:.0f} KB) to {path} "
+              f"in {time.perf_counter() - t0:.2f}s")
+        t0 = time.perf_counter()
+
+
+def build_assets():
+    t0 = time.perf_counter()
+    written = compression.precompress_assets(PUBLIC_DIR, PRECOMPRESSED_DIR)
+    raw = sum(size for _, size, _ in written)
+    for encoding in compression.ENCODINGS:
+        packed = sum(sizes[encoding] for _, _, sizes in written)
+        print(f"Precompressed {len(written)} assets with {encoding}: {raw / 1024:.0f} KB -> {packed / 1024:.0f} KB")
+    print(f"  into {PRECOMPRESSED_DIR} in {time.perf_counter() - t0:.2f}s")
+
+
+def build_fingerprinted():
+    t0 = time.perf_counter()
+    manifest = static_assets.build_assets(PUBLIC_DIR, ASSET_DIR)
+    compression.precompress_assets(ASSET_DIR, ASSET_DIR)
+    print(f"Fingerprinted {len(manifest['assets'])} assets and rewrote {len(manifest['pages'])} pages "
+          f"into {ASSET_DIR} in {time.perf_counter() - t0:.2f}s")
+
+
+if __name__ == "__main__":
+    build_snapshot()
+    build_assets()
+    build_fingerprinted()
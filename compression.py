@@ -0,0 +1,110 @@
+"""
+Content-Encoding negotiation and compression for scenes and public/ assets.
+
+gzip is always available; brotli is used when the optional `brotli` package
+is installed. Responses are compressed at a fast level on the request path
+(and kept with the cached scene). The build step uses the maximum levels for
+everything it can precompress.
+"""
+import gzip
+import os
+import zlib
+
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+ENCODINGS = ("br", "gzip") if brotli else ("gzip",)
+MIN_SIZE = 1024  # smaller bodies are not worth the header and CPU
+
+# Text assets under public/ that the build step precompresses (images are already compressed)
+TEXT_EXTENSIONS = {".html", ".css", ".js", ".json", ".svg", ".txt"}
+EXTENSIONS = {"gzip": ".gz", "br": ".br"}
+
+FAST = {"gzip": 6, "br": 5}
+BEST = {"gzip": 9, "br": 11}
+
+
+def compress(data, encoding, level=None):
+    if encoding == "gzip":
+        # mtime=0 keeps the output (and so its ETag) reproducible
+        return gzip.compress(data, compresslevel=level or FAST["gzip"], mtime=0)
+    if encoding == "br" and brotli:
+        return brotli.compress(data, quality=level or FAST["br"])
+    raise ValueError(f"Unsupported content encoding {encoding!r}")
+
+
+def compress_stream(chunks, encoding, level=None):
+    """
+    gzip of a chunk iterator, flushed after every chunk so the client can
+    decode each one as soon as it arrives (for streamed responses).
+    """
+    if encoding != "gzip":
+        raise ValueError(f"Unsupported streaming content encoding {encoding!r}")
+    compressor = zlib.compressobj(level or FAST["gzip"], zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
+def decompress(data, encoding):
+    if encoding == "gzip":
+        return gzip.decompress(data)
+    if encoding == "br" and brotli:
+        return brotli.decompress(data)
+    raise ValueError(f"Unsupported content encoding {encoding!r}")
+
+
+def negotiate(request, encodings=ENCODINGS):
+    """Best encoding the client accepts (by q-value, then our preference), or None."""
+    return request.accept_encodings.best_match(encodings)
+
+
+def etag_for(etag, encoding):
+    """Each encoded representation needs its own strong validator."""
+    return f"{etag}-{encoding}" if encoding else etag
+
+
+def precompress_assets(source_dir, target_dir):
+    """
+    Writes <name>.gz / <name>.br for every text asset under source_dir into
+    target_dir, mirroring the layout. Returns [(path, raw, {encoding: size})].
+    """
+    written = []
+    for root, _, files in os.walk(source_dir):
+        for name in sorted(files):
+            if os.path.splitext(name)[1].lower() not in TEXT_EXTENSIONS:
+                continue
+            path = os.path.join(root, name)
+            rel = os.path.relpath(path, source_dir)
+            with open(path, "rb") as f:
+                data = f.read()
+            sizes = {}
+            for encoding in ENCODINGS:
+                out = os.path.join(target_dir, rel + EXTENSIONS[encoding])
+                os.makedirs(os.path.dirname(out), exist_ok=True)
+                payload = compress(data, encoding, BEST[encoding])
+                with open(out, "wb") as f:
+                    f.write(payload)
+                sizes[encoding] = len(payload)
+            written.append((rel, len(data), sizes))
+    return written
+
+
+def precompressed_path(source_dir, target_dir, filename, encoding):
+    """Path of an up-to-date precompressed variant of source_dir/filename, or None."""
+    if os.path.splitext(filename)[1].lower() not in TEXT_EXTENSIONS:
+        return None
+    source = safe_join(source_dir, filename)
+    candidate = safe_join(target_dir, filename + EXTENSIONS[encoding])
+    if source is None or candidate is None:
+        return None
+    try:
+        if os.path.getmtime(candidate) >= os.path.getmtime(source):
+            return candidate
+    except OSError:
+        pass
+    return None
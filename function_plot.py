@@ -0,0 +1,287 @@
+"""
+Function plotting: expressions of x compiled once, sampled where it shows.
+
+    f = compile_expression("x^2 + 2x")       # cached by text
+    f(np.linspace(-10, 10, 201))             # a whole range at once
+
+An expression is parsed into a Python AST and checked against a whitelist
+before anything runs: numbers, x, the constants pi/e/tau, arithmetic,
+comparisons, and/or/not, "a if cond else b" and calls of the functions in
+FUNCTIONS (also spelled math.sin or np.sin). Anything else (names,
+attributes, subscripts, lambdas, keyword arguments, ...) is a ValueError,
+so user prompts can be plotted safely. "^" means power and "2x" / "3(x+1)"
+are products, the way people type them.
+
+The checked tree is rewritten for NumPy (a conditional becomes np.where,
+comparisons elementwise) and compiled to code evaluated over an array of
+x, with floating point errors coming back as nan/inf instead of raising.
+Without NumPy the unmodified tree is evaluated point by point with math.
+
+sample_function() starts from a uniform grid in screen space, bisects the
+intervals whose midpoint strays from the chord by more than a tolerance
+(curvature, or a jump) and then drops points the polyline does not need
+(flat stretches), within the same tolerance.
+"""
+import ast
+from functools import lru_cache
+import math
+import re
+
+try:
+    import numpy as np
+except ImportError:  # optional: expressions are evaluated point by point
+    np = None
+
+MAX_LENGTH = 200
+MAX_NODES = 120
+
+# name: (arity, NumPy function name, math function); arity None: two or more
+FUNCTIONS = {
+    "sin": (1, "sin", math.sin), "cos": (1, "cos", math.cos), "tan": (1, "tan", math.tan),
+    "asin": (1, "arcsin", math.asin), "acos": (1, "arccos", math.acos), "atan": (1, "arctan", math.atan),
+    "sinh": (1, "sinh", math.sinh), "cosh": (1, "cosh", math.cosh), "tanh": (1, "tanh", math.tanh),
+    "exp": (1, "exp", math.exp), "log": (1, "log", math.log), "log10": (1, "log10", math.log10),
+    "log2": (1, "log2", math.log2), "sqrt": (1, "sqrt", math.sqrt), "abs": (1, "abs", abs),
+    "floor": (1, "floor", math.floor), "ceil": (1, "ceil", math.ceil), "round": (1, "round", round),
+    "max": (None, "maximum", max), "min": (None, "minimum", min),
+}
+CONSTANTS = {"pi": math.pi, "e": math.e, "tau": math.tau}
+MODULES = ("math", "np", "numpy")
+
+_OPERATORS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow, ast.UAdd, ast.USub, ast.Not,
+              ast.And, ast.Or, ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE)
+_NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare, ast.IfExp, ast.Call, ast.Name,
+          ast.Attribute, ast.Constant, ast.Load) + _OPERATORS
+# 2x, 3(x + 1), 2pi, (x+1)(x-1), x(x+1): products; a digit inside a name (log10) is left alone
+_KEYWORD = r'(?!(?:if|else|and|or|not)\b)'
+_IMPLICIT = [(re.compile(r'(?<![\w.])(\d+(?:\.\d+)?)\s*' + _KEYWORD + r'(?=[a-z(])'), r'\1*'),
+             (re.compile(r'\)\s*' + _KEYWORD + r'(?=[\w(])'), ')*'),
+             (re.compile(r'\bx\s*(?=\()'), 'x*')]
+
+
+def normalize(text):
+    """The expression as Python: "^" to "**", implicit products made explicit."""
+    text = text.strip().replace("^", "**")
+    for pattern, replacement in _IMPLICIT:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def _function(node):
+    """The FUNCTIONS name a call refers to, or None."""
+    if isinstance(node, ast.Name):
+        return node.id if node.id in FUNCTIONS else None
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id in MODULES:
+        name = {"arcsin": "asin", "arccos": "acos", "arctan": "atan", "maximum": "max", "minimum": "min",
+                "fabs": "abs", "absolute": "abs"}.get(node.attr, node.attr)
+        return name if name in FUNCTIONS else None
+    return None
+
+
+def parse(text):
+    """The validated AST of an expression of x; ValueError if it is not one."""
+    if len(text) > MAX_LENGTH:
+        raise ValueError(f"expression longer than {MAX_LENGTH} characters")
+    try:
+        tree = ast.parse(normalize(text), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"not an expression: {text!r}") from e
+    nodes = list(ast.walk(tree))
+    if len(nodes) > MAX_NODES:
+        raise ValueError("expression too long")
+    calls = set()
+    for node in nodes:
+        if not isinstance(node, _NODES):
+            raise ValueError(f"{type(node).__name__} is not allowed in an expression")
+        if isinstance(node, ast.Constant) and (isinstance(node.value, bool) or not isinstance(node.value, (int, float))):
+            raise ValueError(f"{node.value!r} is not a number")
+        if isinstance(node, ast.Call):
+            name = _function(node.func)
+            if name is None:
+                raise ValueError("only the functions " + ", ".join(FUNCTIONS) + " can be called")
+            arity = FUNCTIONS[name][0]
+            if node.keywords or (len(node.args) != arity if arity else len(node.args) < 2):
+                raise ValueError(f"wrong arguments for {name}()")
+            calls.add(id(node.func))
+            calls.update(id(n) for n in ast.walk(node.func))
+        elif isinstance(node, (ast.Name, ast.Attribute)) and id(node) not in calls:
+            if not (isinstance(node, ast.Name) and (node.id == "x" or node.id in CONSTANTS)):
+                raise ValueError(f"unknown name in expression: {ast.unparse(node)}")
+    return tree
+
+
+class _Vectorize(ast.NodeTransformer):
+    """Rewrites a validated tree into NumPy calls (names resolve in _numpy_namespace())."""
+
+    def visit_Call(self, node):
+        self.generic_visit(node)
+        name = FUNCTIONS[_function(node.func)][1]
+        call = ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=node.args[:2], keywords=[])
+        for arg in node.args[2:]:
+            call = ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=[call, arg], keywords=[])
+        return call
+
+    def visit_IfExp(self, node):
+        self.generic_visit(node)
+        return self._call("where", node.test, node.body, node.orelse)
+
+    def visit_Compare(self, node):
+        self.generic_visit(node)
+        left, parts = node.left, []
+        for op, right in zip(node.ops, node.comparators):
+            parts.append(ast.Compare(left=left, ops=[op], comparators=[right]))
+            left = right
+        return self._reduce("logical_and", parts)
+
+    def visit_BoolOp(self, node):
+        self.generic_visit(node)
+        return self._reduce("logical_and" if isinstance(node.op, ast.And) else "logical_or", node.values)
+
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        return self._call("logical_not", node.operand) if isinstance(node.op, ast.Not) else node
+
+    def __init__(self):
+        self.constants = {}
+
+    def visit_Name(self, node):
+        if node.id in CONSTANTS:
+            return self._constant(CONSTANTS[node.id])
+        return node
+
+    def visit_Constant(self, node):
+        return self._constant(node.value)
+
+    def _constant(self, value):
+        # NumPy floats throughout: 9**9**9 or 1/0 give inf instead of raising (or running forever)
+        name = f"_{len(self.constants)}"
+        self.constants[name] = np.float64(value)
+        return ast.Name(id=name, ctx=ast.Load())
+
+    def _reduce(self, name, values):
+        result = values[0]
+        for value in values[1:]:
+            result = self._call(name, result, value)
+        return result
+
+    @staticmethod
+    def _call(name, *args):
+        return ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=list(args), keywords=[])
+
+
+class _Scalar(ast.NodeTransformer):
+    """Rewrites the calls of a validated tree to the math functions' names."""
+
+    def visit_Call(self, node):
+        self.generic_visit(node)
+        node.func = ast.Name(id=_function(node.func), ctx=ast.Load())
+        return node
+
+    def visit_Constant(self, node):
+        return ast.Constant(value=float(node.value))
+
+
+@lru_cache(maxsize=None)
+def _numpy_namespace():
+    namespace = {numpy_name: getattr(np, numpy_name) for _, numpy_name, _ in FUNCTIONS.values()}
+    namespace.update(where=np.where, logical_and=np.logical_and, logical_or=np.logical_or,
+                     logical_not=np.logical_not, __builtins__={})
+    return namespace
+
+
+_SCALAR_NAMESPACE = {name: spec[2] for name, spec in FUNCTIONS.items()}
+_SCALAR_NAMESPACE.update(CONSTANTS, __builtins__={})
+
+
+@lru_cache(maxsize=512)
+def compile_expression(text):
+    """
+    A callable mapping a float array of x to y (nan where undefined), for a
+    validated expression; ValueError if the text is not one. Compiled once
+    per text: later calls return the same callable.
+    """
+    tree = parse(text)
+    if np is None:
+        code = compile(ast.fix_missing_locations(_Scalar().visit(tree)), "<expression>", "eval")
+
+        def evaluate_points(xs):
+            ys = []
+            for x in xs:
+                try:
+                    ys.append(float(eval(code, _SCALAR_NAMESPACE, {"x": x})))
+                except (ArithmeticError, ValueError, TypeError):  # TypeError: a complex result
+                    ys.append(math.nan)
+            return ys
+        return evaluate_points
+
+    vectorize = _Vectorize()
+    code = compile(ast.fix_missing_locations(vectorize.visit(tree)), "<expression>", "eval")
+    namespace = dict(_numpy_namespace(), **vectorize.constants)
+
+    def evaluate(xs):
+        xs = np.asarray(xs, dtype=float)
+        with np.errstate(all="ignore"):
+            ys = eval(code, namespace, {"x": xs})
+        return np.broadcast_to(np.asarray(ys, dtype=float), xs.shape)
+    return evaluate
+
+
+def sample_function(f, x_range, to_screen, tolerance=0.5, start=201, depth=6, max_points=4000):
+    """
+    Points (x, y) of f chosen for drawing: start evenly spaced x, intervals
+    bisected (up to depth times) where the midpoint lies further than
+    tolerance (screen units) from the chord or only one end is defined, and
+    points dropped where the polyline stays within tolerance without them.
+    to_screen(x, y) maps arrays to screen coordinates (px, py). y is nan
+    where f is undefined. Needs NumPy.
+    """
+    lo, hi = x_range
+    xs = np.linspace(lo, hi, start)
+    ys = np.asarray(f(xs), dtype=float)
+    for _ in range(depth):
+        px, py = to_screen(xs, ys)
+        mid_x = (xs[:-1] + xs[1:]) / 2
+        mid_y = np.asarray(f(mid_x), dtype=float)
+        mid_px, mid_py = to_screen(mid_x, mid_y)
+        defined = np.isfinite(py)
+        with np.errstate(invalid="ignore"):
+            strays = np.hypot(mid_px - (px[:-1] + px[1:]) / 2, mid_py - (py[:-1] + py[1:]) / 2) > tolerance
+        split = np.where(defined[:-1] & defined[1:], strays, defined[:-1] != defined[1:])
+        if not split.any() or len(xs) + split.sum() > max_points:
+            break
+        order = np.argsort(np.concatenate([xs, mid_x[split]]), kind="stable")
+        xs = np.concatenate([xs, mid_x[split]])[order]
+        ys = np.concatenate([ys, mid_y[split]])[order]
+    return _drop_flat(xs, ys, to_screen, tolerance)
+
+
+def _drop_flat(xs, ys, to_screen, tolerance):
+    """
+    Drops points that sit close to the chord between their neighbours, never
+    two neighbours in one pass. Each pass may move the polyline by half the
+    tolerance left over from the passes before, so in all it moves by less
+    than tolerance (a straight stretch, costing nothing, ends as one segment).
+    """
+    left = tolerance
+    while len(xs) > 2:
+        px, py = to_screen(xs, ys)
+        ax, ay, bx, by = px[:-2], py[:-2], px[2:], py[2:]
+        cx, cy = px[1:-1], py[1:-1]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            off = np.abs((bx - ax) * (ay - cy) - (ax - cx) * (by - ay)) / np.hypot(bx - ax, by - ay)
+        flat = np.isfinite(off) & (off <= left / 2)
+        # of each run of flat points drop every other one
+        flat &= (np.arange(len(flat)) - _run_starts(flat)) % 2 == 0
+        if not flat.any():
+            break
+        left -= off[flat].max()
+        keep = np.ones(len(xs), dtype=bool)
+        keep[1:-1] = ~flat
+        xs, ys = xs[keep], ys[keep]
+    return xs, ys
+
+
+def _run_starts(mask):
+    """For each index, where the run of equal values it belongs to starts."""
+    starts = np.flatnonzero(np.concatenate([[True], mask[1:] != mask[:-1]]))
+    return starts[np.searchsorted(starts, np.arange(len(mask)), side="right") - 1]
@@ -0,0 +1,339 @@
+"""
+Indexed graphs for the traversal generators.
+
+Node ids (the strings of a prompt, usually) are numbered 0..n-1 once, in
+order of appearance, and the adjacency is kept in flat arrays:
+
+    graph = Graph.from_edges([("A", "B"), ("A", "C", 4)])
+    for slot in range(graph.offsets[i], graph.offsets[i + 1]):
+        graph.targets[slot]     # a neighbour of node i
+        graph.edge_of[slot]     # which of graph.edges leads there
+
+Neighbours keep the order their edges were given in. The traversals use a
+deque frontier and a bytearray of visited flags, so BFS and DFS are
+O(V + E) and Dijkstra O((V + E) log V), whatever the size of the graph.
+
+Grids are graphs too, but implicit ones: astar_grid() searches cells
+numbered r * cols + c straight from a bytearray of walls, so a 1000 x 1000
+grid needs no adjacency at all. Dense graphs come as distance matrices, for
+floyd_warshall(), which relaxes a whole matrix per intermediate vertex with
+NumPy when it is installed.
+"""
+from collections import deque
+import heapq
+import math
+
+try:
+    import numpy as np
+except ImportError:  # optional: floyd_warshall falls back to plain loops
+    np = None
+
+SQRT2 = math.sqrt(2)
+
+# h(dr, dc) from the row and column distances to the goal
+HEURISTICS = {
+    "manhattan": lambda dr, dc: dr + dc,
+    "euclidean": math.hypot,
+    "octile": lambda dr, dc: max(dr, dc) + (SQRT2 - 1) * min(dr, dc),
+    "chebyshev": max,
+    "zero": lambda dr, dc: 0,
+}
+TIE_BREAKS = ("h", "fifo", "lifo")
+
+
+class Graph:
+    __slots__ = ("ids", "index", "edges", "weights", "directed", "offsets", "targets", "edge_of")
+
+    def __init__(self, ids, edges, weights=None, directed=False):
+        """
+        ids: node ids, in index order. edges: (u, v) index pairs; weights:
+        one per edge (1 each if None). An undirected edge is listed once and
+        stored in both nodes' neighbour slots.
+        """
+        n = len(ids)
+        self.ids = list(ids)
+        self.index = {id: i for i, id in enumerate(self.ids)}
+        self.edges = list(edges)
+        self.weights = list(weights) if weights is not None else [1] * len(self.edges)
+        self.directed = directed
+
+        offsets = [0] * (n + 1)
+        for u, v in self.edges:
+            offsets[u + 1] += 1
+            if not directed:
+                offsets[v + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        fill = offsets[:n]
+        targets = [0] * offsets[n]
+        edge_of = [0] * offsets[n]
+        for e, (u, v) in enumerate(self.edges):
+            targets[fill[u]], edge_of[fill[u]] = v, e
+            fill[u] += 1
+            if not directed:
+                targets[fill[v]], edge_of[fill[v]] = u, e
+                fill[v] += 1
+        self.offsets, self.targets, self.edge_of = offsets, targets, edge_of
+
+    @classmethod
+    def from_edges(cls, edges, nodes=(), directed=False):
+        """
+        A graph from (u, v) or (u, v, weight) tuples of node ids. Nodes are
+        numbered in order of appearance, those in `nodes` first (so isolated
+        ones can be listed too).
+        """
+        index, ids, pairs, weights = {}, [], [], []
+        for node in nodes:
+            if node not in index:
+                index[node] = len(ids)
+                ids.append(node)
+        for edge in edges:
+            u, v = edge[0], edge[1]
+            if u not in index:
+                index[u] = len(ids)
+                ids.append(u)
+            if v not in index:
+                index[v] = len(ids)
+                ids.append(v)
+            pairs.append((index[u], index[v]))
+            weights.append(edge[2] if len(edge) > 2 else 1)
+        return cls(ids, pairs, weights, directed)
+
+    def neighbors(self, i):
+        """(neighbour, edge) pairs of node i, in edge order."""
+        targets, edge_of = self.targets, self.edge_of
+        return [(targets[slot], edge_of[slot]) for slot in range(self.offsets[i], self.offsets[i + 1])]
+
+    def bfs(self, source):
+        """
+        Breadth-first visits from source: yields (u, discovered) per visited
+        node, discovered being the (v, edge) pairs it adds to the queue.
+        """
+        targets, edge_of, offsets = self.targets, self.edge_of, self.offsets
+        seen = bytearray(len(self.ids))  # visited or queued
+        seen[source] = 1
+        queue = deque([source])
+        while queue:
+            u = queue.popleft()
+            discovered = []
+            for slot in range(offsets[u], offsets[u + 1]):
+                v = targets[slot]
+                if not seen[v]:
+                    seen[v] = 1
+                    queue.append(v)
+                    discovered.append((v, edge_of[slot]))
+            yield u, discovered
+
+    def dfs(self, source):
+        """
+        Depth-first visits from source with an explicit stack: yields
+        (u, pushed) per visited node, pushed being the (v, edge) pairs it
+        puts on the stack (last neighbour first, so the first is explored
+        first). A node may be pushed again before its first visit; the
+        later copy is skipped when popped.
+        """
+        targets, edge_of, offsets = self.targets, self.edge_of, self.offsets
+        visited = bytearray(len(self.ids))
+        stack = [source]
+        while stack:
+            u = stack.pop()
+            if visited[u]:
+                continue
+            visited[u] = 1
+            pushed = []
+            for slot in range(offsets[u + 1] - 1, offsets[u] - 1, -1):
+                v = targets[slot]
+                if not visited[v]:
+                    stack.append(v)
+                    pushed.append((v, edge_of[slot]))
+            yield u, pushed
+
+    def dijkstra(self, source):
+        """
+        Shortest distances from source, settling nodes nearest first (ties
+        by index): yields (u, dist, relaxed) per settled node, relaxed being
+        the (v, new_dist, edge) improvements it makes.
+        """
+        targets, edge_of, offsets, weights = self.targets, self.edge_of, self.offsets, self.weights
+        dist = [None] * len(self.ids)
+        settled = bytearray(len(self.ids))
+        dist[source] = 0
+        heap = [(0, source)]
+        while heap:
+            d, u = heapq.heappop(heap)
+            if settled[u]:
+                continue
+            settled[u] = 1
+            relaxed = []
+            for slot in range(offsets[u], offsets[u + 1]):
+                v = targets[slot]
+                if settled[v]:
+                    continue
+                e = edge_of[slot]
+                nd = d + weights[e]
+                if dist[v] is None or nd < dist[v]:
+                    dist[v] = nd
+                    heapq.heappush(heap, (nd, v))
+                    relaxed.append((v, nd, e))
+            yield u, d, relaxed
+
+    def levels(self, source):
+        """Hop count from source per node (ignoring direction); None where unreachable."""
+        level = [None] * len(self.ids)
+        level[source] = 0
+        if self.directed:
+            undirected = Graph(self.ids, self.edges, self.weights)
+            targets, offsets = undirected.targets, undirected.offsets
+        else:
+            targets, offsets = self.targets, self.offsets
+        queue = deque([source])
+        while queue:
+            u = queue.popleft()
+            for slot in range(offsets[u], offsets[u + 1]):
+                v = targets[slot]
+                if level[v] is None:
+                    level[v] = level[u] + 1
+                    queue.append(v)
+        return level
+
+    def matrix(self):
+        """The n x n distance matrix of the edges: 0 on the diagonal, math.inf where there is no edge."""
+        n = len(self.ids)
+        dist = [[0 if i == j else math.inf for j in range(n)] for i in range(n)]
+        for (u, v), w in zip(self.edges, self.weights):
+            if u != v:
+                dist[u][v] = min(dist[u][v], w)
+                if not self.directed:
+                    dist[v][u] = min(dist[v][u], w)
+        return dist
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __repr__(self):
+        kind = "directed" if self.directed else "undirected"
+        return f"<Graph {len(self.ids)} nodes, {len(self.edges)} {kind} edges>"
+
+
+def astar_grid(walls, cols, start, goal, heuristic="manhattan", diagonal=False, tie_break="h"):
+    """
+    A* over a grid of len(walls) // cols rows, walls[i] true where cell i
+    is blocked. Moves go to the 4 neighbours at cost 1, and with diagonal
+    to the corners at cost sqrt(2) (never past a blocked side).
+
+    heuristic names one of HEURISTICS. All of them are admissible for 4-way
+    moves; with diagonal ones "manhattan" overestimates, so its paths may
+    come out longer. tie_break orders cells of equal f: "h" takes the one
+    nearer the goal (the newest of those), "fifo" the oldest, "lifo" the
+    newest. The open set is a heap with lazy deletion: a cell is pushed
+    again when its g improves and stale entries are skipped when popped.
+
+    Returns (path, cost, expanded): the cells from start to goal and the
+    path's cost (empty and None when the goal is unreachable), and every
+    cell in the order it was expanded.
+    """
+    h_of = HEURISTICS[heuristic]
+    if tie_break not in TIE_BREAKS:
+        raise ValueError(f"tie_break must be one of {', '.join(TIE_BREAKS)}")
+    if walls[start] or walls[goal]:
+        return [], None, []
+    rows = len(walls) // cols
+    # a border of walls around the grid spares the bounds checks; closed
+    # cells are marked blocked too (the corner checks read the walls alone)
+    width = cols + 2
+    padded = bytearray(b"\x01") * (width * (rows + 2))
+    for r in range(rows):
+        padded[(r + 1) * width + 1:(r + 2) * width - 1] = walls[r * cols:(r + 1) * cols]
+    blocked = bytearray(padded)
+    moves = [(-1, 0, 1), (0, -1, 1), (0, 1, 1), (1, 0, 1)]
+    if diagonal:
+        moves += [(-1, -1, SQRT2), (-1, 1, SQRT2), (1, -1, SQRT2), (1, 1, SQRT2)]
+    moves = [(dr * width + dc, dr, dc, cost) for dr, dc, cost in moves]
+    goal_r, goal_c = divmod(goal, cols)
+    start_r, start_c = divmod(start, cols)
+    row_distance = [abs(r - goal_r) for r in range(rows)]
+    col_distance = [abs(c - goal_c) for c in range(cols)]
+    by_h = tie_break == "h"
+    order = 1 if tie_break == "fifo" else -1
+
+    source, target = (start_r + 1) * width + start_c + 1, (goal_r + 1) * width + goal_c + 1
+    g = [math.inf] * len(padded)
+    parent = [-1] * len(padded)
+    g[source] = 0
+    h = h_of(row_distance[start_r], col_distance[start_c])
+    heap = [(h, h if by_h else 0, 0, source)]
+    pushed = 0
+    expanded = []
+    pop, push = heapq.heappop, heapq.heappush
+    while heap:
+        u = pop(heap)[3]
+        if blocked[u]:
+            continue
+        blocked[u] = 1
+        r, c = divmod(u, width)
+        r, c = r - 1, c - 1
+        expanded.append(r * cols + c)
+        if u == target:
+            break
+        gu = g[u]
+        for step, dr, dc, cost in moves:
+            v = u + step
+            if blocked[v] or (dr and dc and (padded[u + dr * width] or padded[u + dc])):
+                continue
+            gv = gu + cost
+            if gv < g[v]:
+                g[v] = gv
+                parent[v] = u
+                h = h_of(row_distance[r + dr], col_distance[c + dc])
+                pushed += 1
+                push(heap, (gv + h, h if by_h else 0, order * pushed, v))
+
+    if g[target] == math.inf:
+        return [], None, expanded
+    path = [target]
+    while path[-1] != source:
+        path.append(parent[path[-1]])
+    path.reverse()
+    return [(u // width - 1) * cols + u % width - 1 for u in path], g[target], expanded
+
+
+def floyd_warshall(matrix, vectorized=None):
+    """
+    All-pairs shortest distances of a square distance matrix (math.inf
+    where there is no edge, no negative weights), one intermediate vertex
+    at a time: yields (k, changed, values) per k, changed being the flat
+    indices i * n + j that got shorter through k and values their new
+    distances (floats with NumPy, the matrix's own numbers without).
+
+    Each k relaxes the whole matrix at once with NumPy broadcasting,
+    D = min(D, D[:, k] + D[k, :]); vectorized=False (or no NumPy) runs the
+    same relaxation as plain loops instead. Both yield the same diffs.
+    """
+    if vectorized is None:
+        vectorized = np is not None
+    n = len(matrix)
+    if vectorized:
+        dist = np.array(matrix, dtype=float).reshape(n, n)
+        for k in range(n):
+            through = dist[:, k, None] + dist[None, k, :]
+            shorter = through < dist
+            changed = np.flatnonzero(shorter)
+            dist[shorter] = through[shorter]
+            yield k, changed.tolist(), dist.ravel()[changed].tolist()
+        return
+    dist = [list(row) for row in matrix]
+    for k in range(n):
+        row_k = dist[k]
+        changed, values = [], []
+        for i in range(n):
+            row_i = dist[i]
+            d_ik = row_i[k]
+            if d_ik == math.inf:
+                continue
+            for j in range(n):
+                d = d_ik + row_k[j]
+                if d < row_i[j]:
+                    row_i[j] = d
+                    changed.append(i * n + j)
+                    values.append(d)
+        yield k, changed, values
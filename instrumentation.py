@@ -0,0 +1,47 @@
+"""
+Per-request timing instrumentation.
+
+Code on the request path wraps its stages in timed("name"); the durations are
+returned to the client in a Server-Timing header (visible in the browser's
+network panel), e.g.
+
+    Server-Timing: intent;dur=0.012, formula_match;dur=0.004
+"""
+import time
+from contextlib import contextmanager
+
+from flask import g, has_request_context
+
+
+def record_timing(name, seconds):
+    """Adds one named duration to the current request (no-op outside a request)."""
+    if has_request_context():
+        g.setdefault("timings", []).append((name, seconds))
+
+
+@contextmanager
+def timed(name):
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_timing(name, time.perf_counter() - t0)
+
+
+def request_timings():
+    """[(name, seconds)] recorded so far in the current request."""
+    return list(g.get("timings", [])) if has_request_context() else []
+
+
+def server_timing_header(timings):
+    return ", ".join(f"{name};dur={seconds * 1000:.3f}" for name, seconds in timings)
+
+
+def init_app(app):
+    """Emits the recorded timings of every request as a Server-Timing header."""
+    @app.after_request
+    def add_server_timing(response):
+        timings = request_timings()
+        if timings:
+            response.headers["Server-Timing"] = server_timing_header(timings)
+        return response
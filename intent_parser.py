@@ -1,5 +1,111 @@
 import re
 
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+
+def _literal_prefixes(pattern):
+    """Leading literal text of each top-level alternative of a regex ('' when it has none)."""
+    parsed = sre_parse.parse(pattern)
+    items = parsed.data
+    if len(items) == 1 and items[0][0] is sre_parse.BRANCH:
+        alternatives = [alt.data for alt in items[0][1][1]]
+    else:
+        alternatives = [items]
+    prefixes = []
+    for alt in alternatives:
+        chars = []
+        for op, av in alt:
+            if op is not sre_parse.LITERAL:
+                break
+            chars.append(chr(av))
+        prefixes.append("".join(chars))
+    return prefixes
+
+
+class PriorityMatcher:
+    """
+    Matches an ordered list of regexes against a text in a single pass.
+
+    The literal prefix of every pattern alternative goes into one Aho-Corasick
+    automaton. Scanning the text once yields every position where some
+    pattern could start; only those patterns are then confirmed with an
+    anchored match. The result is the lowest-index (highest-priority) pattern
+    found, which is exactly what running re.search() for each pattern in order
+    and stopping at the first hit returns.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        self._compiled = [re.compile(pattern) for pattern in self.patterns]
+        self._unanchored = []  # patterns without a literal prefix: always searched
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        for index, pattern in enumerate(self.patterns):
+            prefixes = _literal_prefixes(pattern)
+            if "" in prefixes:
+                self._unanchored.append(index)
+                continue
+            for prefix in set(prefixes):
+                self._add(prefix, index)
+        self._link()
+
+    @classmethod
+    def from_keywords(cls, keywords):
+        return cls(re.escape(keyword) for keyword in keywords)
+
+    def _add(self, word, index):
+        state = 0
+        for ch in word:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append((len(word), index))
+
+    def _link(self):
+        # Breadth-first failure links; each state also reports its suffixes' hits
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+        for outputs in self._out:
+            outputs.sort(key=lambda hit: hit[1])
+
+    def first(self, text):
+        """Index of the first pattern (in priority order) found in text, or None."""
+        best = None
+        for index in self._unanchored:
+            if self._compiled[index].search(text):
+                best = index
+                break
+        goto, fail, out, compiled = self._goto, self._fail, self._out, self._compiled
+        state = 0
+        for pos, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for length, index in out[state]:
+                if best is not None and index >= best:
+                    break
+                if compiled[index].match(text, pos - length + 1):
+                    best = index
+                    break
+        return best
+
+
 class RuleBasedIntentParser:
     def __init__(self):
         # Map specific keywords to their template keys (as defined in app.py)
@@ -51,6 +157,7 @@ class RuleBasedIntentParser:
             (r'max\s*subarray|kadane', 'max_subarray'),
 
             # Graph / Backtracking
+            (r'dijkstra|shortest\s*path', 'dynamic:dijkstra'),
             (r'bellman-?ford', 'bellman_ford'),
             (r'floyd-?warshall', 'floyd_warshall'),
             (r'a\*|a\s*star', 'astar'),
@@ -71,6 +178,7 @@ class RuleBasedIntentParser:
             (r'electrolysis', 'electrolysis'),
 
             # General Charts
+            (r'plot\s+(?:of\s+)?(?:(?:y|f\(x\))\s*=\s*)?[^,;]*\bx\b|graph\s+(?:of\s+)?(?:(?:y|f\(x\))\s*=\s*)?[^,;]*\bx\b', 'plot'),
             (r'graph|plot|chart', 'graph'),
             (r'pie', 'pie'),
             (r'bar', 'bar_race'),
@@ -108,6 +216,11 @@ class RuleBasedIntentParser:
             "capillary": "capillary_action"
         }
 
+        # Both tables compiled once into single-pass matchers (priority order preserved)
+        self._pattern_matcher = PriorityMatcher(pattern for pattern, _ in self.patterns)
+        self._topic_keys = list(self.advanced_topics.values())
+        self._topic_matcher = PriorityMatcher.from_keywords(self.advanced_topics)
+
     def parse(self, text):
         """
         Parses the natural language text and returns a dictionary with:
@@ -136,19 +249,17 @@ class RuleBasedIntentParser:
         matched_key = None
         
         # Check standard patterns first
-        for pattern, key in self.patterns:
-            if re.search(pattern, text_lower):
-                matched_key = key
-                break
+        index = self._pattern_matcher.first(text_lower)
+        if index is not None:
+            matched_key = self.patterns[index][1]
         
         # Fallback: Check advanced topic strict matching if no pattern matched
         if not matched_key:
-            for keyword, topic_key in self.advanced_topics.items():
-                if keyword in text_lower:
-                    # In app.py this triggers the dynamic generator
-                    # We will return a special prefix to indicate dynamic generation needed
-                    matched_key = f"dynamic:{topic_key}"
-                    break
+            index = self._topic_matcher.first(text_lower)
+            if index is not None:
+                # In app.py this triggers the dynamic generator
+                # We will return a special prefix to indicate dynamic generation needed
+                matched_key = f"dynamic:{self._topic_keys[index]}"
 
         return {
             "template_key": matched_key,
@@ -59,6 +59,8 @@ function initBrowseLibrary() {
     browseBtn.addEventListener('click', () => {
         modal.style.display = 'block';
         renderTopics(LIBRARY_TOPICS);
+        // One batch request for every topic, so picking one loads instantly (main.js)
+        if (typeof prefetchScenes === 'function') prefetchScenes(LIBRARY_TOPICS.map(topic => topic.prompt));
         if (searchInput) searchInput.focus();
     });
 
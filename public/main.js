@@ -7,6 +7,8 @@ let lastTime = 0;
 let mediaRecorder = null;
 let recordedChunks = [];
 let spokenActions = new Set(); // Track which narratives have been spoken
+let bufferedUntil = Infinity; // Playback can't pass this while a streamed scene is still arriving
+let sceneIdentity = null; // { key, seed, description, level, language } of a generated scene, for deltas
 
 // --- DOM ELEMENTS ---
 const promptInput = document.getElementById('promptInput');
@@ -36,6 +38,12 @@ const levelSelect = document.getElementById('levelSelect');
 
 // --- CONSTANTS ---
 const API_URL = ''; // Uses relative path for production
+// 'compact' = columnar payload, ~40% smaller uncompressed but no smaller once
+// gzipped (see bench_compact_format.py); worth it where responses aren't compressed.
+// 'binary' = typed-array container for very large scenes (scene_binary.py).
+// 'ndjson' = long generated scenes (full course) are streamed and start playing
+// after the first time window; everything else still comes back as plain JSON.
+const SCENE_FORMAT = 'ndjson';
 
 // --- INITIALIZATION ---
 function init() {
@@ -49,10 +57,10 @@ function init() {
     timelineScrub.addEventListener('input', handleScrub);
 
     languageSelect.addEventListener('change', () => {
-        if (scene) handleGenerate(true);
+        if (scene) handleOptionsChange();
     });
     levelSelect.addEventListener('change', () => {
-        if (scene) handleGenerate(true);
+        if (scene) handleOptionsChange();
     });
 
     speedRange.addEventListener('input', () => {
@@ -156,16 +164,37 @@ async function handleGenerate(isRefresh = false) {
         language: languageSelect.value,
         level: levelSelect.value
     };
+    // A level/language change keeps the current scene's data (same seed)
+    if (isRefresh && scene && scene.seed !== undefined) options.seed = scene.seed;
+
+    // Library topics are prefetched in one batch when the browser opens (used once)
+    const prefetched = !isRefresh && takePrefetched(text, options);
+    if (prefetched) {
+        loadScene(prefetched.scene);
+        sceneIdentity = prefetched.key ? { key: prefetched.key, description: text, ...options, seed: scene.seed } : null;
+        saveLastViewed(text, options);
+        return;
+    }
 
     if (!isRefresh) showLoader(true);
     try {
-        const res = await fetch(`${API_URL}/generate/scenes`, {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({ description: text, options: options })
-        });
+        // GET so the browser can revalidate with If-None-Match (304 = no body)
+        const query = new URLSearchParams({ description: text, ...options, format: SCENE_FORMAT });
+        const res = await fetch(`${API_URL}/generate/scenes?${query}`);
+        const identity = res.headers.get('X-Scene-Key')
+            ? { key: res.headers.get('X-Scene-Key'), description: text, ...options }
+            : null;
+
+        if (res.ok && res.headers.get('Content-Type') === NDJSON_MIMETYPE) {
+            await loadSceneStream(res);
+            if (identity) sceneIdentity = { ...identity, seed: scene.seed };
+            saveLastViewed(text, options);
+            return;
+        }
 
-        const data = await res.json();
+        const data = res.headers.get('Content-Type') === BINARY_SCENE_MIMETYPE
+            ? decodeBinaryScene(await res.arrayBuffer())
+            : expandCompactScene(await res.json());
 
         if (!res.ok) {
             showError(data.error || 'Generation failed');
@@ -176,19 +205,8 @@ async function handleGenerate(isRefresh = false) {
         }
 
         loadScene(data);
-
-        // Save to Last Viewed for Dashboard
-        try {
-            const lastViewed = {
-                name: text,
-                timestamp: new Date().toISOString(),
-                language: options.language,
-                level: options.level
-            };
-            localStorage.setItem('lastViewed', JSON.stringify(lastViewed));
-        } catch (e) {
-            console.error('Failed to save history', e);
-        }
+        if (identity) sceneIdentity = { ...identity, seed: scene.seed };
+        saveLastViewed(text, options);
     } catch (err) {
         showError('Network error. Is Flask running?');
         console.error(err);
@@ -197,9 +215,308 @@ async function handleGenerate(isRefresh = false) {
     }
 }
 
+// A level/language switch on a generated scene fetches only what changed
+// (/generate/scenes/delta) and patches the scene in place, keeping playback going
+async function handleOptionsChange() {
+    if (!sceneIdentity) return handleGenerate(true);
+    const level = levelSelect.value;
+    const language = languageSelect.value;
+    const { key, seed, description } = sceneIdentity;
+    const query = new URLSearchParams({
+        key, description, level, language,
+        from_level: sceneIdentity.level,
+        from_language: sceneIdentity.language
+    });
+    if (seed !== undefined) query.set('seed', seed);
+    try {
+        const res = await fetch(`${API_URL}/generate/scenes/delta?${query}`);
+        const data = await res.json();
+        if (!res.ok) return showError(data.error || 'Update failed');
+        if (data.patch) {
+            applyScenePatch(scene, data.patch);
+            refreshScene();
+        } else {
+            loadScene(data);
+        }
+        sceneIdentity = { ...sceneIdentity, level, language };
+    } catch (err) {
+        showError('Network error. Is Flask running?');
+        console.error(err);
+    }
+}
+
+// Save to Last Viewed for Dashboard
+function saveLastViewed(text, options) {
+    try {
+        const lastViewed = {
+            name: text,
+            timestamp: new Date().toISOString(),
+            language: options.language,
+            level: options.level
+        };
+        localStorage.setItem('lastViewed', JSON.stringify(lastViewed));
+    } catch (e) {
+        console.error('Failed to save history', e);
+    }
+}
+
+// --- STREAMED SCENES ---
+// `format=ndjson` answers with one JSON part per line (scene_stream.py): header,
+// objects, then actions in time windows ("until"), then end. The scene is
+// loaded as soon as the first window is in; playback waits at bufferedUntil.
+const NDJSON_MIMETYPE = 'application/x-ndjson';
+
+async function readNdjson(res, onPart) {
+    const reader = res.body.getReader();
+    const decoder = new TextDecoder();
+    let pending = '';
+    for (;;) {
+        const { done, value } = await reader.read();
+        pending += decoder.decode(value, { stream: !done });
+        const lines = pending.split('\n');
+        pending = lines.pop();
+        lines.forEach(line => { if (line) onPart(JSON.parse(line)); });
+        if (done) break;
+    }
+    if (pending) onPart(JSON.parse(pending));
+}
+
+async function loadSceneStream(res) {
+    const streamed = { objects: [], actions: [] };
+    let loaded = false;
+    let durationKnown = false;
+    await readNdjson(res, part => {
+        if (part.kind === 'header' || part.kind === 'end') {
+            Object.assign(streamed, part.scene);
+            if (part.scene.duration !== undefined) durationKnown = true;
+        } else if (part.kind === 'objects') streamed.objects.push(...part.objects);
+        else if (part.kind === 'actions') {
+            streamed.actions.push(...part.actions);
+            // Duration is usually only known at the end; until then it is what has arrived
+            const ends = part.actions.map(a => a.end);
+            if (!durationKnown) streamed.duration = Math.max(streamed.duration || 0, part.until, ...ends);
+            if (!loaded) {
+                loaded = true;
+                loadScene(streamed, part.until);
+                showLoader(false);
+            } else if (scene === streamed) {
+                bufferedUntil = part.until;
+                appendBreakdown(part.actions);
+            }
+        }
+        if (part.kind === 'end') {
+            if (!loaded) {
+                loaded = true;
+                loadScene(streamed);
+            } else if (scene === streamed) {
+                bufferedUntil = Infinity;
+                jsonEditor.value = JSON.stringify(scene, null, 2);
+            }
+        }
+        if (scene === streamed) timelineScrub.max = scene.duration;
+    });
+}
+
+// --- BATCH PREFETCH ---
+// POST /generate/scenes/batch answers with one NDJSON line per distinct scene,
+// in the order they are ready: { indices, status, key?, scene | error }.
+const prefetchedScenes = new Map(); // prefetchKey -> { scene, key }
+
+function prefetchKey(description, options) {
+    return JSON.stringify([description.trim().toLowerCase(), options.level, options.language]);
+}
+
+async function fetchSceneBatch(requests, onResult) {
+    const res = await fetch(`${API_URL}/generate/scenes/batch`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ requests })
+    });
+    if (!res.ok) throw new Error((await res.json()).error || 'Batch generation failed');
+    await readNdjson(res, onResult);
+}
+
+async function prefetchScenes(prompts) {
+    const options = { language: languageSelect.value, level: levelSelect.value };
+    const wanted = prompts.filter(prompt => !prefetchedScenes.has(prefetchKey(prompt, options)));
+    if (wanted.length === 0) return;
+    try {
+        await fetchSceneBatch(wanted.map(description => ({ description, options })), result => {
+            if (result.status !== 200) return;
+            result.indices.forEach(i => {
+                prefetchedScenes.set(prefetchKey(wanted[i], options), { scene: result.scene, key: result.key });
+            });
+        });
+    } catch (err) {
+        console.error('Prefetch failed', err);
+    }
+}
+
+function takePrefetched(description, options) {
+    const key = prefetchKey(description, options);
+    const entry = prefetchedScenes.get(key);
+    if (!entry) return null;
+    prefetchedScenes.delete(key);
+    // Identical prompts share one scene object; the player patches scenes in place
+    return { ...entry, scene: structuredClone(entry.scene) };
+}
+
+// --- SCENE PATCHES ---
+// { scene, objects: {id: patch}, actions: {id: patch} } from scene_patch.py;
+// each patch is an RFC 7396 merge patch (null removes a key).
+function mergePatch(target, patch) {
+    for (const [key, value] of Object.entries(patch)) {
+        if (value === null) delete target[key];
+        else if (typeof value === 'object' && !Array.isArray(value) &&
+                 typeof target[key] === 'object' && target[key] !== null && !Array.isArray(target[key])) {
+            mergePatch(target[key], value);
+        } else target[key] = value;
+    }
+    return target;
+}
+
+function applyScenePatch(target, patch) {
+    mergePatch(target, patch.scene);
+    for (const kind of ['objects', 'actions']) {
+        for (const item of target[kind] || []) {
+            if (patch[kind][item.id]) mergePatch(item, patch[kind][item.id]);
+        }
+    }
+    return target;
+}
+
+// --- COMPACT SCENE FORMAT ---
+// Expands the columnar `format=compact` payload (scene_codec.encode_compact)
+// back into the usual { objects: [...], actions: [...] } scene. Anything else
+// (plain scenes, error bodies) is returned unchanged.
+
+// [shape, ...values] -> dict; "$key" values index `strings`, "@key" values are nested records,
+// "=key" marks a plain key that itself starts with a marker
+function expandRecord(rec, shapes, strings) {
+    const shape = shapes[rec[0]];
+    const out = {};
+    for (let i = 0; i < shape.length; i++) {
+        const key = shape[i];
+        const value = rec[i + 1];
+        if (key[0] === '$') out[key.slice(1)] = strings[value];
+        else if (key[0] === '@') out[key.slice(1)] = expandRecord(value, shapes, strings);
+        else if (key[0] === '=') out[key.slice(1)] = value;
+        else out[key] = value;
+    }
+    return out;
+}
+
+function expandCompactScene(data) {
+    if (!data || data.format !== 'compact') return data;
+    if (data.version !== 1) throw new Error(`Unsupported compact scene version ${data.version}`);
+    const { strings, shapes } = data;
+
+    const rows = (table, stringCols, numberCols, nested) => {
+        const count = table[nested].length;
+        const items = new Array(count);
+        for (let i = 0; i < count; i++) {
+            const item = {};
+            for (const key of stringCols) {
+                if (table[key][i] !== null) item[key] = strings[table[key][i]];
+            }
+            for (const key of numberCols) {
+                if (table[key][i] !== null) item[key] = table[key][i];
+            }
+            if (table[nested][i] !== null) item[nested] = expandRecord(table[nested][i], shapes, strings);
+            if (table.extra[i] !== null) Object.assign(item, expandRecord(table.extra[i], shapes, strings));
+            items[i] = item;
+        }
+        return items;
+    };
+
+    return {
+        ...data.scene,
+        objects: rows(data.objects, ['id', 'type'], [], 'props'),
+        actions: rows(data.actions, ['id', 'objectId', 'type'], ['start', 'end'], 'params')
+    };
+}
+
+// --- BINARY SCENE FORMAT ---
+// Reads the `format=binary` container (scene_binary.py) straight out of the
+// response ArrayBuffer: typed columns through a DataView, strings decoded once.
+const BINARY_SCENE_MIMETYPE = 'application/vnd.algoviz.scene';
+const BINARY_ABSENT = 0xFFFFFFFF;
+
+function decodeBinaryScene(buffer) {
+    const view = new DataView(buffer);
+    const magic = String.fromCharCode(view.getUint8(0), view.getUint8(1), view.getUint8(2), view.getUint8(3));
+    const version = view.getUint16(4, true);
+    if (magic !== 'AVZB' || version !== 1) throw new Error(`Unsupported binary scene (${magic} v${version})`);
+    const m = view.getUint32(8, true);
+    const n = view.getUint32(12, true);
+    const count = view.getUint32(16, true);
+    const stringBytes = view.getUint32(20, true);
+    const metaBytes = view.getUint32(24, true);
+    const pad = (len) => len + ((4 - (len % 4)) % 4);
+
+    let pos = 28;
+    const utf8 = new TextDecoder();
+    const blobStart = pos + 4 * (count + 1);
+    const strings = new Array(count);
+    for (let i = 0; i < count; i++) {
+        const start = view.getUint32(pos + 4 * i, true);
+        const end = view.getUint32(pos + 4 * (i + 1), true);
+        strings[i] = utf8.decode(new Uint8Array(buffer, blobStart + start, end - start));
+    }
+    pos = blobStart + pad(stringBytes);
+    const meta = JSON.parse(utf8.decode(new Uint8Array(buffer, pos, metaBytes)));
+    pos += pad(metaBytes);
+
+    // Column k of `size` 4-byte values starting at `base`
+    const u32 = (base, k, size, i) => view.getUint32(base + 4 * (k * size + i), true);
+    const f32 = (base, k, size, i) => view.getFloat32(base + 4 * (k * size + i), true);
+    const objBase = pos;
+    const actBase = objBase + 4 * 4 * m;
+    const { shapes } = meta;
+
+    const objects = new Array(m);
+    for (let i = 0; i < m; i++) {
+        const obj = {};
+        ['id', 'type'].forEach((key, k) => {
+            const s = u32(objBase, k, m, i);
+            if (s !== BINARY_ABSENT) obj[key] = strings[s];
+        });
+        const rec = meta.objects.props[i];
+        if (rec !== null) {
+            const props = expandRecord(rec, shapes, strings);
+            ['x', 'y'].forEach((key, k) => {
+                const v = f32(objBase, 2 + k, m, i);
+                if (!Number.isNaN(v)) props[key] = v;
+            });
+            obj.props = props;
+        }
+        if (meta.objects.extra[i] !== null) Object.assign(obj, expandRecord(meta.objects.extra[i], shapes, strings));
+        objects[i] = obj;
+    }
+
+    const actions = new Array(n);
+    for (let i = 0; i < n; i++) {
+        const action = {};
+        ['id', 'objectId', 'type'].forEach((key, k) => {
+            const s = u32(actBase, k, n, i);
+            if (s !== BINARY_ABSENT) action[key] = strings[s];
+        });
+        ['start', 'end'].forEach((key, k) => {
+            const v = f32(actBase, 3 + k, n, i);
+            if (!Number.isNaN(v)) action[key] = v;
+        });
+        if (meta.actions.params[i] !== null) action.params = expandRecord(meta.actions.params[i], shapes, strings);
+        if (meta.actions.extra[i] !== null) Object.assign(action, expandRecord(meta.actions.extra[i], shapes, strings));
+        actions[i] = action;
+    }
+
+    return { ...meta.scene, objects, actions };
+}
+
 // --- SCENE MANAGEMENT ---
-function loadScene(newScene) {
+function loadScene(newScene, buffered = Infinity) {
     scene = newScene;
+    bufferedUntil = buffered;
 
     // Update UI
     jsonEditor.value = JSON.stringify(scene, null, 2);
@@ -220,6 +537,17 @@ function loadScene(newScene) {
     resetPlayback();
 }
 
+// Redraws everything derived from the scene after an in-place change, keeping the playback position
+function refreshScene() {
+    jsonEditor.value = JSON.stringify(scene, null, 2);
+    setCode(scene.code || "# No code available for this scene.");
+    timelineScrub.max = scene.duration;
+    renderBreakdown(scene);
+    currentTime = Math.min(currentTime, scene.duration);
+    updateTimeline();
+    render(currentTime);
+}
+
 function renderBreakdown(scene) {
     breakdownList.innerHTML = '';
     if (!scene.actions || scene.actions.length === 0) {
@@ -227,8 +555,10 @@ function renderBreakdown(scene) {
         return;
     }
 
-    const actions = [...scene.actions].sort((a, b) => a.start - b.start);
+    appendBreakdown([...scene.actions].sort((a, b) => a.start - b.start));
+}
 
+function appendBreakdown(actions) {
     actions.forEach(action => {
         const div = document.createElement('div');
         div.className = 'breakdown-item';
@@ -252,6 +582,7 @@ function handleApplyJson() {
     try {
         const parsed = JSON.parse(jsonEditor.value);
         loadScene(parsed);
+        sceneIdentity = null;
     } catch (e) {
         showError('Invalid JSON');
     }
@@ -290,7 +621,7 @@ function resetPlayback() {
 }
 
 function handleScrub() {
-    currentTime = parseFloat(timelineScrub.value);
+    currentTime = Math.min(parseFloat(timelineScrub.value), bufferedUntil);
     // When scrubbing, we don't want TTS to fire crazily
     // So we mark all previous actions as "spoken" to avoid backlog
     scene.actions.forEach(a => {
@@ -312,7 +643,9 @@ function loop(timestamp) {
 
     currentTime += dt;
 
-    if (currentTime >= scene.duration) {
+    if (currentTime >= bufferedUntil) {
+        currentTime = bufferedUntil; // Still streaming: hold until the next window arrives
+    } else if (currentTime >= scene.duration) {
         currentTime = scene.duration;
         pause();
     }
@@ -357,6 +690,28 @@ function checkNarrative() {
     });
 }
 
+// Puts obj at fraction p of a path's length. track is the path's arc-length
+// table from the server (scene_paths.py): [x, y, length, x, y, length, ...].
+function placeAlong(obj, track, p) {
+    const count = track.length / 3;
+    const target = p * track[track.length - 1];
+    // Last entry at or before the target length
+    let low = 0, high = count - 1;
+    while (low < high) {
+        const middle = (low + high + 1) >> 1;
+        if (track[3 * middle + 2] <= target) low = middle;
+        else high = middle - 1;
+    }
+    const i = 3 * low;
+    obj.x = track[i];
+    obj.y = track[i + 1];
+    if (low === count - 1) return;
+    const span = track[i + 5] - track[i + 2];
+    const f = span > 0 ? (target - track[i + 2]) / span : 0;
+    obj.x += (track[i + 3] - track[i]) * f;
+    obj.y += (track[i + 4] - track[i + 1]) * f;
+}
+
 // --- RENDERING CORE ---
 function render(t) {
     if (!scene) return;
@@ -416,16 +771,38 @@ function render(t) {
                 const targetOp = action.params.opacity;
                 obj.opacity = startOp + (targetOp - startOp) * p;
                 break;
+            case 'values':
+                // Keyframe of a bars object: the whole array at once, no tween
+                obj.values = action.params.values;
+                obj.sorted = action.params.sorted;
+                break;
+            case 'cells':
+                // Keyframe of a tiles object: every cell of the tile at once
+                obj.cells = action.params.cells;
+                break;
+            case 'diff':
+                // Changed cells of a heatmap, on top of the earlier diffs (the
+                // props' values are copied before the first one of the frame)
+                if (!obj.diffs) obj.values = obj.values.slice();
+                for (let i = 0; i < action.params.at.length; i++) {
+                    obj.values[action.params.at[i]] = action.params.to[i];
+                }
+                obj.diffs = (obj.diffs || 0) + 1;
+                break;
             case 'followPath':
-                const pathId = action.params.pathId;
-                const pathObj = scene.objects.find(o => o.id === pathId);
+                const pathObj = objectStates[action.params.pathId];
                 if (pathObj && pathObj.type === 'path') {
-                    const pathEl = document.createElementNS("http://www.w3.org/2000/svg", "path");
-                    pathEl.setAttribute("d", pathObj.props.d);
-                    const len = pathEl.getTotalLength();
-                    const pt = pathEl.getPointAtLength(p * len);
-                    obj.x = pt.x;
-                    obj.y = pt.y;
+                    if (pathObj.track) {
+                        placeAlong(obj, pathObj.track, p);
+                    } else {
+                        // No arc-length table (path data the server could not read)
+                        const pathEl = document.createElementNS("http://www.w3.org/2000/svg", "path");
+                        pathEl.setAttribute("d", pathObj.d);
+                        const len = pathEl.getTotalLength();
+                        const pt = pathEl.getPointAtLength(p * len);
+                        obj.x = pt.x;
+                        obj.y = pt.y;
+                    }
                 }
                 break;
         }
@@ -437,6 +814,10 @@ function render(t) {
     });
 }
 
+const pathShapes = new Map(); // path object id -> { d, path } last parsed
+const tileBitmaps = new Map(); // tiles object id -> { cells, canvas } last painted
+const heatmapBitmaps = new Map(); // heatmap object id -> { scene, diffs, canvas } last painted
+
 function drawObject(ctx, obj) {
     if (obj.opacity <= 0) return;
 
@@ -503,9 +884,14 @@ function drawObject(ctx, obj) {
         ctx.fillText(obj.text, obj.x, obj.y);
     }
     else if (obj.type === 'path') {
-        const p = new Path2D(obj.d);
+        // Parsed once per path data, not once per frame
+        let shape = pathShapes.get(obj.id);
+        if (!shape || shape.d !== obj.d) {
+            shape = { d: obj.d, path: new Path2D(obj.d) };
+            pathShapes.set(obj.id, shape);
+        }
         ctx.lineWidth = obj.width || 2;
-        ctx.stroke(p);
+        ctx.stroke(shape.path);
     }
     else if (obj.type === 'arrow') {
         let x1 = obj.points[0];
@@ -534,6 +920,81 @@ function drawObject(ctx, obj) {
         ctx.lineTo(x2 - headlen * Math.cos(angle + Math.PI / 6), y2 - headlen * Math.sin(angle + Math.PI / 6));
         ctx.stroke();
     }
+    else if (obj.type === 'bars') {
+        // One rect per value (thousands of them): a single path per color, no shadows
+        ctx.shadowBlur = 0;
+        const values = obj.values, n = values.length;
+        const slot = obj.width / n, w = slot > 3 ? slot - 1 : slot;
+        const scale = obj.height / obj.max;
+        const [lo, hi] = obj.sorted || [0, 0];
+        const fillRange = (from, to, color) => {
+            if (from >= to) return;
+            ctx.fillStyle = color;
+            ctx.beginPath();
+            for (let i = from; i < to; i++) {
+                const h = values[i] * scale;
+                ctx.rect(obj.x + i * slot, obj.y - h, w, h);
+            }
+            ctx.fill();
+        };
+        fillRange(0, lo, obj.color);
+        fillRange(lo, hi, obj.sortedColor || obj.color);
+        fillRange(hi, n, obj.color);
+    }
+    else if (obj.type === 'tiles') {
+        // A block of grid cells, one palette index per char: painted into a
+        // cols x rows bitmap once per cells string, then scaled to the tile
+        let bitmap = tileBitmaps.get(obj.id);
+        if (!bitmap || bitmap.cells !== obj.cells) {
+            const tile = bitmap ? bitmap.canvas : document.createElement('canvas');
+            tile.width = obj.cols;
+            tile.height = obj.rows;
+            const tileCtx = tile.getContext('2d');
+            const image = tileCtx.createImageData(obj.cols, obj.rows);
+            const rgb = obj.palette.map(hex => [1, 3, 5].map(i => parseInt(hex.slice(i, i + 2), 16)));
+            for (let i = 0; i < obj.cells.length; i++) {
+                const [r, g, b] = rgb[obj.cells.charCodeAt(i) - 48];
+                image.data[4 * i] = r;
+                image.data[4 * i + 1] = g;
+                image.data[4 * i + 2] = b;
+                image.data[4 * i + 3] = 255;
+            }
+            tileCtx.putImageData(image, 0, 0);
+            bitmap = { cells: obj.cells, canvas: tile };
+            tileBitmaps.set(obj.id, bitmap);
+        }
+        ctx.shadowBlur = 0;
+        ctx.imageSmoothingEnabled = false;
+        ctx.drawImage(bitmap.canvas, obj.x, obj.y, obj.width, obj.height);
+    }
+    else if (obj.type === 'heatmap') {
+        // An n x n matrix, one pixel per value from colors[0] (0) to colors[1]
+        // (max), scaled up; repainted only when another diff has been applied
+        let bitmap = heatmapBitmaps.get(obj.id);
+        if (!bitmap || bitmap.scene !== scene || bitmap.diffs !== (obj.diffs || 0)) {
+            const n = obj.n;
+            const map = bitmap ? bitmap.canvas : document.createElement('canvas');
+            map.width = n;
+            map.height = n;
+            const mapCtx = map.getContext('2d');
+            const image = mapCtx.createImageData(n, n);
+            const [low, high, none] = [...obj.colors, obj.noneColor].map(hex => [1, 3, 5].map(i => parseInt(hex.slice(i, i + 2), 16)));
+            for (let i = 0; i < n * n; i++) {
+                const v = obj.values[i];
+                const f = v === null ? 0 : Math.min(v / obj.max, 1);
+                for (let c = 0; c < 3; c++) {
+                    image.data[4 * i + c] = v === null ? none[c] : low[c] + (high[c] - low[c]) * f;
+                }
+                image.data[4 * i + 3] = 255;
+            }
+            mapCtx.putImageData(image, 0, 0);
+            bitmap = { scene, diffs: obj.diffs || 0, canvas: map };
+            heatmapBitmaps.set(obj.id, bitmap);
+        }
+        ctx.shadowBlur = 0;
+        ctx.imageSmoothingEnabled = false;
+        ctx.drawImage(bitmap.canvas, obj.x, obj.y, obj.width, obj.height);
+    }
     else if (obj.type === 'axis') {
         ctx.shadowBlur = 0;
         ctx.lineWidth = 1;
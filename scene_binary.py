@@ -0,0 +1,194 @@
+"""
+Binary scene container (format=binary) for very large scenes.
+
+Timeline and position data travel as little-endian typed arrays that the
+browser reads in place through a DataView (decodeBinaryScene in
+public/main.js); strings live in one dictionary section. Everything
+irregular (top-level fields, params/props records) is the compact format's
+record encoding, carried as a small JSON section.
+
+    header   magic "AVZB" (4s) | version (u16) | flags (u16) | objects m (u32)
+             | actions n (u32) | strings (u32) | string bytes (u32) | meta bytes (u32)
+    strings  (count + 1) x u32 byte offsets, then UTF-8 bytes   (padded to 4)
+    meta     UTF-8 JSON {"scene", "shapes", "objects": {"props", "extra"},
+                          "actions": {"params", "extra"}}        (padded to 4)
+    objects  id u32[m] | type u32[m] | x f32[m] | y f32[m]
+    actions  id u32[n] | objectId u32[n] | type u32[n] | start f32[n] | end f32[n]
+
+u32 columns are indices into the string dictionary. An absent key is
+0xFFFFFFFF in a u32 column and NaN in an f32 column. props.x/props.y are
+moved into the f32 columns when they are numbers. Numbers in f32 columns
+come back as Float32 (about 7 significant digits).
+"""
+import json
+import math
+import struct
+from array import array
+
+from scene_codec import ACTION_COLUMNS, ACTION_NUMBERS, OBJECT_COLUMNS, CompactEncoder, decode_record
+
+BINARY_FORMAT = "binary"
+MAGIC = b"AVZB"
+VERSION = 1
+BINARY_MIMETYPE = "application/vnd.algoviz.scene"
+HEADER = struct.Struct("<4sHHIIIII")
+ABSENT = 0xFFFFFFFF
+POSITION_KEYS = ("x", "y")
+
+
+def _pad(data):
+    return data + b"\0" * (-len(data) % 4)
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _little_endian(values):
+    if struct.pack("=I", 1) != struct.pack("<I", 1):
+        values.byteswap()
+    return values.tobytes()
+
+
+def encode_binary(scene):
+    """Packs a scene into the binary container (bytes)."""
+    encoder = CompactEncoder()
+    objects = scene.get("objects", [])
+    actions = scene.get("actions", [])
+
+    object_strings = {key: array("I") for key in OBJECT_COLUMNS}
+    positions = {key: array("f") for key in POSITION_KEYS}
+    props_records, object_extra = [], []
+    for obj in objects:
+        for key in OBJECT_COLUMNS:
+            value = obj.get(key)
+            object_strings[key].append(ABSENT if value is None else encoder.string(value))
+        props = obj.get("props")
+        if isinstance(props, dict):
+            props = dict(props)
+            for key in POSITION_KEYS:
+                value = props.get(key)
+                positions[key].append(props.pop(key) if _is_number(value) else math.nan)
+            props_records.append(encoder.record(props))
+        else:
+            for key in POSITION_KEYS:
+                positions[key].append(math.nan)
+            props_records.append(None)
+        extra = {key: value for key, value in obj.items() if key not in OBJECT_COLUMNS + ("props",)}
+        if "props" in obj and not isinstance(props, dict):
+            extra["props"] = props
+        object_extra.append(encoder.record(extra) if extra else None)
+
+    action_strings = {key: array("I") for key in ACTION_COLUMNS}
+    times = {key: array("f") for key in ACTION_NUMBERS}
+    params_records, action_extra = [], []
+    fixed = ACTION_COLUMNS + ACTION_NUMBERS + ("params",)
+    for action in actions:
+        for key in ACTION_COLUMNS:
+            value = action.get(key)
+            action_strings[key].append(ABSENT if value is None else encoder.string(value))
+        extra = {key: value for key, value in action.items() if key not in fixed}
+        for key in ACTION_NUMBERS:
+            value = action.get(key)
+            if _is_number(value):
+                times[key].append(value)
+            else:
+                times[key].append(math.nan)
+                if value is not None:
+                    extra[key] = value
+        params = action.get("params")
+        if isinstance(params, dict):
+            params_records.append(encoder.record(params))
+        else:
+            params_records.append(None)
+            if "params" in action:
+                extra["params"] = params
+        action_extra.append(encoder.record(extra) if extra else None)
+
+    meta = json.dumps({
+        "scene": {key: value for key, value in scene.items() if key not in ("objects", "actions")},
+        "shapes": encoder.shapes,
+        "objects": {"props": props_records, "extra": object_extra},
+        "actions": {"params": params_records, "extra": action_extra},
+    }, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    encoded_strings = [s.encode("utf-8") for s in encoder.strings]
+    offsets = array("I", [0])
+    for s in encoded_strings:
+        offsets.append(offsets[-1] + len(s))
+    string_bytes = b"".join(encoded_strings)
+
+    parts = [
+        HEADER.pack(MAGIC, VERSION, 0, len(objects), len(actions), len(encoded_strings), len(string_bytes), len(meta)),
+        _little_endian(offsets),
+        _pad(string_bytes),
+        _pad(meta),
+    ]
+    parts += [_little_endian(object_strings[key]) for key in OBJECT_COLUMNS]
+    parts += [_little_endian(positions[key]) for key in POSITION_KEYS]
+    parts += [_little_endian(action_strings[key]) for key in ACTION_COLUMNS]
+    parts += [_little_endian(times[key]) for key in ACTION_NUMBERS]
+    return b"".join(parts)
+
+
+def decode_binary(data):
+    """Inverse of encode_binary (the reference for decodeBinaryScene in public/main.js)."""
+    magic, version, _, m, n, count, string_len, meta_len = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Not a version {VERSION} binary scene")
+    pos = HEADER.size
+    offsets = struct.unpack_from(f"<{count + 1}I", data, pos)
+    pos += 4 * (count + 1)
+    blob = bytes(data[pos:pos + string_len])
+    strings = [blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(count)]
+    pos += string_len + (-string_len % 4)
+    meta = json.loads(bytes(data[pos:pos + meta_len]).decode("utf-8"))
+    pos += meta_len + (-meta_len % 4)
+
+    def column(kind, size):
+        nonlocal pos
+        values = struct.unpack_from(f"<{size}{kind}", data, pos)
+        pos += 4 * size
+        return values
+
+    obj_cols = {key: column("I", m) for key in OBJECT_COLUMNS}
+    obj_pos = {key: column("f", m) for key in POSITION_KEYS}
+    act_cols = {key: column("I", n) for key in ACTION_COLUMNS}
+    act_nums = {key: column("f", n) for key in ACTION_NUMBERS}
+
+    shapes = meta["shapes"]
+
+    def record(rec):
+        return decode_record(rec, shapes, strings)
+
+    objects = []
+    for i in range(m):
+        obj = {key: strings[obj_cols[key][i]] for key in OBJECT_COLUMNS if obj_cols[key][i] != ABSENT}
+        rec = meta["objects"]["props"][i]
+        if rec is not None:
+            props = record(rec)
+            for key in POSITION_KEYS:
+                if not math.isnan(obj_pos[key][i]):
+                    props[key] = obj_pos[key][i]
+            obj["props"] = props
+        if meta["objects"]["extra"][i] is not None:
+            obj.update(record(meta["objects"]["extra"][i]))
+        objects.append(obj)
+
+    actions = []
+    for i in range(n):
+        action = {key: strings[act_cols[key][i]] for key in ACTION_COLUMNS if act_cols[key][i] != ABSENT}
+        for key in ACTION_NUMBERS:
+            if not math.isnan(act_nums[key][i]):
+                action[key] = act_nums[key][i]
+        rec = meta["actions"]["params"][i]
+        if rec is not None:
+            action["params"] = record(rec)
+        if meta["actions"]["extra"][i] is not None:
+            action.update(record(meta["actions"]["extra"][i]))
+        actions.append(action)
+
+    scene = dict(meta["scene"])
+    scene["objects"] = objects
+    scene["actions"] = actions
+    return scene
@@ -0,0 +1,100 @@
+"""
+In-process LRU cache of serialized scenes with a byte budget.
+
+Entries are the JSON response bytes of generated scenes, keyed by the
+canonical generator inputs (intent key, positional args such as the seed
+index, and the resolved keyword arguments: difficulty, language, prompt
+parameters). A hit is served without generating or serializing anything.
+Least recently used entries are evicted once the cached bytes exceed the
+budget. An entry is charged all its bytes, compressed variants included
+(EncodedScene.nbytes); recharge() it when a variant is added.
+"""
+import threading
+from collections import OrderedDict
+
+DEFAULT_BUDGET = 64 * 1024 * 1024
+
+
+def _nbytes(payload):
+    nbytes = getattr(payload, "nbytes", None)
+    return len(payload) if nbytes is None else nbytes
+
+
+class SceneCache:
+    def __init__(self, max_bytes=DEFAULT_BUDGET):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (payload, bytes charged)
+        self._lock = threading.Lock()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Cached bytes for key (marking it most recently used), or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, payload):
+        """Stores payload; entries larger than the whole budget are not cached."""
+        nbytes = _nbytes(payload)
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= old[1]
+            self._entries[key] = (payload, nbytes)
+            self.size += nbytes
+            self._evict()
+
+    def recharge(self, key):
+        """Charges key's entry for the bytes it holds now (it grew a variant), evicting to stay in budget."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            payload, charged = entry
+            nbytes = _nbytes(payload)
+            self._entries.move_to_end(key)
+            self._entries[key] = (payload, nbytes)
+            self.size += nbytes - charged
+            if nbytes > self.max_bytes:
+                del self._entries[key]
+                self.size -= nbytes
+                self.evictions += 1
+            self._evict()
+
+    def _evict(self):
+        while self.size > self.max_bytes:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self.size -= nbytes
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.size,
+                "maxBytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,196 @@
+import hashlib
+import json
+
+import compression
+
+JSON_MIMETYPE = "application/json"
+
+
+def encode_json(scene):
+    """Serializes a scene exactly like flask.jsonify does (compact, sorted keys, ASCII)."""
+    return json.dumps(scene, separators=(",", ":"), sort_keys=True, ensure_ascii=True).encode("ascii")
+
+
+def content_hash(payload):
+    """Strong validator for a serialized scene (used as its ETag)."""
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class EncodedScene:
+    """
+    Serialized scene bytes together with their content hash, computed once.
+    Compressed variants are produced on first request and kept alongside;
+    nbytes counts them too.
+    """
+
+    __slots__ = ("data", "etag", "mimetype", "_variants")
+
+    def __init__(self, data, etag=None, mimetype=JSON_MIMETYPE):
+        self.data = data
+        self.etag = etag or content_hash(data)
+        self.mimetype = mimetype
+        self._variants = {}
+
+    def compressed(self, encoding):
+        variant = self._variants.get(encoding)
+        if variant is None:
+            variant = self._variants[encoding] = compression.compress(self.data, encoding)
+        return variant
+
+    @property
+    def nbytes(self):
+        return len(self.data) + sum(len(variant) for variant in list(self._variants.values()))
+
+    @classmethod
+    def from_scene(cls, scene):
+        return cls(encode_json(scene))
+
+    def __len__(self):
+        return len(self.data)
+
+    def __eq__(self, other):
+        return isinstance(other, EncodedScene) and self.data == other.data
+
+    def __repr__(self):
+        return f"<EncodedScene {len(self.data)} bytes etag={self.etag}>"
+
+
+# --- Compact wire format (opt-in: format=compact) ---
+#
+# {"format": "compact", "version": 1,
+#  "strings": [...],            interned strings (ids, types, colors, fonts, ...)
+#  "shapes": [[key, ...], ...], key layouts of the params/props dicts
+#  "scene": {...},              every other top-level field, unchanged
+#  "objects": {"id": [s], "type": [s], "props": [rec], "extra": [rec|null]},
+#  "actions": {"id": [s], "objectId": [s], "type": [s], "start": [n], "end": [n],
+#              "params": [rec|null], "extra": [rec|null]}}
+#
+# [s] are indices into "strings". A record is [shape index, value, ...] with one
+# value per key of the shape: "$key" holds a string index, "@key" a nested
+# record, any other key a plain JSON value ("=key" when the key itself starts
+# with one of these markers, or is empty). "extra" records carry whatever
+# other keys an object/action has (narrative, codeLine, ...), and props/params
+# that are not dicts. null in a column means the key is absent.
+
+COMPACT_FORMAT = "compact"
+COMPACT_VERSION = 1
+OBJECT_COLUMNS = ("id", "type")
+ACTION_COLUMNS = ("id", "objectId", "type")
+ACTION_NUMBERS = ("start", "end")
+# prefixes a plain key must not start with (escaped by PLAIN_MARK)
+MARKERS = ("$", "@", "=")
+PLAIN_MARK = "="
+
+
+class CompactEncoder:
+    def __init__(self):
+        self.strings = []
+        self.string_index = {}
+        self.shapes = []
+        self.shape_index = {}
+
+    def string(self, value):
+        index = self.string_index.get(value)
+        if index is None:
+            index = self.string_index[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+    def record(self, mapping):
+        keys = []
+        values = []
+        for key, value in mapping.items():
+            if isinstance(value, str):
+                keys.append("$" + key)
+                values.append(self.string(value))
+            elif isinstance(value, dict):
+                keys.append("@" + key)
+                values.append(self.record(value))
+            else:
+                keys.append(PLAIN_MARK + key if key[:1] in MARKERS or not key else key)
+                values.append(value)
+        keys = tuple(keys)
+        shape = self.shape_index.get(keys)
+        if shape is None:
+            shape = self.shape_index[keys] = len(self.shapes)
+            self.shapes.append(list(keys))
+        return [shape] + values
+
+    def columns(self, items, strings, numbers, nested):
+        fixed = set(strings) | set(numbers) | {nested}
+        table = {key: [] for key in strings + numbers + (nested, "extra")}
+        for item in items:
+            for key in strings:
+                value = item.get(key)
+                table[key].append(None if value is None else self.string(value))
+            for key in numbers:
+                table[key].append(item.get(key))
+            value = item.get(nested)
+            table[nested].append(self.record(value) if isinstance(value, dict) else None)
+            # anything else under the nested key travels as a plain extra value
+            extra = {key: value for key, value in item.items()
+                     if key not in fixed or (key == nested and not isinstance(value, dict))}
+            table["extra"].append(self.record(extra) if extra else None)
+        return table
+
+
+def encode_compact(scene):
+    """Columnar, string-interned form of a scene (see the format notes above)."""
+    encoder = CompactEncoder()
+    objects = encoder.columns(scene.get("objects", []), OBJECT_COLUMNS, (), "props")
+    actions = encoder.columns(scene.get("actions", []), ACTION_COLUMNS, ACTION_NUMBERS, "params")
+    return {
+        "format": COMPACT_FORMAT,
+        "version": COMPACT_VERSION,
+        "strings": encoder.strings,
+        "shapes": encoder.shapes,
+        "scene": {key: value for key, value in scene.items() if key not in ("objects", "actions")},
+        "objects": objects,
+        "actions": actions,
+    }
+
+
+def decode_record(rec, shapes, strings):
+    """The dict a CompactEncoder record stands for."""
+    out = {}
+    for key, value in zip(shapes[rec[0]], rec[1:]):
+        if key[:1] == "$":
+            out[key[1:]] = strings[value]
+        elif key[:1] == "@":
+            out[key[1:]] = decode_record(value, shapes, strings)
+        elif key[:1] == PLAIN_MARK:
+            out[key[1:]] = value
+        else:
+            out[key] = value
+    return out
+
+
+def decode_compact(data):
+    """Inverse of encode_compact (the reference for the decoder in public/main.js)."""
+    strings = data["strings"]
+    shapes = data["shapes"]
+
+    def record(rec):
+        return decode_record(rec, shapes, strings)
+
+    def rows(table, strings_cols, number_cols, nested):
+        items = []
+        for i in range(len(table[nested])):
+            item = {}
+            for key in strings_cols:
+                if table[key][i] is not None:
+                    item[key] = strings[table[key][i]]
+            for key in number_cols:
+                if table[key][i] is not None:
+                    item[key] = table[key][i]
+            if table[nested][i] is not None:
+                item[nested] = record(table[nested][i])
+            if table["extra"][i] is not None:
+                item.update(record(table["extra"][i]))
+            items.append(item)
+        return items
+
+    scene = dict(data["scene"])
+    scene["objects"] = rows(data["objects"], OBJECT_COLUMNS, (), "props")
+    scene["actions"] = rows(data["actions"], ACTION_COLUMNS, ACTION_NUMBERS, "params")
+    return scene
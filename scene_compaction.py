@@ -0,0 +1,246 @@
+"""
+Timeline compaction: drops the actions of a scene that cannot change what
+is rendered, and merges tweens that simply continue one another.
+
+The renderer (render() in public/main.js) folds the actions in start order
+(ties keep their order) over the objects' props. Each action touches some
+channels of its object:
+
+    tweened   translate (x, y), scale, rotate (rotation), fade (opacity):
+              value + (target - value) * progress
+    applied   diff (at, to): changes some cells of a heatmap, on top of
+              the earlier diffs, so it is never a no-op nor overwritten
+    set       every other param (color, values, text, ...), taken at start
+
+Only silent actions (no narrative, no codeLine) are candidates, since the
+narrator and the code highlight read the action list itself. A silent
+action goes when each channel it touches is
+
+    a no-op        a set to the value the channel already holds, or a tween
+                   to the value it holds once every earlier action on that
+                   channel has finished
+    overwritten    a set followed by another set of the channel that
+                   starts at the same time
+
+and two back-to-back silent tweens of the same channels that move at the
+same speed become one. Silent actions on objects that do not exist go too.
+
+Every rule looks at a single object's actions, so compacting parts of a
+scene that each hold all the actions of their objects gives the same
+actions as compacting the whole scene. Objects moved by followPath are
+left as they are.
+"""
+import math
+
+TWEENED = {"scale": "scale", "rotate": "rotation", "fade": "opacity"}
+DEFAULTS = {"x": 0, "y": 0, "opacity": 1, "scale": 1, "rotation": 0}
+_TWEEN = {key: ("tween", key) for key in DEFAULTS}
+_UNSET = object()
+
+
+def channels(action):
+    """
+    [(channel, target)] of one action: ("tween", prop) for tweened props,
+    ("apply", key) for the params of a diff, ("set", key) for the rest.
+    """
+    type = action.get("type")
+    params = action.get("params") or {}
+    if type == "diff":
+        return [(("apply", key), value) for key, value in params.items()]
+    if type == "translate":
+        to = params.get("to") or {}
+        touched = [(_TWEEN["x"], to.get("x")), (_TWEEN["y"], to.get("y"))]
+        skip = "to"
+    elif type in TWEENED:
+        skip = TWEENED[type]
+        target = params.get(skip)
+        # the renderer leaves rotation alone when the target is missing
+        touched = [] if type == "rotate" and target is None else [(_TWEEN[skip], target)]
+    else:
+        touched, skip = [], None
+    for key, value in params.items():
+        if key != skip:
+            touched.append((("set", key), value))
+    return touched
+
+
+def _number(value):
+    """The renderer's number for a prop or target (None computes as NaN, like undefined); None if not numeric."""
+    if value is None:
+        return math.nan
+    # exact types: bool is an int too, but true is no number in a scene
+    return float(value) if value.__class__ is int or value.__class__ is float else None
+
+
+def _same(a, b):
+    # 1, 1.0 and True are equal in Python but not the same JSON
+    return type(a) is type(b) and a == b
+
+
+def _silent(action, keep_ids):
+    # an id the narrator has to see stays on every action that carries it
+    return "narrative" not in action and "codeLine" not in action and action.get("id") not in keep_ids
+
+
+class _Tween:
+    """One tweened channel after the actions kept so far."""
+    __slots__ = ("value", "settled", "last")
+
+    def __init__(self, value):
+        self.value = value          # once all of them have finished (None: not a number)
+        self.settled = -math.inf    # when the last of them finishes
+        self.last = None            # (index in kept, settled by its start?, value at its start)
+
+    def finish(self, target, start, end):
+        target = _number(target)
+        if self.value is not None and target is not None:
+            # p = 1, in the renderer's float arithmetic
+            self.value = self.value + (target - self.value) * 1.0
+        else:
+            self.value = None
+        # a negative duration never finishes (its progress clamps to 0)
+        self.settled = max(self.settled, end) if end >= start else math.inf
+
+
+def _redundant(touched, start, end, props, tweens, sets, overwritten):
+    for channel, target in touched:
+        kind, key = channel
+        if kind == "apply":
+            return False
+        if kind == "set":
+            if channel in overwritten or _same(sets.get(channel, props.get(key, _UNSET)), target):
+                continue
+            return False
+        tween = tweens.get(channel)
+        value, settled = (tween.value, tween.settled) if tween else (_number(props.get(key, DEFAULTS[key])), -math.inf)
+        if not (end > start and settled <= start and value is not None and value == _number(target)):
+            return False
+    return True
+
+
+def _merge(kept, tweens, action, touched):
+    """
+    Folds a silent tween into the kept one it continues (same channels, back
+    to back, same speed). Returns the channels' finished values, or None.
+    """
+    if not touched or touched[0][0][0] != "tween" or touched[-1][0][0] != "tween":
+        return None
+    last = tweens[touched[0][0]].last if touched[0][0] in tweens else None
+    if last is None:
+        return None
+    index = last[0]
+    position, previous, previous_touched = kept[index]
+    if (previous.get("type") != action.get("type") or "narrative" in previous or "codeLine" in previous
+            or [c for c, _ in previous_touched] != [c for c, _ in touched]):
+        return None
+    a_start, a_end, b_end = previous["start"], previous["end"], action["end"]
+    if not a_start < a_end == action["start"] < b_end:
+        return None
+    finished = {}
+    for (channel, a), (_, b) in zip(previous_touched, touched):
+        last_index, settled, v = tweens[channel].last
+        a, b = _number(a), _number(b)
+        if last_index != index or not settled or None in (v, a, b) or not all(map(math.isfinite, (v, a, b))):
+            return None
+        if not math.isclose((a - v) / (a_end - a_start), (b - a) / (b_end - a_end), rel_tol=1e-9, abs_tol=1e-12):
+            return None
+        finished[channel] = v + (b - v) * 1.0
+    kept[index] = (position, dict(previous, end=b_end, params=action["params"]), touched)
+    return finished
+
+
+def _overwritten(actions, n):
+    """The channels set by the actions after actions[n] that start with it."""
+    start, channels_set = actions[n][1]["start"], set()
+    for _, later, touched in actions[n + 1:]:
+        if later["start"] != start:
+            break
+        channels_set.update(channel for channel, _ in touched if channel[0] == "set")
+    return channels_set
+
+
+def _compact_object(props, actions, keep_ids):
+    """
+    Compacts one object's (position, action, touched) triples, in fold order.
+    Each decision looks only at the actions kept before it (and at sets
+    starting with it, which stay overwritten even when dropped themselves),
+    so one pass leaves nothing more to drop.
+    """
+    tweens, sets, kept = {}, {}, []
+    final = len(actions) - 1
+    for n, (position, action, touched) in enumerate(actions):
+        start, end = action["start"], action["end"]
+
+        if _silent(action, keep_ids):
+            overwritten = _overwritten(actions, n) if n < final and actions[n + 1][1]["start"] == start else ()
+            if _redundant(touched, start, end, props, tweens, sets, overwritten):
+                continue
+            finished = _merge(kept, tweens, action, touched)
+            if finished is not None:
+                for channel, value in finished.items():
+                    tweens[channel].value = value
+                    tweens[channel].settled = max(tweens[channel].settled, end)
+                continue
+
+        for channel, target in touched:
+            if channel[0] == "set":
+                sets[channel] = target
+                continue
+            if channel[0] == "apply":
+                continue
+            tween = tweens.get(channel)
+            if tween is None:
+                tween = tweens[channel] = _Tween(_number(props.get(channel[1], DEFAULTS[channel[1]])))
+            began = (len(kept), tween.settled <= start, tween.value)
+            tween.finish(target, start, end)
+            tween.last = began
+        kept.append((position, action, touched))
+    return kept
+
+
+def compact_actions(objects, actions):
+    """The actions of a scene made of `objects`, compacted; the rest keep their order."""
+    props = {obj["id"]: obj.get("props") or {} for obj in objects}
+    pinned = {action.get("objectId") for action in actions if action.get("type") == "followPath"}
+    keep_ids = {action.get("id") for action in actions if "narrative" in action or "codeLine" in action}
+    by_object = {}
+    for position, action in enumerate(actions):
+        by_object.setdefault(action.get("objectId"), []).append((position, action, None))
+
+    result = [None] * len(actions)
+    for object_id, own in by_object.items():
+        if object_id in pinned:
+            kept = own
+        elif object_id not in props:
+            kept = [item for item in own if not _silent(item[1], keep_ids)]
+        elif len(own) == 1:
+            # nothing before it, nothing to merge with
+            position, action, _ = own[0]
+            redundant = _silent(action, keep_ids) and _redundant(channels(action), action["start"], action["end"],
+                                                                 props[object_id], {}, {}, ())
+            kept = () if redundant else own
+        else:
+            own.sort(key=lambda item: item[1]["start"])
+            kept = _compact_object(props[object_id], [(position, action, channels(action))
+                                                      for position, action, _ in own], keep_ids)
+        for position, action, _ in kept:
+            result[position] = action
+    return [action for action in result if action is not None]
+
+
+def compact_scene(scene):
+    """
+    The scene with its actions compacted. A scene that loses actions comes
+    back as a new dict (the given one is left alone) whose metadata records
+    "compaction": {"before": n, "after": m}; otherwise the same scene does.
+    """
+    actions = scene.get("actions")
+    if not actions:
+        return scene
+    compacted = compact_actions(scene.get("objects") or [], actions)
+    if len(compacted) == len(actions):
+        return scene
+    compacted_scene = dict(scene, actions=compacted)
+    compacted_scene["metadata"] = dict(scene.get("metadata") or {},
+                                       compaction={"before": len(actions), "after": len(compacted)})
+    return compacted_scene
@@ -0,0 +1,195 @@
+"""
+Dispatch table from intent keys to scene generators.
+
+Generator functions register themselves with a decorator, together with
+the metadata the server needs to call them:
+
+    @GENERATORS.register("bubble", seeded=True, algo_type="bubble")
+    def generate_algo_template(idx, difficulty="beginner", language="python", algo_type="bubble", seed=None):
+        ...
+
+The table is filled once when the generator modules are imported, so serving
+a request is a single dict lookup instead of a chain of key comparisons.
+"""
+import inspect
+import random
+
+import scene_stream
+from code_generator import LANGUAGES, LEVELS
+from scene_compaction import compact_scene
+from scene_paths import compact_objects, compact_paths, followed_paths
+
+SEED_RANGE = 2 ** 32
+
+
+def _fallback(func, keyword, choices, usual):
+    """What an unsupported value of keyword becomes: func's own default, else usual, else the first choice."""
+    if not choices:
+        return None
+    try:
+        default = inspect.signature(func).parameters[keyword].default
+    except (KeyError, TypeError, ValueError):
+        default = None
+    if default in choices:
+        return default
+    return usual if usual in choices else choices[0]
+
+
+class GeneratorSpec:
+    """
+    One registered generator and how to call it.
+
+    levels/languages: values the generator accepts for difficulty/language
+        (empty when it takes no such argument). Anything else falls back to
+        the generator's own default ("beginner"/"python" when it has none
+        among them, then the first entry).
+    cacheable: the scene depends only on the canonical inputs, so its
+        serialized form may be cached.
+    seeded: the generator takes a seed keyword and draws its data from a
+        random.Random(seed) of its own. The seed is picked per request
+        unless the client sends one, is echoed in the scene as "seed", and
+        also supplies the idx (seed % 100). Unseeded generators get idx 0.
+    indexed: the generator takes a leading idx argument at all.
+    params: {keyword: extractor(description)} pulled from the prompt; an
+        extractor returning None leaves the generator's default in place.
+    arg: keyword that receives the suffix of a "family:suffix" intent key.
+    fixed: keyword arguments passed on every call.
+    stream: optional streaming variant taking the same arguments and
+        yielding scene_stream parts (see scene_stream.py). Its actions parts
+        must already be compacted, each holding every action of the objects
+        it touches, so that the stream assembles to the generated scene.
+        Paths are compacted here, as they are sent; a path followed by
+        followPath must come in the objects parts right before the actions
+        part that follows it, which is when its track is known.
+    """
+
+    def __init__(self, key, func, levels=LEVELS, languages=LANGUAGES, cacheable=True,
+                 seeded=False, indexed=True, params=None, arg=None, fixed=None, stream=None):
+        self.key = key
+        self.func = func
+        self.levels = tuple(levels)
+        self.languages = tuple(languages)
+        self.cacheable = cacheable
+        self.seeded = seeded
+        self.indexed = indexed
+        self.params = dict(params or {})
+        self.arg = arg
+        self.fixed = dict(fixed or {})
+        self.stream = stream
+        self.default_level = _fallback(func, "difficulty", self.levels, "beginner")
+        self.default_language = _fallback(func, "language", self.languages, "python")
+
+    def inputs(self, description="", level="beginner", language="python", arg=None, seed=None):
+        """
+        Canonical (args, kwargs) for one request: the idx plus every keyword
+        (seed included) after fallbacks, so equal inputs produce equal scenes.
+        """
+        kwargs = dict(self.fixed)
+        if self.levels:
+            kwargs["difficulty"] = level if level in self.levels else self.default_level
+        if self.languages:
+            kwargs["language"] = language if language in self.languages else self.default_language
+        for name, extract in self.params.items():
+            value = extract(description)
+            if value is not None:
+                kwargs[name] = value
+        if self.arg and arg is not None:
+            kwargs[self.arg] = arg
+        if self.seeded:
+            kwargs["seed"] = seed = random.randrange(SEED_RANGE) if seed is None else seed
+        if not self.indexed:
+            return (), kwargs
+        return (seed % 100 if self.seeded else 0,), kwargs
+
+    def cache_key(self, args, kwargs):
+        return (self.key, args, tuple(sorted(kwargs.items())))
+
+    def generate(self, args, kwargs):
+        """
+        Calls the generator with canonical inputs; seeded scenes echo their
+        seed. The scene comes back compacted (see scene_compaction.py), with
+        compact path data (see scene_paths.py).
+        """
+        scene = compact_paths(compact_scene(self.func(*args, **kwargs)))
+        if self.seeded:
+            scene["seed"] = kwargs["seed"]
+        return scene
+
+    def parts(self, args, kwargs):
+        """
+        Streams the scene as scene_stream parts (requires a streaming variant).
+        Objects parts wait for the next actions part, whose followPath actions
+        pick the paths that get tracks (see scene_paths.py).
+        """
+        parts = self.stream(*args, **kwargs)
+        head = next(parts)
+        if self.seeded:
+            head["scene"]["seed"] = kwargs["seed"]
+        yield head
+        pending = []
+        for part in parts:
+            if part["kind"] == scene_stream.OBJECTS:
+                pending.append(part["objects"])
+                continue
+            followed = followed_paths(part["actions"]) if part["kind"] == scene_stream.ACTIONS else ()
+            for objects in pending:
+                yield scene_stream.objects(compact_objects(objects, followed))
+            pending = []
+            yield part
+        for objects in pending:
+            yield scene_stream.objects(compact_objects(objects))
+
+    def build(self, description="", level="beginner", language="python", arg=None, seed=None):
+        """Generates the scene for one request."""
+        return self.generate(*self.inputs(description, level, language, arg, seed))
+
+    def __repr__(self):
+        return f"<GeneratorSpec {self.key!r} -> {self.func.__name__}>"
+
+
+class GeneratorRegistry:
+    """Intent key -> GeneratorSpec. Keys ending in ':' match a whole "family:..." namespace."""
+
+    def __init__(self):
+        self._specs = {}
+
+    def register(self, key, levels=LEVELS, languages=LANGUAGES, cacheable=True, seeded=False,
+                 indexed=True, params=None, arg=None, stream=None, **fixed):
+        """Decorator registering a generator function under key; stack it for several keys."""
+        def decorator(func):
+            if key in self._specs:
+                raise ValueError(f"Generator {key!r} is already registered")
+            self._specs[key] = GeneratorSpec(key, func, levels, languages, cacheable,
+                                             seeded, indexed, params, arg, fixed, stream)
+            return func
+        return decorator
+
+    def resolve(self, key):
+        """Returns (spec, arg) for an intent key, or (None, None) if no generator handles it."""
+        spec = self._specs.get(key)
+        if spec is not None:
+            return spec, None
+        family, sep, arg = key.partition(":")
+        if sep:
+            spec = self._specs.get(family + sep)
+            if spec is not None:
+                return spec, arg
+        return None, None
+
+    def __getitem__(self, key):
+        return self._specs[key]
+
+    def __contains__(self, key):
+        return key in self._specs
+
+    def __iter__(self):
+        return iter(self._specs)
+
+    def __len__(self):
+        return len(self._specs)
+
+    def __repr__(self):
+        return f"<GeneratorRegistry {len(self._specs)} generators>"
+
+
+GENERATORS = GeneratorRegistry()
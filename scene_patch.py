@@ -0,0 +1,84 @@
+"""
+Scene patches: the difference between two renditions of the same scene.
+Switching level or language keeps a seeded scene's data, so mostly code,
+narrative and codeLine change, and the client can patch the scene it is
+already playing instead of downloading it again.
+
+    {"scene":   merge patch of the top-level fields,
+     "objects": {id: merge patch},    objects that changed
+     "actions": {id: merge patch}}    actions that changed
+
+Merge patches follow RFC 7396: a value replaces, null removes the key, a
+dict patches the dict underneath. Objects and actions are matched by id, so
+there is only a patch when both scenes have the same ids in the same order
+(and no changed value is itself null).
+"""
+
+
+class _Unpatchable(Exception):
+    pass
+
+
+def merge_patch(old, new):
+    """RFC 7396 patch turning dict old into dict new."""
+    patch = {}
+    for key in old:
+        if key not in new:
+            patch[key] = None
+    for key, value in new.items():
+        before = old.get(key, _Unpatchable)
+        if before == value and type(before) is type(value):
+            continue
+        if value is None:
+            raise _Unpatchable(key)
+        if isinstance(value, dict) and isinstance(before, dict):
+            patch[key] = merge_patch(before, value)
+        else:
+            patch[key] = value
+    return patch
+
+
+def _entity_patches(old, new):
+    if [item.get("id") for item in old] != [item.get("id") for item in new]:
+        raise _Unpatchable("ids")
+    patches = {}
+    for before, after in zip(old, new):
+        patch = merge_patch(before, after)
+        if patch:
+            patches[after["id"]] = patch
+    return patches
+
+
+def diff_scenes(old, new):
+    """Patch turning scene old into scene new, or None if they don't line up."""
+    try:
+        return {
+            "scene": merge_patch({k: v for k, v in old.items() if k not in ("objects", "actions")},
+                                 {k: v for k, v in new.items() if k not in ("objects", "actions")}),
+            "objects": _entity_patches(old.get("objects", []), new.get("objects", [])),
+            "actions": _entity_patches(old.get("actions", []), new.get("actions", [])),
+        }
+    except _Unpatchable:
+        return None
+
+
+def apply_merge_patch(target, patch):
+    for key, value in patch.items():
+        if value is None:
+            target.pop(key, None)
+        elif isinstance(value, dict) and isinstance(target.get(key), dict):
+            apply_merge_patch(target[key], value)
+        else:
+            target[key] = value
+    return target
+
+
+def apply_patch(scene, patch):
+    """Applies a diff_scenes patch to scene in place (the reference for applyScenePatch in main.js)."""
+    apply_merge_patch(scene, patch["scene"])
+    for kind in ("objects", "actions"):
+        patches = patch[kind]
+        for item in scene.get(kind, []):
+            if item.get("id") in patches:
+                apply_merge_patch(item, patches[item["id"]])
+    return scene
@@ -0,0 +1,419 @@
+"""
+Compact path data: rewrites the "d" of path objects into fewer, shorter
+commands that draw the same thing.
+
+Generated paths are polylines with one segment per sample, written with
+absolute ".1f" coordinates ("M 12.0 225.0 L 12.5 224.7 L ..."). Each path
+is rewritten as follows:
+
+    simplified   every run of line segments goes through Ramer-Douglas-
+                 Peucker: a point is dropped when the line that skips it
+                 stays within PATH_TOLERANCE pixels of it
+    quantized    coordinates are rounded to PATH_QUANTUM (a tenth of a
+                 pixel, what ".1f" kept) before anything else, so the
+                 relative offsets below add up to exactly those points
+    relative     commands are the relative ones (l, h, v, q, ..., a), with
+                 repeated letters, trailing zeros, leading zeros and
+                 separators left out: "M12 225l.5-.3h4"
+
+Curves and arcs keep their shape and are only quantized and made
+relative. A drawn point moves by at most PATH_TOLERANCE plus half a
+quantum along each axis, well under a pixel; moves that draw nothing (a
+moveto right before another one) go. Path data that does not parse is
+left as it is.
+
+Paths that followPath actions move objects along also get a "track": the
+path flattened (within PATH_TOLERANCE) into an arc-length table,
+[x, y, length, x, y, length, ...]. The client finds a point a fraction of
+the way along with a binary search in it (point_along() is the same
+lookup), where it used to build an SVG path element and measure it on
+every frame.
+"""
+import math
+import re
+from functools import lru_cache
+
+PATH_TOLERANCE = 0.25
+PATH_QUANTUM = 0.1
+_SCALE = round(1 / PATH_QUANTUM)
+
+# numbers each command takes; the coordinates among them come in (x, y) pairs
+ARITY = {"M": 2, "L": 2, "H": 1, "V": 1, "C": 6, "S": 4, "Q": 4, "T": 2, "A": 7, "Z": 0}
+_TOKEN = re.compile(r"\s*,?\s*(?:([MmLlHhVvCcSsQqTtAaZz])|([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?))")
+
+
+def parse_path(d):
+    """
+    [(command, args)] of path data with absolute coordinates: commands are
+    M, L, C, S, Q, T, A and Z (H and V become L, repeats are spelled out).
+    Raises ValueError on anything else.
+    """
+    tokens, position = [], 0
+    d = d.strip()
+    while position < len(d):
+        match = _TOKEN.match(d, position)
+        if not match:
+            raise ValueError(f"bad path data at {position}: {d[position:position + 10]!r}")
+        letter, number = match.groups()
+        if number is not None:
+            number = float(number)
+            if not math.isfinite(number):
+                raise ValueError(f"bad number in path data: {match.group(2)!r}")
+        tokens.append(letter or number)
+        position = match.end()
+
+    if tokens and tokens[0] not in ("M", "m"):
+        raise ValueError("path data must start with a moveto")
+    commands = []
+    x = y = start_x = start_y = 0.0
+    i, letter = 0, None
+    while i < len(tokens):
+        if isinstance(tokens[i], str):
+            letter = tokens[i]
+            i += 1
+        elif letter in "Zz":
+            raise ValueError("z takes no numbers")
+        upper = letter.upper()
+        n = ARITY[upper]
+        args = tokens[i:i + n]
+        if len(args) < n or any(isinstance(a, str) for a in args):
+            raise ValueError(f"{letter} takes {n} numbers")
+        i += n
+        relative = letter.islower()
+        if upper == "Z":
+            commands.append(("Z", ()))
+            x, y = start_x, start_y
+            continue
+        if upper == "H":
+            upper, args = "L", [args[0] + x if relative else args[0], y]
+        elif upper == "V":
+            upper, args = "L", [x, args[0] + y if relative else args[0]]
+        elif upper == "A":
+            if relative:
+                args[5] += x
+                args[6] += y
+        elif relative:
+            args = [a + (y if k % 2 else x) for k, a in enumerate(args)]
+        x, y = args[-2], args[-1]
+        if upper == "M":
+            start_x, start_y = x, y
+            # further pairs after a moveto are linetos
+            letter = "l" if relative else "L"
+        commands.append((upper, tuple(args)))
+    return commands
+
+
+def _quantize(commands):
+    """The commands with every number in whole quanta (arc flags too: 0 or one whole)."""
+    quantized = []
+    for command, args in commands:
+        if command == "A":
+            rx, ry, rotation, large, sweep, x, y = args
+            args = (round(rx * _SCALE), round(ry * _SCALE), round(rotation * _SCALE),
+                    _SCALE * bool(large), _SCALE * bool(sweep), round(x * _SCALE), round(y * _SCALE))
+        else:
+            args = tuple(round(a * _SCALE) for a in args)
+        quantized.append((command, args))
+    return quantized
+
+
+def _simplify(points, tolerance):
+    """The points of a polyline Ramer-Douglas-Peucker keeps (ends included)."""
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    limit = tolerance * tolerance
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        ax, ay = points[first]
+        dx, dy = points[last][0] - ax, points[last][1] - ay
+        norm = dx * dx + dy * dy
+        worst, index = limit, None
+        for i in range(first + 1, last):
+            px, py = points[i][0] - ax, points[i][1] - ay
+            # distance to the segment (not the line), so turning back is seen
+            t = (px * dx + py * dy) / norm if norm else 0.0
+            t = 0.0 if t < 0 else 1.0 if t > 1 else t
+            ex, ey = px - t * dx, py - t * dy
+            distance = ex * ex + ey * ey
+            if distance > worst:
+                worst, index = distance, i
+        if index is not None:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+    return [point for point, kept in zip(points, keep) if kept]
+
+
+def _number(quanta):
+    whole, fraction = divmod(abs(quanta), _SCALE)
+    text = str(whole) if not fraction else f".{fraction}" if not whole else f"{whole}.{fraction}"
+    return "-" + text if quanta < 0 else text
+
+
+def _write(parts):
+    """Path text from letters and quanta, with only the separators it needs."""
+    out, previous = [], None
+    for part in parts:
+        if isinstance(part, str):
+            out.append(part)
+            previous = None
+            continue
+        text = _number(part)
+        if previous is not None and not (text[0] == "-" or text[0] == "." and "." in previous):
+            out.append(" ")
+        out.append(text)
+        previous = text
+    return "".join(out)
+
+
+@lru_cache(maxsize=1024)
+def compact_path(d, tolerance=PATH_TOLERANCE):
+    """The path data d simplified, quantized and relative (see the module docstring)."""
+    try:
+        commands = _quantize(parse_path(d))
+    except ValueError:
+        return d
+    step = tolerance * _SCALE
+    parts = []
+    x = y = start_x = start_y = 0
+    letter = None
+    for n, (command, args) in enumerate(commands):
+        if command == "M":
+            # a moveto straight into another one draws nothing
+            if n + 1 < len(commands) and commands[n + 1][0] == "M":
+                continue
+            if parts:
+                parts += ["m", args[0] - x, args[1] - y]
+                letter = "l"
+            else:
+                parts += ["M", *args]
+                letter = "L"
+            x, y = start_x, start_y = args
+            continue
+        if command == "L":
+            if n and commands[n - 1][0] == "L":
+                continue
+            run = [(x, y)]
+            for following, point in commands[n:]:
+                if following != "L":
+                    break
+                run.append(point)
+            for px, py in _simplify(run, step)[1:]:
+                dx, dy = px - x, py - y
+                move = ("h", dx) if not dy and dx else ("v", dy) if not dx and dy else ("l", dx, dy)
+                if move[0] != letter:
+                    parts.append(move[0])
+                    letter = move[0]
+                parts += move[1:]
+                x, y = px, py
+            continue
+        if command == "Z":
+            parts.append("z")
+            letter = "z"
+            x, y = start_x, start_y
+            continue
+        relative = command.lower()
+        if command == "A":
+            relative_args = [*args[:5], args[5] - x, args[6] - y]
+        else:
+            relative_args = [a - (y if k % 2 else x) for k, a in enumerate(args)]
+        if relative != letter:
+            parts.append(relative)
+            letter = relative
+        parts += relative_args
+        x, y = args[-2], args[-1]
+    return _write(parts)
+
+
+def _curve_points(start, controls, end, tolerance):
+    """Points along a quadratic or cubic Bezier curve, the chords within tolerance of it."""
+    points = [start, *controls, end]
+    # the chords stray by at most an eighth of the largest second difference
+    # (times the degree) over the number of pieces squared
+    bend = max(math.dist((a[0] - 2 * b[0] + c[0], a[1] - 2 * b[1] + c[1]), (0, 0))
+               for a, b, c in zip(points, points[1:], points[2:]))
+    degree = len(points) - 1
+    pieces = max(1, math.ceil(math.sqrt(degree * (degree - 1) * bend / (8 * tolerance))))
+    out = []
+    for k in range(1, pieces + 1):
+        t = k / pieces
+        level = points
+        while len(level) > 1:
+            level = [(a[0] + (b[0] - a[0]) * t, a[1] + (b[1] - a[1]) * t) for a, b in zip(level, level[1:])]
+        out.append(level[0])
+    out[-1] = end
+    return out
+
+
+def _arc_points(start, rx, ry, rotation, large, sweep, end, tolerance):
+    """Points along an elliptical arc (endpoint form, as SVG gives it), the chords within tolerance."""
+    (x1, y1), (x2, y2) = start, end
+    rx, ry = abs(rx), abs(ry)
+    if start == end:
+        return []
+    if not rx or not ry:
+        return [end]
+    phi = math.radians(rotation)
+    cos_phi, sin_phi = math.cos(phi), math.sin(phi)
+    # centre parametrization (SVG 1.1, appendix F.6.5)
+    hx, hy = (x1 - x2) / 2, (y1 - y2) / 2
+    px, py = cos_phi * hx + sin_phi * hy, -sin_phi * hx + cos_phi * hy
+    scale = px * px / (rx * rx) + py * py / (ry * ry)
+    if scale > 1:
+        rx, ry = rx * math.sqrt(scale), ry * math.sqrt(scale)
+    spread = rx * rx * py * py + ry * ry * px * px
+    root = math.sqrt(max(rx * rx * ry * ry - spread, 0) / spread)
+    if bool(large) == bool(sweep):
+        root = -root
+    cx_, cy_ = root * rx * py / ry, -root * ry * px / rx
+    cx = cos_phi * cx_ - sin_phi * cy_ + (x1 + x2) / 2
+    cy = sin_phi * cx_ + cos_phi * cy_ + (y1 + y2) / 2
+    theta = math.atan2((py - cy_) / ry, (px - cx_) / rx)
+    delta = math.atan2((-py - cy_) / ry, (-px - cx_) / rx) - theta
+    if sweep and delta < 0:
+        delta += 2 * math.pi
+    elif not sweep and delta > 0:
+        delta -= 2 * math.pi
+    step = 2 * math.acos(max(1 - tolerance / max(rx, ry), -1))
+    pieces = max(1, math.ceil(abs(delta) / step))
+    out = []
+    for k in range(1, pieces + 1):
+        angle = theta + delta * k / pieces
+        ex, ey = rx * math.cos(angle), ry * math.sin(angle)
+        out.append((cx + cos_phi * ex - sin_phi * ey, cy + sin_phi * ex + cos_phi * ey))
+    out[-1] = end
+    return out
+
+
+def flatten_path(d, tolerance=PATH_TOLERANCE):
+    """
+    The subpaths of path data as polylines [[(x, y), ...], ...] that stay
+    within tolerance of the curves and arcs. Raises ValueError like
+    parse_path().
+    """
+    subpaths = []
+    x = y = 0.0
+    start = control = None
+    previous = None
+    for command, args in parse_path(d):
+        here = (x, y)
+        if command == "M":
+            subpaths.append([args])
+            start = args
+        elif command == "Z":
+            subpaths[-1].append(start)
+            # drawing after a closepath starts from its first point
+            subpaths.append([start])
+            args = start
+        elif command == "L":
+            subpaths[-1].append(args)
+        elif command == "A":
+            subpaths[-1] += _arc_points(here, *args[:5], args[5:], tolerance)
+        else:
+            # S and T reflect the previous curve's last control point
+            if command in ("S", "T"):
+                smooth = control if previous in (("C", "S") if command == "S" else ("Q", "T")) else None
+                reflected = (2 * x - smooth[0], 2 * y - smooth[1]) if smooth else here
+                args = (*reflected, *args)
+            controls = [args[k:k + 2] for k in range(0, len(args) - 2, 2)]
+            subpaths[-1] += _curve_points(here, controls, args[-2:], tolerance)
+            control = controls[-1]
+        x, y = args[-2:] if command != "Z" else start
+        previous = command
+    return [points for points in subpaths if len(points) > 1]
+
+
+@lru_cache(maxsize=1024)
+def path_track(d, tolerance=PATH_TOLERANCE):
+    """
+    The arc-length table of path data: [x, y, length, x, y, length, ...]
+    along the flattened path, length being how far along it the point is.
+    A jump to the next subpath repeats the length. None if the path does not
+    parse or has no length.
+    """
+    try:
+        subpaths = flatten_path(d, tolerance)
+    except ValueError:
+        return None
+    track, length = [], 0.0
+    for points in subpaths:
+        last = None
+        for point in points:
+            point = (round(point[0], 1), round(point[1], 1))
+            if last is not None:
+                if point == last:
+                    continue
+                length += math.dist(last, point)
+            track += [*point, round(length, 1)]
+            last = point
+    return track if length else None
+
+
+def point_along(track, p):
+    """
+    The point at fraction p of a track's length, the way followPath in
+    public/main.js finds it: a binary search for the last entry at or before
+    that length, then a straight line to the next one.
+    """
+    count = len(track) // 3
+    target = p * track[-1]
+    low, high = 0, count - 1
+    while low < high:
+        middle = (low + high + 1) // 2
+        if track[3 * middle + 2] <= target:
+            low = middle
+        else:
+            high = middle - 1
+    x, y, at = track[3 * low:3 * low + 3]
+    if low == count - 1:
+        return x, y
+    nx, ny, next_at = track[3 * low + 3:3 * low + 6]
+    f = (target - at) / (next_at - at) if next_at > at else 0
+    return x + (nx - x) * f, y + (ny - y) * f
+
+
+def followed_paths(actions):
+    """Ids of the paths followPath actions move objects along."""
+    return {(action.get("params") or {}).get("pathId") for action in actions if action.get("type") == "followPath"}
+
+
+def compact_objects(objects, followed=()):
+    """
+    The objects with the d of every path compacted, and a "track" on the
+    paths in `followed`; changed objects are copies.
+    """
+    compacted = []
+    for obj in objects:
+        props = obj.get("props") or {}
+        d = props.get("d")
+        if obj.get("type") == "path" and isinstance(d, str):
+            changes = {}
+            compact = compact_path(d)
+            if compact != d:
+                changes["d"] = compact
+            if obj.get("id") in followed:
+                track = path_track(compact)
+                if track and props.get("track") != track:
+                    changes["track"] = track
+            if changes:
+                obj = dict(obj, props=dict(props, **changes))
+        compacted.append(obj)
+    return compacted
+
+
+def compact_paths(scene):
+    """
+    The scene with compact path data, and tracks on the paths it follows.
+    A scene with paths to rewrite comes back as a new dict (the given one
+    is left alone); otherwise the same scene does.
+    """
+    objects = scene.get("objects")
+    if not objects:
+        return scene
+    compacted = compact_objects(objects, followed_paths(scene.get("actions") or ()))
+    if all(a is b for a, b in zip(compacted, objects)):
+        return scene
+    return dict(scene, objects=compacted)
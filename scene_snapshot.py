@@ -0,0 +1,163 @@
+"""
+Precompiled snapshot of the static scenes.
+
+Static scenes (the TEMPLATE_* literals in app.py and the static generated
+families: poly_N, formula_*, graph_*, deriv_x*, atom_N) are identical on every
+deploy, so the build step serializes them once into a single indexed file:
+
+    header   magic (8s) | version (u32) | count (u32) | digest (20s) | encoding (8s)
+    index    count x [data offset (u64) | data length (u32) | key length (u16) | content hash (16s)]
+    keys     UTF-8 keys, concatenated in index order
+    data     pre-serialized JSON payloads, concatenated
+
+The content hash is always that of the uncompressed JSON. The build also
+writes one snapshot per content encoding (build/scenes.gzip.snap, ...) whose
+payloads are precompressed at the highest level; those omit scenes under
+compression.MIN_SIZE, which are served uncompressed.
+
+At startup the server memory-maps the file and answers a lookup by slicing the
+map, so no scene dict is built and nothing is re-serialized or re-hashed (the
+content hash is the scene's ETag). The mapping is read-only and backed by the
+page cache, so forked workers share it.
+"""
+import hashlib
+import logging
+import mmap
+import os
+import struct
+
+import compression
+from scene_codec import EncodedScene, content_hash, encode_json
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"AVZSNAP\0"
+VERSION = 3
+HEADER = struct.Struct("<8sII20s8s")
+ENTRY = struct.Struct("<QIH16s")
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "build", "scenes.snap")
+# Everything that decides a static scene's bytes: the scenes themselves, the
+# transforms they go through, and the serialization (which sets the ETags too)
+SOURCE_FILES = ("app.py", "template_generator.py", "code_generator.py", "scene_compaction.py", "function_plot.py",
+                "scene_paths.py", "template_registry.py", "scene_codec.py", "compression.py")
+
+
+def source_digest():
+    """Digest of the modules that define static scenes; a stale snapshot is ignored."""
+    root = os.path.dirname(os.path.abspath(__file__))
+    h = hashlib.sha1()
+    for name in SOURCE_FILES:
+        with open(os.path.join(root, name), "rb") as f:
+            h.update(f.read())
+    return h.digest()
+
+
+def snapshot_path(encoding=None, path=DEFAULT_PATH):
+    """build/scenes.snap, or build/scenes.<encoding>.snap for a precompressed one."""
+    if not encoding:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}.{encoding}{ext}"
+
+
+def write_snapshot(templates, path=DEFAULT_PATH, encoding=None, payloads=None):
+    """
+    Serializes every static scene of a TemplateRegistry into a snapshot file,
+    compressed with `encoding` if given. `payloads` ({key: JSON bytes}) reuses
+    serializations from a previous call.
+    """
+    keys = templates.static_keys()
+    if payloads is None:
+        payloads = {key: encode_json(templates[key]) for key in keys}
+    if encoding:
+        keys = [key for key in keys if len(payloads[key]) >= compression.MIN_SIZE]
+    encoded_keys = [key.encode("utf-8") for key in keys]
+    blobs = [compression.compress(payloads[key], encoding, compression.BEST[encoding]) if encoding
+             else payloads[key] for key in keys]
+
+    data_start = HEADER.size + ENTRY.size * len(keys) + sum(len(k) for k in encoded_keys)
+    index = []
+    offset = data_start
+    for key, encoded_key, blob in zip(keys, encoded_keys, blobs):
+        index.append(ENTRY.pack(offset, len(blob), len(encoded_key), bytes.fromhex(content_hash(payloads[key]))))
+        offset += len(blob)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(keys), source_digest(), (encoding or "").encode("ascii")))
+        f.writelines(index)
+        f.writelines(encoded_keys)
+        f.writelines(blobs)
+    os.replace(tmp_path, path)
+    return len(keys), offset
+
+
+class SceneSnapshot:
+    """Read-only, memory-mapped view of a snapshot file."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, self.digest, encoding = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {VERSION} scene snapshot")
+        self.encoding = encoding.rstrip(b"\0").decode("ascii") or None
+
+        self._index = {}
+        pos = HEADER.size
+        key_pos = HEADER.size + ENTRY.size * count
+        for _ in range(count):
+            data_offset, data_length, key_length, digest = ENTRY.unpack_from(self._map, pos)
+            key = self._map[key_pos:key_pos + key_length].decode("utf-8")
+            self._index[key] = (data_offset, data_length, digest.hex())
+            pos += ENTRY.size
+            key_pos += key_length
+
+    @classmethod
+    def open(cls, path=DEFAULT_PATH):
+        """Returns the snapshot at path, or None if it is missing or stale."""
+        if not os.path.exists(path):
+            return None
+        try:
+            snapshot = cls(path)
+        except ValueError:  # written by another snapshot format version
+            logger.warning("Ignoring incompatible scene snapshot %s; rerun `python build.py`.", path)
+            return None
+        if snapshot.digest != source_digest():
+            logger.warning("Ignoring stale scene snapshot %s; rerun `python build.py`.", path)
+            snapshot.close()
+            return None
+        return snapshot
+
+    def get(self, key):
+        """Serialized JSON bytes for key, or None."""
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+        offset, length, _ = entry
+        return self._map[offset:offset + length]
+
+    def etag(self, key):
+        """Content hash of the uncompressed scene, or None."""
+        entry = self._index.get(key)
+        return entry[2] if entry else None
+
+    def get_encoded(self, key):
+        """EncodedScene (bytes + stored content hash) for key, or None; uncompressed snapshots only."""
+        entry = self._index.get(key)
+        if entry is None or self.encoding:
+            return None
+        offset, length, etag = entry
+        return EncodedScene(self._map[offset:offset + length], etag)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def close(self):
+        self._map.close()
@@ -0,0 +1,55 @@
+"""
+Streamed scenes (format=ndjson): a scene sent as newline-delimited JSON parts
+while it is still being generated, so playback can start before the last
+action exists.
+
+    {"kind": "header",  "scene": {...}}                   first, exactly once
+    {"kind": "objects", "objects": [...]}                 before any action that uses them
+    {"kind": "actions", "actions": [...], "until": t}     sorted by start
+    {"kind": "end",     "scene": {...}}                   last; fields known only at the end
+
+Every action in an "actions" part starts before `until`, and no later part
+holds an action that starts before it, so once that part has arrived the
+client can play up to `until`. "header" and "end" together carry every
+top-level field except objects/actions (duration usually comes with "end").
+
+Streaming generators are plain Python generators yielding these parts; the
+matching whole-scene generator is assemble() of the same stream.
+"""
+NDJSON_FORMAT = "ndjson"
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+HEADER, OBJECTS, ACTIONS, END = "header", "objects", "actions", "end"
+
+
+def header(fields):
+    return {"kind": HEADER, "scene": dict(fields)}
+
+
+def objects(items):
+    return {"kind": OBJECTS, "objects": list(items)}
+
+
+def actions(items, until):
+    """Actions starting before `until`, in time order (ties keep their order)."""
+    return {"kind": ACTIONS, "actions": sorted(items, key=lambda action: action["start"]), "until": until}
+
+
+def end(fields=None):
+    return {"kind": END, "scene": dict(fields or {})}
+
+
+def assemble(parts):
+    """The whole scene a stream of parts describes."""
+    scene, all_objects, all_actions = {}, [], []
+    for part in parts:
+        kind = part["kind"]
+        if kind == OBJECTS:
+            all_objects.extend(part["objects"])
+        elif kind == ACTIONS:
+            all_actions.extend(part["actions"])
+        else:
+            scene.update(part["scene"])
+    scene["objects"] = all_objects
+    scene["actions"] = all_actions
+    return scene
@@ -0,0 +1,121 @@
+"""
+Fingerprinted public/ assets.
+
+The build step copies every public/ asset to build/assets/ under a name
+that carries its content hash (main.js -> main.1f3a5c7e9b.js), rewrites the
+src/href references of the HTML pages to those names and records both in
+build/assets/manifest.json. A hashed file never changes, so it is served
+with a year-long immutable Cache-Control; the pages are revalidated on every
+load (a 304 while unchanged). A repeat visit therefore costs one conditional
+request per page and none for its scripts, styles and images.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+
+logger = logging.getLogger(__name__)
+
+MANIFEST = "manifest.json"
+MANIFEST_VERSION = 1
+PAGE_EXTENSIONS = {".html"}
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+# src="main.js", href='/style.css?v=2', ... (same-site references only)
+REFERENCE = re.compile(r"""(?P<attr>\b(?:src|href)=)(?P<quote>["'])/?(?P<name>[^"'?#:]+)(?:\?[^"'#]*)?(?P=quote)""")
+
+
+def content_digest(data):
+    return hashlib.blake2b(data, digest_size=5).hexdigest()
+
+
+def hashed_name(name, data):
+    root, ext = os.path.splitext(name)
+    return f"{root}.{content_digest(data)}{ext}"
+
+
+def is_page(name):
+    return os.path.splitext(name)[1].lower() in PAGE_EXTENSIONS
+
+
+def rewrite_references(html, assets):
+    """Points every src/href naming a fingerprinted asset at its hashed name."""
+    def replace(match):
+        hashed = assets.get(match.group("name"))
+        if hashed is None:
+            return match.group(0)
+        return f"{match.group('attr')}{match.group('quote')}/{hashed}{match.group('quote')}"
+    return REFERENCE.sub(replace, html)
+
+
+def _source_files(source_dir):
+    for root, _, files in os.walk(source_dir):
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            with open(path, "rb") as f:
+                yield os.path.relpath(path, source_dir).replace(os.sep, "/"), f.read()
+
+
+def build_assets(source_dir, target_dir):
+    """
+    Writes the hashed assets, the rewritten pages and the manifest into
+    target_dir (replacing what was there). Returns the manifest.
+    """
+    shutil.rmtree(target_dir, ignore_errors=True)
+    os.makedirs(target_dir)
+    files = dict(_source_files(source_dir))
+    assets = {name: hashed_name(name, data) for name, data in files.items() if not is_page(name)}
+    outputs = {assets[name]: data for name, data in files.items() if name in assets}
+    pages = [name for name in files if is_page(name)]
+    for name in pages:
+        outputs[name] = rewrite_references(files[name].decode("utf-8"), assets).encode("utf-8")
+    for name, data in outputs.items():
+        path = os.path.join(target_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "assets": assets,
+        "pages": pages,
+        "sources": {name: content_digest(data) for name, data in files.items()},
+    }
+    with open(os.path.join(target_dir, MANIFEST), "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+class AssetManifest:
+    """The fingerprinted build of public/, as served by the app."""
+
+    def __init__(self, directory, assets, pages):
+        self.directory = directory
+        self.assets = assets
+        self.pages = frozenset(pages)
+        self.hashed = frozenset(assets.values())
+
+    @classmethod
+    def open(cls, source_dir, directory):
+        """
+        Loads directory/manifest.json, or returns None when there is none or
+        public/ has changed since it was built (the build would be stale).
+        """
+        try:
+            with open(os.path.join(directory, MANIFEST)) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if manifest.get("version") != MANIFEST_VERSION:
+            return None
+        sources = {name: content_digest(data) for name, data in _source_files(source_dir)}
+        if sources != manifest["sources"]:
+            logger.warning("Ignoring stale asset build %s; rerun `python build.py`.", directory)
+            return None
+        return cls(directory, manifest["assets"], manifest["pages"])
+
+    def __repr__(self):
+        return f"<AssetManifest {len(self.assets)} assets, {len(self.pages)} pages in {self.directory}>"
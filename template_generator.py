@@ -1,10 +1,20 @@
+import heapq
 import random
 import math
 import re
+import function_plot
+import scene_stream
 from code_generator import CodeGenerator
-
-def generate_polygon_template(n_sides):
+from function_plot import compile_expression, sample_function
+from graph_model import HEURISTICS, Graph, astar_grid, floyd_warshall
+from scene_generators import GENERATORS
+from scene_compaction import compact_actions
+from timeline import Timeline
+from template_registry import TemplateRegistry
+
+def generate_polygon_template(n_sides, seed=None):
     """Generates a premium template for a regular polygon with n_sides."""
+    rng = random.Random(seed)
     scene_id = f"poly_{n_sides}"
     angle_step = 2 * math.pi / n_sides
     points = []
@@ -21,7 +31,7 @@ def generate_polygon_template(n_sides):
         points.append(f"{x:.1f} {y:.1f}")
     
     path_d = "M " + " L ".join(points) + " Z"
-    color = random.choice(["#e74c3c", "#3498db", "#2ecc71", "#9b59b6", "#f1c40f", "#e67e22"])
+    color = rng.choice(["#e74c3c", "#3498db", "#2ecc71", "#9b59b6", "#f1c40f", "#e67e22"])
     
     objects = [
         {"id": "bg", "type": "rect", "props": {"x": 0, "y": 0, "width": 800, "height": 450, "color": "#1e1e2e"}},
@@ -55,8 +65,9 @@ def generate_polygon_template(n_sides):
         "actions": actions
     }
 
-def get_formula_simulation(name):
+def get_formula_simulation(name, seed=None):
     """Returns extra objects and actions for specific physics simulations."""
+    rng = random.Random(seed)
     objects = []
     actions = []
     
@@ -385,15 +396,15 @@ def get_formula_simulation(name):
                 elif state == "Liquid":
                     # Bottom, random-ish
                     objects.append({"id": pid, "type": "circle", "props": {"x": px, "y": py + 20, "r": 10, "color": "#89b4fa"}})
-                    actions.append({"id": f"flow_{pid}", "objectId": pid, "type": "translate", "start": 1, "end": 5, "params": {"to": {"x": px + random.randint(-10, 10), "y": py + 20}}})
+                    actions.append({"id": f"flow_{pid}", "objectId": pid, "type": "translate", "start": 1, "end": 5, "params": {"to": {"x": px + rng.randint(-10, 10), "y": py + 20}}})
                 elif state == "Gas":
                     # Spread out
                     objects.append({"id": pid, "type": "circle", "props": {"x": px, "y": py, "r": 10, "color": "#89b4fa"}})
-                    actions.append({"id": f"fly_{pid}", "objectId": pid, "type": "translate", "start": 1, "end": 5, "params": {"to": {"x": px + random.randint(-50, 50), "y": py + random.randint(-50, 50)}}})
+                    actions.append({"id": f"fly_{pid}", "objectId": pid, "type": "translate", "start": 1, "end": 5, "params": {"to": {"x": px + rng.randint(-50, 50), "y": py + rng.randint(-50, 50)}}})
 
     return objects, actions
 
-def generate_formula_template(name, formula_latex, description):
+def generate_formula_template(name, formula_latex, description, seed=None):
     """Generates a premium template for a mathematical formula."""
     
     # Get base objects
@@ -426,7 +437,7 @@ def generate_formula_template(name, formula_latex, description):
     ]
     
     # Add Simulation if available
-    sim_objs, sim_acts = get_formula_simulation(name)
+    sim_objs, sim_acts = get_formula_simulation(name, seed)
     objects.extend(sim_objs)
     actions.extend(sim_acts)
     
@@ -440,10 +451,11 @@ def generate_formula_template(name, formula_latex, description):
         "actions": actions
     }
 
-def generate_vector_template(idx):
+def generate_vector_template(idx, seed=None):
     """Generates a random vector addition template."""
-    ax, ay = random.randint(50, 200), random.randint(50, 100)
-    bx, by = random.randint(50, 200), random.randint(-50, 100)
+    rng = random.Random(seed)
+    ax, ay = rng.randint(50, 200), rng.randint(50, 100)
+    bx, by = rng.randint(50, 200), rng.randint(-50, 100)
     start_x, start_y = 100, 300
     
     return {
@@ -464,29 +476,43 @@ def generate_vector_template(idx):
         ]
     }
 
+PLOT_X_RANGE = (-10, 10)
+
+def _plot_runs(func_expr, center_x=400, center_y=225, scale=40):
+    """
+    The curve as runs of on-screen (px, py) points, split wherever it leaves
+    the screen or is undefined. Sampled adaptively with NumPy (see
+    function_plot.sample_function), every 0.1 along x without.
+    """
+    f = compile_expression(func_expr)
+    if function_plot.np is not None:
+        xs, ys = sample_function(f, PLOT_X_RANGE, lambda xs, ys: (center_x + xs * scale, center_y - ys * scale))
+        xs, ys = xs.tolist(), ys.tolist()
+    else:
+        xs = [i / 10.0 for i in range(PLOT_X_RANGE[0] * 10, PLOT_X_RANGE[1] * 10 + 1)]
+        ys = f(xs)
+    runs, run = [], []
+    for x, y in zip(xs, ys):
+        px, py = center_x + x * scale, center_y - y * scale
+        if 0 <= px <= 800 and 0 <= py <= 450:  # False for nan
+            run.append((px, py))
+        elif run:
+            runs.append(run)
+            run = []
+    if run:
+        runs.append(run)
+    return runs
+
 def generate_graph_template(func_name, func_expr):
-    """Generates a premium graph plot template."""
-    points = []
-    scale_x = 40
-    scale_y = 40
+    """
+    Generates a premium graph plot template. func_expr is compiled once and
+    checked (see function_plot.py): a ValueError if it is not an expression of x.
+    """
+    runs = _plot_runs(func_expr)
+    path_d = " ".join("M " + " L ".join(f"{px:.1f} {py:.1f}" for px, py in run) for run in runs)
+    trace_points = [tuple(round(v, 1) for v in p) for p in (runs[0][0], runs[-1][-1])] if runs else []
     center_x, center_y = 400, 225
     
-    # Calculate points
-    trace_points = []
-    for i in range(-100, 101):
-        x = i / 10.0
-        try:
-            y = eval(func_expr, {"x": x, "sin": math.sin, "cos": math.cos, "tan": math.tan, "exp": math.exp, "sqrt": math.sqrt, "log": math.log})
-            px = center_x + x * scale_x
-            py = center_y - y * scale_y
-            if 0 <= px <= 800 and 0 <= py <= 450:
-                points.append(f"{px:.1f} {py:.1f}")
-                if i % 5 == 0: trace_points.append((px, py)) 
-        except:
-            pass
-            
-    path_d = "M " + " L ".join(points) if points else ""
-    
     objects = [
         {"id": "bg", "type": "rect", "props": {"x": 0, "y": 0, "width": 800, "height": 450, "color": "#1e1e2e"}},
         # Grid
@@ -520,6 +546,23 @@ def generate_graph_template(func_name, func_expr):
         "actions": actions
     }
 
+def _plot_expression(description):
+    """A function to plot: "plot y = x^2 + 2x", "graph of sin(x)/x" (None unless it compiles)."""
+    match = re.search(r'\b(?:plot|graph)\s+(?:of\s+)?(?:(?:y|f\(x\))\s*=\s*)?(.+)$', description)
+    if not match:
+        return None
+    expression = match.group(1).strip().rstrip(".?!").strip()
+    try:
+        compile_expression(expression)
+    except ValueError:
+        return None
+    return expression
+
+@GENERATORS.register("plot", levels=(), languages=(), indexed=False, params={"expression": _plot_expression})
+def generate_plot_template(expression="sin(x)"):
+    """Generates a graph plot of the prompt's own function."""
+    return generate_graph_template(expression, expression)
+
 def generate_derivation_template(idx):
     """Generates a premium derivation template for x^n."""
     n = idx + 2
@@ -597,23 +640,152 @@ def generate_atom_template(atomic_number):
         "actions": actions
     }
 
-def generate_algo_template(idx, difficulty="beginner", language="python", algo_type="bubble"):
-    """Generates a sorting visualization (Bubble or Selection) with difficulty levels."""
-    import random
+# Sorting scenes take arrays of up to SORT_MAX_VALUES values. A scene ships at
+# most SORT_ACTION_BUDGET actions: past that, the inner-loop steps collapse
+# into one keyframe per (sampled) pass of a single "bars" object, and all
+# keyframes together carry at most SORT_KEYFRAME_VALUES bar heights.
+SORT_MAX_VALUES = 10_000
+SORT_ACTION_BUDGET = 400
+SORT_KEYFRAME_VALUES = 200_000
+
+def _sort_values(description):
+    """An explicit array in the prompt: "bubble sort [5, 3, 8, 1]" (non-negative integers)."""
+    match = re.search(r'\[([\d\s,.-]*)\]', description)
+    if not match:
+        return None
+    tokens = re.split(r'[\s,]+', match.group(1).strip(" ,"))
+    # signs and decimal points are not sortable bar heights: no array at all
+    if not all(token.isdigit() for token in tokens):
+        return None
+    values = tuple(int(v) for v in tokens[:SORT_MAX_VALUES])
+    return values if len(values) >= 2 else None
+
+def _sort_size(description):
+    """A requested size: "bubble sort 500 elements", "selection sort n=2000"."""
+    match = re.search(r'\bn\s*=\s*(\d+)|\b(\d+)\s*(?:elements|numbers|values|items|bars)\b', description)
+    if not match:
+        return None
+    return min(max(int(match.group(1) or match.group(2)), 2), SORT_MAX_VALUES)
+
+SORT_PARAMS = {"values": _sort_values, "size": _sort_size}
+
+def _count_inversions(values):
+    """Pairs i < j with values[i] > values[j] (the swaps bubble sort makes), by merge sort."""
+    if len(values) < 2:
+        return list(values), 0
+    mid = len(values) // 2
+    left, a = _count_inversions(values[:mid])
+    right, b = _count_inversions(values[mid:])
+    merged, count, i, j = [], a + b, 0, 0
+    while i < len(left) and j < len(right):
+        if right[j] < left[i]:
+            merged.append(right[j])
+            count += len(left) - i
+            j += 1
+        else:
+            merged.append(left[i])
+            i += 1
+    merged.extend(left[i:])
+    merged.extend(right[j:])
+    return merged, count
+
+def _bubble_passes(data, passes):
+    """
+    The array after each of the given (ascending) numbers of bubble sort
+    passes. p passes leave the p largest values sorted at the end, and the
+    rest in the order a buffer of the p largest values seen so far lets them
+    through, so each state costs O(n log p) instead of O(n p).
+    """
+    for p in passes:
+        if p == 0:
+            yield list(data)
+            continue
+        heap = data[:p]
+        heapq.heapify(heap)
+        front = [heapq.heappushpop(heap, value) for value in data[p:]]
+        yield front + sorted(heap)
+
+def _selection_passes(data, passes):
+    """
+    The array after each of the given (ascending) numbers of selection sort
+    passes, and the swap count. The minimum of the unsorted part comes from
+    a heap of (value, position) entries: an entry is current while its
+    position still holds its value, and a swap pushes the moved value anew.
+    """
+    arr = list(data)
+    heap = [(value, j) for j, value in enumerate(arr)]
+    heapq.heapify(heap)
+    wanted = iter(passes)
+    target = next(wanted, None)
+    states, swaps = [], 0
+    for i in range(len(arr) + 1):
+        while target == i:
+            states.append(list(arr))
+            target = next(wanted, None)
+        if i == len(arr):
+            break
+        while True:
+            # smallest value, then smallest position: the first occurrence, as the step-by-step scene picks it
+            value, min_idx = heapq.heappop(heap)
+            if min_idx >= i and arr[min_idx] == value:
+                break
+        if min_idx != i:
+            arr[i], arr[min_idx] = arr[min_idx], arr[i]
+            heapq.heappush(heap, (arr[min_idx], min_idx))
+            swaps += 1
+    return states, swaps
+
+def _sort_metadata(steps, actions, keyframes=None):
+    """
+    Budget report: steps are the comparisons and swaps the scene shows,
+    actions the ones it ships. Only keyframes fold several steps into one
+    action; the step-by-step scene reports a ratio of 1.0.
+    """
+    metadata = {"actionBudget": SORT_ACTION_BUDGET, "steps": steps, "actions": len(actions),
+                "compactionRatio": round(steps / len(actions), 2) if keyframes else 1.0}
+    if keyframes:
+        metadata["keyframes"] = keyframes
+    return metadata
+
+@GENERATORS.register("bubble", seeded=True, params=SORT_PARAMS, algo_type="bubble")
+@GENERATORS.register("selection", seeded=True, params=SORT_PARAMS, algo_type="selection")
+def generate_algo_template(idx, difficulty="beginner", language="python", algo_type="bubble", seed=None,
+                           values=None, size=None):
+    """
+    Generates a sorting visualization (Bubble or Selection) with difficulty levels.
+    values/size (from the prompt) replace the random data; scenes over the
+    action budget are shown pass by pass (see _sort_keyframes).
+    """
+    rng = random.Random(seed)
     
     # 1. Data Setup
-    if difficulty == "kids":
-       data = [random.randint(1, 10) for _ in range(5)] # Smaller numbers
+    if values:
+       data = list(values)
+    elif size:
+       data = [rng.randint(10, 99) for _ in range(size)]
+    elif difficulty == "kids":
+       data = [rng.randint(1, 10) for _ in range(5)] # Smaller numbers
     else:
-       data = [random.randint(10, 99) for _ in range(6)]
-       
-    n = len(data)
-    arr = list(data) # Copy for simulation
+       data = [rng.randint(10, 99) for _ in range(6)]
     
     scene_id = f"sort_{algo_type}_{idx}"
     
     # 2. Code Content based on Difficulty, Algo, and Language
     code_content = CodeGenerator.get_code(f"{algo_type}_sort", language=language, level=difficulty)
+
+    # Every comparison takes at least two actions, every bar two more
+    n = len(data)
+    if 4 * n + n * (n - 1) + 1 <= SORT_ACTION_BUDGET:
+        scene = _sort_steps(scene_id, code_content, data, difficulty, language, algo_type)
+        if len(scene["actions"]) <= SORT_ACTION_BUDGET:
+            return scene
+    return _sort_keyframes(scene_id, code_content, data, algo_type)
+
+def _sort_steps(scene_id, code_content, data, difficulty, language, algo_type):
+    """The step-by-step scene: every comparison and swap animated on its own bars."""
+    n = len(data)
+    arr = list(data) # Copy for simulation
+    swaps = 0
     
     # 3. Base Objects
     objects = [
@@ -623,14 +795,17 @@ def generate_algo_template(idx, difficulty="beginner", language="python", algo_t
     
     bar_width = 50
     gap = 20
+    if n * (bar_width + gap) - gap > 720:
+        bar_width, gap = 500 / n, 200 / n
     total_w = n * bar_width + (n-1) * gap
     start_x = (800 - total_w) / 2
+    unit = 3 if max(data) <= 100 else 300 / max(data)
     
     # Create Bar Objects
     bar_objs = []
     val_objs = []
     for i, val in enumerate(data):
-        h = val * 3
+        h = val * unit
         x = start_x + i * (bar_width + gap)
         y = 400 - h
         color = "#f9e2af" if difficulty == "kids" else "#89b4fa"
@@ -650,21 +825,22 @@ def generate_algo_template(idx, difficulty="beginner", language="python", algo_t
         bar_objs.append(bid)
         val_objs.append(vid)
 
-    actions = [
-        {"id": "show_title", "objectId": "title", "type": "fade", "start": 0.5, "end": 1.5, "params": {"opacity": 1}}
-    ]
+    timeline = Timeline()
+    timeline.fade("show_title", "title", 1, 1.0, start=0.5)
 
     # Show bars
     for i in range(n):
-        actions.append({"id": f"show_bar_{i}", "objectId": f"bar_{i}", "type": "fade", "start": 1.0 + i*0.2, "end": 1.5 + i*0.2, "params": {"opacity": 1}})
-        actions.append({"id": f"show_val_{i}", "objectId": f"val_{i}", "type": "fade", "start": 1.0 + i*0.2, "end": 1.5 + i*0.2, "params": {"opacity": 1}})
+        timeline.fade(f"show_bar_{i}", f"bar_{i}", 1, 0.5, start=1.0 + i*0.2)
+        timeline.fade(f"show_val_{i}", f"val_{i}", 1, 0.5, start=1.0 + i*0.2)
 
     # 4. Simulation & Animation Generation
-    time = 3.0
+    timeline.time = 3.0
     step_dur = 2.0 if difficulty == "beginner" else (2.5 if difficulty == "kids" else 1.2)
+    base_color = "#f9e2af" if difficulty == "kids" else "#89b4fa"
     
     if algo_type == "bubble":
-        # ... (Existing Bubble Logic)
+        compare_line = 5 if difficulty == "beginner" else (2 if difficulty == "kids" else 6)
+        swap_line = 6 if difficulty == "beginner" else (3 if difficulty == "kids" else 7)
         for i in range(n):
             for j in range(0, n-i-1):
                 # Highlight Comparison
@@ -672,162 +848,205 @@ def generate_algo_template(idx, difficulty="beginner", language="python", algo_t
                 v1, v2 = arr[j], arr[j+1]
                 
                 # Action: Highlight
-                actions.append({
-                    "id": f"comp_{i}_{j}",
-                    "objectId": id1,
-                    "type": "color",
-                    "start": time,
-                    "end": time + step_dur/2,
-                    "params": {"color": "#e74c3c"}, 
-                    "narrative": CodeGenerator.get_narrative("compare", v1, v2, language=language, level=difficulty),
-                    "codeLine": 5 if difficulty == "beginner" else (2 if difficulty == "kids" else 6)
-                })
-                actions.append({
-                    "id": f"comp_{i}_{j}_2",
-                    "objectId": id2,
-                    "type": "color",
-                    "start": time,
-                    "end": time + step_dur/2,
-                    "params": {"color": "#e74c3c"}
-                })
-                
-                time += step_dur/2
+                timeline.color(f"comp_{i}_{j}", id1, "#e74c3c", step_dur/2,
+                               narrative=CodeGenerator.get_narrative("compare", v1, v2, language=language, level=difficulty),
+                               code_line=compare_line)
+                timeline.color(f"comp_{i}_{j}_2", id2, "#e74c3c", step_dur/2)
+                timeline.advance(step_dur/2)
                 
                 if v1 > v2:
                     # Swap Logic
-                    actions.append({
-                        "id": f"swap_narrative_{i}_{j}",
-                        "objectId": "title",
-                        "type": "wait",
-                        "start": time,
-                        "end": time + step_dur,
-                        "narrative": CodeGenerator.get_narrative("swap", v1, v2, language=language, level=difficulty),
-                        "codeLine": 6 if difficulty == "beginner" else (3 if difficulty == "kids" else 7)
-                    })
+                    timeline.wait(f"swap_narrative_{i}_{j}", "title", step_dur,
+                                  narrative=CodeGenerator.get_narrative("swap", v1, v2, language=language, level=difficulty),
+                                  code_line=swap_line)
                     
                     # Animate Swap (Positions)
                     x1 = start_x + j * (bar_width + gap)
                     x2 = start_x + (j+1) * (bar_width + gap)
                     
-                    actions.append({"id": f"swap_{i}_{j}_1", "objectId": id1, "type": "translate", "start": time, "end": time + step_dur, "params": {"to": {"x": x2}}})
-                    actions.append({"id": f"swap_val_{i}_{j}_1", "objectId": val_objs[j], "type": "translate", "start": time, "end": time + step_dur, "params": {"to": {"x": x2 + bar_width/2}}})
+                    timeline.translate(f"swap_{i}_{j}_1", id1, step_dur, x=x2)
+                    timeline.translate(f"swap_val_{i}_{j}_1", val_objs[j], step_dur, x=x2 + bar_width/2)
                     
-                    actions.append({"id": f"swap_{i}_{j}_2", "objectId": id2, "type": "translate", "start": time, "end": time + step_dur, "params": {"to": {"x": x1}}})
-                    actions.append({"id": f"swap_val_{i}_{j}_2", "objectId": val_objs[j+1], "type": "translate", "start": time, "end": time + step_dur, "params": {"to": {"x": x1 + bar_width/2}}})
+                    timeline.translate(f"swap_{i}_{j}_2", id2, step_dur, x=x1)
+                    timeline.translate(f"swap_val_{i}_{j}_2", val_objs[j+1], step_dur, x=x1 + bar_width/2)
                     
                     # Update logical arrays
+                    swaps += 1
                     arr[j], arr[j+1] = arr[j+1], arr[j]
                     bar_objs[j], bar_objs[j+1] = bar_objs[j+1], bar_objs[j]
                     val_objs[j], val_objs[j+1] = val_objs[j+1], val_objs[j]
                     
-                    time += step_dur
+                    timeline.advance(step_dur)
                 else:
-                    time += step_dur * 0.5
+                    timeline.advance(step_dur * 0.5)
                 
                 # De-Highlight
-                def get_color(idx_pos):
-                    return "#f9e2af" if difficulty == "kids" else "#89b4fa"
-
-                actions.append({"id": f"uncomp_{i}_{j}", "objectId": id1, "type": "color", "start": time, "end": time + 0.2, "params": {"color": get_color(j)}})
-                actions.append({"id": f"uncomp_{i}_{j}_2", "objectId": id2, "type": "color", "start": time, "end": time + 0.2, "params": {"color": get_color(j+1)}})
+                timeline.color(f"uncomp_{i}_{j}", id1, base_color, 0.2)
+                timeline.color(f"uncomp_{i}_{j}_2", id2, base_color, 0.2)
                 
             # End of pass
             sorted_idx = n - 1 - i
-            actions.append({"id": f"sorted_{sorted_idx}", "objectId": bar_objs[sorted_idx], "type": "color", "start": time, "end": time + 0.5, "params": {"color": "#a6e3a1"}, "narrative": f"{arr[sorted_idx]} is now sorted." if difficulty != "kids" else "Sorted!"})
-            time += 0.5
+            timeline.color(f"sorted_{sorted_idx}", bar_objs[sorted_idx], "#a6e3a1", 0.5,
+                           narrative=f"{arr[sorted_idx]} is now sorted." if difficulty != "kids" else "Sorted!")
+            timeline.advance(0.5)
 
     elif algo_type == "selection":
+        start_line = 4 if difficulty == "beginner" else (1 if difficulty == "kids" else 6)
+        compare_line = 6 if difficulty == "beginner" else (1 if difficulty == "kids" else 8)
+        min_line = 7 if difficulty == "beginner" else (1 if difficulty == "kids" else 9)
+        swap_line = 8 if difficulty == "beginner" else 10
         for i in range(n):
             min_idx = i
             
             # Highlight current start
-            actions.append({
-                "id": f"sel_start_{i}", 
-                "objectId": bar_objs[i], 
-                "type": "color", 
-                "start": time, 
-                "end": time+0.5, 
-                "params": {"color": "#fab387"}, 
-                "narrative": f"Pick {arr[i]} as initial minimum." if difficulty != "kids" else f"Try {arr[i]}!",
-                "codeLine": 4 if difficulty == "beginner" else (1 if difficulty == "kids" else 6)
-            })
-            time += 0.5
+            timeline.color(f"sel_start_{i}", bar_objs[i], "#fab387", 0.5,
+                           narrative=f"Pick {arr[i]} as initial minimum." if difficulty != "kids" else f"Try {arr[i]}!",
+                           code_line=start_line)
+            timeline.advance(0.5)
             
             for j in range(i+1, n):
                 # Compare arr[j] with arr[min_idx]
-                actions.append({
-                    "id": f"sel_comp_{i}_{j}", 
-                    "objectId": bar_objs[j], 
-                    "type": "color", 
-                    "start": time, 
-                    "end": time+0.5, 
-                    "params": {"color": "#e74c3c"}, 
-                    "narrative": CodeGenerator.get_narrative("compare", arr[j], arr[min_idx], language=language, level=difficulty), 
-                    "codeLine": 6 if difficulty == "beginner" else (1 if difficulty == "kids" else 8)
-                })
+                time = timeline.time
+                timeline.color(f"sel_comp_{i}_{j}", bar_objs[j], "#e74c3c", 0.5,
+                               narrative=CodeGenerator.get_narrative("compare", arr[j], arr[min_idx], language=language, level=difficulty),
+                               code_line=compare_line)
                 
                 if arr[j] < arr[min_idx]:
                     # Update min
                     old_min = bar_objs[min_idx]
                     if min_idx != i: # Don't uncolor start yet
-                         actions.append({"id": f"unmin_{i}_{j}", "objectId": old_min, "type": "color", "start": time+0.5, "end": time+1, "params": {"color": "#89b4fa"}})
+                         timeline.color(f"unmin_{i}_{j}", old_min, "#89b4fa", 0.5, start=time+0.5)
                     
                     min_idx = j
-                    actions.append({"id": f"new_min_{i}_{j}", "objectId": bar_objs[min_idx], "type": "color", "start": time+0.5, "end": time+1, "params": {"color": "#fab387"}, "narrative": f"New minimum found: {arr[j]}", "codeLine": 7 if difficulty == "beginner" else (1 if difficulty == "kids" else 9)})
-                    time += 1.0
+                    timeline.color(f"new_min_{i}_{j}", bar_objs[min_idx], "#fab387", 0.5, start=time+0.5,
+                                   narrative=f"New minimum found: {arr[j]}", code_line=min_line)
+                    timeline.advance(1.0)
                 else:
-                    actions.append({"id": f"uncomp_{i}_{j}", "objectId": bar_objs[j], "type": "color", "start": time+0.5, "end": time+1, "params": {"color": "#89b4fa"}})
-                    time += 0.5
+                    timeline.color(f"uncomp_{i}_{j}", bar_objs[j], "#89b4fa", 0.5, start=time+0.5)
+                    timeline.advance(0.5)
             
             # Swap if needed
             if min_idx != i:
-                actions.append({"id": f"swap_narr_{i}", "objectId": "title", "type": "wait", "start": time, "end": time+1, "narrative": CodeGenerator.get_narrative("swap", arr[i], arr[min_idx], language=language, level=difficulty), "codeLine": 8 if difficulty=="beginner" else 10})
+                timeline.wait(f"swap_narr_{i}", "title", 1,
+                              narrative=CodeGenerator.get_narrative("swap", arr[i], arr[min_idx], language=language, level=difficulty),
+                              code_line=swap_line)
                 
                 id1, id2 = bar_objs[i], bar_objs[min_idx]
                 x1 = start_x + i * (bar_width + gap)
                 x2 = start_x + min_idx * (bar_width + gap)
                 
                 # Animate
-                actions.append({"id": f"swap_{i}_pos", "objectId": id1, "type": "translate", "start": time, "end": time+1, "params": {"to": {"x": x2}}})
-                actions.append({"id": f"swap_{i}_val", "objectId": val_objs[i], "type": "translate", "start": time, "end": time+1, "params": {"to": {"x": x2 + bar_width/2}}})
-                actions.append({"id": f"swap_{min_idx}_pos", "objectId": id2, "type": "translate", "start": time, "end": time+1, "params": {"to": {"x": x1}}})
-                actions.append({"id": f"swap_{min_idx}_val", "objectId": val_objs[min_idx], "type": "translate", "start": time, "end": time+1, "params": {"to": {"x": x1 + bar_width/2}}})
+                timeline.translate(f"swap_{i}_pos", id1, 1, x=x2)
+                timeline.translate(f"swap_{i}_val", val_objs[i], 1, x=x2 + bar_width/2)
+                timeline.translate(f"swap_{min_idx}_pos", id2, 1, x=x1)
+                timeline.translate(f"swap_{min_idx}_val", val_objs[min_idx], 1, x=x1 + bar_width/2)
                 
+                swaps += 1
                 arr[i], arr[min_idx] = arr[min_idx], arr[i]
                 bar_objs[i], bar_objs[min_idx] = bar_objs[min_idx], bar_objs[i]
                 val_objs[i], val_objs[min_idx] = val_objs[min_idx], val_objs[i]
                 
-                time += 1.0
+                timeline.advance(1.0)
 
             # Mark sorted
-            actions.append({"id": f"sorted_{i}", "objectId": bar_objs[i], "type": "color", "start": time, "end": time+0.5, "params": {"color": "#a6e3a1"}, "narrative": f"{arr[i]} is sorted."})
-            time += 0.5
-            
+            timeline.color(f"sorted_{i}", bar_objs[i], "#a6e3a1", 0.5, narrative=f"{arr[i]} is sorted.")
+            timeline.advance(0.5)
+
+    # metadata counts what is served, so compact here rather than in generate()
+    actions = compact_actions(objects, timeline.actions())
     return {
         "sceneId": scene_id,
         "width": 800,
         "height": 450,
-        "duration": time + 2,
+        "duration": timeline.time + 2,
         "code": code_content,
         "objects": objects,
-        "actions": actions
+        "actions": actions,
+        "metadata": _sort_metadata(n * (n - 1) // 2 + swaps, actions),
     }
 
-def generate_matrix_template(rows, cols, operation="mult"):
+def _sort_keyframes(scene_id, code_content, data, algo_type):
+    """
+    The compacted scene: all values in one "bars" object, and one "values"
+    keyframe (the whole array, plus the sorted range) per sampled pass.
+    """
+    n = len(data)
+    passes = n - 1 if algo_type == "bubble" else n
+    frames = max(1, min(passes, SORT_ACTION_BUDGET - 4, SORT_KEYFRAME_VALUES // n))
+    # evenly spaced passes, always ending on the sorted array
+    sampled = [-(-(k + 1) * passes // frames) for k in range(frames)]
+    if algo_type == "bubble":
+        states = _bubble_passes(data, sampled)
+        swaps = _count_inversions(data)[1]
+    else:
+        states, swaps = _selection_passes(data, sampled)
+
+    objects = [
+        {"id": "bg", "type": "rect", "props": {"x": 0, "y": 0, "width": 800, "height": 450, "color": "#1e1e2e"}},
+        {"id": "title", "type": "text", "props": {"x": 400, "y": 50, "text": f"{algo_type.title()} Sort: {n} values", "font": "bold 32px Inter", "color": "#89b4fa", "textAlign": "center", "opacity": 0}},
+        {"id": "bars", "type": "bars", "props": {"x": 40, "y": 410, "width": 720, "height": 300, "values": list(data),
+                                                  "max": max(data) or 1, "sorted": [0, 0], "color": "#89b4fa",
+                                                  "sortedColor": "#a6e3a1", "opacity": 0}},
+    ]
+    step = max(0.2, min(1.0, 20 / frames))
+    timeline = Timeline()
+    timeline.fade("show_title", "title", 1, 1.0, start=0.5)
+    timeline.fade("show_bars", "bars", 1, 1.0, start=1.0)
+    timeline.wait("explain", "title", 1.0, start=2.0,
+                  narrative=f"{n} values: showing the array after each pass instead of every comparison.")
+    timeline.time = 3.0
+    largest = algo_type == "bubble"
+    for p, state in zip(sampled, states):
+        region = [n - p, n] if largest else [0, p]
+        if p == passes:
+            region = [0, n]
+        timeline.add(f"pass_{p}", "bars", "values", step, {"values": state, "sorted": region},
+                     narrative=f"Pass {p} of {passes}: the {p} {'largest' if largest else 'smallest'} values are in place.")
+        timeline.advance(step)
+
+    actions = compact_actions(objects, timeline.actions())
+    return {
+        "sceneId": scene_id,
+        "width": 800,
+        "height": 450,
+        "duration": timeline.time + 2,
+        "code": code_content,
+        "objects": objects,
+        "actions": actions,
+        "metadata": _sort_metadata(n * (n - 1) // 2 + swaps, actions, keyframes=frames),
+    }
+
+def _matrix_size(description, group):
+    match = re.search(r'(\d+)[\*x](\d+)', description)
+    return min(int(match.group(group)), 6) if match else None
+
+def _matrix_operation(description):
+    if "exponentiation" in description or "power" in description: return "exp"
+    if "add" in description or "sum" in description: return "add"
+    return "mult"
+
+MATRIX_PARAMS = {
+    "rows": lambda description: _matrix_size(description, 1),
+    "cols": lambda description: _matrix_size(description, 2),
+    "operation": _matrix_operation,
+}
+
+@GENERATORS.register("matrix_op", seeded=True, levels=(), languages=(), indexed=False, params=MATRIX_PARAMS)
+def generate_matrix_template(rows, cols, operation="mult", seed=None):
     """Generates a detailed step-by-step matrix operation template."""
-    import random
+    rng = random.Random(seed)
     
     # Generate Matrix A
-    matrix_a = [[random.randint(0, 5) for _ in range(cols)] for _ in range(rows)]
+    matrix_a = [[rng.randint(0, 5) for _ in range(cols)] for _ in range(rows)]
     
     # Generate Matrix B
     if operation == "mult" or operation == "exp":
         rows_b = cols
         cols_b = rows if operation == "exp" else cols 
-        matrix_b = [[random.randint(0, 5) for _ in range(cols_b)] for _ in range(rows_b)]
+        matrix_b = [[rng.randint(0, 5) for _ in range(cols_b)] for _ in range(rows_b)]
         if operation == "exp": matrix_b = matrix_a 
     else:
-        matrix_b = [[random.randint(0, 5) for _ in range(cols)] for _ in range(rows)]
+        matrix_b = [[rng.randint(0, 5) for _ in range(cols)] for _ in range(rows)]
 
     # Calculate Result C
     matrix_c = []
@@ -962,10 +1181,12 @@ def generate_matrix_template(rows, cols, operation="mult"):
         "actions": actions
     }
 
-def generate_quicksort_template(idx, difficulty="beginner", language="python"):
+@GENERATORS.register("quicksort", seeded=True)
+@GENERATORS.register("dynamic:quicksort", seeded=True)
+def generate_quicksort_template(idx, difficulty="beginner", language="python", seed=None):
     """Generates a Quicksort partitioning visualization."""
-    import random
-    data = [random.randint(20, 90) for _ in range(7)]
+    rng = random.Random(seed)
+    data = [rng.randint(20, 90) for _ in range(7)]
     scene_id = f"algo_quicksort_{idx}"
     
     code_content = CodeGenerator.get_code("quicksort", language=language, level=difficulty)
@@ -983,39 +1204,129 @@ def generate_quicksort_template(idx, difficulty="beginner", language="python"):
         objects.append({"id": f"txt_{i}", "type": "text", "props": {"x": start_x + i*(bar_w+gap) + bar_w/2, "y": 400 - val*3.5 - 10, "text": str(val), "font": "16px monospace", "color": "#fff", "textAlign": "center"}})
         
     pivot_idx = len(data) - 1
-    actions = [
-        {"id": "hl_pivot", "objectId": f"bar_{pivot_idx}", "type": "fade", "start": 1, "end": 2, "params": {"color": "#f38ba8"}, "narrative": f"Pick {data[pivot_idx]} as the pivot."},
-    ]
+    timeline = Timeline(start=1)
+    timeline.add("hl_pivot", f"bar_{pivot_idx}", "fade", 1, {"color": "#f38ba8"}, narrative=f"Pick {data[pivot_idx]} as the pivot.")
     
     i = -1
     for j in range(len(data) - 1):
-        actions.append({"id": f"scan_{j}", "objectId": f"bar_{j}", "type": "fade", "start": 3 + j*2, "end": 4 + j*2, "params": {"color": "#fab387"}, "narrative": f"Compare {data[j]} with pivot."})
+        timeline.add(f"scan_{j}", f"bar_{j}", "fade", 1, {"color": "#fab387"}, start=3 + j*2, narrative=f"Compare {data[j]} with pivot.")
         if data[j] <= data[pivot_idx]:
             i += 1
             if i != j:
-                actions.append({"id": f"swap_{j}", "objectId": f"bar_{j}", "type": "translate", "start": 4 + j*2, "end": 5 + j*2, "params": {"to": {"x": start_x + i*(bar_w+gap), "y": 400 - data[j]*3.5}}, "narrative": "Swap into left side."})
-                actions.append({"id": f"swap_t_{j}", "objectId": f"txt_{j}", "type": "translate", "start": 4 + j*2, "end": 5 + j*2, "params": {"to": {"x": start_x + i*(bar_w+gap) + bar_w/2, "y": 400 - data[j]*3.5 - 10}}})
+                timeline.translate(f"swap_{j}", f"bar_{j}", 1, start=4 + j*2, x=start_x + i*(bar_w+gap), y=400 - data[j]*3.5,
+                                   narrative="Swap into left side.")
+                timeline.translate(f"swap_t_{j}", f"txt_{j}", 1, start=4 + j*2, x=start_x + i*(bar_w+gap) + bar_w/2, y=400 - data[j]*3.5 - 10)
+
+    return {"sceneId": scene_id, "width": 800, "height": 450, "duration": 18, "code": code_content, "objects": objects, "actions": timeline.actions()}
+
+GRAPH_MAX_EDGES = 100_000
+GRAPH_NARRATED_VISITS = 40
+
+_GRAPH_EDGE = r'(\w+)\s*-+>?\s*(\w+)(?:\s*[:=]\s*(\d+(?:\.\d+)?))?'
+_GRAPH_EDGES = re.compile(_GRAPH_EDGE)
+_GRAPH_EDGE_LIST = re.compile(rf'{_GRAPH_EDGE}(?:\s*,\s*{_GRAPH_EDGE})+')
+
+def _graph_edges(description):
+    """
+    Edges listed after "graph" or "edges" in the prompt: "bfs on graph A-B,
+    A-C, B-D" ("A->B" for an arc, "A-B:4" for a weight). Without a colon
+    ("edges: A-B") it takes a comma-separated list of two edges or more, so
+    hyphenated words ("breadth-first") are not read as a graph.
+    """
+    match = re.search(r'\b(?:graph|edges)\b(\s*:)?', description, re.IGNORECASE)
+    if not match:
+        return None
+    start, end = match.end(), len(description)
+    if not match.group(1):
+        listed = _GRAPH_EDGE_LIST.search(description, start)
+        if not listed:
+            return None
+        start, end = listed.span()
+    edges = []
+    for m in _GRAPH_EDGES.finditer(description, start, end):
+        u, v, weight = m.groups()
+        edges.append((u, v) if weight is None else (u, v, float(weight) if "." in weight else int(weight)))
+        if len(edges) == GRAPH_MAX_EDGES:
+            break
+    return tuple(edges) or None
+
+def _graph_directed(description):
+    """Whether the prompt's edges are arcs ("A->B")."""
+    return True if re.search(r'\w\s*-+>\s*\w', description) else None
 
-    return {"sceneId": scene_id, "width": 800, "height": 450, "duration": 18, "code": code_content, "objects": objects, "actions": actions}
+GRAPH_PARAMS = {"edges": _graph_edges, "directed": _graph_directed}
 
-def generate_graph_algo_template(idx, algo="dijkstra", difficulty="beginner", language="python"):
-    """Generates a Dijkstra pathfinding visualization."""
+def _graph_layout(graph, source, top=130, bottom=400, width=800):
+    """
+    Positions for a user graph, one row per hop from source (unreachable
+    nodes on a last row), and a node radius that keeps the widest row apart.
+    """
+    level = graph.levels(source)
+    unreached = max(l for l in level if l is not None) + 1
+    rows = {}
+    for i, l in enumerate(level):
+        rows.setdefault(unreached if l is None else l, []).append(i)
+    depth = max(rows)
+    widest = max(len(row) for row in rows.values())
+    radius = max(2, min(25, 0.35 * width / (widest + 1), 0.35 * (bottom - top) / (depth + 1)))
+    positions = [None] * len(graph)
+    for l, row in rows.items():
+        y = round(top + (bottom - top) * l / depth, 1) if depth else (top + bottom) / 2
+        for k, i in enumerate(row):
+            positions[i] = (round(width * (k + 1) / (len(row) + 1), 1), y)
+    return positions, radius
+
+def _graph_pace(visits):
+    """Time scale for a traversal: past GRAPH_NARRATED_VISITS visits the steps speed up to fit."""
+    return min(1.0, GRAPH_NARRATED_VISITS / max(visits, 1))
+
+@GENERATORS.register("dynamic:dijkstra", algo="dijkstra", params=GRAPH_PARAMS)
+def generate_graph_algo_template(idx, algo="dijkstra", difficulty="beginner", language="python", edges=None, directed=False):
+    """
+    Generates a Dijkstra pathfinding visualization: nodes settle nearest
+    first while their neighbours' distances are relaxed. Runs on the graph
+    given in the prompt (weighted "A-B:4" edges, from the first node), or on
+    a small example graph.
+    """
     scene_id = f"graph_{algo}_{idx}"
     
     code_content = CodeGenerator.get_code(algo, language=language, level=difficulty)
-    nodes = [{"id": "A", "x": 100, "y": 225}, {"id": "B", "x": 300, "y": 100}, {"id": "C", "x": 300, "y": 350}, {"id": "D", "x": 500, "y": 225}, {"id": "E", "x": 700, "y": 225}]
-    edges = [("A", "B", 4), ("A", "C", 2), ("B", "C", 5), ("B", "D", 10), ("C", "D", 3), ("D", "E", 1)]
+    if edges:
+        graph = Graph.from_edges(edges, directed=directed)
+        positions, radius = _graph_layout(graph, 0)
+    else:
+        nodes = [{"id": "A", "x": 100, "y": 225}, {"id": "B", "x": 300, "y": 100}, {"id": "C", "x": 300, "y": 350}, {"id": "D", "x": 500, "y": 225}, {"id": "E", "x": 700, "y": 225}]
+        graph = Graph.from_edges([("A", "B", 4), ("A", "C", 2), ("B", "C", 5), ("B", "D", 10), ("C", "D", 3), ("D", "E", 1)],
+                                 nodes=[n["id"] for n in nodes])
+        positions, radius = [(n["x"], n["y"]) for n in nodes], 25
+    ids = graph.ids
     objects = [{"id": "bg", "type": "rect", "props": {"x": 0, "y": 0, "width": 800, "height": 450, "color": "#1e1e2e"}}, {"id": "title", "type": "text", "props": {"x": 400, "y": 40, "text": "Dijkstra's Shortest Path", "font": "bold 28px Inter", "color": "#89b4fa", "textAlign": "center"}}]
-    for u_id, v_id, w in edges:
-        u, v = next(n for n in nodes if n["id"] == u_id), next(n for n in nodes if n["id"] == v_id)
-        objects.append({"id": f"e_{u_id}_{v_id}", "type": "path", "props": {"d": f"M {u['x']} {u['y']} L {v['x']} {v['y']}", "color": "#45475a", "width": 3}})
-        objects.append({"id": f"w_{u_id}_{v_id}", "type": "text", "props": {"x": (u['x']+v['x'])/2, "y": (u['y']+v['y'])/2 - 10, "text": str(w), "font": "14px monospace", "color": "#fff"}})
-    for n in nodes:
-        objects.append({"id": f"n_{n['id']}", "type": "circle", "props": {"x": n['x'], "y": n['y'], "r": 25, "color": "#313244"}})
-        objects.append({"id": f"l_{n['id']}", "type": "text", "props": {"x": n['x'], "y": n['y']+8, "text": n['id'], "font": "bold 20px Inter", "color": "#fff", "textAlign": "center"}})
-        objects.append({"id": f"d_{n['id']}", "type": "text", "props": {"x": n['x'], "y": n['y']+50, "text": "∞", "font": "14px monospace", "color": "#89b4fa", "textAlign": "center"}})
-    actions = [{"id": "a1", "objectId": "d_A", "type": "fade", "start": 1, "end": 2, "params": {"opacity": 1}, "narrative": "Start at Node A."}, {"id": "a2", "objectId": "n_A", "type": "fade", "start": 1, "end": 2, "params": {"color": "#a6e3a1"}}, {"id": "a3", "objectId": "n_C", "type": "fade", "start": 3, "end": 4, "params": {"color": "#fab387"}, "narrative": CodeGenerator.get_narrative(f"{algo}_update", "C", "2", language=language, level=difficulty)}]
-    return {"sceneId": scene_id, "width": 800, "height": 450, "duration": 12, "code": code_content, "objects": objects, "actions": actions}
+    for (u, v), w in zip(graph.edges, graph.weights):
+        (ux, uy), (vx, vy) = positions[u], positions[v]
+        objects.append({"id": f"e_{ids[u]}_{ids[v]}", "type": "path", "props": {"d": f"M {ux} {uy} L {vx} {vy}", "color": "#45475a", "width": 3}})
+        objects.append({"id": f"w_{ids[u]}_{ids[v]}", "type": "text", "props": {"x": (ux+vx)/2, "y": (uy+vy)/2 - 10, "text": str(w), "font": "14px monospace", "color": "#fff"}})
+    for i, (x, y) in enumerate(positions):
+        objects.append({"id": f"n_{ids[i]}", "type": "circle", "props": {"x": x, "y": y, "r": radius, "color": "#313244"}})
+        objects.append({"id": f"l_{ids[i]}", "type": "text", "props": {"x": x, "y": y+8, "text": str(ids[i]), "font": "bold 20px Inter", "color": "#fff", "textAlign": "center"}})
+        objects.append({"id": f"d_{ids[i]}", "type": "text", "props": {"x": x, "y": y+radius*2, "text": "∞", "font": "14px monospace", "color": "#89b4fa", "textAlign": "center"}})
+
+    order = list(graph.dijkstra(0))
+    pace = _graph_pace(len(order))
+    timeline = Timeline(start=1)
+    timeline.add("d_start", f"d_{ids[0]}", "fade", pace, {"text": "0", "opacity": 1}, narrative=f"Start at Node {ids[0]} with distance 0.")
+    timeline.advance(pace)
+    for k, (u, dist, relaxed) in enumerate(order):
+        narrated = k < GRAPH_NARRATED_VISITS
+        timeline.color(f"settle_{ids[u]}", f"n_{ids[u]}", "#a6e3a1", 0.6 * pace,
+                       narrative=f"Node {ids[u]} is settled at distance {dist:g}." if narrated else None)
+        timeline.advance(0.8 * pace)
+        for v, new_dist, e in relaxed:
+            a, b = graph.edges[e]
+            timeline.color(f"relax_{ids[u]}_{ids[v]}_{k}", f"e_{ids[a]}_{ids[b]}", "#fab387", 0.5 * pace)
+            timeline.add(f"dist_{ids[v]}_{k}", f"d_{ids[v]}", "fade", 0.5 * pace, {"text": f"{new_dist:g}", "opacity": 1},
+                         narrative=CodeGenerator.get_narrative(f"{algo}_update", ids[v], f"{new_dist:g}", language=language, level=difficulty) if narrated else None)
+            timeline.advance(0.6 * pace)
+    return {"sceneId": scene_id, "width": 800, "height": 450, "duration": timeline.time + 2, "code": code_content, "objects": objects, "actions": timeline.actions()}
 
 def generate_fractal_template(idx, fractal="koch"):
     """Generates a recursive fractal visualization."""
@@ -1037,8 +1348,10 @@ def generate_ai_template(idx, model="neural_net"):
     return {"sceneId": scene_id, "width": 800, "height": 450, "duration": 10, "code": "y = activation(Wx + b)", "objects": objects, "actions": actions}
 
 
-def generate_advanced_math_template(topic):
+@GENERATORS.register("dynamic:", seeded=True, levels=(), languages=(), indexed=False, arg="topic")
+def generate_advanced_math_template(topic, seed=None):
     """Generates templates for advanced math concepts."""
+    rng = random.Random(seed)
     scene_id = f"adv_{topic.lower().replace(' ', '_')}"
     objects = [{"id": "bg", "type": "rect", "props": {"x": 0, "y": 0, "width": 800, "height": 450, "color": "#111"}}]
     actions = []
@@ -1086,7 +1399,7 @@ def generate_advanced_math_template(topic):
         path_d = "M 100 350 Q 400 50 700 350"
         objects.append({"id": "curve", "type": "path", "props": {"d": path_d, "color": "#fff", "width": 2}})
         for i in range(10):
-            h = random.randint(50, 200) # In reality should follow curve, but random for visual effect ok
+            h = rng.randint(50, 200) # In reality should follow curve, but random for visual effect ok
             # Better approximation for visual
             x_pos = 100 + i*60
             # Simple parabolic height approx: y = -0.003(x-400)^2 + 300
@@ -1115,8 +1428,8 @@ def generate_advanced_math_template(topic):
     }
 
 # --- GENERATE LIBRARIES ---
-
-GEOMETRY_TEMPLATES = [generate_polygon_template(n) for n in range(3, 54)] # 51 templates
+# Scenes are registered by key and only generated the first time they are
+# requested (see template_registry.TemplateRegistry).
 
 FORMULAS = [
     ("Area of Circle", "A = πr²", "Area is pi times radius squared"),
@@ -1257,10 +1570,6 @@ FORMULAS = [
     ("States of Matter", "PV = nRT", "Solid, Liquid, Gas"),
     ("Force and Pressure", "P = F/A", "Force distribution")
 ]
-MATH_TEMPLATES = [generate_formula_template(n, f, d) for n, f, d in FORMULAS] # 50 templates
-
-VECTOR_TEMPLATES = [generate_vector_template(i) for i in range(50)] # 50 templates
-
 FUNCTIONS = [
     ("x^2", "x**2"), ("x^3", "x**3"), ("sin(x)", "sin(x)"), ("cos(x)", "cos(x)"), ("tan(x)", "tan(x)"),
     ("exp(x)", "exp(x)"), ("sqrt(x)", "sqrt(x)"), ("1/x", "1/x"), ("-x^2", "-x**2"), ("abs(x)", "abs(x)"),
@@ -1273,66 +1582,71 @@ FUNCTIONS = [
     ("ceil", "math.ceil(x)"), ("round", "round(x)"), ("x%1", "x%1"), ("x^3-x", "x**3-x"), ("x^4-x^2", "x**4-x**2"),
     ("sin(x)+cos(x)", "sin(x)+cos(x)"), ("sin(x)-cos(x)", "sin(x)-cos(x)"), ("sin(x)*cos(x)", "sin(x)*cos(x)"), ("sin(x^2)", "sin(x**2)"), ("cos(x^2)", "cos(x**2)")
 ]
-GRAPH_TEMPLATES = [generate_graph_template(n, e) for n, e in FUNCTIONS] # 50 templates
-
-DERIVATION_TEMPLATES = [generate_derivation_template(i) for i in range(50)] # 50 templates
-
-ALGO_TEMPLATES = [generate_algo_template(i) for i in range(50)] # 50 templates
-
-SCIENTIFIC_TEMPLATES = [generate_atom_template(i) for i in range(1, 51)] # 50 templates
 
 # Master Dictionary
-GENERATED_TEMPLATES = {}
-for t in GEOMETRY_TEMPLATES: GENERATED_TEMPLATES[t["sceneId"]] = t
-for t in MATH_TEMPLATES: GENERATED_TEMPLATES[t["sceneId"]] = t
-for t in VECTOR_TEMPLATES: GENERATED_TEMPLATES[t["sceneId"]] = t
-for t in GRAPH_TEMPLATES: GENERATED_TEMPLATES[t["sceneId"]] = t
-for t in DERIVATION_TEMPLATES: GENERATED_TEMPLATES[t["sceneId"]] = t
-for t in ALGO_TEMPLATES: GENERATED_TEMPLATES[t["sceneId"]] = t
-for t in SCIENTIFIC_TEMPLATES: GENERATED_TEMPLATES[t["sceneId"]] = t
+GENERATED_TEMPLATES = TemplateRegistry()
+for n in range(3, 54): # 51 templates
+    GENERATED_TEMPLATES.register_static(f"poly_{n}", generate_polygon_template, n, seed=n)
+for n, f, d in FORMULAS:
+    GENERATED_TEMPLATES.register_static(f"formula_{n.lower().replace(' ', '_')}", generate_formula_template, n, f, d, seed=0)
+for i in range(50):
+    GENERATED_TEMPLATES.register(f"vector_gen_{i}", generate_vector_template, i, seed=i)
+for n, e in FUNCTIONS:
+    GENERATED_TEMPLATES.register_static(f"graph_{n}", generate_graph_template, n, e)
+for i in range(50):
+    GENERATED_TEMPLATES.register_static(f"deriv_x{i + 2}", generate_derivation_template, i)
+for i in range(50):
+    GENERATED_TEMPLATES.register(f"sort_bubble_{i}", generate_algo_template, i, seed=i)
+for n in range(1, 51):
+    GENERATED_TEMPLATES.register_static(f"atom_{n}", generate_atom_template, n)
 
 # New Advanced Topics
-QUICK_TEMPLATES = [generate_quicksort_template(i) for i in range(20)]
-GRAPH_ALGO_TEMPLATES = [generate_graph_algo_template(i) for i in range(20)]
-FRACTAL_TEMPLATES = [generate_fractal_template(i) for i in range(20)]
-AI_TEMPLATES = [generate_ai_template(i) for i in range(20)]
-
-for t in QUICK_TEMPLATES: GENERATED_TEMPLATES[t["sceneId"]] = t
-for t in GRAPH_ALGO_TEMPLATES: GENERATED_TEMPLATES[t["sceneId"]] = t
-for t in FRACTAL_TEMPLATES: GENERATED_TEMPLATES[t["sceneId"]] = t
-for t in AI_TEMPLATES: GENERATED_TEMPLATES[t["sceneId"]] = t
+for i in range(20):
+    GENERATED_TEMPLATES.register(f"algo_quicksort_{i}", generate_quicksort_template, i, seed=i)
+for i in range(20):
+    GENERATED_TEMPLATES.register(f"graph_dijkstra_{i}", generate_graph_algo_template, i)
+for i in range(20):
+    GENERATED_TEMPLATES.register(f"fractal_koch_{i}", generate_fractal_template, i)
+for i in range(20):
+    GENERATED_TEMPLATES.register(f"ai_neural_net_{i}", generate_ai_template, i)
 
 def get_generated_template(key):
     return GENERATED_TEMPLATES.get(key)
 
-def generate_full_course_template():
-    """Generates a master template combining all formula animations."""
-    combined_objects = [
-        {"id": "bg", "type": "rect", "props": {"x": 0, "y": 0, "width": 800, "height": 450, "color": "#1e1e2e"}}
+def iter_full_course(seed=None):
+    """Streams the full course topic by topic: each topic's objects, then its actions."""
+    target_topics = [
+        "Newton's Laws", "Friction", "Work Energy Principle", "Solar System", "Life Cycle of Star",
+        "Carbon Cycle", "Nitrogen Cycle", "Greenhouse Effect", "Global Warming", "Water Cycle",
+        "Photosynthesis", "Respiration", "Digestive System", "Human Heart", "Nervous System",
+        "Electricity Basics", "Ohm's Law", "Reflection Refraction", "Sound Propagation",
+        "States of Matter", "Force and Pressure"
     ]
-    combined_actions = []
-    
+    yield scene_stream.header({
+        "sceneId": "full_course",
+        "width": 800,
+        "height": 450,
+        "code": "# Full Course Generated\n# Topics: " + ", ".join(target_topics)
+    })
+
     current_time = 0
     topic_duration = 10 # Base duration per topic
     
     # Intro
-    combined_objects.append({"id": "intro_title", "type": "text", "props": {"x": 400, "y": 225, "text": "DevForge Full Course", "font": "bold 40px Inter", "color": "#fff", "opacity": 0}})
-    combined_actions.append({"id": "intro_in", "objectId": "intro_title", "type": "fade", "start": 0.5, "end": 1.5, "params": {"opacity": 1}})
-    combined_actions.append({"id": "intro_out", "objectId": "intro_title", "type": "fade", "start": 3.5, "end": 4.5, "params": {"opacity": 0}})
+    yield scene_stream.objects([
+        {"id": "bg", "type": "rect", "props": {"x": 0, "y": 0, "width": 800, "height": 450, "color": "#1e1e2e"}},
+        {"id": "intro_title", "type": "text", "props": {"x": 400, "y": 225, "text": "DevForge Full Course", "font": "bold 40px Inter", "color": "#fff", "opacity": 0}}
+    ])
     current_time += 5
+    yield scene_stream.actions([
+        {"id": "intro_in", "objectId": "intro_title", "type": "fade", "start": 0.5, "end": 1.5, "params": {"opacity": 1}},
+        {"id": "intro_out", "objectId": "intro_title", "type": "fade", "start": 3.5, "end": 4.5, "params": {"opacity": 0}}
+    ], current_time)
     
     # Iterate through selected formulas (subset to avoid 10 min video if needed, but user asked for full)
     # Let's take the new ones we added + some classics
     # The user listed specific topics in the prompt. Let's try to match those.
     
-    target_topics = [
-        "Newton's Laws", "Friction", "Work Energy Principle", "Solar System", "Life Cycle of Star",
-        "Carbon Cycle", "Nitrogen Cycle", "Greenhouse Effect", "Global Warming", "Water Cycle",
-        "Photosynthesis", "Respiration", "Digestive System", "Human Heart", "Nervous System",
-        "Electricity Basics", "Ohm's Law", "Reflection Refraction", "Sound Propagation",
-        "States of Matter", "Force and Pressure"
-    ]
-    
     for i, topic in enumerate(target_topics):
         # Find formula data
         formula_data = next((f for f in FORMULAS if f[0] == topic), None)
@@ -1343,12 +1657,13 @@ def generate_full_course_template():
         name, eqn, desc = formula_data
         
         # Generate template
-        tmpl = generate_formula_template(name, eqn, desc)
+        tmpl = generate_formula_template(name, eqn, desc, seed)
         
         # Prefix for uniqueness
         prefix = f"t{i}_"
         
         # Add Objects (skip bg)
+        topic_objects = []
         for obj in tmpl["objects"]:
             if obj["id"] == "bg": continue
             
@@ -1361,9 +1676,11 @@ def generate_full_course_template():
             if "opacity" not in new_obj["props"]:
                 new_obj["props"]["opacity"] = 0
             
-            combined_objects.append(new_obj)
+            topic_objects.append(new_obj)
+        yield scene_stream.objects(topic_objects)
             
         # Add Actions with time offset
+        topic_actions = []
         for act in tmpl["actions"]:
             new_act = act.copy()
             new_act["id"] = prefix + act["id"]
@@ -1375,44 +1692,45 @@ def generate_full_course_template():
             if "params" in new_act and "pathId" in new_act["params"]:
                 new_act["params"]["pathId"] = prefix + new_act["params"]["pathId"]
                 
-            combined_actions.append(new_act)
+            topic_actions.append(new_act)
             
         # Transition out (Fade out all objects of this topic)
-        # Find all objects for this topic
-        topic_objs = [obj["id"] for obj in combined_objects if obj["id"].startswith(prefix)]
-        for obj_id in topic_objs:
-            combined_actions.append({
-                "id": f"cleanup_{obj_id}",
-                "objectId": obj_id,
+        for obj in topic_objects:
+            topic_actions.append({
+                "id": f"cleanup_{obj['id']}",
+                "objectId": obj["id"],
                 "type": "fade",
                 "start": current_time + tmpl["duration"] - 1,
                 "end": current_time + tmpl["duration"],
                 "params": {"opacity": 0}
             })
             
+        # Every action of a topic's objects is in this part, so compacting it
+        # alone matches compacting the assembled course
+        topic_actions = compact_actions(topic_objects, topic_actions)
         current_time += tmpl["duration"]
+        # The next topic starts here, so everything before it has been sent
+        yield scene_stream.actions(topic_actions, current_time)
         
-    return {
-        "sceneId": "full_course",
-        "width": 800,
-        "height": 450,
-        "duration": current_time,
-        "code": "# Full Course Generated\n# Topics: " + ", ".join(target_topics),
-        "objects": combined_objects,
-        "actions": combined_actions
-    }
+    yield scene_stream.end({"duration": current_time})
 
-def generate_search_template(idx, difficulty="beginner", language="python", target_val=None):
+@GENERATORS.register("full_course", seeded=True, levels=(), languages=(), indexed=False, stream=iter_full_course)
+def generate_full_course_template(seed=None):
+    """Generates a master template combining all formula animations."""
+    return scene_stream.assemble(iter_full_course(seed))
+
+@GENERATORS.register("binary", seeded=True)
+def generate_search_template(idx, difficulty="beginner", language="python", target_val=None, seed=None):
     """Generates a Binary Search visualization with difficulty levels."""
-    import random
+    rng = random.Random(seed)
     
     # 1. Data Setup
     if difficulty == "kids":
-       data = sorted([random.randint(1, 15) for _ in range(5)])
+       data = sorted([rng.randint(1, 15) for _ in range(5)])
     else:
-       data = sorted([random.randint(10, 99) for _ in range(9)])
+       data = sorted([rng.randint(10, 99) for _ in range(9)])
        
-    target = target_val if target_val else random.choice(data)
+    target = target_val if target_val else rng.choice(data)
     n = len(data)
     
     scene_id = f"search_binary_{idx}"
@@ -1454,24 +1772,27 @@ def generate_search_template(idx, difficulty="beginner", language="python", targ
             "props": {"x": x + bar_width/2, "y": y - 10, "text": str(val), "font": "16px monospace", "color": "#fff", "opacity": 0}
         })
 
-    actions = [
-        {"id": "show_title", "objectId": "title", "type": "fade", "start": 0.5, "end": 1.5, "params": {"opacity": 1}},
-        {"id": "show_ptrs", "objectId": "ptr_low", "type": "fade", "start": 1.5, "end": 2.5, "params": {"opacity": 1}},
-        {"id": "show_ptrs_h", "objectId": "ptr_high", "type": "fade", "start": 1.5, "end": 2.5, "params": {"opacity": 1}}
-    ]
+    timeline = Timeline()
+    timeline.fade("show_title", "title", 1, 1.0, start=0.5)
+    timeline.fade("show_ptrs", "ptr_low", 1, 1.0, start=1.5)
+    timeline.fade("show_ptrs_h", "ptr_high", 1, 1.0, start=1.5)
 
     # Show bars
     for i in range(n):
-        actions.append({"id": f"show_bar_{i}", "objectId": f"bar_{i}", "type": "fade", "start": 1.0 + i*0.1, "end": 1.5 + i*0.1, "params": {"opacity": 1}})
-        actions.append({"id": f"show_val_{i}", "objectId": f"val_{i}", "type": "fade", "start": 1.0 + i*0.1, "end": 1.5 + i*0.1, "params": {"opacity": 1}})
+        timeline.fade(f"show_bar_{i}", f"bar_{i}", 1, 0.5, start=1.0 + i*0.1)
+        timeline.fade(f"show_val_{i}", f"val_{i}", 1, 0.5, start=1.0 + i*0.1)
 
     # 4. Simulation
     low = 0
     high = n - 1
     found = False
     
-    time = 3.0
+    timeline.time = 3.0
     step_dur = 2.0
+    mid_line = 4 if difficulty == "beginner" else (2 if difficulty == "kids" else 3)
+    found_line = 6 if difficulty == "beginner" else (3 if difficulty == "kids" else 6)
+    low_line = 8 if difficulty == "beginner" else (2 if difficulty == "kids" else 8)
+    high_line = 10 if difficulty == "beginner" else (2 if difficulty == "kids" else 10)
     
     while low <= high:
         # Calculate Mid
@@ -1480,99 +1801,69 @@ def generate_search_template(idx, difficulty="beginner", language="python", targ
         mid_x = start_x + mid * (bar_width + gap) + bar_width/2
         
         # Step 2: First Mid
-        actions.append({
-            "id": f"calc_mid_{time}", 
-            "objectId": "ptr_mid", 
-            "type": "translate", # Changed to translate to allow narrative
-            "start": time, 
-            "end": time + 0.5, 
-            "params": {"to": {"x": mid_x, "y": 380 - data[mid]*3 - 30}}, 
-            "narrative": CodeGenerator.get_narrative("binary_mid", data[mid], language=language, level=difficulty), 
-            "codeLine": 4 if difficulty == "beginner" else (2 if difficulty == "kids" else 3)
-        })
-        actions.append({"id": f"show_mid_{time}", "objectId": "ptr_mid", "type": "fade", "start": time, "end": time + 0.5, "params": {"opacity": 1}})
-        time += 0.5
+        time = timeline.time
+        timeline.translate(f"calc_mid_{time}", "ptr_mid", 0.5, x=mid_x, y=380 - data[mid]*3 - 30, # translate (not fade) to allow narrative
+                           narrative=CodeGenerator.get_narrative("binary_mid", data[mid], language=language, level=difficulty),
+                           code_line=mid_line)
+        timeline.fade(f"show_mid_{time}", "ptr_mid", 1, 0.5)
+        time = timeline.advance(0.5)
         
         # Highlight Mid Bar
         mid_bar_id = f"bar_{mid}"
-        actions.append({"id": f"hi_mid_{time}", "objectId": mid_bar_id, "type": "color", "start": time, "end": time + 0.5, "params": {"color": "#e74c3c"}})
+        timeline.color(f"hi_mid_{time}", mid_bar_id, "#e74c3c", 0.5)
         
-        if data[mid] == target_val:
-            actions.append({
-                "id": f"found_{time}",
-                "objectId": mid_bar_id,
-                "type": "color", 
-                "start": time, 
-                "end": time + 1.0, 
-                "params": {"color": "#a6e3a1"}, 
-                "narrative": f"Found target {target_val} at index {mid}!" if difficulty != "kids" else "We found it! Yay!",
-                "codeLine": 6 if difficulty == "beginner" else (3 if difficulty == "kids" else 6)
-            })
+        if data[mid] == target:
+            timeline.color(f"found_{time}", mid_bar_id, "#a6e3a1", 1.0,
+                           narrative=f"Found target {target} at index {mid}!" if difficulty != "kids" else "We found it! Yay!",
+                           code_line=found_line)
             found = True
             break
-        elif data[mid] < target_val:
-            narr = f"{data[mid]} < {target_val}, so ignore left half." if difficulty != "kids" else "Too small! Look to the right."
-            ln = 8 if difficulty == "beginner" else (2 if difficulty == "kids" else 8)
-            actions.append({
-                "id": f"narr_low_{time}",
-                "objectId": "title",
-                "type": "wait",
-                "start": time,
-                "end": time + step_dur,
-                "narrative": narr,
-                "codeLine": ln
-            })
+        elif data[mid] < target:
+            narr = f"{data[mid]} < {target}, so ignore left half." if difficulty != "kids" else "Too small! Look to the right."
+            timeline.wait(f"narr_low_{time}", "title", step_dur, narrative=narr, code_line=low_line)
             
             # Grey out left half
             for i in range(low, mid + 1):
-                actions.append({"id": f"grey_{i}_{time}", "objectId": f"bar_{i}", "type": "color", "start": time, "end": time + 1, "params": {"color": "#45475a"}})
+                timeline.color(f"grey_{i}_{time}", f"bar_{i}", "#45475a", 1)
                 
             low = mid + 1
             # Move Low Ptr
             new_low_x = start_x + low * (bar_width + gap) + bar_width/2
-            actions.append({"id": f"move_low_{time}", "objectId": "ptr_low", "type": "translate", "start": time + 1, "end": time + 1.5, "params": {"to": {"x": new_low_x}}})
+            timeline.translate(f"move_low_{time}", "ptr_low", 0.5, start=time + 1, x=new_low_x)
             
         else:
-            narr = f"{data[mid]} > {target_val}, so ignore right half." if difficulty != "kids" else "Too big! Look to the left."
-            ln = 10 if difficulty == "beginner" else (2 if difficulty == "kids" else 10)
-            actions.append({
-                "id": f"narr_high_{time}",
-                "objectId": "title",
-                "type": "wait",
-                "start": time,
-                "end": time + step_dur,
-                "narrative": narr,
-                "codeLine": ln
-            })
+            narr = f"{data[mid]} > {target}, so ignore right half." if difficulty != "kids" else "Too big! Look to the left."
+            timeline.wait(f"narr_high_{time}", "title", step_dur, narrative=narr, code_line=high_line)
             
             # Grey out right half
             for i in range(mid, high + 1):
-                actions.append({"id": f"grey_{i}_{time}", "objectId": f"bar_{i}", "type": "color", "start": time, "end": time + 1, "params": {"color": "#45475a"}})
+                timeline.color(f"grey_{i}_{time}", f"bar_{i}", "#45475a", 1)
                 
             high = mid - 1
             # Move High Ptr
             new_high_x = start_x + high * (bar_width + gap) + bar_width/2
-            actions.append({"id": f"move_high_{time}", "objectId": "ptr_high", "type": "translate", "start": time + 1, "end": time + 1.5, "params": {"to": {"x": new_high_x}}})
+            timeline.translate(f"move_high_{time}", "ptr_high", 0.5, start=time + 1, x=new_high_x)
 
-        time += 2.0
+        timeline.advance(2.0)
     
     if not found:
-        actions.append({"id": "not_found", "objectId": "title", "type": "wait", "start": time, "end": time + 2, "narrative": "Target not found."})
+        timeline.wait("not_found", "title", 2, narrative="Target not found.")
 
     return {
         "sceneId": scene_id,
         "width": 800,
         "height": 450,
-        "duration": time + 3,
+        "duration": timeline.time + 3,
         "code": code_content,
         "objects": objects,
-        "actions": actions
+        "actions": timeline.actions()
     }
 
 # ==========================================
 # PHASE 1 ALGORITHMS (PART 1)
 # ==========================================
 
+@GENERATORS.register("fibonacci")
 def generate_fibonacci_template(idx, n=10, difficulty="beginner", language="python"):
     """
     Generates Fibonacci Sequence visualization using Dynamic Programming.
@@ -1674,19 +1965,20 @@ def generate_fibonacci_template(idx, n=10, difficulty="beginner", language="pyth
     }
 
 
-def generate_counting_sort_template(idx, difficulty="beginner", language="python"):
+@GENERATORS.register("counting_sort", seeded=True)
+def generate_counting_sort_template(idx, difficulty="beginner", language="python", seed=None):
     """
     Generates Counting Sort visualization.
     Linear time O(n+k) sorting algorithm for integers in a known range.
     """
     from code_generator import CodeGenerator
-    import random
+    rng = random.Random(seed)
     
     scene_id = f"counting_sort_{idx}"
     code_content = CodeGenerator.get_code("counting_sort", language=language, level=difficulty)
     
     # Generate random array with small range
-    data = [random.randint(0, 9) for _ in range(8)]
+    data = [rng.randint(0, 9) for _ in range(8)]
     n = len(data)
     max_val = max(data)
     
@@ -1732,80 +2024,60 @@ def generate_counting_sort_template(idx, difficulty="beginner", language="python
         })
     
     # Create actions
-    actions = []
-    time = 0.5
+    timeline = Timeline(start=0.5)
     
     # Count occurrences
     count = [0] * (max_val + 1)
     for i, val in enumerate(data):
         count[val] += 1
-        actions.append({
-            "id": f"highlight_input_{i}",
-            "objectId": f"input_{i}",
-            "type": "color",
-            "start": time,
-            "end": time + 0.5,
-            "params": {"color": "#f9e2af"},
-            "narrative": f"Count occurrence of {val}"
-        })
+        timeline.color(f"highlight_input_{i}", f"input_{i}", "#f9e2af", 0.5, narrative=f"Count occurrence of {val}")
         
         # Update count array
         new_height = count[val] * 20 + 20
-        actions.append({
-            "id": f"update_count_{val}_{i}",
-            "objectId": f"count_{val}",
-            "type": "resize",
-            "start": time + 0.3,
-            "end": time + 0.8,
-            "params": {"height": new_height, "text": str(count[val]), "color": "#a6e3a1"}
-        })
-        time += 1
+        timeline.add(f"update_count_{val}_{i}", f"count_{val}", "resize", 0.5,
+                     {"height": new_height, "text": str(count[val]), "color": "#a6e3a1"}, start=timeline.time + 0.3)
+        timeline.advance(1)
     
     # Build output array
-    time += 0.5
+    timeline.advance(0.5)
     output_idx = 0
     for val in range(max_val + 1):
         for _ in range(count[val]):
             h = val * 15 + 20
-            actions.append({
-                "id": f"place_output_{output_idx}",
-                "objectId": f"output_{output_idx}",
-                "type": "fade",
-                "start": time,
-                "end": time + 0.5,
-                "params": {"opacity": 1, "height": h, "text": str(val), "color": "#a6e3a1"},
-                "narrative": f"Place {val} in sorted position"
-            })
+            timeline.add(f"place_output_{output_idx}", f"output_{output_idx}", "fade", 0.5,
+                         {"opacity": 1, "height": h, "text": str(val), "color": "#a6e3a1"},
+                         narrative=f"Place {val} in sorted position")
             output_idx += 1
-            time += 0.6
+            timeline.advance(0.6)
     
     return {
         "sceneId": scene_id,
         "width": 800,
         "height": 450,
-        "duration": time + 2,
+        "duration": timeline.time + 2,
         "code": code_content,
         "objects": objects,
-        "actions": actions
+        "actions": timeline.actions()
     }
 
 # ==========================================
 # PHASE 1 ALGORITHMS (PART 2)
 # ==========================================
 
-def generate_bucket_sort_template(idx, difficulty="beginner", language="python"):
+@GENERATORS.register("bucket_sort", seeded=True)
+def generate_bucket_sort_template(idx, difficulty="beginner", language="python", seed=None):
     """
     Generates Bucket Sort visualization.
     Distributes elements into buckets, sorts each bucket, then concatenates.
     """
     from code_generator import CodeGenerator
-    import random
+    rng = random.Random(seed)
     
     scene_id = f"bucket_sort_{idx}"
     code_content = CodeGenerator.get_code("bucket_sort", language=language, level=difficulty)
     
     # Generate data in range 0-99
-    data = [random.randint(0, 99) for _ in range(10)]
+    data = [rng.randint(0, 99) for _ in range(10)]
     n = len(data)
     num_buckets = 5
     
@@ -1843,8 +2115,7 @@ def generate_bucket_sort_template(idx, difficulty="beginner", language="python")
             "props": {"x": x + bucket_width/2, "y": bucket_y - 10, "text": f"[{i*20}-{(i+1)*20-1}]", "font": "12px Inter", "color": "#cdd6f4"}
         })
     
-    actions = []
-    time = 0.5
+    timeline = Timeline(start=0.5)
     
     # Distribute into buckets
     buckets = [[] for _ in range(num_buckets)]
@@ -1852,60 +2123,40 @@ def generate_bucket_sort_template(idx, difficulty="beginner", language="python")
         bucket_idx = min(val // 20, num_buckets - 1)
         buckets[bucket_idx].append(val)
         
-        actions.append({
-            "id": f"highlight_{i}",
-            "objectId": f"input_{i}",
-            "type": "color",
-            "start": time,
-            "end": time + 0.5,
-            "params": {"color": "#f9e2af"},
-            "narrative": f"Place {val} in bucket {bucket_idx}"
-        })
+        timeline.color(f"highlight_{i}", f"input_{i}", "#f9e2af", 0.5, narrative=f"Place {val} in bucket {bucket_idx}")
         
         # Move to bucket
         target_x = 50 + bucket_idx * (bucket_width + 20) + 20
         target_y = bucket_y + 30 + len(buckets[bucket_idx]) * 25
-        actions.append({
-            "id": f"move_{i}",
-            "objectId": f"input_{i}",
-            "type": "translate",
-            "start": time + 0.3,
-            "end": time + 0.8,
-            "params": {"to": {"x": target_x, "y": target_y}, "color": "#a6e3a1"}
-        })
-        time += 1
+        timeline.add(f"move_{i}", f"input_{i}", "translate", 0.5,
+                     {"to": {"x": target_x, "y": target_y}, "color": "#a6e3a1"}, start=timeline.time + 0.3)
+        timeline.advance(1)
     
     # Sort and merge
-    time += 0.5
+    timeline.advance(0.5)
     output_x = 100
     output_idx = 0
     for bucket_idx, bucket in enumerate(buckets):
         bucket.sort()
         for val in bucket:
             x = output_x + output_idx * (bar_width + gap)
-            actions.append({
-                "id": f"final_{output_idx}",
-                "objectId": f"input_{data.index(val)}",
-                "type": "translate",
-                "start": time,
-                "end": time + 0.5,
-                "params": {"to": {"x": x, "y": 120}, "color": "#a6e3a1"},
-                "narrative": "Merge sorted buckets"
-            })
+            timeline.add(f"final_{output_idx}", f"input_{data.index(val)}", "translate", 0.5,
+                         {"to": {"x": x, "y": 120}, "color": "#a6e3a1"}, narrative="Merge sorted buckets")
             output_idx += 1
-            time += 0.4
+            timeline.advance(0.4)
     
     return {
         "sceneId": scene_id,
         "width": 800,
         "height": 450,
-        "duration": time + 2,
+        "duration": timeline.time + 2,
         "code": code_content,
         "objects": objects,
-        "actions": actions
+        "actions": timeline.actions()
     }
 
 
+@GENERATORS.register("knapsack")
 def generate_knapsack_template(idx, difficulty="beginner", language="python"):
     """
     Generates 0/1 Knapsack Problem visualization using Dynamic Programming.
@@ -2004,6 +2255,7 @@ def generate_knapsack_template(idx, difficulty="beginner", language="python"):
     }
 
 
+@GENERATORS.register("lcs")
 def generate_lcs_template(idx, difficulty="beginner", language="python"):
     """
     Generates Longest Common Subsequence visualization.
@@ -2090,6 +2342,7 @@ def generate_lcs_template(idx, difficulty="beginner", language="python"):
     }
 
 
+@GENERATORS.register("edit_distance")
 def generate_edit_distance_template(idx, difficulty="beginner", language="python"):
     """
     Generates Levenshtein Edit Distance visualization.
@@ -2184,6 +2437,7 @@ def generate_edit_distance_template(idx, difficulty="beginner", language="python
 # PHASE 1 ALGORITHMS (PART 3)
 # ==========================================
 
+@GENERATORS.register("nqueens", params={"n": lambda description: 5 if "5" in description else 4})
 def generate_nqueens_template(idx, n=4, difficulty="beginner", language="python"):
     """
     Generates N-Queens Problem visualization using Backtracking.
@@ -2259,6 +2513,7 @@ def generate_nqueens_template(idx, n=4, difficulty="beginner", language="python"
     }
 
 
+@GENERATORS.register("kruskal_mst")
 def generate_kruskal_mst_template(idx, difficulty="beginner", language="python"):
     """
     Generates Kruskal's Minimum Spanning Tree visualization.
@@ -2322,32 +2577,25 @@ def generate_kruskal_mst_template(idx, difficulty="beginner", language="python")
     # Sort edges by weight
     sorted_edges = sorted(enumerate(edges), key=lambda x: x[1][2])
     
-    actions = []
-    time = 0.5
+    timeline = Timeline(start=0.5)
     
     for edge_idx, (u, v, w) in sorted_edges:
-        actions.append({
-            "id": f"select_{edge_idx}",
-            "objectId": f"edge_{edge_idx}",
-            "type": "color",
-            "start": time,
-            "end": time + 0.5,
-            "params": {"color": "#a6e3a1", "width": 4},
-            "narrative": f"Add edge {u}-{v} (weight {w}) to MST"
-        })
-        time += 1
+        timeline.add(f"select_{edge_idx}", f"edge_{edge_idx}", "color", 0.5, {"color": "#a6e3a1", "width": 4},
+                     narrative=f"Add edge {u}-{v} (weight {w}) to MST")
+        timeline.advance(1)
     
     return {
         "sceneId": scene_id,
         "width": 800,
         "height": 450,
-        "duration": time + 2,
+        "duration": timeline.time + 2,
         "code": code_content,
         "objects": objects,
-        "actions": actions
+        "actions": timeline.actions()
     }
 
 
+@GENERATORS.register("prim_mst")
 def generate_prim_mst_template(idx, difficulty="beginner", language="python"):
     """
     Generates Prim's Minimum Spanning Tree visualization.
@@ -2407,46 +2655,31 @@ def generate_prim_mst_template(idx, difficulty="beginner", language="python"):
         })
     
     # Prim's algorithm starting from A
-    actions = []
-    time = 0.5
+    timeline = Timeline(start=0.5)
     
     # Start with A
-    actions.append({
-        "id": "start_A",
-        "objectId": "node_A",
-        "type": "color",
-        "start": time,
-        "end": time + 0.5,
-        "params": {"color": "#a6e3a1"},
-        "narrative": "Start from node A"
-    })
-    time += 1
+    timeline.color("start_A", "node_A", "#a6e3a1", 0.5, narrative="Start from node A")
+    timeline.advance(1)
     
     # Add edges in order: A-D(2), B-C(3), C-E(1), A-B(4)
     mst_edges = [(1, "A", "D", 2), (2, "B", "C", 3), (5, "C", "E", 1), (0, "A", "B", 4)]
     for edge_idx, u, v, w in mst_edges:
-        actions.append({
-            "id": f"add_{edge_idx}",
-            "objectId": f"edge_{edge_idx}",
-            "type": "color",
-            "start": time,
-            "end": time + 0.5,
-            "params": {"color": "#a6e3a1", "width": 4},
-            "narrative": f"Add edge {u}-{v} (weight {w})"
-        })
-        time += 1
+        timeline.add(f"add_{edge_idx}", f"edge_{edge_idx}", "color", 0.5, {"color": "#a6e3a1", "width": 4},
+                     narrative=f"Add edge {u}-{v} (weight {w})")
+        timeline.advance(1)
     
     return {
         "sceneId": scene_id,
         "width": 800,
         "height": 450,
-        "duration": time + 2,
+        "duration": timeline.time + 2,
         "code": code_content,
         "objects": objects,
-        "actions": actions
+        "actions": timeline.actions()
     }
 
 
+@GENERATORS.register("max_subarray")
 def generate_max_subarray_template(idx, difficulty="beginner", language="python"):
     """
     Generates Maximum Subarray (Kadane's Algorithm) visualization.
@@ -2540,19 +2773,20 @@ def generate_max_subarray_template(idx, difficulty="beginner", language="python"
         "actions": actions
     }
 
-def generate_mergesort_template(idx, difficulty="beginner", language="python"):
+@GENERATORS.register("merge_sort", seeded=True)
+def generate_mergesort_template(idx, difficulty="beginner", language="python", seed=None):
     """
     Generates Merge Sort visualization.
     Shows the Divide and Conquer approach: splitting the array and merging sorted halves.
     """
     from code_generator import CodeGenerator
-    import random
+    rng = random.Random(seed)
     
     scene_id = f"mergesort_{idx}"
     code_content = CodeGenerator.get_code("mergesort", language=language, level=difficulty)
     
     # Generate random small array
-    data = [random.randint(10, 90) for _ in range(8)]
+    data = [rng.randint(10, 90) for _ in range(8)]
     n = len(data)
     
     objects = [
@@ -2584,16 +2818,14 @@ def generate_mergesort_template(idx, difficulty="beginner", language="python"):
     # Initial array
     add_bars(data, 0, 400, 0)
     
-    actions = []
-    time = 0.5
+    timeline = Timeline(start=0.5)
     
     # Show initial array
     for i in range(n):
-        actions.append({"id": f"show_base_{i}", "objectId": f"bar_l0_i{i}", "type": "fade", "start": time, "end": time+0.5, "params": {"opacity": 1}})
-    time += 1
+        timeline.fade(f"show_base_{i}", f"bar_l0_i{i}", 1, 0.5)
+    timeline.advance(1)
 
     def merge_sort_viz(arr, level, offset_x, start_idx):
-        nonlocal time
         if len(arr) <= 1:
             return arr
             
@@ -2611,19 +2843,21 @@ def generate_mergesort_template(idx, difficulty="beginner", language="python"):
         add_bars(right, level + 1, right_offset, start_idx + mid)
         
         # Narrative for splitting
-        actions.append({"id": f"nar_split_l{level}_i{start_idx}", "objectId": "status", "type": "fade", "start": time, "end": time+0.5, "params": {"text": f"Split at index {start_idx + mid}"}, "narrative": f"Dividing array of size {len(arr)} into two halves."})
+        timeline.add(f"nar_split_l{level}_i{start_idx}", "status", "fade", 0.5, {"text": f"Split at index {start_idx + mid}"},
+                     narrative=f"Dividing array of size {len(arr)} into two halves.")
         
         for i in range(len(left)):
-            actions.append({"id": f"fadein_l_l{level+1}_i{start_idx+i}", "objectId": f"bar_l{level+1}_i{start_idx+i}", "type": "fade", "start": time, "end": time+0.5, "params": {"opacity": 1}})
+            timeline.fade(f"fadein_l_l{level+1}_i{start_idx+i}", f"bar_l{level+1}_i{start_idx+i}", 1, 0.5)
         for i in range(len(right)):
-            actions.append({"id": f"fadein_r_l{level+1}_i{start_idx+mid+i}", "objectId": f"bar_l{level+1}_i{start_idx+mid+i}", "type": "fade", "start": time, "end": time+0.5, "params": {"opacity": 1}})
-        time += 1
+            timeline.fade(f"fadein_r_l{level+1}_i{start_idx+mid+i}", f"bar_l{level+1}_i{start_idx+mid+i}", 1, 0.5)
+        timeline.advance(1)
         
         left_sorted = merge_sort_viz(left, level + 1, left_offset, start_idx)
         right_sorted = merge_sort_viz(right, level + 1, right_offset, start_idx + mid)
         
         # Visualize merging
-        actions.append({"id": f"nar_merge_l{level}_i{start_idx}", "objectId": "status", "type": "fade", "start": time, "end": time+0.5, "params": {"text": f"Merging..."}, "narrative": f"Merging two sorted subarrays into one of size {len(arr)}."})
+        timeline.add(f"nar_merge_l{level}_i{start_idx}", "status", "fade", 0.5, {"text": f"Merging..."},
+                     narrative=f"Merging two sorted subarrays into one of size {len(arr)}.")
         
         merged = []
         i_idx = j_idx = 0
@@ -2639,32 +2873,35 @@ def generate_mergesort_template(idx, difficulty="beginner", language="python"):
         
         # Update colors on children
         for k in range(len(arr)):
-            actions.append({"id": f"color_merge_l{level+1}_i{start_idx+k}", "objectId": f"bar_l{level+1}_i{start_idx+k}", "type": "color", "start": time, "end": time+0.3, "params": {"color": "#a6e3a1"}})
+            timeline.color(f"color_merge_l{level+1}_i{start_idx+k}", f"bar_l{level+1}_i{start_idx+k}", "#a6e3a1", 0.3)
         
-        time += 0.5
+        timeline.advance(0.5)
         
         # Update parent bars with sorted values
         for k, val in enumerate(merged):
-            actions.append({"id": f"update_parent_l{level}_i{start_idx+k}", "objectId": f"bar_l{level}_i{start_idx+k}", "type": "color", "start": time, "end": time+0.5, "params": {"color": "#a6e3a1", "text": str(val), "height": val*0.6 + 10}})
+            timeline.add(f"update_parent_l{level}_i{start_idx+k}", f"bar_l{level}_i{start_idx+k}", "color", 0.5,
+                         {"color": "#a6e3a1", "text": str(val), "height": val*0.6 + 10})
         
-        time += 0.8
+        timeline.advance(0.8)
         
         return merged
 
     merge_sort_viz(data, 0, 400, 0)
     
-    actions.append({"id": "success", "objectId": "status", "type": "fade", "start": time, "end": time+1, "params": {"text": "Array Sorted!", "color": "#a6e3a1"}, "narrative": "Merge Sort completed successfully using O(n log n) time."})
+    timeline.add("success", "status", "fade", 1, {"text": "Array Sorted!", "color": "#a6e3a1"},
+                 narrative="Merge Sort completed successfully using O(n log n) time.")
 
     return {
         "sceneId": scene_id,
         "width": 800,
         "height": 450,
-        "duration": time + 2,
+        "duration": timeline.time + 2,
         "code": code_content,
         "objects": objects,
-        "actions": actions
+        "actions": timeline.actions()
     }
 
+@GENERATORS.register("bellman_ford")
 def generate_bellman_ford_template(idx, difficulty="beginner", language="python"):
     """
     Generates Bellman-Ford shortest path visualization.
@@ -2720,129 +2957,257 @@ def generate_bellman_ford_template(idx, difficulty="beginner", language="python"
             "props": {"x": mx, "y": my-10, "text": str(w), "font": "14px Inter", "color": "#bac2de"}
         })
 
-    actions = []
-    time = 0.5
+    timeline = Timeline(start=0.5)
     dist = {node['id']: float('inf') for node in nodes}; dist['0'] = 0
-    actions.append({"id": "init", "objectId": "node_0", "type": "color", "start": time, "end": time+0.5, "params": {"text": "S\n0", "color": "#a6e3a1"}, "narrative": "Initializing distances. Source node S set to 0, others to infinity."})
-    time += 1
+    labels = {node['id']: node['val'] for node in nodes}
+    timeline.add("init", "node_0", "color", 0.5, {"text": "S\n0", "color": "#a6e3a1"},
+                 narrative="Initializing distances. Source node S set to 0, others to infinity.")
+    timeline.advance(1)
 
     for it in range(len(nodes) - 1):
         changed = False
-        time += 0.5
+        timeline.advance(0.5)
         for u, v, w in edges:
             if dist[u] != float('inf') and dist[u] + w < dist[v]:
                 dist[v] = dist[u] + w; changed = True
-                v_node_val = next(n for n in nodes if n['id'] == v)['val']
-                actions.append({"id": f"relax_{it}_{u}_{v}", "objectId": f"edge_{u}_{v}", "type": "color", "start": time, "end": time+0.3, "params": {"color": "#f9e2af", "width": 4}})
-                actions.append({"id": f"update_{it}_{v}", "objectId": f"node_{v}", "type": "color", "start": time+0.3, "end": time+0.6, "params": {"text": f"{v_node_val}\n{dist[v]}", "color": "#fab387"}, "narrative": f"Relaxing edge ({next(n for n in nodes if n['id']==u)['val']},{v_node_val}): updated to {dist[v]}."})
-                time += 0.7
-                actions.append({"id": f"reset_{it}_{u}_{v}", "objectId": f"edge_{u}_{v}", "type": "color", "start": time, "end": time+0.1, "params": {"color": "#45475a", "width": 2}})
+                timeline.add(f"relax_{it}_{u}_{v}", f"edge_{u}_{v}", "color", 0.3, {"color": "#f9e2af", "width": 4})
+                timeline.add(f"update_{it}_{v}", f"node_{v}", "color", 0.3, {"text": f"{labels[v]}\n{dist[v]}", "color": "#fab387"},
+                             start=timeline.time + 0.3, narrative=f"Relaxing edge ({labels[u]},{labels[v]}): updated to {dist[v]}.")
+                timeline.advance(0.7)
+                timeline.add(f"reset_{it}_{u}_{v}", f"edge_{u}_{v}", "color", 0.1, {"color": "#45475a", "width": 2})
         if not changed: break
 
-    actions.append({"id": "complete", "objectId": "status", "type": "fade", "start": time, "end": time+1, "params": {"text": "Shortest Paths Calculated", "color": "#a6e3a1"}})
+    timeline.add("complete", "status", "fade", 1, {"text": "Shortest Paths Calculated", "color": "#a6e3a1"})
     return {
         "sceneId": scene_id,
         "width": 800,
         "height": 450,
-        "duration": time + 2,
+        "duration": timeline.time + 2,
         "code": code_content,
         "objects": objects,
-        "actions": actions
+        "actions": timeline.actions()
     }
 
-def generate_floyd_warshall_template(idx, difficulty="beginner", language="python"):
+# Floyd-Warshall runs on the graph of the prompt ("floyd warshall graph A-B:3,
+# B->C:2", the first FLOYD_MAX_NODES nodes), on a random graph of the size
+# asked for ("floyd warshall 200 nodes") or on a small example matrix. Up to
+# FLOYD_CELL_LIMIT vertices every cell is checked on screen; past that the
+# matrix is a "heatmap" object and each k is one "diff" action listing the
+# cells it shortened. Diffs of consecutive k are merged when they would
+# carry more than FLOYD_DIFF_CELLS cells in all.
+FLOYD_MAX_NODES = 300
+FLOYD_CELL_LIMIT = 6
+FLOYD_DIFF_CELLS = 300_000
+FLOYD_MATRIX = [[0, 3, float('inf'), 7], [8, 0, 2, float('inf')], [5, float('inf'), 0, 1], [2, float('inf'), float('inf'), 0]]
+
+def _floyd_size(description):
+    """A requested graph size: "floyd warshall 200 nodes", "floyd-warshall v=50"."""
+    match = re.search(r'\bv\s*=\s*(\d+)|\b(\d+)\s*(?:nodes|vertices)\b', description)
+    if not match:
+        return None
+    return min(max(int(match.group(1) or match.group(2)), 2), FLOYD_MAX_NODES)
+
+FLOYD_PARAMS = {**GRAPH_PARAMS, "size": _floyd_size}
+
+def _floyd_matrix(edges, directed, size):
+    """
+    (names, matrix) of the prompt's graph, of a random directed graph of the
+    given size (the same for every request of that size) or of the example.
+    """
+    if edges:
+        graph = Graph.from_edges(edges, directed=directed)
+        if len(graph) > FLOYD_MAX_NODES:
+            kept = [e for e, (u, v) in enumerate(graph.edges) if u < FLOYD_MAX_NODES and v < FLOYD_MAX_NODES]
+            graph = Graph(graph.ids[:FLOYD_MAX_NODES], [graph.edges[e] for e in kept],
+                          [graph.weights[e] for e in kept], directed)
+        return graph.ids, graph.matrix()
+    if size:
+        rng = random.Random(f"floyd {size}")
+        matrix = [[0 if i == j else float('inf') for j in range(size)] for i in range(size)]
+        for i in range(size):
+            for j in rng.sample(range(size), min(3, size)):
+                if j != i:
+                    matrix[i][j] = rng.randint(1, 20)
+        return [f"V{i}" for i in range(size)], matrix
+    return [f"V{i}" for i in range(len(FLOYD_MATRIX))], FLOYD_MATRIX
+
+def _distance(value):
+    """A distance for the scene: None for no path, ints kept whole."""
+    if value == float('inf'):
+        return None
+    return int(value) if value == int(value) else round(value, 3)
+
+@GENERATORS.register("floyd_warshall", params=FLOYD_PARAMS)
+def generate_floyd_warshall_template(idx, difficulty="beginner", language="python", edges=None, directed=False,
+                                     size=None):
     """
     Generates Floyd-Warshall All-Pairs Shortest Path visualization.
     Shows the distance matrix updating as we consider each vertex as an intermediate node.
+    Large graphs are shown as a heatmap, one diff per vertex (see _floyd_heatmap).
     """
     from code_generator import CodeGenerator
     
     scene_id = f"floyd_warshall_{idx}"
     code_content = CodeGenerator.get_code("floyd_warshall", language=language, level=difficulty)
-    
-    matrix = [[0, 3, float('inf'), 7], [8, 0, 2, float('inf')], [5, float('inf'), 0, 1], [2, float('inf'), float('inf'), 0]]
-    V = 4
+    names, matrix = _floyd_matrix(edges, directed, size)
+    V = len(names)
     
     objects = [
         {"id": "bg", "type": "rect", "props": {"x": 0, "y": 0, "width": 800, "height": 450, "color": "#1e1e2e"}},
         {"id": "title", "type": "text", "props": {"x": 400, "y": 30, "text": "Floyd-Warshall (All-Pairs Shortest Path)", "font": "bold 24px Inter", "color": "#89b4fa"}},
         {"id": "status", "type": "text", "props": {"x": 400, "y": 70, "text": "Initial Distance Matrix", "font": "18px monospace", "color": "#cdd6f4"}}
     ]
+    if V > FLOYD_CELL_LIMIT:
+        return _floyd_heatmap(scene_id, code_content, objects, names, matrix)
     
-    cell_size, start_x, start_y = 60, 280, 150
+    cell_size = min(60, 270 // V); start_x, start_y = 400 - V * cell_size // 2, 150
     for i in range(V):
-        objects.append({"id": f"row_lab_{i}", "type": "text", "props": {"x": start_x - 40, "y": start_y + i*cell_size + 30, "text": f"V{i}", "font": "bold 16px Inter", "color": "#f5c2e7"}})
-        objects.append({"id": f"col_lab_{i}", "type": "text", "props": {"x": start_x + i*cell_size + 30, "y": start_y - 30, "text": f"V{i}", "font": "bold 16px Inter", "color": "#f5c2e7"}})
+        objects.append({"id": f"row_lab_{i}", "type": "text", "props": {"x": start_x - 40, "y": start_y + i*cell_size + cell_size // 2, "text": names[i], "font": "bold 16px Inter", "color": "#f5c2e7"}})
+        objects.append({"id": f"col_lab_{i}", "type": "text", "props": {"x": start_x + i*cell_size + cell_size // 2, "y": start_y - 30, "text": names[i], "font": "bold 16px Inter", "color": "#f5c2e7"}})
         for j in range(V):
             val = matrix[i][j]; display_val = "∞" if val == float('inf') else str(val)
             objects.append({"id": f"cell_bg_{i}_{j}", "type": "rect", "props": {"x": start_x + j*cell_size, "y": start_y + i*cell_size, "width": cell_size, "height": cell_size, "color": "#313244", "borderColor": "#45475a", "borderWidth": 1}})
-            objects.append({"id": f"cell_txt_{i}_{j}", "type": "text", "props": {"x": start_x + j*cell_size + 30, "y": start_y + i*cell_size + 30, "text": display_val, "font": "16px Inter", "color": "#cdd6f4"}})
+            objects.append({"id": f"cell_txt_{i}_{j}", "type": "text", "props": {"x": start_x + j*cell_size + cell_size // 2, "y": start_y + i*cell_size + cell_size // 2, "text": display_val, "font": "16px Inter", "color": "#cdd6f4"}})
 
-    actions = []; time = 1.0; dist = [row[:] for row in matrix]
+    timeline = Timeline(start=1.0); dist = [row[:] for row in matrix]
     for k in range(V):
-        actions.append({"id": f"iter_k_{k}", "objectId": "status", "type": "fade", "start": time, "end": time+0.5, "params": {"text": f"Considering intermediate vertex V{k}"}, "narrative": f"Using V{k} to find shorter paths."})
+        timeline.add(f"iter_k_{k}", "status", "fade", 0.5, {"text": f"Considering intermediate vertex {names[k]}"},
+                     narrative=f"Using {names[k]} to find shorter paths.")
         for i in range(V):
-            actions.append({"id": f"high_row_{k}_{i}", "objectId": f"cell_bg_{k}_{i}", "type": "color", "start": time, "end": time+0.5, "params": {"color": "#45475a"}})
-            actions.append({"id": f"high_col_{k}_{i}", "objectId": f"cell_bg_{i}_{k}", "type": "color", "start": time, "end": time+0.5, "params": {"color": "#45475a"}})
-        time += 0.8
+            timeline.color(f"high_row_{k}_{i}", f"cell_bg_{k}_{i}", "#45475a", 0.5)
+            timeline.color(f"high_col_{k}_{i}", f"cell_bg_{i}_{k}", "#45475a", 0.5)
+        timeline.advance(0.8)
         for i in range(V):
             for j in range(V):
                 if i == k or j == k: continue
-                actions.append({"id": f"check_{k}_{i}_{j}", "objectId": f"cell_bg_{i}_{j}", "type": "color", "start": time, "end": time+0.2, "params": {"color": "#89b4fa"}})
+                timeline.color(f"check_{k}_{i}_{j}", f"cell_bg_{i}_{j}", "#89b4fa", 0.2)
                 if dist[i][k] + dist[k][j] < dist[i][j]:
                     dist[i][j] = dist[i][k] + dist[k][j]
-                    actions.append({"id": f"update_{k}_{i}_{j}", "objectId": f"cell_txt_{i}_{j}", "type": "fade", "start": time+0.2, "end": time+0.4, "params": {"text": str(dist[i][j]), "color": "#a6e3a1"}, "narrative": f"V{i}->V{j} through V{k} is shorter: {dist[i][j]}"})
-                    time += 0.6
-                else: time += 0.2
-                actions.append({"id": f"reset_{k}_{i}_{j}", "objectId": f"cell_bg_{i}_{j}", "type": "color", "start": time, "end": time+0.1, "params": {"color": "#313244"}})
+                    timeline.add(f"update_{k}_{i}_{j}", f"cell_txt_{i}_{j}", "fade", 0.2, {"text": str(dist[i][j]), "color": "#a6e3a1"},
+                                 start=timeline.time + 0.2, narrative=f"{names[i]}->{names[j]} through {names[k]} is shorter: {dist[i][j]}")
+                    timeline.advance(0.6)
+                else: timeline.advance(0.2)
+                timeline.color(f"reset_{k}_{i}_{j}", f"cell_bg_{i}_{j}", "#313244", 0.1)
         for i in range(V):
-            actions.append({"id": f"unhigh_row_{k}_{i}", "objectId": f"cell_bg_{k}_{i}", "type": "color", "start": time, "end": time+0.1, "params": {"color": "#313244"}})
-            actions.append({"id": f"unhigh_col_{k}_{i}", "objectId": f"cell_bg_{i}_{k}", "type": "color", "start": time, "end": time+0.1, "params": {"color": "#313244"}})
-        time += 0.5
+            timeline.color(f"unhigh_row_{k}_{i}", f"cell_bg_{k}_{i}", "#313244", 0.1)
+            timeline.color(f"unhigh_col_{k}_{i}", f"cell_bg_{i}_{k}", "#313244", 0.1)
+        timeline.advance(0.5)
 
-    actions.append({"id": "complete", "objectId": "status", "type": "fade", "start": time, "end": time+1, "params": {"text": "All-Pairs Shortest Paths Found", "color": "#a6e3a1"}})
+    timeline.add("complete", "status", "fade", 1, {"text": "All-Pairs Shortest Paths Found", "color": "#a6e3a1"})
     return {
         "sceneId": scene_id,
         "width": 800,
         "height": 450,
-        "duration": time + 2,
+        "duration": timeline.time + 2,
         "code": code_content,
         "objects": objects,
-        "actions": actions
+        "actions": timeline.actions()
+    }
+
+def _floyd_heatmap(scene_id, code_content, objects, names, matrix):
+    """
+    The distance matrix as one "heatmap" object (row-major values, None for
+    no path) with bands marking row and column k, and per k a "diff" action
+    with the cells that got shorter: "at" their flat indices, "to" their new
+    distances.
+    """
+    V = len(names)
+    cell = 320 / V
+    left, top = 400 - V * cell / 2, 110
+    flat = [d for row in matrix for d in row]
+    diffs = []
+    for k, changed, values in floyd_warshall(matrix):
+        for i, d in zip(changed, values):
+            flat[i] = d
+        diffs.append((k, changed, values))
+    finite = [d for d in flat if d != float('inf')]
+    objects += [
+        {"id": "dist", "type": "heatmap", "props": {"x": round(left, 2), "y": top, "width": 320, "height": 320, "n": V,
+                                                     "values": [_distance(d) for row in matrix for d in row],
+                                                     "max": _distance(max(finite)) or 1, "colors": ["#a6e3a1", "#f38ba8"],
+                                                     "noneColor": "#313244"}},
+        {"id": "k_row", "type": "rect", "props": {"x": round(left, 2), "y": top, "width": 320, "height": round(cell, 2),
+                                                   "color": "#cdd6f4", "opacity": 0}},
+        {"id": "k_col", "type": "rect", "props": {"x": round(left, 2), "y": top, "width": round(cell, 2), "height": 320,
+                                                   "color": "#cdd6f4", "opacity": 0}},
+    ]
+
+    step = max(0.1, min(1.0, 30 / V))
+    timeline = Timeline(start=1.0)
+    timeline.fade("show_k_row", "k_row", 0.25, 0.5, narrative=f"{V} vertices: each step relaxes every pair through one "
+                  "more intermediate vertex, and only the distances that got shorter change colour.")
+    timeline.fade("show_k_col", "k_col", 0.25, 0.5)
+    timeline.advance(1.0)
+    shortened = sum(len(changed) for _, changed, _ in diffs)
+    pending, sent = {}, 0
+    for k, changed, values in diffs:
+        pending.update(zip(changed, values))
+        timeline.translate(f"k_row_{k}", "k_row", step, x=round(left, 2), y=round(top + k * cell, 2))
+        timeline.translate(f"k_col_{k}", "k_col", step, x=round(left + k * cell, 2), y=top)
+        timeline.add(f"iter_k_{k}", "status", "fade", step, {"text": f"k = {names[k]}: {len(changed)} pairs shorter"},
+                     narrative=f"Through {names[k]}: {len(changed)} pairs get shorter." if k < 3 else None)
+        # over budget, a diff waits for the next k while it would overrun its share
+        if pending and (shortened <= FLOYD_DIFF_CELLS or k == V - 1
+                        or sent + len(pending) <= FLOYD_DIFF_CELLS * (k + 1) // V):
+            at = sorted(pending)
+            timeline.add(f"diff_{k}", "dist", "diff", step, {"at": at, "to": [_distance(pending[i]) for i in at]})
+            sent += len(at)
+            pending = {}
+        timeline.advance(step)
+
+    timeline.fade("hide_k_row", "k_row", 0, 0.5)
+    timeline.fade("hide_k_col", "k_col", 0, 0.5)
+    reachable = sum(d != float('inf') for d in flat) - V
+    timeline.add("complete", "status", "fade", 1, {"text": "All-Pairs Shortest Paths Found", "color": "#a6e3a1"},
+                 narrative=f"Done: {reachable} of {V * (V - 1)} pairs are connected, after {shortened} improvements.")
+    return {
+        "sceneId": scene_id,
+        "width": 800,
+        "height": 450,
+        "duration": timeline.time + 2,
+        "code": code_content,
+        "objects": objects,
+        "actions": timeline.actions(),
+        "metadata": {"vertices": V, "shortened": shortened, "diffCells": sent},
     }
 
-def generate_dfs_bfs_template(idx, algo_type="bfs", difficulty="beginner", language="python"):
+@GENERATORS.register("dfs", algo_type="dfs", params=GRAPH_PARAMS)
+@GENERATORS.register("bfs", algo_type="bfs", params=GRAPH_PARAMS)
+def generate_dfs_bfs_template(idx, algo_type="bfs", difficulty="beginner", language="python", edges=None, directed=False):
     """
     Generates DFS or BFS Graph Traversal visualization.
     Shows the difference between Stack (DFS) and Queue (BFS) order.
+    Traverses the graph given in the prompt (from its first node), or a
+    small example tree.
     """
     from code_generator import CodeGenerator
     
     scene_id = f"{algo_type}_{idx}"
     code_content = CodeGenerator.get_code(algo_type, language=language, level=difficulty)
     
-    # Simple graph layout
-    nodes = [
-        {"id": "0", "x": 400, "y": 80, "val": "A"},
-        {"id": "1", "x": 200, "y": 180, "val": "B"},
-        {"id": "2", "x": 600, "y": 180, "val": "C"},
-        {"id": "3", "x": 100, "y": 300, "val": "D"},
-        {"id": "4", "x": 300, "y": 300, "val": "E"},
-        {"id": "5", "x": 500, "y": 300, "val": "F"},
-        {"id": "6", "x": 700, "y": 300, "val": "G"},
-    ]
-    edges = [
-        ("0", "1"), ("0", "2"),
-        ("1", "3"), ("1", "4"),
-        ("2", "5"), ("2", "6")
-    ]
-    
-    adj = {
-        "0": ["1", "2"],
-        "1": ["3", "4"],
-        "2": ["5", "6"],
-        "3": [], "4": [], "5": [], "6": []
-    }
+    if edges:
+        graph = Graph.from_edges(edges, directed=directed)
+        positions, radius = _graph_layout(graph, 0)
+        labels = [str(id) for id in graph.ids]
+    else:
+        # Simple graph layout
+        nodes = [
+            {"id": "0", "x": 400, "y": 80, "val": "A"},
+            {"id": "1", "x": 200, "y": 180, "val": "B"},
+            {"id": "2", "x": 600, "y": 180, "val": "C"},
+            {"id": "3", "x": 100, "y": 300, "val": "D"},
+            {"id": "4", "x": 300, "y": 300, "val": "E"},
+            {"id": "5", "x": 500, "y": 300, "val": "F"},
+            {"id": "6", "x": 700, "y": 300, "val": "G"},
+        ]
+        graph = Graph.from_edges([
+            ("0", "1"), ("0", "2"),
+            ("1", "3"), ("1", "4"),
+            ("2", "5"), ("2", "6")
+        ], nodes=[node["id"] for node in nodes], directed=True)
+        positions, radius = [(node["x"], node["y"]) for node in nodes], 25
+        labels = [node["val"] for node in nodes]
+    ids = graph.ids
     
     objects = [
         {"id": "bg", "type": "rect", "props": {"x": 0, "y": 0, "width": 800, "height": 450, "color": "#1e1e2e"}},
@@ -2851,80 +3216,78 @@ def generate_dfs_bfs_template(idx, algo_type="bfs", difficulty="beginner", langu
     ]
     
     # Add nodes
-    for node in nodes:
+    for i, (x, y) in enumerate(positions):
         objects.append({
-            "id": f"node_{node['id']}",
+            "id": f"node_{ids[i]}",
             "type": "circle",
-            "props": {"x": node['x'], "y": node['y'], "radius": 25, "color": "#313244", "borderColor": "#cdd6f4", "borderWidth": 2, "text": node['val']}
+            "props": {"x": x, "y": y, "radius": radius, "color": "#313244", "borderColor": "#cdd6f4", "borderWidth": 2, "text": labels[i]}
         })
         
     # Add edges
-    for u, v in edges:
-        u_node = next(n for n in nodes if n['id'] == u)
-        v_node = next(n for n in nodes if n['id'] == v)
+    for u, v in graph.edges:
+        (x1, y1), (x2, y2) = positions[u], positions[v]
         objects.append({
-            "id": f"edge_{u}_{v}",
+            "id": f"edge_{ids[u]}_{ids[v]}",
             "type": "line",
-            "props": {"x1": u_node['x'], "y1": u_node['y'], "x2": v_node['x'], "y2": v_node['y'], "color": "#45475a", "width": 2}
+            "props": {"x1": x1, "y1": y1, "x2": x2, "y2": y2, "color": "#45475a", "width": 2}
         })
 
-    actions = []
-    time = 0.5
-    visited = []
+    # Visits past the first GRAPH_NARRATED_VISITS speed up and only recolour
+    # the graph, so big graphs stay watchable
+    order = list(graph.bfs(0) if algo_type == "bfs" else graph.dfs(0))
+    pace = _graph_pace(len(order))
+    timeline = Timeline(start=0.5)
     
     if algo_type == "bfs":
-        queue = ["0"]
-        actions.append({"id": "start_bfs", "objectId": "status", "type": "fade", "start": time, "end": time+0.5, "params": {"text": "Enqueue Root node A"}, "narrative": "Starting BFS from the root node."})
-        time += 0.8
-        
-        while queue:
-            u = queue.pop(0)
-            if u not in visited:
-                visited.append(u)
-                u_val = next(n for n in nodes if n['id'] == u)['val']
-                actions.append({"id": f"visit_{u}", "objectId": f"node_{u}", "type": "color", "start": time, "end": time+0.5, "params": {"color": "#fab387"}, "narrative": f"Visiting node {u_val}."})
-                actions.append({"id": f"stat_{u}", "objectId": "status", "type": "fade", "start": time, "end": time+0.5, "params": {"text": f"Visiting {u_val}"}})
-                time += 0.8
-                for v in adj[u]:
-                    if v not in visited and v not in queue:
-                        queue.append(v)
-                        v_val = next(n for n in nodes if n['id'] == v)['val']
-                        actions.append({"id": f"edge_{u}_{v}_on", "objectId": f"edge_{u}_{v}", "type": "color", "start": time, "end": time+0.5, "params": {"color": "#89b4fa", "width": 4}})
-                        actions.append({"id": f"stat_enc_{v}", "objectId": "status", "type": "fade", "start": time, "end": time+0.5, "params": {"text": f"Enqueue {v_val}"}, "narrative": f"Discovered child {v_val}, adding it to the queue."})
-                        time += 0.5
+        timeline.add("start_bfs", "status", "fade", 0.5, {"text": f"Enqueue Root node {labels[0]}"}, narrative="Starting BFS from the root node.")
+        timeline.advance(0.8)
+        
+        for k, (u, discovered) in enumerate(order):
+            narrated = k < GRAPH_NARRATED_VISITS
+            timeline.color(f"visit_{ids[u]}", f"node_{ids[u]}", "#fab387", 0.5 * pace,
+                           narrative=f"Visiting node {labels[u]}." if narrated else None)
+            if narrated:
+                timeline.add(f"stat_{ids[u]}", "status", "fade", 0.5, {"text": f"Visiting {labels[u]}"})
+            timeline.advance(0.8 * pace)
+            for v, e in discovered:
+                a, b = graph.edges[e]
+                timeline.add(f"edge_{ids[u]}_{ids[v]}_on", f"edge_{ids[a]}_{ids[b]}", "color", 0.5 * pace, {"color": "#89b4fa", "width": 4})
+                if narrated:
+                    timeline.add(f"stat_enc_{ids[v]}", "status", "fade", 0.5, {"text": f"Enqueue {labels[v]}"},
+                                 narrative=f"Discovered child {labels[v]}, adding it to the queue.")
+                timeline.advance(0.5 * pace)
     else:
-        stack = ["0"]
-        actions.append({"id": "start_dfs", "objectId": "status", "type": "fade", "start": time, "end": time+0.5, "params": {"text": "Push Root node A"}, "narrative": "Starting DFS from the root node."})
-        time += 0.8
-        
-        while stack:
-            u = stack.pop()
-            if u not in visited:
-                visited.append(u)
-                u_val = next(n for n in nodes if n['id'] == u)['val']
-                actions.append({"id": f"visit_{u}", "objectId": f"node_{u}", "type": "color", "start": time, "end": time+0.5, "params": {"color": "#a6e3a1"}, "narrative": f"Visiting node {u_val}."})
-                actions.append({"id": f"stat_{u}", "objectId": "status", "type": "fade", "start": time, "end": time+0.5, "params": {"text": f"Visiting {u_val}"}})
-                time += 0.8
-                for v in reversed(adj[u]):
-                    if v not in visited:
-                        stack.append(v)
-                        v_val = next(n for n in nodes if n['id'] == v)['val']
-                        actions.append({"id": f"edge_{u}_{v}_on", "objectId": f"edge_{u}_{v}", "type": "color", "start": time, "end": time+0.5, "params": {"color": "#89b4fa", "width": 4}})
-                        actions.append({"id": f"stat_push_{v}", "objectId": "status", "type": "fade", "start": time, "end": time+0.5, "params": {"text": f"Push {v_val}"}, "narrative": f"Exploring deeper to child {v_val}, adding it to the stack."})
-                        time += 0.5
-
-    actions.append({"id": "complete", "objectId": "status", "type": "fade", "start": time, "end": time+1, "params": {"text": "Traversal Complete!", "color": "#a6e3a1"}, "narrative": f"{algo_type.upper()} completed."})
+        timeline.add("start_dfs", "status", "fade", 0.5, {"text": f"Push Root node {labels[0]}"}, narrative="Starting DFS from the root node.")
+        timeline.advance(0.8)
+        
+        for k, (u, pushed) in enumerate(order):
+            narrated = k < GRAPH_NARRATED_VISITS
+            timeline.color(f"visit_{ids[u]}", f"node_{ids[u]}", "#a6e3a1", 0.5 * pace,
+                           narrative=f"Visiting node {labels[u]}." if narrated else None)
+            if narrated:
+                timeline.add(f"stat_{ids[u]}", "status", "fade", 0.5, {"text": f"Visiting {labels[u]}"})
+            timeline.advance(0.8 * pace)
+            for v, e in pushed:
+                a, b = graph.edges[e]
+                timeline.add(f"edge_{ids[u]}_{ids[v]}_on", f"edge_{ids[a]}_{ids[b]}", "color", 0.5 * pace, {"color": "#89b4fa", "width": 4})
+                if narrated:
+                    timeline.add(f"stat_push_{ids[v]}", "status", "fade", 0.5, {"text": f"Push {labels[v]}"},
+                                 narrative=f"Exploring deeper to child {labels[v]}, adding it to the stack.")
+                timeline.advance(0.5 * pace)
+
+    timeline.add("complete", "status", "fade", 1, {"text": "Traversal Complete!", "color": "#a6e3a1"}, narrative=f"{algo_type.upper()} completed.")
 
     return {
         "sceneId": scene_id,
         "width": 800,
         "height": 450,
-        "duration": time + 2,
+        "duration": timeline.time + 2,
         "code": code_content,
         "objects": objects,
-        "actions": actions
+        "actions": timeline.actions()
     }
 
+@GENERATORS.register("radix_sort")
 def generate_radix_sort_template(idx, difficulty="beginner", language="python"):
     """
     Generates Radix Sort visualization.
@@ -2944,51 +3307,224 @@ def generate_radix_sort_template(idx, difficulty="beginner", language="python"):
         objects.append({"id": f"bucket_{i}", "type": "rect", "props": {"x": start_x + i * 75, "y": 350, "width": bucket_w, "height": 80, "color": "#313244", "borderColor": "#45475a", "borderWidth": 2, "text": f"D{i}"}})
     for i, val in enumerate(vals):
         objects.append({"id": f"num_{i}", "type": "circle", "props": {"x": 100 + i * 80, "y": 150, "radius": 25, "color": "#181825", "borderColor": "#cdd6f4", "borderWidth": 2, "text": str(val)}})
-    actions = []; time = 1.0; max_val = max(vals); exp = 1
+    timeline = Timeline(start=1.0); max_val = max(vals); exp = 1
     while max_val // exp > 0:
-        actions.append({"id": f"digit_{exp}", "objectId": "status", "type": "fade", "start": time, "end": time+0.5, "params": {"text": f"Sorting by digit at 10^{len(str(exp))-1} place"}, "narrative": f"Processing digit position {exp}."}); time += 0.8
+        timeline.add(f"digit_{exp}", "status", "fade", 0.5, {"text": f"Sorting by digit at 10^{len(str(exp))-1} place"}, narrative=f"Processing digit position {exp}."); timeline.advance(0.8)
         bucket_counts = [0] * 10
         for i, val in enumerate(vals):
             digit = (val // exp) % 10; bx = start_x + digit * 75 + 35; by = 350 + 20 + bucket_counts[digit] * 20; bucket_counts[digit] += 1
-            actions.append({"id": f"move_to_b_{exp}_{i}", "objectId": f"num_{i}", "type": "move", "start": time, "end": time+0.5, "params": {"x": bx, "y": by}}); time += 0.2
-        time += 0.6; actions.append({"id": f"col_{exp}", "objectId": "status", "type": "fade", "start": time, "end": time+0.5, "params": {"text": "Collecting from buckets..."}}); time += 0.8
+            timeline.add(f"move_to_b_{exp}_{i}", f"num_{i}", "move", 0.5, {"x": bx, "y": by}); timeline.advance(0.2)
+        timeline.advance(0.6); timeline.add(f"col_{exp}", "status", "fade", 0.5, {"text": "Collecting from buckets..."}); timeline.advance(0.8)
         for i in range(len(vals)):
-             actions.append({"id": f"move_back_{exp}_{i}", "objectId": f"num_{i}", "type": "move", "start": time, "end": time+0.5, "params": {"x": 100 + i * 80, "y": 150}}); time += 0.1
-        exp *= 10; time += 0.5
-    actions.append({"id": "complete", "objectId": "status", "type": "fade", "start": time, "end": time+1, "params": {"text": "Radix Sort Complete", "color": "#a6e3a1"}})
-    return {"sceneId": scene_id, "width": 800, "height": 450, "duration": time + 1, "code": code_content, "objects": objects, "actions": actions}
-
-def generate_astar_template(idx, difficulty="beginner", language="python"):
+             timeline.add(f"move_back_{exp}_{i}", f"num_{i}", "move", 0.5, {"x": 100 + i * 80, "y": 150}); timeline.advance(0.1)
+        exp *= 10; timeline.advance(0.5)
+    timeline.add("complete", "status", "fade", 1, {"text": "Radix Sort Complete", "color": "#a6e3a1"})
+    return {"sceneId": scene_id, "width": 800, "height": 450, "duration": timeline.time + 1, "code": code_content, "objects": objects, "actions": timeline.actions()}
+
+# A* runs on the grid of the prompt ("a* grid s..#/.#../...g": rows split by
+# "/", s start, g goal, # or 1 a wall) or on a random grid of the size asked
+# for ("a* 300x300"), up to ASTAR_MAX_SIDE cells a side. Grids of at most
+# ASTAR_CELL_LIMIT cells whose search fits ASTAR_ACTION_BUDGET actions get a
+# rect per cell. Larger ones are drawn as "tiles" objects of ASTAR_TILE x
+# ASTAR_TILE cells, redrawn by whole-tile "cells" keyframes (at most
+# ASTAR_FRAMES of them, carrying at most ASTAR_KEYFRAME_CELLS cells in all).
+ASTAR_MAX_SIDE = 1000
+ASTAR_CELL_LIMIT = 400
+ASTAR_ACTION_BUDGET = 400
+ASTAR_TILE = 50
+ASTAR_FRAMES = 40
+ASTAR_KEYFRAME_CELLS = 4_000_000
+ASTAR_WALLS = 0.25
+ASTAR_GRID = ("s....", ".###.", "...#.", "##.#.", "....g")
+
+# tile cells are one character each, the palette index: empty, wall, start,
+# goal, expanded, path
+ASTAR_PALETTE = ["#313244", "#45475a", "#a6e3a1", "#f38ba8", "#89b4fa", "#f9e2af"]
+
+def _astar_grid(description):
+    """A grid in the prompt: "a* grid s..#/.#../...g" (at least two rows, padded to the longest)."""
+    match = re.search(r'\bgrid\s*[:=]?\s*([.#01sg]+(?:\s*[/|]\s*[.#01sg]+)+)', description)
+    if not match:
+        return None
+    rows = re.split(r'\s*[/|]\s*', match.group(1))[:ASTAR_MAX_SIDE]
+    width = min(max(len(row) for row in rows), ASTAR_MAX_SIDE)
+    return tuple(row[:width].translate(str.maketrans("01", ".#")).ljust(width, ".") for row in rows)
+
+def _astar_size(description):
+    """A requested grid size: "a* 300x300", "a star on a 50 x 80 grid" (rows x columns)."""
+    match = re.search(r'\b(\d+)\s*[x*]\s*(\d+)\b', description)
+    if not match:
+        return None
+    return tuple(min(max(int(side), 2), ASTAR_MAX_SIDE) for side in match.groups())
+
+def _astar_heuristic(description):
+    match = re.search(r'\b(' + '|'.join(HEURISTICS) + r')\b', description)
+    return match.group(1) if match else None
+
+def _astar_diagonal(description):
+    """Whether the prompt allows diagonal moves ("diagonal", "8-way")."""
+    return True if re.search(r'\bdiagonal|\b8[- ]?(?:way|connected|neighbou?r)', description) else None
+
+def _astar_tie_break(description):
+    match = re.search(r'\b(fifo|lifo)\b', description)
+    return match.group(1) if match else None
+
+ASTAR_PARAMS = {"grid": _astar_grid, "size": _astar_size, "heuristic": _astar_heuristic,
+                "diagonal": _astar_diagonal, "tie_break": _astar_tie_break}
+
+def _astar_board(grid, size):
+    """
+    (rows, cols, walls, start, goal) of a prompt grid, of a random grid of
+    the given size, or of the example grid. A random grid is the same for
+    every request of its size; a staircase from corner to corner is kept
+    clear, so its goal is always reachable.
+    """
+    if grid is None and size:
+        rows, cols = size
+        rng = random.Random(f"astar {rows}x{cols}")
+        walls = bytearray(rng.random() < ASTAR_WALLS for _ in range(rows * cols))
+        r = c = 0
+        while r < rows - 1 or c < cols - 1:
+            walls[r * cols + c] = 0
+            if c == cols - 1 or (r < rows - 1 and rng.random() < rows / (rows + cols)):
+                r += 1
+            else:
+                c += 1
+        walls[-1] = 0
+        return rows, cols, walls, 0, rows * cols - 1
+    cells = "".join(grid or ASTAR_GRID)
+    rows, cols = len(grid or ASTAR_GRID), len((grid or ASTAR_GRID)[0])
+    start, goal = cells.find("s"), cells.rfind("g")
+    start = 0 if start < 0 else start
+    goal = len(cells) - 1 if goal < 0 or goal == start else goal
+    walls = bytearray(ch == "#" for ch in cells)
+    walls[start] = walls[goal] = 0
+    return rows, cols, walls, start, goal
+
+@GENERATORS.register("astar", params=ASTAR_PARAMS)
+def generate_astar_template(idx, difficulty="beginner", language="python", grid=None, size=None,
+                            heuristic="manhattan", diagonal=False, tie_break="h"):
     """
     Generates A* Search Pathfinding visualization.
-    Shows the exploration of nodes based on f(n) = g(n) + h(n).
+    Shows the exploration of nodes based on f(n) = g(n) + h(n), as expanded
+    by astar_grid (see graph_model.py) on the prompt's grid, a random grid of
+    the prompt's size, or a small example grid.
     """
-    from code_generator import CodeGenerator
     scene_id = f"astar_{idx}"
     code_content = CodeGenerator.get_code("astar", language=language, level=difficulty)
-    grid = [[2, 0, 0, 0, 0], [0, 1, 1, 1, 0], [0, 0, 0, 1, 0], [1, 1, 0, 1, 0], [0, 0, 0, 0, 3]]
-    rows, cols, cell_size, start_x, start_y = 5, 5, 50, 275, 120
+    rows, cols, walls, start, goal = _astar_board(grid, size)
+    path, cost, expanded = astar_grid(walls, cols, start, goal, heuristic, diagonal, tie_break)
     objects = [
         {"id": "bg", "type": "rect", "props": {"x": 0, "y": 0, "width": 800, "height": 450, "color": "#1e1e2e"}},
         {"id": "title", "type": "text", "props": {"x": 400, "y": 30, "text": "A* Pathfinding Visualization", "font": "bold 24px Inter", "color": "#89b4fa"}},
         {"id": "status", "type": "text", "props": {"x": 400, "y": 70, "text": "Exploring Paths...", "font": "18px monospace", "color": "#cdd6f4"}}
     ]
+    metadata = {"grid": [rows, cols], "heuristic": heuristic, "expanded": len(expanded), "path": len(path),
+                "cost": cost if cost is None or cost == int(cost) else round(cost, 3)}
+    if rows * cols <= ASTAR_CELL_LIMIT and len(expanded) + len(path) + 3 <= ASTAR_ACTION_BUDGET:
+        timeline = _astar_cells(objects, rows, cols, walls, start, goal, path, expanded)
+    else:
+        timeline, metadata["keyframes"] = _astar_tiles(objects, rows, cols, walls, start, goal, path, expanded)
+    if path:
+        timeline.add("complete", "status", "fade", 1, {"text": "A* Search Complete", "color": "#a6e3a1"})
+    else:
+        timeline.add("complete", "status", "fade", 1, {"text": "No Path to the Target", "color": "#f38ba8"},
+                     narrative=f"Every reachable cell has been expanded ({len(expanded)} of them): the target is walled off.")
+    return {"sceneId": scene_id, "width": 800, "height": 450, "duration": timeline.time + 1, "code": code_content,
+            "objects": objects, "actions": timeline.actions(), "metadata": metadata}
+
+def _astar_found(timeline, path):
+    if path:
+        timeline.advance(0.5); timeline.add("found", "status", "fade", 0.5, {"text": "Target Reached! Highlighting Path"}, narrative="Target node found. Backtracking to show the shortest path."); timeline.advance(0.8)
+
+def _astar_cells(objects, rows, cols, walls, start, goal, path, expanded):
+    """A rect per cell, recoloured as the search expands it and again on the path."""
+    cell_size = min(50, 320 // rows, 700 // cols)
+    start_x, start_y = 400 - cols * cell_size // 2, 120
     for r in range(rows):
         for c in range(cols):
+            i = r * cols + c
             x, y = start_x + c * cell_size, start_y + r * cell_size; color = "#313244"
-            if grid[r][c] == 1: color = "#45475a"
-            elif grid[r][c] == 2: color = "#a6e3a1"
-            elif grid[r][c] == 3: color = "#f38ba8"
+            if walls[i]: color = "#45475a"
+            elif i == start: color = "#a6e3a1"
+            elif i == goal: color = "#f38ba8"
             objects.append({"id": f"cell_{r}_{c}", "type": "rect", "props": {"x": x, "y": y, "width": cell_size-2, "height": cell_size-2, "color": color, "borderColor": "#cdd6f4", "borderWidth": 1}})
-    actions = []; time = 1.0; path = [(0,0), (1,0), (2,0), (2,1), (2,2), (3,2), (4,2), (4,3), (4,4)]; explored = [(0,1), (0,2), (1,3), (1,4), (2,4), (3,0)]
-    for r, c in explored:
-        actions.append({"id": f"exp_{r}_{c}", "objectId": f"cell_{r}_{c}", "type": "color", "start": time, "end": time+0.4, "params": {"color": "#89b4fa"}, "narrative": f"Exploring node at ({r}, {c}) with lowest f-score."}); time += 0.3
-    time += 0.5; actions.append({"id": "found", "objectId": "status", "type": "fade", "start": time, "end": time+0.5, "params": {"text": "Target Reached! Highlighting Path"}, "narrative": "Target node found. Backtracking to show the shortest path."}); time += 0.8
-    for r, c in path:
-        actions.append({"id": f"path_{r}_{c}", "objectId": f"cell_{r}_{c}", "type": "color", "start": time, "end": time+0.3, "params": {"color": "#f9e2af"}}); time += 0.2
-    actions.append({"id": "complete", "objectId": "status", "type": "fade", "start": time, "end": time+1, "params": {"text": "A* Search Complete", "color": "#a6e3a1"}})
-    return {"sceneId": scene_id, "width": 800, "height": 450, "duration": time + 1, "code": code_content, "objects": objects, "actions": actions}
-
+    timeline = Timeline(start=1.0); pace = _graph_pace(len(expanded))
+    for k, i in enumerate(i for i in expanded if i not in (start, goal)):
+        r, c = divmod(i, cols)
+        narrative = f"Exploring node at ({r}, {c}) with lowest f-score." if k < GRAPH_NARRATED_VISITS else None
+        timeline.color(f"exp_{r}_{c}", f"cell_{r}_{c}", "#89b4fa", 0.4 * pace, narrative=narrative); timeline.advance(0.3 * pace)
+    _astar_found(timeline, path)
+    for i in path:
+        r, c = divmod(i, cols)
+        timeline.color(f"path_{r}_{c}", f"cell_{r}_{c}", "#f9e2af", 0.3 * pace); timeline.advance(0.2 * pace)
+    return timeline
+
+def _astar_tiles(objects, rows, cols, walls, start, goal, path, expanded):
+    """
+    The grid as "tiles" objects, one char per cell (an ASTAR_PALETTE index),
+    and a "cells" keyframe per tile the search changed since the last frame.
+    Returns the timeline and the number of frames.
+    """
+    cell = min(700 / cols, 320 / rows)
+    left, top = 400 - cols * cell / 2, 120
+    state = walls.translate(bytes.maketrans(b"\x00\x01", b"01"))
+    state[start], state[goal] = ord("2"), ord("3")
+    across = -(-cols // ASTAR_TILE)
+    bounds = [(tr * ASTAR_TILE, min(rows, (tr + 1) * ASTAR_TILE), tc * ASTAR_TILE, min(cols, (tc + 1) * ASTAR_TILE))
+              for tr in range(-(-rows // ASTAR_TILE)) for tc in range(across)]
+
+    def cells(tile):
+        r0, r1, c0, c1 = bounds[tile]
+        return b"".join(state[r * cols + c0:r * cols + c1] for r in range(r0, r1)).decode()
+
+    def tile_id(tile):
+        return f"tile_{tile // across}_{tile % across}"
+
+    for tile, (r0, r1, c0, c1) in enumerate(bounds):
+        objects.append({"id": tile_id(tile), "type": "tiles", "props": {
+            "x": round(left + c0 * cell, 2), "y": round(top + r0 * cell, 2), "width": round((c1 - c0) * cell, 2),
+            "height": round((r1 - r0) * cell, 2), "rows": r1 - r0, "cols": c1 - c0, "cells": cells(tile),
+            "palette": ASTAR_PALETTE}})
+    for marker, i, color in (("start", start, "#a6e3a1"), ("goal", goal, "#f38ba8")):
+        r, c = divmod(i, cols)
+        objects.append({"id": f"{marker}_marker", "type": "circle", "props": {
+            "x": round(left + (c + 0.5) * cell, 2), "y": round(top + (r + 0.5) * cell, 2), "r": 6, "color": color}})
+
+    def mark(cells_to_mark, code, dirty):
+        for i in cells_to_mark:
+            if state[i] == 48 or state[i] == 52:  # empty or expanded
+                state[i] = code
+                dirty.add(i // cols // ASTAR_TILE * across + i % cols // ASTAR_TILE)
+
+    def keyframe(prefix, dirty, step):
+        for tile in sorted(dirty):
+            timeline.add(f"{prefix}_{tile_id(tile)}", tile_id(tile), "cells", step, {"cells": cells(tile)})
+
+    n = len(expanded)
+    frames = max(1, min(ASTAR_FRAMES, n, ASTAR_KEYFRAME_CELLS // (rows * cols) - 1))
+    step = max(0.2, min(1.0, 20 / frames))
+    timeline = Timeline(start=1.0)
+    timeline.wait("explain", "status", 1.0, narrative=f"{rows} x {cols} grid: showing the expanded cells "
+                  f"{'all at once' if frames == 1 else f'in {frames} steps'} instead of one by one.")
+    timeline.advance(1.0)
+    done = 0
+    for k in range(frames):
+        upto = -(-(k + 1) * n // frames)
+        dirty = set()
+        mark(expanded[done:upto], 52, dirty)
+        done = upto
+        keyframe(f"exp_{k}", dirty, step)
+        timeline.add(f"count_{k}", "status", "fade", step, {"text": f"Expanded {upto} of {n} cells"})
+        timeline.advance(step)
+    _astar_found(timeline, path)
+    dirty = set()
+    mark(path, 53, dirty)
+    keyframe("path", dirty, 0.5)
+    timeline.advance(1.0)
+    return timeline, frames
+
+@GENERATORS.register("linked_list")
 def generate_linked_list_template(idx, difficulty="beginner", language="python"):
     """
     Generates Linked List visualization.
@@ -3018,6 +3554,7 @@ def generate_linked_list_template(idx, difficulty="beginner", language="python")
     actions.append({"id": "complete", "objectId": "status", "type": "fade", "start": time, "end": time+1, "params": {"text": "Linked List Created", "color": "#a6e3a1"}})
     return {"sceneId": scene_id, "width": 800, "height": 450, "duration": time + 2, "code": code_content, "objects": objects, "actions": actions}
 
+@GENERATORS.register("stack")
 def generate_stack_template(idx, difficulty="beginner", language="python"):
     """
     Generates Stack visualization.
@@ -3042,6 +3579,7 @@ def generate_stack_template(idx, difficulty="beginner", language="python"):
     actions.append({"id": f"pop_{i}", "objectId": f"item_{i}", "type": "move", "start": time, "end": time+0.5, "params": {"y": -50}, "narrative": f"Popping {stack_data[i]} from the stack (Top element)."}); actions.append({"id": f"stat_pop_{i}", "objectId": "status", "type": "fade", "start": time, "end": time+0.5, "params": {"text": f"POP {stack_data[i]}"}}); time += 1.0
     return {"sceneId": scene_id, "width": 800, "height": 450, "duration": time + 1, "code": code_content, "objects": objects, "actions": actions}
 
+@GENERATORS.register("queue")
 def generate_queue_template(idx, difficulty="beginner", language="python"):
     """
     Generates Queue visualization.
@@ -3066,6 +3604,7 @@ def generate_queue_template(idx, difficulty="beginner", language="python"):
     time += 0.5
     return {"sceneId": scene_id, "width": 800, "height": 450, "duration": time + 1, "code": code_content, "objects": objects, "actions": actions}
 
+@GENERATORS.register("bst")
 def generate_bst_template(idx, difficulty="beginner", language="python"):
     """
     Generates Binary Search Tree (BST) visualization.
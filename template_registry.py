@@ -0,0 +1,100 @@
+from collections.abc import MutableMapping
+import threading
+
+
+class TemplateRegistry(MutableMapping):
+    """
+    Ordered mapping of template keys to scenes that are built on first access.
+
+    Every key is known up front (so listing and membership checks never build
+    anything), but a scene is only generated the first time it is looked up and
+    is memoized afterwards. Plain scenes can be stored too, in which case they
+    behave exactly like entries of a regular dict.
+
+    transform, if given, is applied to every scene as it is built or stored
+    (the library compacts its scenes this way).
+    """
+
+    def __init__(self, templates=None, transform=None):
+        self._transform = transform
+        self._builders = {}
+        self._scenes = {}
+        self._static = set()
+        self._lock = threading.Lock()
+        if templates:
+            self.update(templates)
+
+    def register(self, key, builder, *args, **kwargs):
+        """Registers a builder called as builder(*args, **kwargs) on first lookup."""
+        self._builders[key] = (builder, args, kwargs)
+        self._scenes.pop(key, None)
+        self._static.discard(key)
+
+    def register_static(self, key, builder, *args, **kwargs):
+        """Like register(), for scenes that are identical on every build (snapshot-able)."""
+        self.register(key, builder, *args, **kwargs)
+        self._static.add(key)
+
+    def static_keys(self):
+        """Keys of scenes that never change between deploys, in registry order."""
+        return [key for key in self._builders if key in self._static]
+
+    def update(self, other=(), **kwargs):
+        # Copy builders instead of materializing another registry's scenes.
+        if isinstance(other, TemplateRegistry):
+            for key in other._builders:
+                if key in other._scenes:
+                    self[key] = other._scenes[key]
+                else:
+                    self._builders[key] = other._builders[key]
+                    self._scenes.pop(key, None)
+                if key in other._static:
+                    self._static.add(key)
+                else:
+                    self._static.discard(key)
+            other = ()
+        super().update(other, **kwargs)
+
+    def is_built(self, key):
+        return key in self._scenes
+
+    def materialize(self):
+        """Builds every pending scene (what importing used to cost)."""
+        for key in self._builders:
+            self[key]
+        return self
+
+    def __getitem__(self, key):
+        try:
+            return self._scenes[key]
+        except KeyError:
+            pass
+        builder, args, kwargs = self._builders[key]
+        with self._lock:
+            if key not in self._scenes:
+                scene = builder(*args, **kwargs)
+                self._scenes[key] = self._transform(scene) if self._transform else scene
+            return self._scenes[key]
+
+    def __setitem__(self, key, scene):
+        # Scenes stored directly are fixed literals, so they count as static.
+        self._builders[key] = (None, (), {})
+        self._scenes[key] = self._transform(scene) if self._transform else scene
+        self._static.add(key)
+
+    def __delitem__(self, key):
+        del self._builders[key]
+        self._scenes.pop(key, None)
+        self._static.discard(key)
+
+    def __contains__(self, key):
+        return key in self._builders
+
+    def __iter__(self):
+        return iter(self._builders)
+
+    def __len__(self):
+        return len(self._builders)
+
+    def __repr__(self):
+        return f"<TemplateRegistry {len(self._scenes)}/{len(self._builders)} built>"
@@ -0,0 +1,137 @@
+import heapq
+import math
+import random
+import unittest
+
+from graph_model import HEURISTICS, SQRT2, TIE_BREAKS, astar_grid
+from scene_generators import GENERATORS
+from template_generator import (ASTAR_CELL_LIMIT, ASTAR_KEYFRAME_CELLS, ASTAR_MAX_SIDE, ASTAR_TILE, _astar_board,
+                                _astar_grid, _astar_size)
+
+
+def random_walls(rng, rows, cols):
+    return bytearray(rng.random() < 0.3 for _ in range(rows * cols))
+
+
+def shortest(walls, cols, start, goal, diagonal):
+    """Plain Dijkstra over the grid's moves (the costs A* must match)."""
+    rows = len(walls) // cols
+    dist = {start: 0}
+    heap = [(0, start)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if u == goal:
+            return d
+        if d > dist[u]:
+            continue
+        r, c = divmod(u, cols)
+        for dr in (-1, 0, 1):
+            for dc in (-1, 0, 1):
+                if (dr or dc) and (diagonal or not (dr and dc)) and 0 <= r + dr < rows and 0 <= c + dc < cols:
+                    v = u + dr * cols + dc
+                    if walls[v] or (dr and dc and (walls[u + dr * cols] or walls[u + dc])):
+                        continue
+                    nd = d + (SQRT2 if dr and dc else 1)
+                    if nd < dist.get(v, math.inf):
+                        dist[v] = nd
+                        heapq.heappush(heap, (nd, v))
+    return None
+
+
+class TestAStar(unittest.TestCase):
+    def assertPath(self, walls, cols, start, goal, path, cost, diagonal):
+        self.assertEqual((path[0], path[-1]), (start, goal))
+        total = 0
+        for u, v in zip(path, path[1:]):
+            (r, c), (nr, nc) = divmod(u, cols), divmod(v, cols)
+            dr, dc = nr - r, nc - c
+            self.assertTrue(max(abs(dr), abs(dc)) == 1 and (diagonal or not (dr and dc)))
+            self.assertFalse(walls[v] or (dr and dc and (walls[u + dr * cols] or walls[u + dc])))
+            total += SQRT2 if dr and dc else 1
+        self.assertAlmostEqual(total, cost)
+
+    def test_optimal_with_admissible_heuristics(self):
+        rng = random.Random(6)
+        for _ in range(150):
+            rows, cols, diagonal = rng.randint(1, 12), rng.randint(2, 12), rng.random() < 0.5
+            walls = random_walls(rng, rows, cols)
+            start, goal = rng.randrange(rows * cols), rng.randrange(rows * cols)
+            walls[start] = walls[goal] = 0
+            best = shortest(walls, cols, start, goal, diagonal)
+            for heuristic in HEURISTICS:
+                if diagonal and heuristic == "manhattan":
+                    continue
+                for tie_break in TIE_BREAKS:
+                    with self.subTest(rows=rows, cols=cols, diagonal=diagonal, heuristic=heuristic, tie_break=tie_break):
+                        path, cost, expanded = astar_grid(walls, cols, start, goal, heuristic, diagonal, tie_break)
+                        self.assertEqual(len(set(expanded)), len(expanded))
+                        if best is None:
+                            self.assertEqual((path, cost), ([], None))
+                            continue
+                        self.assertAlmostEqual(cost, best)
+                        self.assertPath(walls, cols, start, goal, path, cost, diagonal)
+                        self.assertEqual(expanded[-1], goal)
+
+    def test_heuristic_and_tie_break_guide_the_search(self):
+        walls = bytearray(50 * 50)
+        expanded = {(h, t): len(astar_grid(walls, 50, 0, len(walls) - 1, h, False, t)[2])
+                    for h in ("manhattan", "zero") for t in TIE_BREAKS}
+        # on an open grid, preferring the cell nearest the goal walks straight there
+        self.assertEqual(expanded["manhattan", "h"], 99)
+        self.assertGreater(expanded["manhattan", "fifo"], 99)
+        self.assertEqual(expanded["zero", "fifo"], len(walls))
+        with self.assertRaises(ValueError):
+            astar_grid(walls, 50, 0, 1, tie_break="random")
+
+    def test_largest_grid(self):
+        rows, cols, walls, start, goal = _astar_board(None, (ASTAR_MAX_SIDE, ASTAR_MAX_SIDE))
+        path, cost, expanded = astar_grid(walls, cols, start, goal)
+        self.assertEqual(cost, rows + cols - 2)
+        self.assertLess(len(expanded), rows * cols // 4)
+
+
+class TestAStarScenes(unittest.TestCase):
+    def test_prompt_grid(self):
+        self.assertEqual(_astar_grid("a* grid s.#1/0..g/.."), ("s.##", "...g", "...."))
+        self.assertIsNone(_astar_grid("a* on a grid 100x100"))
+        self.assertEqual(_astar_size("a* on a 30 x 4000 grid"), (30, ASTAR_MAX_SIDE))
+        spec = GENERATORS["astar"]
+        args, kwargs = spec.inputs("a* grid s#../.#.#/...g diagonal octile lifo")
+        self.assertEqual((kwargs["heuristic"], kwargs["diagonal"], kwargs["tie_break"]), ("octile", True, "lifo"))
+
+    def test_example_follows_the_search(self):
+        scene = GENERATORS["astar"].build("a star pathfinding")
+        rows, cols, walls, start, goal = _astar_board(None, None)
+        path, cost, expanded = astar_grid(walls, cols, start, goal)
+        ids = [a["id"] for a in scene["actions"]]
+        self.assertEqual([i for i in ids if i.startswith("exp_")],
+                         ["exp_%d_%d" % divmod(i, cols) for i in expanded if i not in (start, goal)])
+        self.assertEqual([i for i in ids if i.startswith("path_")], ["path_%d_%d" % divmod(i, cols) for i in path])
+        self.assertEqual(scene["metadata"]["cost"], cost)
+
+    def test_unreachable_goal(self):
+        scene = GENERATORS["astar"].build("a* grid s#./##./..g")
+        self.assertEqual(scene["metadata"]["path"], 0)
+        self.assertNotIn("found", [a["id"] for a in scene["actions"]])
+
+    def test_large_grids_are_tiled(self):
+        for size in (40, ASTAR_MAX_SIDE):
+            with self.subTest(size=size):
+                scene = GENERATORS["astar"].build(f"a* {size}x{size}")
+                self.assertGreater(size * size, ASTAR_CELL_LIMIT)
+                tiles = {o["id"]: o["props"] for o in scene["objects"] if o["type"] == "tiles"}
+                self.assertEqual(len(tiles), (-(-size // ASTAR_TILE)) ** 2)
+                self.assertEqual(sum(len(t["cells"]) for t in tiles.values()), size * size)
+                for props in tiles.values():
+                    self.assertEqual(len(props["cells"]), props["rows"] * props["cols"])
+                keyframes = [a for a in scene["actions"] if a["type"] == "cells"]
+                self.assertLessEqual(sum(len(a["params"]["cells"]) for a in keyframes), ASTAR_KEYFRAME_CELLS)
+                self.assertTrue({a["objectId"] for a in keyframes} <= set(tiles))
+                # the last keyframe of every tile shows the path
+                last = {a["objectId"]: a["params"]["cells"] for a in keyframes}
+                on_path = sum(cells.count("5") for cells in last.values())
+                self.assertEqual(on_path, scene["metadata"]["path"] - 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import json
+import unittest
+from unittest import mock
+
+import app
+
+
+def results(response):
+    return [json.loads(line) for line in response.data.splitlines()]
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        app.SCENE_CACHE.clear()
+        self.client = app.app.test_client()
+
+    def batch(self, requests):
+        return self.client.post('/generate/scenes/batch', json={'requests': requests})
+
+    def single(self, item):
+        return self.client.post('/generate/scenes', json=item)
+
+    def test_results_match_single_requests(self):
+        requests = [{'description': 'bubble sort', 'options': {'seed': 3}},
+                    {'description': 'solar system'},
+                    {'description': 'binary search', 'options': {'seed': 4, 'level': 'advanced', 'language': 'java'}},
+                    {'description': 'polygon 7'}]
+        response = self.batch(requests)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        lines = results(response)
+        self.assertEqual(sorted(i for line in lines for i in line['indices']), [0, 1, 2, 3])
+        for line in lines:
+            self.assertEqual(line['status'], 200)
+            self.assertEqual(line['scene'], self.single(requests[line['indices'][0]]).get_json())
+        self.assertEqual({line['indices'][0]: line.get('key') for line in lines},
+                         {0: 'bubble', 1: None, 2: 'binary', 3: None})
+
+    def test_dedupe(self):
+        requests = [{'description': 'bubble sort', 'options': {'seed': 3}},
+                    {'description': 'visualize bubble sort', 'options': {'seed': 3}},
+                    {'description': 'quicksort'},
+                    {'description': 'quicksort'}]
+        with mock.patch.object(app, 'generate_encoded', wraps=app.generate_encoded) as generate:
+            lines = results(self.batch(requests))
+        self.assertEqual(sorted(line['indices'] for line in lines), [[0, 1], [2, 3]])
+        self.assertEqual(generate.call_count, 2)
+
+    def test_cache_hits_come_first(self):
+        cached = {'description': 'knapsack', 'options': {'seed': 8}}
+        self.single(cached)
+        lines = results(self.batch([{'description': 'lcs', 'options': {'seed': 8}}, cached]))
+        self.assertEqual([(line['indices'], line['cache']) for line in lines], [([1], 'HIT'), ([0], 'MISS')])
+        # Misses are cached for the next single or batch request
+        self.assertEqual(self.single({'description': 'lcs', 'options': {'seed': 8}}).headers['X-Cache'], 'HIT')
+
+    def test_uncacheable_scenes_skip_the_cache(self):
+        item = {'description': 'knapsack', 'options': {'seed': 8}}
+        with mock.patch.object(app.GENERATORS['knapsack'], 'cacheable', False):
+            self.single(item)
+            for _ in range(2):
+                [line] = results(self.batch([item]))
+                self.assertEqual(line['cache'], 'MISS')
+        self.assertEqual(len(app.SCENE_CACHE), 0)
+
+    def test_errors_are_per_request(self):
+        lines = results(self.batch([{'description': 'zzz'}, {'description': 'stack', 'options': {'seed': -1}},
+                                    'bubble', {'description': 'stack'}]))
+        status = {line['indices'][0]: line['status'] for line in lines}
+        self.assertEqual(status, {0: 400, 1: 400, 2: 400, 3: 200})
+
+        # badly typed fields are per-request errors too, here and on the single route
+        bad = [{'description': 'stack', 'options': 'x'}, {'description': 5}]
+        lines = results(self.batch(bad + [{'description': 'stack'}]))
+        self.assertEqual({line['indices'][0]: (line['status'], line.get('error')) for line in lines},
+                         {0: (400, 'options must be an object'), 1: (400, 'description must be a string'),
+                          2: (200, None)})
+        for item in bad + ['stack']:
+            with self.subTest(item=item):
+                self.assertEqual(self.single(item).status_code, 400)
+
+        with mock.patch.object(app.GENERATORS['queue'], 'func', side_effect=RuntimeError('boom')):
+            with self.assertLogs(app.app.logger, 'ERROR'):
+                lines = results(self.batch([{'description': 'queue'}, {'description': 'stack'}]))
+        self.assertEqual({line['indices'][0]: line['status'] for line in lines}, {0: 500, 1: 200})
+
+    def test_bad_batches(self):
+        self.assertEqual(self.batch([]).status_code, 400)
+        self.assertEqual(self.client.post('/generate/scenes/batch', json={'prompts': ['x']}).status_code, 400)
+        for body in ([{'description': 'bubble sort'}], 'bubble sort', 3, None):
+            with self.subTest(body=body):
+                response = self.client.post('/generate/scenes/batch', json=body)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.get_json(), {"error": "requests must be a non-empty list"})
+        self.assertEqual(self.batch([{'description': 'stack'}] * (app.BATCH_LIMIT + 1)).status_code, 400)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from code_generator import CodeGenerator
+from code_generator import CODE_TABLE, CodeGenerator
 
 class TestCodeGenerator(unittest.TestCase):
     def setUp(self):
@@ -27,5 +27,12 @@ class TestCodeGenerator(unittest.TestCase):
                         self.assertNotEqual(code, bubble_code, f"Code for {algo} in {lang} appears to be a fallback to bubble_sort")
                     print(f"Verified {algo} in {lang}")
 
+    def test_fallbacks(self):
+        # Unknown level -> beginner, unknown language -> python, unknown topic -> bubble_sort
+        self.assertEqual(CodeGenerator.get_code("stack", "java", "kids"), CodeGenerator.get_code("stack", "java", "beginner"))
+        self.assertEqual(CodeGenerator.get_code("stack", "Rust", "Expert"), CodeGenerator.get_code("stack"))
+        self.assertEqual(CodeGenerator.get_code("no_such_topic"), CodeGenerator.get_code("bubble_sort"))
+        self.assertEqual(CODE_TABLE[("stack", "java", "kids")], CodeGenerator.get_code("stack", "java", "beginner"))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,85 @@
+import json
+import os
+import shutil
+import subprocess
+import unittest
+
+import app
+from scene_codec import decode_compact, encode_compact, encode_json
+from scene_generators import GENERATORS
+
+MAIN_JS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'public', 'main.js')
+
+
+def sample_scenes():
+    scenes = [app.TEMPLATES[key] for key in ['bubble_sort', 'poly_7', 'atom_12', 'formula_doppler_effect', 'graph_sin(x)']
+              if key in app.TEMPLATES]
+    for key in ['bubble', 'binary', 'floyd_warshall', 'knapsack', 'full_course']:
+        scenes.append(GENERATORS[key].build(level='advanced', seed=11))
+    return scenes
+
+
+# user keys that look like the format's markers, and props/params that are not dicts
+MARKED_SCENE = {
+    'sceneId': 'marked',
+    'objects': [{'id': 'a', 'type': 'text', 'props': {'$ref': 'x', '@at': 2, '=eq': [1], '': 0, 'x': 1,
+                                                      'style': {'$color': 5, '@font': {'@': 'b'}}}},
+                {'id': 'b', 'type': 'group', 'props': [1, 2]},
+                {'id': 'c', 'type': 'group', 'props': None}],
+    'actions': [{'id': 'p', 'objectId': 'a', 'type': 'set', 'start': 0, 'end': 1, 'params': {'$text': 'hi'}},
+                {'id': 'q', 'objectId': 'a', 'type': 'set', 'start': 1, 'end': 2, 'params': 'opaque',
+                 '$note': 3}],
+}
+
+
+class TestCompactFormat(unittest.TestCase):
+    def test_round_trip(self):
+        for scene in sample_scenes():
+            with self.subTest(scene=scene['sceneId']):
+                compact = json.loads(encode_json(encode_compact(scene)))
+                self.assertEqual(decode_compact(compact), scene)
+
+    def test_strings_are_interned(self):
+        scene = GENERATORS['bubble'].build(seed=11)
+        compact = encode_compact(scene)
+        self.assertEqual(len(compact['strings']), len(set(compact['strings'])))
+        self.assertLess(len(encode_json(compact)), len(encode_json(scene)))
+
+    def test_absent_keys_stay_absent(self):
+        scene = {'sceneId': 's', 'objects': [{'id': 'a', 'type': 'circle', 'props': {'x': 1}}],
+                 'actions': [{'id': 'w', 'objectId': 'a', 'type': 'wait', 'start': 0, 'end': 1},
+                             {'id': 'm', 'objectId': 'a', 'type': 'translate', 'start': 1, 'end': 2.5,
+                              'params': {'to': {'x': 2, 'y': 3}}, 'narrative': 'Move', 'codeLine': 4}]}
+        self.assertEqual(decode_compact(json.loads(encode_json(encode_compact(scene)))), scene)
+
+    def test_marker_keys_round_trip(self):
+        compact = json.loads(encode_json(encode_compact(MARKED_SCENE)))
+        self.assertEqual(decode_compact(compact), MARKED_SCENE)
+
+    def test_endpoint(self):
+        client = app.app.test_client()
+        plain = client.get('/generate/scenes', query_string={'description': 'bubble sort', 'seed': 5}).get_json()
+        compact = client.get('/generate/scenes', query_string={'description': 'bubble sort', 'seed': 5, 'format': 'compact'})
+        self.assertEqual(compact.get_json()['format'], 'compact')
+        self.assertEqual(decode_compact(compact.get_json()), plain)
+        library = client.post('/generate/scenes', json={'description': 'solar system', 'options': {'format': 'compact'}})
+        self.assertEqual(decode_compact(library.get_json()), app.TEMPLATES['solar'])
+        bad = client.post('/generate/scenes', json={'description': 'solar system', 'options': {'format': 'xml'}})
+        self.assertEqual(bad.status_code, 400)
+
+    @unittest.skipUnless(shutil.which('node'), 'node is not installed')
+    def test_main_js_decoder_matches(self):
+        with open(MAIN_JS) as f:
+            source = f.read()
+        start = source.index('// --- COMPACT SCENE FORMAT ---')
+        decoder = source[start:source.index('// --- SCENE MANAGEMENT ---', start)]
+        scenes = sample_scenes() + [MARKED_SCENE]
+        payload = json.dumps([encode_compact(scene) for scene in scenes])
+        script = decoder + ('\nlet data = ""; process.stdin.on("data", c => data += c);'
+                            'process.stdin.on("end", () => process.stdout.write('
+                            'JSON.stringify(JSON.parse(data).map(expandCompactScene))));')
+        out = subprocess.run(['node', '-e', script], input=payload, capture_output=True, text=True, check=True)
+        self.assertEqual(json.loads(out.stdout), scenes)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import gzip
+import os
+import tempfile
+import time
+import unittest
+
+import app
+import compression
+from scene_codec import encode_json
+from scene_snapshot import SceneSnapshot, write_snapshot
+from template_registry import TemplateRegistry
+
+
+class TestNegotiation(unittest.TestCase):
+    def negotiate(self, header):
+        with app.app.test_request_context(headers={'Accept-Encoding': header} if header else {}):
+            return compression.negotiate(app.request)
+
+    def test_accept_encoding(self):
+        self.assertIsNone(self.negotiate(None))
+        self.assertIsNone(self.negotiate('identity'))
+        self.assertEqual(self.negotiate('gzip, deflate'), 'gzip')
+        self.assertIsNone(self.negotiate('gzip;q=0'))
+        self.assertEqual(self.negotiate('*'), compression.ENCODINGS[0])
+
+    def test_gzip_is_reproducible(self):
+        data = b'{"a":1}' * 500
+        self.assertEqual(compression.compress(data, 'gzip'), compression.compress(data, 'gzip'))
+        self.assertEqual(compression.decompress(compression.compress(data, 'gzip', 9), 'gzip'), data)
+
+
+class TestCompressedResponses(unittest.TestCase):
+    def setUp(self):
+        app.SCENE_CACHE.clear()
+        self.client = app.app.test_client()
+
+    def get(self, encoding='gzip', headers=None, **query):
+        headers = dict(headers or {}, **{'Accept-Encoding': encoding})
+        return self.client.get('/generate/scenes', query_string=query, headers=headers)
+
+    def test_generated_scene(self):
+        plain = self.client.get('/generate/scenes', query_string={'description': 'bubble sort', 'seed': 3})
+        packed = self.get(description='bubble sort', seed=3)
+        self.assertEqual(packed.headers['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', packed.headers['Vary'])
+        self.assertEqual(gzip.decompress(packed.data), plain.data)
+        self.assertEqual(packed.headers['ETag'], plain.headers['ETag'][:-1] + '-gzip"')
+        again = self.get(headers={'If-None-Match': packed.headers['ETag']}, description='bubble sort', seed=3)
+        self.assertEqual(again.status_code, 304)
+
+    def test_library_scene(self):
+        plain = self.client.get('/generate/scenes', query_string={'description': 'atom 12'})
+        packed = self.get(description='atom 12')
+        self.assertEqual(packed.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(packed.data), plain.data)
+
+    def test_small_bodies_are_not_compressed(self):
+        response = self.get(description='zzz qqq')  # 400 error body
+        self.assertNotIn('Content-Encoding', response.headers)
+
+
+class TestPrecompression(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.tmp.name, 'public')
+        self.target = os.path.join(self.tmp.name, 'build')
+        os.makedirs(self.source)
+        for name, data in [('main.js', b'console.log(1);\n' * 200), ('logo.png', b'\x89PNG' * 10)]:
+            with open(os.path.join(self.source, name), 'wb') as f:
+                f.write(data)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_text_assets_only(self):
+        written = compression.precompress_assets(self.source, self.target)
+        self.assertEqual([rel for rel, _, _ in written], ['main.js'])
+        path = compression.precompressed_path(self.source, self.target, 'main.js', 'gzip')
+        with open(path, 'rb') as f:
+            self.assertEqual(gzip.decompress(f.read()), b'console.log(1);\n' * 200)
+        self.assertIsNone(compression.precompressed_path(self.source, self.target, 'logo.png', 'gzip'))
+        self.assertIsNone(compression.precompressed_path(self.source, self.target, '../public/main.js', 'gzip'))
+
+    def test_stale_copies_are_ignored(self):
+        compression.precompress_assets(self.source, self.target)
+        later = time.time() + 10
+        os.utime(os.path.join(self.source, 'main.js'), (later, later))
+        self.assertIsNone(compression.precompressed_path(self.source, self.target, 'main.js', 'gzip'))
+
+    def test_compressed_snapshot(self):
+        templates = TemplateRegistry({'big': {'sceneId': 'big', 'objects': [{'id': i} for i in range(200)]},
+                                      'small': {'sceneId': 'small'}})
+        path = os.path.join(self.target, 'scenes.gzip.snap')
+        write_snapshot(templates, path, 'gzip')
+        snap = SceneSnapshot(path)
+        try:
+            self.assertEqual(snap.encoding, 'gzip')
+            self.assertNotIn('small', snap)
+            self.assertEqual(gzip.decompress(snap.get('big')), encode_json(templates['big']))
+            self.assertIsNone(snap.get_encoded('big'))
+        finally:
+            snap.close()
+
+if __name__ == '__main__':
+    unittest.main()
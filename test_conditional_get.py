@@ -0,0 +1,44 @@
+import unittest
+
+import app
+
+
+class TestConditionalGet(unittest.TestCase):
+    def setUp(self):
+        app.SCENE_CACHE.clear()
+        self.client = app.app.test_client()
+
+    def get(self, headers=None, **query):
+        return self.client.get('/generate/scenes', query_string=query, headers=headers or {})
+
+    def test_library_scene_revalidates(self):
+        first = self.get(description='solar system')
+        self.assertEqual(first.status_code, 200)
+        etag = first.headers['ETag']
+        second = self.get(headers={'If-None-Match': etag}, description='solar system')
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.data, b'')
+        self.assertEqual(self.get(headers={'If-None-Match': '"stale"'}, description='solar system').status_code, 200)
+
+    def test_seeded_scene_revalidates(self):
+        first = self.get(description='floyd-warshall', level='advanced', language='cpp')
+        etag = first.headers['ETag']
+        self.assertEqual(self.get(headers={'If-None-Match': etag}, description='floyd-warshall',
+                                  level='advanced', language='cpp').status_code, 304)
+        first = self.get(description='bubble sort', seed='7')
+        self.assertEqual(first.get_json()['seed'], 7)
+        again = self.get(headers={'If-None-Match': first.headers['ETag']}, description='bubble sort', seed='7')
+        self.assertEqual(again.status_code, 304)
+        other = self.get(headers={'If-None-Match': first.headers['ETag']}, description='bubble sort', seed='8')
+        self.assertEqual(other.status_code, 200)
+
+    def test_post_matches_get(self):
+        post = self.client.post('/generate/scenes', json={'description': 'bubble sort', 'options': {'seed': 7}},
+                                headers={'If-None-Match': '*'})
+        get = self.get(description='bubble sort', seed='7')
+        self.assertEqual(post.status_code, 200)
+        self.assertEqual(post.data, get.data)
+        self.assertEqual(post.headers['ETag'], get.headers['ETag'])
+
+if __name__ == '__main__':
+    unittest.main()
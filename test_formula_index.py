@@ -0,0 +1,46 @@
+import random
+import unittest
+
+import app
+
+
+def linear_match(description):
+    """The original fallback: normalize every formula name on every request."""
+    norm_desc = app.normalize(description)
+    for t_key in app.TEMPLATES:
+        if t_key.startswith('formula_'):
+            raw_name = t_key.replace('formula_', '').replace('_', ' ')
+            if app.normalize(raw_name) in norm_desc:
+                return t_key
+    return None
+
+
+class TestFormulaIndex(unittest.TestCase):
+    def test_every_formula_name(self):
+        for key in app.FORMULA_KEYS:
+            name = key.replace('formula_', '').replace('_', ' ')
+            for prompt in [name, f"Explain {name.title()} please", name.upper().replace(' ', '-')]:
+                with self.subTest(prompt=prompt):
+                    self.assertEqual(app.match_formula(prompt), linear_match(prompt))
+
+    def test_mixed_prompts(self):
+        names = [key.replace('formula_', '').replace('_', ' ') for key in app.FORMULA_KEYS]
+        rng = random.Random(5)
+        for _ in range(300):
+            prompt = " and ".join(rng.sample(names, 2)) + " " + rng.choice(["", "x", "law"])
+            with self.subTest(prompt=prompt):
+                self.assertEqual(app.match_formula(prompt), linear_match(prompt))
+
+    def test_no_match(self):
+        self.assertIsNone(app.match_formula("zzz qqq"))
+
+    def test_server_timing_header(self):
+        client = app.app.test_client()
+        response = client.post('/generate/scenes', json={'description': 'doppler effect'})
+        self.assertEqual(response.status_code, 200)
+        timing = response.headers['Server-Timing']
+        self.assertIn('intent;dur=', timing)
+        self.assertIn('formula_match;dur=', timing)
+
+if __name__ == '__main__':
+    unittest.main()
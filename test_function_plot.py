@@ -0,0 +1,111 @@
+import math
+import re
+import unittest
+
+import numpy as np
+
+import app
+from function_plot import compile_expression, normalize, parse, sample_function
+from scene_generators import GENERATORS
+from scene_paths import parse_path
+from template_generator import FUNCTIONS, _plot_expression, generate_graph_template
+
+MATH = {"sin": math.sin, "cos": math.cos, "tan": math.tan, "exp": math.exp, "sqrt": math.sqrt, "log": math.log,
+        "math": math}
+
+
+def to_screen(xs, ys):
+    return 400 + xs * 40, 225 - ys * 40
+
+
+class TestExpressions(unittest.TestCase):
+    def test_library_functions_match_eval(self):
+        xs = np.linspace(-10, 10, 401)
+        for name, expr in FUNCTIONS:
+            ys = compile_expression(expr)(xs)
+            with self.subTest(name=name):
+                for x, y in zip(xs.tolist(), ys.tolist()):
+                    try:
+                        expected = float(eval(expr, dict(MATH, x=x)))
+                    except (ArithmeticError, ValueError):
+                        expected = math.nan
+                    if math.isfinite(expected):
+                        self.assertTrue(math.isclose(y, expected, rel_tol=1e-9, abs_tol=1e-12), (x, y, expected))
+                    else:
+                        self.assertFalse(math.isfinite(y), x)
+
+    def test_written_the_way_people_type(self):
+        self.assertEqual(normalize("2x^2 + 3(x+1)"), "2*x**2 + 3*(x+1)")
+        self.assertEqual(normalize("(x+1)(x-1) + x(2pi)"), "(x+1)*(x-1) + x*(2*pi)")
+        self.assertEqual(normalize("log10(x) if x > 0 else 0"), "log10(x) if x > 0 else 0")
+        f = compile_expression("0 < x < 2 and not x == 1")
+        self.assertEqual(f(np.array([0.5, 1, 3])).tolist(), [1, 0, 0])
+        self.assertEqual(compile_expression("max(x, 1, 2)")(np.array([0, 3])).tolist(), [2, 3])
+
+    def test_rejects_anything_else(self):
+        for text in ("__import__('os').system('ls')", "x.__class__", "open('f')", "lambda: x", "[x]", "x[0]",
+                     "y + 1", "math.pi", "sin(x, 2)", "max(x)", "sin(x=1)", "'a'", "True", "(x := 2)",
+                     "sin", "x +", "x" + " + x" * 100, "getattr(x, 'real')"):
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                parse(text)
+
+    def test_float_errors_do_not_raise(self):
+        f = compile_expression("9**9**9**9 + 1/0 + sqrt(-1) + x")
+        self.assertFalse(np.isfinite(f(np.array([1.0]))).any())
+
+    def test_compiled_once(self):
+        compile_expression.cache_clear()
+        self.assertIs(compile_expression("x^3 - x"), compile_expression("x^3 - x"))
+        self.assertEqual(compile_expression.cache_info().hits, 1)
+
+
+class TestAdaptiveSampling(unittest.TestCase):
+    def test_within_tolerance(self):
+        dense = np.linspace(-10, 10, 200_001)
+        # (vertical distances: only for curves without near-vertical stretches)
+        for expr in ("sin(x)", "x^2/10", "exp(-x^2)", "1/(1+x^2)", "x*cos(x)/4"):
+            f = compile_expression(expr)
+            xs, ys = sample_function(f, (-10, 10), to_screen, tolerance=0.5)
+            with self.subTest(expr=expr):
+                self.assertTrue(np.all(np.diff(xs) > 0))
+                self.assertEqual((xs[0], xs[-1]), (-10, 10))
+                # the polyline against the curve, in screen units
+                px, py = to_screen(dense, f(dense))
+                sx, sy = to_screen(xs, ys)
+                self.assertLess(np.max(np.abs(np.interp(px, sx, sy) - py)), 1.0)
+
+    def test_points_go_where_the_curve_bends(self):
+        counts = {expr: len(sample_function(compile_expression(expr), (-10, 10), to_screen)[0])
+                  for expr in ("2x", "sin(x)", "sin(x^2)")}
+        self.assertEqual(counts["2x"], 2)
+        self.assertLess(counts["2x"], counts["sin(x)"])
+        self.assertLess(counts["sin(x)"], counts["sin(x^2)"])
+
+    def test_undefined_stretches_break_the_path(self):
+        d = generate_graph_template("tan", "tan(x)")["objects"][4]["props"]["d"]
+        # one piece per branch of tan on screen
+        self.assertEqual(d.count("M "), 7)
+        for piece in d.split("M ")[1:]:
+            ys = [float(v) for v in re.findall(r'[\d.]+ ([\d.]+)', piece)]
+            self.assertTrue(all(0 <= y <= 450 for y in ys))
+
+
+class TestPlotPrompts(unittest.TestCase):
+    def test_user_functions(self):
+        self.assertEqual(_plot_expression("plot y = x^2 + 2x."), "x^2 + 2x")
+        self.assertEqual(_plot_expression("graph of sin(x)/x"), "sin(x)/x")
+        self.assertIsNone(_plot_expression("plot __import__('os').system('ls')"))
+        for prompt in ("plot y = x^2 + 2x", "graph of exp(-x^2)"):
+            with self.subTest(prompt=prompt):
+                kind, spec, _ = app.resolve_scene(prompt)
+                self.assertEqual(spec.key, "plot")
+        scene = GENERATORS["plot"].build("plot f(x) = 3(x - 1)^2 - 4")
+        self.assertEqual(scene["sceneId"], "graph_3(x - 1)^2 - 4")
+        self.assertEqual({command for command, _ in parse_path(scene["objects"][4]["props"]["d"])}, {"M", "L"})
+        # prompts that only mention a graph keep their scenes
+        self.assertEqual(app.resolve_scene("bfs on graph a-x, x-b")[1].key, "bfs")
+        self.assertEqual(app.resolve_scene("plot a chart"), ("template", "graph", None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+import math
+import random
+import unittest
+
+import graph_model
+from graph_model import Graph, floyd_warshall
+from scene_generators import GENERATORS
+from template_generator import (FLOYD_CELL_LIMIT, FLOYD_DIFF_CELLS, FLOYD_MAX_NODES, GRAPH_MAX_EDGES,
+                                GRAPH_NARRATED_VISITS, _floyd_size, _graph_directed, _graph_edges)
+
+
+def random_graph(rng, directed):
+    n = rng.randint(1, 12)
+    edges = [(str(rng.randrange(n)), str(rng.randrange(n)), rng.randint(1, 9)) for _ in range(rng.randint(0, 25))]
+    return Graph.from_edges(edges, nodes=[str(i) for i in range(n)], directed=directed), edges
+
+
+def adjacency(graph):
+    """Neighbour lists the way the generators used to keep them."""
+    adj = {i: [] for i in range(len(graph))}
+    for e, (u, v) in enumerate(graph.edges):
+        adj[u].append((v, e))
+        if not graph.directed:
+            adj[v].append((u, e))
+    return adj
+
+
+def list_bfs(adj, source):
+    queue, visited, out = [source], [], []
+    while queue:
+        u = queue.pop(0)
+        if u not in visited:
+            visited.append(u)
+            out.append((u, []))
+            for v, e in adj[u]:
+                if v not in visited and v not in queue:
+                    queue.append(v)
+                    out[-1][1].append((v, e))
+    return out
+
+
+def list_dfs(adj, source):
+    stack, visited, out = [source], [], []
+    while stack:
+        u = stack.pop()
+        if u not in visited:
+            visited.append(u)
+            out.append((u, []))
+            for v, e in reversed(adj[u]):
+                if v not in visited:
+                    stack.append(v)
+                    out[-1][1].append((v, e))
+    return out
+
+
+class TestGraph(unittest.TestCase):
+    def test_traversals_match_list_versions(self):
+        rng = random.Random(3)
+        for _ in range(300):
+            graph, edges = random_graph(rng, directed=rng.random() < 0.5)
+            adj = adjacency(graph)
+            with self.subTest(edges=edges, directed=graph.directed):
+                self.assertEqual([graph.neighbors(i) for i in range(len(graph))], [adj[i] for i in range(len(graph))])
+                self.assertEqual(list(graph.bfs(0)), list_bfs(adj, 0))
+                self.assertEqual(list(graph.dfs(0)), list_dfs(adj, 0))
+
+    def test_dijkstra_distances(self):
+        rng = random.Random(4)
+        for _ in range(300):
+            graph, edges = random_graph(rng, directed=rng.random() < 0.5)
+            dist = [None] * len(graph)
+            dist[0] = 0
+            for _ in range(len(graph)):
+                for e, (u, v) in enumerate(graph.edges):
+                    for a, b in ((u, v),) if graph.directed else ((u, v), (v, u)):
+                        if dist[a] is not None and (dist[b] is None or dist[a] + graph.weights[e] < dist[b]):
+                            dist[b] = dist[a] + graph.weights[e]
+            with self.subTest(edges=edges, directed=graph.directed):
+                settled = [(u, d) for u, d, _ in graph.dijkstra(0)]
+                self.assertEqual(sorted(settled), [(u, d) for u, d in enumerate(dist) if d is not None])
+                self.assertEqual([d for _, d in settled], sorted(d for _, d in settled))
+
+    def test_floyd_warshall_diffs(self):
+        rng = random.Random(8)
+        for _ in range(100):
+            graph, edges = random_graph(rng, directed=rng.random() < 0.5)
+            matrix = graph.matrix()
+            n = len(graph)
+            with self.subTest(edges=edges, directed=graph.directed):
+                loops = list(floyd_warshall(matrix, vectorized=False))
+                flat = [d for row in matrix for d in row]
+                for k, changed, values in loops:
+                    for i, d in zip(changed, values):
+                        self.assertLess(d, flat[i])
+                        flat[i] = d
+                for u in range(n):
+                    settled = dict((v, d) for v, d, _ in graph.dijkstra(u))
+                    self.assertEqual(flat[u * n:(u + 1) * n], [settled.get(v, math.inf) for v in range(n)])
+                if graph_model.np is not None:
+                    self.assertEqual(list(floyd_warshall(matrix)), loops)
+
+    def test_levels_ignore_direction(self):
+        graph = Graph.from_edges([("b", "a"), ("b", "c")], nodes=["a", "z"], directed=True)
+        self.assertEqual(graph.ids, ["a", "z", "b", "c"])
+        self.assertEqual(graph.levels(0), [0, None, 1, 2])
+
+
+class TestGraphScenes(unittest.TestCase):
+    def test_prompt_graph(self):
+        self.assertEqual(_graph_edges("bfs on graph A-B, A-C:4, C->D"), (("A", "B"), ("A", "C", 4), ("C", "D")))
+        self.assertIsNone(_graph_edges("bfs traversal of a tree"))
+        self.assertEqual(_graph_edges("dfs edges: A->B"), (("A", "B"),))
+        self.assertEqual(_graph_edges("bfs on a well-known graph: a-b, b-c"), (("a", "b"), ("b", "c")))
+        # hyphenated words are not edges: these prompts keep the example graph
+        for prompt in ("bfs graph breadth-first traversal", "dijkstra on a graph with a well-known example",
+                       "dfs graph A-B", "bfs graph, depth-first vs breadth-first"):
+            with self.subTest(prompt=prompt):
+                self.assertIsNone(_graph_edges(prompt))
+        spec = GENERATORS["bfs"]
+        self.assertEqual(spec.build("bfs graph breadth-first traversal", seed=1)["objects"],
+                         spec.build("bfs graph traversal", seed=1)["objects"])
+        self.assertIsNone(_graph_directed("graph A-B"))
+        self.assertTrue(_graph_directed("graph A->B"))
+        many = "graph " + ", ".join(f"{i}-{i + 1}" for i in range(GRAPH_MAX_EDGES + 10))
+        self.assertEqual(len(_graph_edges(many)), GRAPH_MAX_EDGES)
+
+    def test_user_graph_scenes(self):
+        for key in ("bfs", "dfs", "dynamic:dijkstra"):
+            with self.subTest(key=key):
+                spec, _ = GENERATORS.resolve(key)
+                scene = spec.build("graph A-B:2, A-C:5, B-C:1, C-D:1, E-F", seed=1)
+                ids = {obj["id"] for obj in scene["objects"]}
+                self.assertTrue({a["objectId"] for a in scene["actions"]} <= ids)
+                visits = [a for a in scene["actions"] if a["id"].startswith(("visit_", "settle_"))]
+                # E and F are not reachable from A
+                self.assertEqual(len(visits), 4)
+
+    def test_floyd_heatmap(self):
+        self.assertEqual(_floyd_size("floyd warshall 5000 vertices"), FLOYD_MAX_NODES)
+        spec = GENERATORS["floyd_warshall"]
+        small = spec.build("floyd warshall graph A-B:2, B-C:3")
+        self.assertIn("update_1_0_2", [a["id"] for a in small["actions"]])
+        for size in (FLOYD_CELL_LIMIT + 1, FLOYD_MAX_NODES):
+            with self.subTest(size=size):
+                scene = spec.build(f"floyd warshall {size} nodes")
+                heatmap = next(obj["props"] for obj in scene["objects"] if obj["type"] == "heatmap")
+                values = list(heatmap["values"])
+                diffs = [a for a in scene["actions"] if a["type"] == "diff"]
+                for diff in diffs:
+                    for i, d in zip(diff["params"]["at"], diff["params"]["to"]):
+                        values[i] = d
+                names = ["V%d" % i for i in range(size)]
+                edges = [(f"V{i}", f"V{j}", heatmap["values"][i * size + j]) for i in range(size) for j in range(size)
+                         if i != j and heatmap["values"][i * size + j] is not None]
+                graph = Graph.from_edges(edges, nodes=names, directed=True)
+                for u in (0, size // 2, size - 1):
+                    settled = dict((v, d) for v, d, _ in graph.dijkstra(u))
+                    self.assertEqual(values[u * size:(u + 1) * size], [settled.get(v) for v in range(size)])
+                sent = sum(len(d["params"]["at"]) for d in diffs)
+                self.assertLessEqual(sent, FLOYD_DIFF_CELLS + size * size)
+                # diffs are merged only to stay in budget
+                shortened = scene["metadata"]["shortened"]
+                self.assertEqual(sent == shortened, shortened <= FLOYD_DIFF_CELLS)
+
+    def test_big_graph_stays_linear(self):
+        rng = random.Random(5)
+        nodes = GRAPH_MAX_EDGES // 2
+        prompt = "bfs on graph " + ", ".join(f"{rng.randrange(nodes)}-{rng.randrange(nodes)}"
+                                             for _ in range(GRAPH_MAX_EDGES))
+        scene = GENERATORS["bfs"].build(prompt, seed=1)
+        visits = sum(a["id"].startswith("visit_") for a in scene["actions"])
+        self.assertGreater(visits, nodes // 2)
+        # a recolour per visit and per tree edge, status lines for the narrated ones only
+        self.assertLess(len(scene["actions"]), 2 * visits + 10 * GRAPH_NARRATED_VISITS)
+        self.assertLess(scene["duration"], 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import random
+import re
+import unittest
+
+from bench_intent_parser import PROMPT_CORPUS, sequential_match
+from intent_parser import PriorityMatcher, RuleBasedIntentParser
+
+
+class TestIntentMatcherEquivalence(unittest.TestCase):
+    def setUp(self):
+        self.parser = RuleBasedIntentParser()
+
+    def test_corpus_matches_sequential_implementation(self):
+        for prompt in PROMPT_CORPUS:
+            with self.subTest(prompt=prompt):
+                self.assertEqual(self.parser.parse(prompt)["template_key"], sequential_match(self.parser, prompt))
+
+    def test_random_keyword_mixes(self):
+        # Prompts built from pattern/keyword fragments exercise overlapping and out-of-order hits
+        words = set(self.parser.advanced_topics)
+        for pattern, _ in self.parser.patterns:
+            words.update(w for w in re.split(r"[^a-z*-]+", pattern.replace(r"\s*", " ")) if w)
+        words = sorted(words)
+        rng = random.Random(1234)
+        for _ in range(2000):
+            prompt = " ".join(rng.choice(words) for _ in range(rng.randint(1, 4)))
+            with self.subTest(prompt=prompt):
+                self.assertEqual(self.parser.parse(prompt)["template_key"], sequential_match(self.parser, prompt))
+
+    def test_priority_beats_position(self):
+        matcher = PriorityMatcher([r"sort", r"bubble"])
+        self.assertEqual(matcher.first("bubble sort"), 0)
+        self.assertEqual(matcher.first("bubble"), 1)
+        self.assertIsNone(matcher.first("heap"))
+
+    def test_patterns_without_literal_prefix(self):
+        matcher = PriorityMatcher([r"quick\s*sort", r"[0-9]+x[0-9]+", r"(heap|tree)sort"])
+        self.assertEqual(matcher.first("matrix 3x3"), 1)
+        self.assertEqual(matcher.first("treesort 3x3"), 1)
+        self.assertEqual(matcher.first("treesort or quick sort"), 0)
+        self.assertEqual(matcher.first("heapsort"), 2)
+
+if __name__ == '__main__':
+    unittest.main()
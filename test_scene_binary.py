@@ -0,0 +1,87 @@
+import base64
+import json
+import os
+import shutil
+import struct
+import subprocess
+import unittest
+
+import app
+from scene_binary import BINARY_MIMETYPE, HEADER, decode_binary, encode_binary
+from test_compact_format import MAIN_JS, MARKED_SCENE, sample_scenes
+
+
+def f32(value):
+    return struct.unpack('<f', struct.pack('<f', value))[0]
+
+
+def as_float32(scene):
+    """What a scene looks like after a trip through the Float32 columns."""
+    scene = json.loads(json.dumps(scene))
+    for obj in scene['objects']:
+        props = obj.get('props')
+        for key in ('x', 'y'):
+            value = props.get(key) if isinstance(props, dict) else None
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                obj['props'][key] = f32(value)
+    for action in scene['actions']:
+        for key in ('start', 'end'):
+            value = action.get(key)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                action[key] = f32(value)
+    return scene
+
+
+class TestBinaryFormat(unittest.TestCase):
+    def test_round_trip(self):
+        for scene in sample_scenes():
+            with self.subTest(scene=scene['sceneId']):
+                self.assertEqual(decode_binary(encode_binary(scene)), as_float32(scene))
+
+    def test_sections_are_aligned(self):
+        data = encode_binary(sample_scenes()[0])
+        _, _, _, m, n, count, string_len, meta_len = HEADER.unpack_from(data)
+        pad = lambda size: size + -size % 4
+        expected = HEADER.size + 4 * (count + 1) + pad(string_len) + pad(meta_len) + 16 * m + 20 * n
+        self.assertEqual(len(data), expected)
+
+    def test_absent_and_irregular_values(self):
+        scene = {'sceneId': 's', 'objects': [{'id': 'a', 'type': 'circle', 'props': {'x': 1.5, 'y': 'top'}},
+                                              {'id': 'b', 'type': 'group'}],
+                 'actions': [{'id': 'w', 'objectId': 'a', 'type': 'wait', 'start': 0},
+                             {'id': 'm', 'type': 'translate', 'start': '0', 'end': 2.5,
+                              'params': {'to': {'x': 2, 'y': 3}}, 'narrative': 'Move', 'codeLine': 4}]}
+        self.assertEqual(decode_binary(encode_binary(scene)), scene)
+        self.assertEqual(decode_binary(encode_binary(MARKED_SCENE)), as_float32(MARKED_SCENE))
+
+    def test_rejects_other_payloads(self):
+        with self.assertRaises(ValueError):
+            decode_binary(b'\0' * HEADER.size)
+
+    def test_endpoint(self):
+        client = app.app.test_client()
+        query = {'description': 'bubble sort', 'seed': 5}
+        plain = client.get('/generate/scenes', query_string=query).get_json()
+        binary = client.get('/generate/scenes', query_string={**query, 'format': 'binary'})
+        self.assertEqual(binary.mimetype, BINARY_MIMETYPE)
+        self.assertEqual(decode_binary(binary.data), as_float32(plain))
+        library = client.post('/generate/scenes', json={'description': 'solar system', 'options': {'format': 'binary'}})
+        self.assertEqual(decode_binary(library.data), as_float32(app.TEMPLATES['solar']))
+
+    @unittest.skipUnless(shutil.which('node'), 'node is not installed')
+    def test_main_js_decoder_matches(self):
+        with open(MAIN_JS) as f:
+            source = f.read()
+        start = source.index('// --- COMPACT SCENE FORMAT ---')
+        decoder = source[start:source.index('// --- SCENE MANAGEMENT ---', start)]
+        scenes = sample_scenes() + [MARKED_SCENE]
+        payload = json.dumps([base64.b64encode(encode_binary(scene)).decode() for scene in scenes])
+        script = decoder + ('\nlet data = ""; process.stdin.on("data", c => data += c);'
+                            'process.stdin.on("end", () => process.stdout.write(JSON.stringify('
+                            'JSON.parse(data).map(b => { const buf = Buffer.from(b, "base64");'
+                            ' return decodeBinaryScene(buf.buffer.slice(buf.byteOffset, buf.byteOffset + buf.length)); }))));')
+        out = subprocess.run(['node', '-e', script], input=payload, capture_output=True, text=True, check=True)
+        self.assertEqual(json.loads(out.stdout), [as_float32(scene) for scene in scenes])
+
+if __name__ == '__main__':
+    unittest.main()
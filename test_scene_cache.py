@@ -0,0 +1,124 @@
+import json
+import unittest
+
+import app
+from scene_cache import SceneCache
+from scene_codec import EncodedScene
+
+
+class TestSceneCache(unittest.TestCase):
+    def test_lru_eviction_by_bytes(self):
+        cache = SceneCache(max_bytes=10)
+        cache.put("a", b"1234")
+        cache.put("b", b"1234")
+        self.assertEqual(cache.get("a"), b"1234")  # a is now most recent
+        cache.put("c", b"1234")  # 12 bytes > 10: evicts b
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertEqual(cache.stats()["bytes"], 8)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_counters(self):
+        cache = SceneCache(max_bytes=100)
+        self.assertIsNone(cache.get("x"))
+        cache.put("x", b"{}")
+        cache.get("x")
+        cache.get("x")
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (2, 1, 1))
+
+    def test_replace_and_oversized_entries(self):
+        cache = SceneCache(max_bytes=5)
+        cache.put("x", b"12")
+        cache.put("x", b"123")
+        self.assertEqual(cache.stats()["bytes"], 3)
+        cache.put("y", b"123456")
+        self.assertNotIn("y", cache)
+        self.assertEqual(len(cache), 1)
+
+    def test_variants_are_charged(self):
+        cache = SceneCache(max_bytes=3000)
+        a, b = EncodedScene(b"a" * 1000), EncodedScene(b"b" * 1000)
+        cache.put("a", a)
+        cache.put("b", b)
+        a.compressed("gzip")
+        cache.recharge("a")
+        self.assertEqual(cache.stats()["bytes"], a.nbytes + 1000)
+        a._variants["gzip"] = b"x" * 1500  # grows past the budget: b goes
+        cache.recharge("a")
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.stats()["bytes"], 2500)
+        cache.recharge("gone")
+
+
+CACHE = app.SCENE_CACHE
+
+
+class TestGenerateScenesCache(unittest.TestCase):
+    def setUp(self):
+        app.SCENE_CACHE.clear()
+        self.client = app.app.test_client()
+
+    def post(self, description, **options):
+        return self.client.post('/generate/scenes', json={'description': description, 'options': options})
+
+    def test_repeat_request_is_a_hit(self):
+        first = self.post('fibonacci', level='advanced', language='java')
+        second = self.post('fibonacci', level='advanced', language='java')
+        self.assertEqual(first.headers['X-Cache'], 'MISS')
+        self.assertEqual(second.headers['X-Cache'], 'HIT')
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(json.loads(second.data)['sceneId'], json.loads(first.data)['sceneId'])
+
+    def test_options_are_part_of_the_key(self):
+        self.post('fibonacci', level='advanced', language='java')
+        self.assertEqual(self.post('fibonacci', level='beginner', language='java').headers['X-Cache'], 'MISS')
+        # Unsupported values resolve to the same canonical inputs as the default
+        self.post('fibonacci', language='python')
+        self.assertEqual(self.post('fibonacci', language='rust').headers['X-Cache'], 'HIT')
+
+    def test_seeded_requests_are_cacheable(self):
+        first = self.post('bubble sort', seed=42)
+        second = self.post('bubble sort', seed=42)
+        self.assertEqual(second.headers['X-Cache'], 'HIT')
+        self.assertEqual(json.loads(first.data)['seed'], 42)
+        self.assertEqual(self.post('bubble sort', seed=43).headers['X-Cache'], 'MISS')
+        # Without a seed the server picks one and echoes it
+        self.assertIsInstance(json.loads(self.post('bubble sort').data)['seed'], int)
+
+    def test_invalid_seed(self):
+        for seed in [-1, 1.5, "abc", True]:
+            with self.subTest(seed=seed):
+                self.assertEqual(self.post('bubble sort', seed=seed).status_code, 400)
+
+    def post_compressed(self):
+        return self.client.post('/generate/scenes', json={'description': 'bubble sort', 'options': {'seed': 5}},
+                                headers={'Accept-Encoding': 'gzip, br'})
+
+    def test_compressed_variants_count_against_the_budget(self):
+        size = len(self.post('bubble sort', seed=5).data)
+        self.assertEqual(self.client.get('/api/cache').get_json()['bytes'], size)
+        response = self.post_compressed()
+        self.assertIn(response.headers['Content-Encoding'], ('gzip', 'br'))
+        stats = self.client.get('/api/cache').get_json()
+        self.assertEqual(stats['bytes'], size + len(response.data))
+        # a budget with room for the scene but not for its variant too
+        try:
+            app.SCENE_CACHE = SceneCache(max_bytes=size + 100)
+            for _ in range(2):
+                self.post_compressed()
+                stats = self.client.get('/api/cache').get_json()
+                self.assertLessEqual(stats['bytes'], stats['maxBytes'])
+            self.assertEqual(stats['evictions'], 2)
+        finally:
+            app.SCENE_CACHE = CACHE
+
+    def test_stats_endpoint(self):
+        self.post('knapsack')
+        self.post('knapsack')
+        stats = self.client.get('/api/cache').get_json()
+        self.assertGreaterEqual(stats['hits'], 1)
+        self.assertGreater(stats['bytes'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
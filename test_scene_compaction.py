@@ -0,0 +1,182 @@
+import math
+import unittest
+
+import app
+import scene_stream
+from scene_compaction import compact_actions, compact_scene
+from scene_generators import GENERATORS
+from scene_paths import compact_paths
+from template_generator import GENERATED_TEMPLATES, generate_formula_template
+
+TWEENED = {"scale": "scale", "rotate": "rotation", "fade": "opacity"}
+
+
+def frame(scene, t):
+    """
+    What render(t) in main.js draws, plus every other param an action sets
+    (as "@key", starting from the prop), the narratives spoken so far and
+    the highlighted code line.
+    """
+    states = {}
+    for obj in scene["objects"]:
+        props = obj.get("props") or {}
+        states[obj["id"]] = state = dict(props)
+        state.update(("@" + key, value) for key, value in props.items())
+        for key, default in (("opacity", 1), ("scale", 1), ("rotation", 0), ("x", 0), ("y", 0)):
+            state.setdefault(key, default)
+    for action in sorted(scene["actions"], key=lambda a: a["start"]):
+        obj = states.get(action["objectId"])
+        if obj is None or t < action["start"]:
+            continue
+        span = action["end"] - action["start"]
+        p = (t - action["start"]) / span if span else (math.nan if t == action["start"] else math.inf)
+        p = 1 if p > 1 else 0 if p < 0 else p
+        params = action.get("params") or {}
+        tweened = {}
+        if action["type"] == "translate":
+            tweened = {"x": params["to"].get("x"), "y": params["to"].get("y")}
+        elif action["type"] in TWEENED and (action["type"] != "rotate" or "rotation" in params):
+            tweened = {TWEENED[action["type"]]: params.get(TWEENED[action["type"]])}
+        for key, target in tweened.items():
+            target = math.nan if target is None else target
+            obj[key] = obj[key] + (target - obj[key]) * p
+        for key, value in params.items():
+            if key not in tweened and key != "to":
+                obj["@" + key] = value
+    spoken, seen = [], set()
+    for action in scene["actions"]:
+        if t >= action["start"] and action["id"] not in seen:
+            seen.add(action["id"])
+            spoken.append(action.get("narrative"))
+    line = next((a["codeLine"] for a in sorted(scene["actions"], key=lambda a: -a["start"])
+                 if a.get("codeLine") and a["start"] <= t < a["end"] + 0.5), None)
+    return states, [narrative for narrative in spoken if narrative], line
+
+
+def sample_times(scene):
+    times = {0.0}
+    for action in scene["actions"]:
+        start, end = action["start"], action["end"]
+        times.update((start, end, (start + end) / 2, start + (end - start) / 3, end + 0.5, end + 0.01))
+    return sorted(times)
+
+
+class TestSceneCompaction(unittest.TestCase):
+    def assertSameFrames(self, before, after):
+        for t in sample_times(before):
+            states_before, spoken_before, line_before = frame(before, t)
+            states_after, spoken_after, line_after = frame(after, t)
+            self.assertEqual((spoken_before, line_before), (spoken_after, line_after), t)
+            for object_id, state in states_before.items():
+                for key, value in state.items():
+                    other = states_after[object_id][key]
+                    if isinstance(value, float) and isinstance(other, float):
+                        self.assertTrue(math.isclose(value, other, rel_tol=1e-9, abs_tol=1e-9)
+                                        or (math.isnan(value) and math.isnan(other)), (t, object_id, key))
+                    else:
+                        self.assertEqual(value, other, (t, object_id, key))
+
+    def test_library_frames_unchanged(self):
+        library = {"bubble": app.TEMPLATE_BUBBLE_SORT, "selection": app.TEMPLATE_SELECTION_SORT,
+                   "bfs": app.TEMPLATE_ALGO_BFS, "dna": app.TEMPLATE_DNA, "bar_race": app.TEMPLATE_BAR_RACE,
+                   "bernoulli": app.TEMPLATE_BERNOULLI, "derivation": app.TEMPLATE_DERIVATION}
+        families = {}
+        for key in GENERATED_TEMPLATES:
+            # two of each numbered family (poly_3, poly_4, ...); every formula
+            family = key if key.startswith("formula_") else key.rsplit("_", 1)[0]
+            if len(families.setdefault(family, [])) < 2:
+                families[family].append(key)
+                library[key] = GENERATED_TEMPLATES[key]
+        removed = 0
+        for key, before in library.items():
+            after = app.TEMPLATES[key]
+            with self.subTest(key=key):
+                # the library rewrites path data too (checked in test_scene_paths.py)
+                self.assertSameFrames(compact_paths(before), after)
+                removed += len(before["actions"]) - len(after["actions"])
+        self.assertGreater(removed, 0)
+
+    def test_generator_frames_unchanged(self):
+        for key in ("bubble", "selection", "merge_sort", "binary", "floyd_warshall", "bst", "quicksort",
+                    "bfs", "radix_sort"):
+            spec = GENERATORS[key]
+            for level in ("kids", "advanced"):
+                with self.subTest(key=key, level=level):
+                    args, kwargs = spec.inputs(key, level, "python", None, 7)
+                    before = spec.func(*args, **kwargs)
+                    after = compact_scene(before)
+                    self.assertSameFrames(before, after)
+                    self.assertEqual(compact_scene(after), after)
+
+    def test_reports_counts_and_leaves_the_scene_alone(self):
+        # (sorting scenes compact their own actions to report them, see _sort_metadata)
+        spec = GENERATORS["merge_sort"]
+        args, kwargs = spec.inputs("merge sort", "advanced", "python", None, 7)
+        before = spec.func(*args, **kwargs)
+        count = len(before["actions"])
+        after = compact_scene(before)
+        self.assertEqual(len(before["actions"]), count)
+        self.assertEqual(after["metadata"]["compaction"], {"before": count, "after": len(after["actions"])})
+        # child bars already green from the merge below are not coloured green again
+        self.assertIn("color_merge_l2_i0", {a["id"] for a in before["actions"]} - {a["id"] for a in after["actions"]})
+        self.assertEqual(spec.generate(args, kwargs)["actions"], after["actions"])
+
+    def test_formula_dummy_dropped(self):
+        scene = compact_scene(generate_formula_template("Density", "p = m/V", "Mass per volume", 0))
+        self.assertNotIn("show_grid", [a["id"] for a in scene["actions"]])
+
+    def test_rules(self):
+        objects = [{"id": "a", "type": "rect", "props": {"opacity": 0, "color": "#fff"}},
+                   {"id": "m", "type": "circle", "props": {}}, {"id": "p", "type": "path", "props": {"d": "M 0 0 L 9 9"}}]
+        actions = [
+            {"id": "in1", "objectId": "a", "type": "fade", "start": 0, "end": 1, "params": {"opacity": 0.5}},
+            {"id": "in2", "objectId": "a", "type": "fade", "start": 1, "end": 2, "params": {"opacity": 1}},
+            {"id": "same", "objectId": "a", "type": "color", "start": 2, "end": 2, "params": {"color": "#fff"}},
+            {"id": "red", "objectId": "a", "type": "color", "start": 3, "end": 3.5, "params": {"color": "red"}},
+            {"id": "blue", "objectId": "a", "type": "color", "start": 3, "end": 3.5, "params": {"color": "blue"}},
+            {"id": "slow", "objectId": "a", "type": "fade", "start": 4, "end": 6, "params": {"opacity": 0}},
+            {"id": "told", "objectId": "a", "type": "fade", "start": 7, "end": 8, "params": {"opacity": 0},
+             "narrative": "Kept: it is spoken."},
+            {"id": "ghost", "objectId": "nobody", "type": "fade", "start": 0, "end": 1, "params": {"opacity": 1}},
+            {"id": "walk", "objectId": "m", "type": "followPath", "start": 0, "end": 1, "params": {"pathId": "p"}},
+            {"id": "stay", "objectId": "m", "type": "fade", "start": 2, "end": 3, "params": {"opacity": 1}},
+        ]
+        compacted = compact_actions(objects, actions)
+        self.assertEqual([a["id"] for a in compacted], ["in1", "blue", "slow", "told", "walk", "stay"])
+        self.assertEqual(compacted[0], {"id": "in1", "objectId": "a", "type": "fade", "start": 0, "end": 2,
+                                        "params": {"opacity": 1}})
+        self.assertSameFrames({"objects": objects, "actions": actions}, {"objects": objects, "actions": compacted})
+
+    def test_tweens_at_other_speeds_stay(self):
+        objects = [{"id": "a", "type": "rect", "props": {}}]
+        actions = [
+            {"id": "go", "objectId": "a", "type": "translate", "start": 0, "end": 1, "params": {"to": {"x": 10, "y": 0}}},
+            {"id": "on", "objectId": "a", "type": "translate", "start": 1, "end": 2, "params": {"to": {"x": 30, "y": 0}}},
+            {"id": "half", "objectId": "a", "type": "fade", "start": 0, "end": 1, "params": {"opacity": 1}},
+            {"id": "one", "objectId": "a", "type": "fade", "start": 0.5, "end": 1, "params": {"opacity": 1.0}},
+        ]
+        # both fades are no-ops: the opacity is 1 already
+        self.assertEqual([a["id"] for a in compact_actions(objects, actions)], ["go", "on"])
+
+    def test_diffs_stay(self):
+        objects = [{"id": "h", "type": "heatmap", "props": {"values": [1, 2]}}]
+        actions = [
+            {"id": "d0", "objectId": "h", "type": "diff", "start": 0, "end": 1, "params": {"at": [0], "to": [2]}},
+            {"id": "d1", "objectId": "h", "type": "diff", "start": 1, "end": 2, "params": {"at": [0], "to": [2]}},
+            {"id": "d2", "objectId": "h", "type": "diff", "start": 1, "end": 2, "params": {"at": [1], "to": [0]}},
+        ]
+        # each one changes some cells; none stands for the whole matrix
+        self.assertEqual(compact_actions(objects, actions), actions)
+
+    def test_stream_is_compacted_per_topic(self):
+        spec = GENERATORS["full_course"]
+        args, kwargs = spec.inputs(seed=4)
+        scene = spec.generate(args, kwargs)
+        self.assertEqual(scene_stream.assemble(spec.parts(args, kwargs)), scene)
+        ids = {a["id"] for a in scene["actions"]}
+        self.assertIn("t0_show_eq", ids)
+        self.assertNotIn("t0_show_grid", ids)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import random
+import unittest
+
+import template_generator
+from scene_generators import GENERATORS, GeneratorRegistry
+
+
+class TestGeneratorRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = GeneratorRegistry()
+        self.calls = []
+
+        @self.registry.register("demo", seeded=False, params={"n": lambda d: 5 if "5" in d else None})
+        @self.registry.register("family:", levels=(), languages=(), indexed=False, arg="topic")
+        def demo(*args, **kwargs):
+            self.calls.append((args, kwargs))
+            return {"sceneId": "demo"}
+
+    def test_build_passes_request_options(self):
+        self.registry["demo"].build("demo 5", level="advanced", language="java")
+        self.assertEqual(self.calls[-1], ((0,), {"difficulty": "advanced", "language": "java", "n": 5}))
+
+    def test_unsupported_options_fall_back(self):
+        self.registry["demo"].build("demo", level="expert", language="rust")
+        self.assertEqual(self.calls[-1], ((0,), {"difficulty": "beginner", "language": "python"}))
+        # the generator's own default wins
+        self.registry.register("own", levels=("kids", "advanced"))(lambda idx, difficulty="advanced", language="java": {})
+        args, kwargs = self.registry["own"].inputs(level="expert", language="rust")
+        self.assertEqual((kwargs["difficulty"], kwargs["language"]), ("advanced", "java"))
+        # real generators: an unknown level is the beginner scene, not the kids one
+        spec = GENERATORS["bubble"]
+        self.assertEqual(spec.build(level="expert", seed=3), spec.build(level="beginner", seed=3))
+
+    def test_family_keys(self):
+        spec, arg = self.registry.resolve("family:carbon_cycle")
+        self.assertEqual(arg, "carbon_cycle")
+        spec.build(arg=arg)
+        self.assertEqual(self.calls[-1], ((), {"topic": "carbon_cycle"}))
+        self.assertEqual(self.registry.resolve("missing"), (None, None))
+        self.assertEqual(self.registry.resolve("other:x"), (None, None))
+
+    def test_duplicate_key_rejected(self):
+        with self.assertRaises(ValueError):
+            self.registry.register("demo")(lambda idx: {})
+
+
+class TestRegisteredGenerators(unittest.TestCase):
+    def test_generators_register_on_import(self):
+        self.assertIs(GENERATORS["bubble"].func, template_generator.generate_algo_template)
+        self.assertEqual(GENERATORS["dfs"].fixed, {"algo_type": "dfs"})
+        self.assertTrue(GENERATORS["bubble"].seeded)
+        self.assertFalse(GENERATORS["fibonacci"].seeded)
+
+    def test_seeded_generation_is_reproducible(self):
+        for key in ["bubble", "selection", "binary", "quicksort", "merge_sort", "counting_sort", "bucket_sort"]:
+            with self.subTest(key=key):
+                spec = GENERATORS[key]
+                scene = spec.build(level="advanced", seed=1234)
+                self.assertEqual(scene, spec.build(level="advanced", seed=1234))
+                self.assertEqual(scene["seed"], 1234)
+                self.assertTrue(scene["sceneId"].endswith("_34"))
+        self.assertNotEqual(GENERATORS["bubble"].build(seed=1), GENERATORS["bubble"].build(seed=2))
+
+    def test_seeded_generation_leaves_global_random_alone(self):
+        random.seed(99)
+        expected = random.random()
+        random.seed(99)
+        GENERATORS["matrix_op"].build("matrix 3x3", seed=5)
+        self.assertEqual(random.random(), expected)
+
+    def test_nqueens_reads_board_size(self):
+        scene = GENERATORS["nqueens"].build("5 queens")
+        self.assertEqual(scene, template_generator.generate_nqueens_template(0, n=5))
+
+    def test_dynamic_topics(self):
+        spec, arg = GENERATORS.resolve("dynamic:Determinant")
+        self.assertEqual(spec.build(arg=arg)["sceneId"], "adv_determinant")
+
+if __name__ == '__main__':
+    unittest.main()
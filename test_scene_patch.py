@@ -0,0 +1,126 @@
+import json
+import os
+import shutil
+import subprocess
+import unittest
+
+import app
+from scene_codec import encode_json
+from scene_generators import GENERATORS
+from scene_patch import apply_patch, diff_scenes, merge_patch
+
+MAIN_JS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'public', 'main.js')
+
+SWITCHES = [(('beginner', 'python'), ('advanced', 'python')), (('beginner', 'python'), ('beginner', 'java')),
+            (('intermediate', 'cpp'), ('beginner', 'javascript'))]
+
+
+def parsed(scene):
+    return json.loads(encode_json(scene))
+
+
+def scene_pairs():
+    for key in ['bubble', 'binary', 'knapsack', 'bfs', 'bst', 'merge_sort']:
+        for before, after in SWITCHES:
+            yield (key, before, after,
+                   parsed(GENERATORS[key].build(level=before[0], language=before[1], seed=7)),
+                   parsed(GENERATORS[key].build(level=after[0], language=after[1], seed=7)))
+
+
+class TestScenePatch(unittest.TestCase):
+    def test_merge_patch(self):
+        old = {'a': 1, 'b': {'c': 2, 'd': 3}, 'e': [1, 2], 'f': True}
+        new = {'a': 1, 'b': {'c': 2, 'd': 4, 'x': {'y': 1}}, 'e': [1], 'f': 1}
+        patch = merge_patch(old, new)
+        self.assertEqual(patch, {'b': {'d': 4, 'x': {'y': 1}}, 'e': [1], 'f': 1})
+        self.assertEqual(merge_patch(new, {'a': 1}), {'b': None, 'e': None, 'f': None})
+
+    def test_round_trip(self):
+        for key, before, after, old, new in scene_pairs():
+            with self.subTest(key=key, before=before, after=after):
+                patch = diff_scenes(old, new)
+                self.assertIsNotNone(patch)
+                self.assertEqual(apply_patch(old, parsed(patch)), new)
+
+    def test_mismatched_scenes_have_no_patch(self):
+        old = {'objects': [{'id': 'a'}], 'actions': []}
+        self.assertIsNone(diff_scenes(old, {'objects': [{'id': 'b'}], 'actions': []}))
+        self.assertIsNone(diff_scenes(old, {'objects': [{'id': 'a', 'props': None}], 'actions': []}))
+
+    def test_patches_are_an_order_of_magnitude_smaller(self):
+        full = patches = 0
+        for key in GENERATORS:
+            if key.endswith(':') or key == 'matrix_op':
+                continue
+            for before, after in SWITCHES:
+                new = GENERATORS[key].build(key, level=after[0], language=after[1], seed=7)
+                patch = diff_scenes(parsed(GENERATORS[key].build(key, level=before[0], language=before[1], seed=7)),
+                                    parsed(new))
+                full += len(encode_json(new))
+                patches += len(encode_json(patch))
+        self.assertLess(patches * 10, full)
+
+    def test_patches_are_small_per_switch(self):
+        app.SCENE_CACHE.clear()
+        client = app.app.test_client()
+        patched = set()
+        for key in GENERATORS:
+            if key.endswith(':') or key == 'matrix_op':
+                continue
+            for before, after in SWITCHES:
+                query = {'key': key, 'seed': 7, 'description': key, 'from_level': before[0],
+                         'from_language': before[1], 'level': after[0], 'language': after[1]}
+                with self.subTest(key=key, before=before, after=after):
+                    delta = client.get('/generate/scenes/delta', query_string=query)
+                    full = GENERATORS[key].build(key, level=after[0], language=after[1], seed=7)
+                    if 'patch' not in delta.get_json():
+                        self.assertEqual(delta.get_json(), parsed(full))
+                        continue
+                    self.assertLessEqual(len(delta.data), app.PATCH_MAX_RATIO * len(encode_json(full)))
+                    patched.add(key)
+        self.assertTrue({'binary', 'bfs', 'knapsack', 'merge_sort', 'dynamic:dijkstra'} <= patched)
+        # advanced bubble sort re-times nearly every action: the whole scene is cheaper
+        query = {'key': 'bubble', 'seed': 7, 'from_level': 'beginner', 'from_language': 'python',
+                 'level': 'advanced', 'language': 'java'}
+        delta = client.get('/generate/scenes/delta', query_string=query)
+        self.assertEqual(delta.get_json(), parsed(GENERATORS['bubble'].build(level='advanced', language='java',
+                                                                             seed=7)))
+
+    def test_endpoint(self):
+        app.SCENE_CACHE.clear()
+        client = app.app.test_client()
+        first = client.get('/generate/scenes', query_string={'description': 'binary search', 'seed': 5})
+        self.assertEqual(first.headers['X-Scene-Key'], 'binary')
+        query = {'key': 'binary', 'seed': 5, 'description': 'binary search', 'from_level': 'beginner',
+                 'from_language': 'python', 'level': 'advanced', 'language': 'java'}
+        delta = client.get('/generate/scenes/delta', query_string=query)
+        target = client.get('/generate/scenes', query_string={'description': 'binary search', 'seed': 5,
+                                                              'level': 'advanced', 'language': 'java'})
+        self.assertLess(len(delta.data) * 10, len(target.data))
+        self.assertEqual(apply_patch(first.get_json(), delta.get_json()['patch']), target.get_json())
+        self.assertIsNotNone(delta.headers.get('ETag'))
+
+        # kids binary search has a smaller array: the whole scene comes back
+        kids = client.get('/generate/scenes/delta', query_string={**query, 'level': 'kids'})
+        self.assertNotIn('patch', kids.get_json())
+        self.assertEqual(kids.get_json(), GENERATORS['binary'].build(level='kids', language='java', seed=5))
+
+        self.assertEqual(client.get('/generate/scenes/delta', query_string={'key': 'nope'}).status_code, 404)
+        self.assertEqual(client.get('/generate/scenes/delta', query_string={'key': 'binary'}).status_code, 400)
+
+    @unittest.skipUnless(shutil.which('node'), 'node is not installed')
+    def test_main_js_patch_matches(self):
+        with open(MAIN_JS) as f:
+            source = f.read()
+        start = source.index('// --- SCENE PATCHES ---')
+        patcher = source[start:source.index('// --- COMPACT SCENE FORMAT ---', start)]
+        pairs = list(scene_pairs())
+        payload = json.dumps([[old, diff_scenes(old, new)] for _, _, _, old, new in pairs])
+        script = patcher + ('\nlet data = ""; process.stdin.on("data", c => data += c);'
+                            'process.stdin.on("end", () => process.stdout.write(JSON.stringify('
+                            'JSON.parse(data).map(([scene, patch]) => applyScenePatch(scene, patch)))));')
+        out = subprocess.run(['node', '-e', script], input=payload, capture_output=True, text=True, check=True)
+        self.assertEqual(json.loads(out.stdout), [new for _, _, _, _, new in pairs])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,194 @@
+import math
+import unittest
+
+import numpy as np
+
+import app
+from scene_generators import GENERATORS
+from scene_paths import (PATH_QUANTUM, PATH_TOLERANCE, compact_path, compact_paths, flatten_path, followed_paths,
+                         parse_path, path_track, point_along)
+from template_generator import GENERATED_TEMPLATES, generate_graph_template
+
+WIDTH, HEIGHT = 800, 450
+PIXEL_Y, PIXEL_X = np.mgrid[0:HEIGHT, 0:WIDTH] + 0.5
+
+
+def segments(d):
+    """The line segments of path data made of M, L and Z only (None otherwise)."""
+    out, x, y = [], None, None
+    for command, args in parse_path(d):
+        # (relative offsets add up to the points they came from, give or take float error)
+        args = tuple(round(v, 6) for v in args)
+        if command == "M":
+            x, y = start = args
+        elif command in ("L", "Z"):
+            end = args if command == "L" else start
+            out.append((x, y) + end)
+            x, y = end
+        else:
+            return None
+    return out
+
+
+def raster(lines, width):
+    """Coverage of the stroked lines on the canvas, with a pixel of antialiasing."""
+    half = width / 2 + 0.5
+    distance = np.full((HEIGHT, WIDTH), np.inf)
+    for ax, ay, bx, by in lines:
+        x0, x1 = max(int(min(ax, bx) - half) - 1, 0), min(int(max(ax, bx) + half) + 2, WIDTH)
+        y0, y1 = max(int(min(ay, by) - half) - 1, 0), min(int(max(ay, by) + half) + 2, HEIGHT)
+        if x0 >= x1 or y0 >= y1:
+            continue
+        px, py = PIXEL_X[y0:y1, x0:x1] - ax, PIXEL_Y[y0:y1, x0:x1] - ay
+        dx, dy = bx - ax, by - ay
+        t = np.clip((px * dx + py * dy) / (dx * dx + dy * dy), 0, 1) if dx or dy else 0
+        np.minimum(distance[y0:y1, x0:x1], np.hypot(px - t * dx, py - t * dy), out=distance[y0:y1, x0:x1])
+    return np.clip(half - distance, 0, 1)
+
+
+class TestPathData(unittest.TestCase):
+    def test_parse(self):
+        self.assertEqual(parse_path("M 10 20 h 5 v-5 L 0,0 1 1 m 2 2 3 3 z l 1 1"),
+                         [("M", (10, 20)), ("L", (15, 20)), ("L", (15, 15)), ("L", (0, 0)), ("L", (1, 1)),
+                          ("M", (3, 3)), ("L", (6, 6)), ("Z", ()), ("L", (4, 4))])
+        self.assertEqual(parse_path("M1 1q1 1 2 0t2 0a5 5 0 1 0 10 0"),
+                         [("M", (1, 1)), ("Q", (2, 2, 3, 1)), ("T", (5, 1)), ("A", (5, 5, 0, 1, 0, 15, 1))])
+        for d in ("L 1 1", "M 1", "M 1 1 z 2", "M 1 1 X 2", "M 1e999 0"):
+            with self.subTest(d=d):
+                with self.assertRaises(ValueError):
+                    parse_path(d)
+                self.assertEqual(compact_path(d), d)
+
+    def test_compact_text(self):
+        self.assertEqual(compact_path("M 400 225 m -50, 0 a 50,50 0 1,0 100,0 a 50,50 0 1,0 -100,0"),
+                         "M350 225a50 50 0 1 0 100 0 50 50 0 1 0-100 0")
+        self.assertEqual(compact_path("M 100 100 L 700 100 L 700 350 L 100 350 Z"), "M100 100h600v250h-600z")
+        self.assertEqual(compact_path("M 0 300 Q 100 200 200 300 T 400 300"), "M0 300q100-100 200 0t200 0")
+        self.assertEqual(compact_path("M 0.0 0.0 L 1.0 0.1 L 2.0 0.0 L 2.5 -0.5 M 5 5 L 5.06 6"), "M0 0h2l.5-.5m2.5 5.5.1 1")
+
+    def test_offsets_add_up(self):
+        # relative offsets of rounded points, so nothing drifts along a long path
+        rng = np.random.default_rng(2)
+        points = np.cumsum(rng.uniform(-3, 3, (2000, 2)), axis=0) + 400
+        d = "M " + " L ".join(f"{x:.3f} {y:.3f}" for x, y in points)
+        end = parse_path(compact_path(d, tolerance=0))[-1][1]
+        self.assertEqual(tuple(round(v, 6) for v in end), tuple(round(v, 1) for v in points[-1]))
+
+
+class TestNoVisibleChange(unittest.TestCase):
+    def test_generated_paths(self):
+        paths = [obj for key in GENERATED_TEMPLATES.static_keys() for obj in GENERATED_TEMPLATES[key]["objects"]
+                 if obj["type"] == "path"]
+        paths += [{"props": {"d": generate_graph_template(e, e)["objects"][4]["props"]["d"], "width": 4}}
+                  for e in ("sin(x^2)", "x^3 - x", "tan(x)", "floor(x)")]
+        before = after = rastered = 0
+        for obj in paths:
+            d = obj["props"]["d"]
+            compact = compact_path(d)
+            before, after = before + len(d), after + len(compact)
+            original, simplified = segments(d), segments(compact)
+            with self.subTest(d=d[:60]):
+                if original is None:
+                    # curves and arcs are only rounded
+                    commands, rounded = parse_path(d), parse_path(compact)
+                    self.assertEqual([c for c, _ in commands if c != "M"], [c for c, _ in rounded if c != "M"])
+                    for (_, args), (_, other) in zip([c for c in commands if c[0] != "M"],
+                                                     [c for c in rounded if c[0] != "M"]):
+                        self.assertTrue(np.allclose(args, other, atol=PATH_QUANTUM / 2 + 1e-9))
+                    continue
+                if original == simplified:
+                    continue
+                self.assertLess(len(simplified), len(original))
+                width = obj["props"].get("width") or 2
+                change = np.abs(raster(original, width) - raster(simplified, width))
+                # no pixel moves by more than the tolerance (plus rounding)
+                self.assertLessEqual(change.max(), PATH_TOLERANCE + PATH_QUANTUM)
+                rastered += 1
+        self.assertGreater(rastered, 30)
+        self.assertLess(after, before * 0.6)
+
+    def test_scenes_are_sent_compact(self):
+        scene = GENERATORS["plot"].build("plot y = x^3 - x")
+        self.assertEqual(scene["objects"][4]["props"]["d"],
+                         compact_path(generate_graph_template("x^3 - x", "x^3 - x")["objects"][4]["props"]["d"]))
+        atom = app.TEMPLATES["atom_3"]
+        self.assertEqual(atom["objects"], compact_paths(GENERATED_TEMPLATES["atom_3"])["objects"])
+        # nothing left to rewrite
+        self.assertIs(compact_paths(atom), atom)
+
+
+def bezier(points, t):
+    """Dense points of a Bezier curve at the parameters t (an array)."""
+    n = len(points) - 1
+    return sum(math.comb(n, k) * (1 - t) ** (n - k) * t ** k * np.array(p)[:, None] for k, p in enumerate(points)).T
+
+
+class TestTracks(unittest.TestCase):
+    def assertNear(self, points, curve, tolerance):
+        """Every point lies within tolerance of the densely sampled curve."""
+        for x, y in points:
+            self.assertLessEqual(np.min(np.hypot(curve[:, 0] - x, curve[:, 1] - y)), tolerance, (x, y))
+
+    def test_arcs(self):
+        # the orbits of the atom scenes: from the left of the circle, sweep flag 0
+        for r in (50, 170):
+            track = path_track(compact_path(f"M 400 225 m -{r}, 0 a {r},{r} 0 1,0 {2*r},0 a {r},{r} 0 1,0 -{2*r},0"))
+            with self.subTest(r=r):
+                self.assertAlmostEqual(track[-1] / (2 * math.pi * r), 1, delta=0.002)
+                for p, (x, y) in ((0, (400 - r, 225)), (0.25, (400, 225 + r)), (0.5, (400 + r, 225)),
+                                  (0.75, (400, 225 - r)), (1, (400 - r, 225))):
+                    self.assertLess(math.dist(point_along(track, p), (x, y)), 0.5)
+                for x, y in zip(track[::3], track[1::3]):
+                    self.assertLess(abs(math.dist((x, y), (400, 225)) - r), PATH_TOLERANCE + PATH_QUANTUM)
+        # radii too small for the endpoints grow until they fit; sweep flag 1 turns clockwise on screen
+        [points] = flatten_path("M 0 0 A 10 10 0 0 1 100 0")
+        self.assertTrue(np.allclose(np.hypot(*(np.array(points) - (50, 0)).T), 50))
+        self.assertTrue(all(y <= 1e-9 for _, y in points))
+        self.assertEqual(points[-1], (100, 0))
+        # an ellipse turned a quarter is the one with its radii swapped
+        self.assertTrue(np.allclose(flatten_path("M 0 0 A 30 60 90 0 1 100 20"),
+                                    flatten_path("M 0 0 A 60 30 0 0 1 100 20")))
+
+    def test_curves(self):
+        t = np.linspace(0, 1, 20001)
+        quadratic = bezier([(0, 300), (100, 200), (200, 300)], t)
+        reflected = bezier([(200, 300), (300, 400), (400, 300)], t)
+        cubic = bezier([(400, 300), (400, 200), (300, 150), (300, 250)], t)
+        smooth = bezier([(300, 250), (300, 350), (400, 400), (400, 400)], t)
+        curve = np.concatenate([quadratic, reflected, cubic, smooth])
+        d = "M 0 300 Q 100 200 200 300 T 400 300 C 400 200 300 150 300 250 S 400 400 400 400"
+        [points] = flatten_path(d)
+        self.assertNear(points, curve, PATH_TOLERANCE)
+        track = path_track(d)
+        self.assertAlmostEqual(track[-1] / np.sum(np.hypot(*np.diff(curve, axis=0).T)), 1, delta=0.002)
+        self.assertNear([point_along(track, p) for p in np.linspace(0, 1, 101)], curve, PATH_TOLERANCE + PATH_QUANTUM)
+
+    def test_moves_add_no_length(self):
+        track = path_track("M 0 0 L 10 0 M 100 100 L 100 110 Z")
+        self.assertEqual(track, [0, 0, 0, 10, 0, 10, 100, 100, 10, 100, 110, 20, 100, 100, 30])
+        self.assertEqual(point_along(track, 0.5), (100, 105))
+        self.assertEqual(point_along(track, 1 / 3), (100, 100))
+        self.assertIsNone(path_track("M 5 5"))
+        self.assertIsNone(path_track("L 5 5"))
+
+    def test_followed_paths_get_tracks(self):
+        spec, topic = GENERATORS.resolve("dynamic:Gradient Descent")
+        scenes = {"atom_50": app.TEMPLATES["atom_50"], "solar": app.TEMPLATES["solar"],
+                  "gradient": spec.build(arg=topic, seed=1)}
+        for key, scene in scenes.items():
+            followed = followed_paths(scene["actions"])
+            with self.subTest(key=key):
+                self.assertTrue(followed)
+                for obj in scene["objects"]:
+                    if obj["type"] == "path":
+                        track = obj["props"].get("track")
+                        self.assertEqual(track, path_track(obj["props"]["d"]) if obj["id"] in followed else None)
+        # the tracks ride along in the streamed course too
+        spec = GENERATORS["full_course"]
+        tracks = [obj["id"] for part in spec.parts(*spec.inputs(seed=2)) if part["kind"] == "objects"
+                  for obj in part["objects"] if "track" in obj["props"]]
+        self.assertEqual(tracks, ["t12_tract"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from scene_codec import content_hash, encode_json
+import scene_snapshot
+from scene_snapshot import SceneSnapshot, write_snapshot
+from template_registry import TemplateRegistry
+
+
+class TestSceneSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "scenes.snap")
+        self.templates = TemplateRegistry({"static": {"sceneId": "static", "objects": [], "actions": []}})
+        self.templates.register_static("poly_3", lambda: {"sceneId": "poly_3", "title": "Triangle △"})
+        self.templates.register("sort_bubble_0", lambda: {"sceneId": "sort_bubble_0"})
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_static_scenes_only(self):
+        count, _ = write_snapshot(self.templates, self.path)
+        self.assertEqual(count, 2)
+        snap = SceneSnapshot.open(self.path)
+        try:
+            self.assertEqual(len(snap), 2)
+            for key in ["static", "poly_3"]:
+                self.assertEqual(snap.get(key), encode_json(self.templates[key]))
+                self.assertEqual(snap.get_encoded(key).etag, content_hash(snap.get(key)))
+            self.assertNotIn("sort_bubble_0", snap)
+            self.assertIsNone(snap.get("sort_bubble_0"))
+        finally:
+            snap.close()
+
+    def test_missing_file(self):
+        self.assertIsNone(SceneSnapshot.open(os.path.join(self.tmp.name, "missing.snap")))
+
+    def test_rejects_foreign_file(self):
+        with open(self.path, "wb") as f:
+            f.write(b"\0" * 64)
+        with self.assertRaises(ValueError):
+            SceneSnapshot(self.path)
+
+    def test_stale_snapshot_is_ignored(self):
+        write_snapshot(self.templates, self.path)
+        # serialization and the registry's transforms decide the bytes too
+        for name in ("scene_codec.py", "compression.py", "template_registry.py"):
+            self.assertIn(name, scene_snapshot.SOURCE_FILES)
+        with mock.patch.object(scene_snapshot, "source_digest", return_value=b"\0" * 20):
+            with self.assertLogs("scene_snapshot", "WARNING"):
+                self.assertIsNone(SceneSnapshot.open(self.path))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import gzip
+import json
+import os
+import shutil
+import subprocess
+import unittest
+
+import app
+import scene_stream
+from scene_generators import GENERATORS
+
+MAIN_JS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'public', 'main.js')
+
+
+def ndjson(data):
+    return [json.loads(line) for line in data.splitlines()]
+
+
+class TestSceneStream(unittest.TestCase):
+    def setUp(self):
+        app.SCENE_CACHE.clear()
+        self.client = app.app.test_client()
+
+    def test_parts_are_in_playback_order(self):
+        spec = GENERATORS['full_course']
+        parts = list(spec.parts(*spec.inputs(seed=3)))
+        self.assertEqual(parts[0]['kind'], 'header')
+        self.assertEqual(parts[-1]['kind'], 'end')
+        defined, until = set(), 0
+        for part in parts[1:-1]:
+            if part['kind'] == 'objects':
+                defined.update(obj['id'] for obj in part['objects'])
+                continue
+            starts = [action['start'] for action in part['actions']]
+            self.assertEqual(starts, sorted(starts))
+            self.assertGreaterEqual(min(starts), until)
+            self.assertLess(max(starts), part['until'])
+            self.assertTrue({action['objectId'] for action in part['actions']} <= defined)
+            until = part['until']
+
+    def test_stream_assembles_to_the_scene(self):
+        spec = GENERATORS['full_course']
+        args, kwargs = spec.inputs(seed=3)
+        self.assertEqual(scene_stream.assemble(spec.parts(args, kwargs)), spec.generate(args, kwargs))
+
+    def test_endpoint_streams_then_caches_json(self):
+        query = {'description': 'full course', 'seed': 3, 'format': 'ndjson'}
+        streamed = self.client.get('/generate/scenes', query_string=query)
+        self.assertEqual(streamed.mimetype, scene_stream.NDJSON_MIMETYPE)
+        self.assertEqual(streamed.headers['X-Cache'], 'MISS')
+        scene = scene_stream.assemble(ndjson(streamed.data))
+
+        again = self.client.get('/generate/scenes', query_string=query)
+        self.assertEqual(again.headers['X-Cache'], 'HIT')
+        self.assertEqual(again.get_json(), scene)
+        plain = self.client.get('/generate/scenes', query_string={'description': 'full course', 'seed': 3})
+        self.assertEqual(plain.headers['X-Cache'], 'HIT')
+        self.assertEqual(plain.get_json(), scene)
+
+    def test_gzip_stream(self):
+        query = {'description': 'full course', 'seed': 4, 'format': 'ndjson'}
+        streamed = self.client.get('/generate/scenes', query_string=query, headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(streamed.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(scene_stream.assemble(ndjson(gzip.decompress(streamed.data))),
+                         GENERATORS['full_course'].build(seed=4))
+
+    def test_nothing_to_stream_is_json(self):
+        for description in ('bubble sort', 'solar system'):
+            response = self.client.get('/generate/scenes', query_string={'description': description, 'format': 'ndjson'})
+            self.assertEqual(response.mimetype, 'application/json')
+            self.assertIn('actions', response.get_json())
+
+    @unittest.skipUnless(shutil.which('node'), 'node is not installed')
+    def test_main_js_reader_splits_lines(self):
+        with open(MAIN_JS) as f:
+            source = f.read()
+        start = source.index('// --- STREAMED SCENES ---')
+        reader = source[start:source.index('async function loadSceneStream', start)]
+        spec = GENERATORS['full_course']
+        payload = b''.join(json.dumps(part).encode() + b'\n' for part in spec.parts(*spec.inputs(seed=3)))
+        # Fed in 777-byte chunks, so lines are split across reads
+        script = reader + ('\nconst chunks = []; process.stdin.on("data", c => chunks.push(c));'
+                           'process.stdin.on("end", () => { const data = Buffer.concat(chunks), parts = [];'
+                           ' const body = new ReadableStream({ start(c) {'
+                           '  for (let i = 0; i < data.length; i += 777) c.enqueue(data.subarray(i, i + 777)); c.close(); } });'
+                           ' readNdjson(new Response(body), p => parts.push(p.kind))'
+                           '  .then(() => process.stdout.write(JSON.stringify(parts))); });')
+        out = subprocess.run(['node', '-e', script], input=payload, capture_output=True, check=True)
+        self.assertEqual(json.loads(out.stdout), [part['kind'] for part in ndjson(payload)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import random
+import unittest
+
+import app
+from scene_binary import decode_binary
+from scene_generators import GENERATORS
+from template_generator import (SORT_ACTION_BUDGET, SORT_KEYFRAME_VALUES, SORT_MAX_VALUES, _bubble_passes,
+                                _count_inversions, _selection_passes, _sort_size, _sort_values)
+
+
+def bubble_states(data):
+    arr, states, swaps = list(data), [list(data)], 0
+    for i in range(len(arr)):
+        for j in range(len(arr) - i - 1):
+            if arr[j] > arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                swaps += 1
+        states.append(list(arr))
+    return states, swaps
+
+
+def selection_states(data):
+    arr, states, swaps = list(data), [list(data)], 0
+    for i in range(len(arr)):
+        m = i
+        for j in range(i + 1, len(arr)):
+            if arr[j] < arr[m]:
+                m = j
+        if m != i:
+            arr[i], arr[m] = arr[m], arr[i]
+            swaps += 1
+        states.append(list(arr))
+    return states, swaps
+
+
+class TestSortPasses(unittest.TestCase):
+    def test_pass_states_match_the_sorts(self):
+        rng = random.Random(5)
+        for _ in range(200):
+            data = [rng.randint(0, 9) for _ in range(rng.randint(2, 25))]
+            passes = sorted(rng.sample(range(len(data)), rng.randint(1, len(data))))
+            with self.subTest(data=data, passes=passes):
+                states, swaps = bubble_states(data)
+                self.assertEqual(list(_bubble_passes(data, passes)), [states[p] for p in passes])
+                self.assertEqual(_count_inversions(data)[1], swaps)
+                states, swaps = selection_states(data)
+                self.assertEqual(_selection_passes(data, passes), ([states[p] for p in passes], swaps))
+
+
+class TestSortBudget(unittest.TestCase):
+    def test_prompt_params(self):
+        self.assertEqual(_sort_values("bubble sort [5, 3, 8, 1]"), (5, 3, 8, 1))
+        self.assertIsNone(_sort_values("bubble sort [5]"))
+        self.assertEqual(len(_sort_values("sort [" + ", ".join(["7"] * 20000) + "]")), SORT_MAX_VALUES)
+        self.assertEqual(_sort_size("bubble sort 500 elements"), 500)
+        self.assertEqual(_sort_size("selection sort n=99999"), SORT_MAX_VALUES)
+        self.assertIsNone(_sort_size("bubble sort"))
+        _, kwargs = GENERATORS["bubble"].inputs("bubble sort [5, 3, 8, 1]", seed=1)
+        self.assertEqual(kwargs["values"], (5, 3, 8, 1))
+        self.assertEqual(_sort_values("bubble sort [5,3 ,8, 1]"), (5, 3, 8, 1))
+        for description in ("bubble sort [-5, 3]", "bubble sort [1.5, 2]", "bubble sort [5, 3-]"):
+            with self.subTest(description=description):
+                self.assertIsNone(_sort_values(description))
+
+    def test_small_scenes_stay_step_by_step(self):
+        for key in ("bubble", "selection"):
+            with self.subTest(key=key):
+                scene = GENERATORS[key].build(f"{key} sort [4, 1, 3, 2]", seed=1)
+                self.assertIn("bar_3", {obj["id"] for obj in scene["objects"]})
+                sort = bubble_states if key == "bubble" else selection_states
+                # "actions" counts what is served; steps are not folded together
+                self.assertEqual(scene["metadata"], {
+                    "actionBudget": SORT_ACTION_BUDGET, "steps": 6 + sort([4, 1, 3, 2])[1],
+                    "actions": len(scene["actions"]), "compactionRatio": 1.0})
+        scene = GENERATORS["bubble"].build("bubble sort 7 elements", seed=1)
+        self.assertEqual(scene["metadata"]["actions"], len(scene["actions"]))
+        self.assertEqual(scene["metadata"]["compactionRatio"], 1.0)
+
+    def test_large_scenes_are_keyframed(self):
+        for key in ("bubble", "selection"):
+            for size in (40, 1000, SORT_MAX_VALUES):
+                with self.subTest(key=key, size=size):
+                    scene = GENERATORS[key].build(f"{key} sort {size} elements", seed=3)
+                    bars = next(obj for obj in scene["objects"] if obj["type"] == "bars")
+                    keyframes = [a for a in scene["actions"] if a["type"] == "values"]
+                    self.assertLessEqual(len(scene["actions"]), SORT_ACTION_BUDGET)
+                    self.assertEqual(len(bars["props"]["values"]), size)
+                    self.assertEqual(keyframes[-1]["params"], {"values": sorted(bars["props"]["values"]),
+                                                               "sorted": [0, size]})
+                    self.assertLessEqual(sum(len(a["params"]["values"]) for a in keyframes), SORT_KEYFRAME_VALUES)
+                    self.assertEqual(scene["metadata"]["keyframes"], len(keyframes))
+                    self.assertEqual(scene["metadata"]["actions"], len(scene["actions"]))
+                    self.assertGreater(scene["metadata"]["compactionRatio"], 1)
+
+    def test_keyframed_scene_is_served(self):
+        client = app.app.test_client()
+        values = list(range(30, 0, -1))
+        response = client.post('/generate/scenes', json={'description': f'selection sort {values}',
+                                                         'options': {'seed': 1, 'format': 'binary'}})
+        self.assertEqual(response.status_code, 200)
+        scene = decode_binary(response.data)
+        self.assertEqual(scene["objects"][-1]["props"]["values"], values)
+        self.assertEqual(scene["actions"][-1]["params"], {"values": sorted(values), "sorted": [0, 30]})
+        self.assertEqual(scene["metadata"]["steps"], 30 * 29 // 2 + 15)
+
+
+if __name__ == "__main__":
+    unittest.main()
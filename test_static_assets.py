@@ -0,0 +1,72 @@
+import os
+import re
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import app
+import static_assets
+from static_assets import AssetManifest, build_assets, rewrite_references
+
+
+class TestStaticAssets(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.public = os.path.join(self.tmp, 'public')
+        self.build = os.path.join(self.tmp, 'assets')
+        shutil.copytree(app.PUBLIC_DIR, self.public)
+        self.manifest = build_assets(self.public, self.build)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_rewrite_references(self):
+        assets = {'main.js': 'main.0123456789.js', 'style.css': 'style.abcdefabcd.css'}
+        html = ('<link href="/style.css?v=2"><script src=\'main.js\'></script>'
+                '<a href="/app">x</a><script src="https://cdn.example/main.js"></script>')
+        self.assertEqual(rewrite_references(html, assets),
+                         '<link href="/style.abcdefabcd.css"><script src=\'/main.0123456789.js\'></script>'
+                         '<a href="/app">x</a><script src="https://cdn.example/main.js"></script>')
+
+    def test_build(self):
+        self.assertIn('app.html', self.manifest['pages'])
+        self.assertRegex(self.manifest['assets']['main.js'], r'^main\.[0-9a-f]{10}\.js$')
+        with open(os.path.join(self.build, 'app.html')) as f:
+            page = f.read()
+        for name in ('main.js', 'style.css', 'browse-library.js', 'logo.png'):
+            self.assertIn(f'"/{self.manifest["assets"][name]}"', page)
+        self.assertNotRegex(page, r'src="/?main\.js"')
+        with open(os.path.join(self.public, 'main.js'), 'rb') as src, \
+                open(os.path.join(self.build, self.manifest['assets']['main.js']), 'rb') as out:
+            self.assertEqual(src.read(), out.read())
+
+    def test_stale_build_is_ignored(self):
+        self.assertIsNotNone(AssetManifest.open(self.public, self.build))
+        with open(os.path.join(self.public, 'style.css'), 'a') as f:
+            f.write('\n/* edited */\n')
+        with self.assertLogs('static_assets', 'WARNING'):
+            self.assertIsNone(AssetManifest.open(self.public, self.build))
+        self.assertIsNone(AssetManifest.open(self.public, os.path.join(self.tmp, 'missing')))
+
+    def test_serving(self):
+        client = app.app.test_client()
+        with mock.patch.object(app, 'ASSETS', AssetManifest.open(self.public, self.build)):
+            page = client.get('/app')
+            self.assertEqual(page.headers['Cache-Control'], static_assets.REVALIDATE)
+            self.assertEqual(client.get('/app', headers={'If-None-Match': page.headers['ETag']}).status_code, 304)
+
+            scripts = re.findall(r'src="/([^"]+\.js)"', page.get_data(as_text=True))
+            self.assertIn(self.manifest['assets']['main.js'], scripts)
+            for name in scripts:
+                asset = client.get('/' + name)
+                self.assertEqual(asset.status_code, 200)
+                self.assertEqual(asset.headers['Cache-Control'], static_assets.IMMUTABLE)
+
+            # Plain names keep working for anything that still links them
+            self.assertEqual(client.get('/main.js').headers['Cache-Control'], static_assets.REVALIDATE)
+        with mock.patch.object(app, 'ASSETS', None):
+            self.assertIn(b'src="main.js"', client.get('/app').data)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+from template_registry import TemplateRegistry
+import template_generator
+
+
+class TestTemplateRegistry(unittest.TestCase):
+    def test_keys_known_without_building(self):
+        calls = []
+        reg = TemplateRegistry()
+        reg.register("a", lambda: calls.append("a") or {"sceneId": "a"})
+        reg.register("b", lambda: calls.append("b") or {"sceneId": "b"})
+        self.assertEqual(list(reg), ["a", "b"])
+        self.assertIn("a", reg)
+        self.assertEqual(calls, [])
+
+    def test_builds_once_and_memoizes(self):
+        calls = []
+        reg = TemplateRegistry()
+        reg.register("a", lambda n: calls.append(n) or {"n": n}, 3)
+        first = reg["a"]
+        self.assertIs(reg["a"], first)
+        self.assertEqual(calls, [3])
+        self.assertTrue(reg.is_built("a"))
+
+    def test_update_from_registry_stays_lazy(self):
+        calls = []
+        lazy = TemplateRegistry()
+        lazy.register("x", lambda: calls.append("x") or {"sceneId": "x"})
+        merged = TemplateRegistry({"static": {"sceneId": "static"}})
+        merged.update(lazy)
+        self.assertEqual(list(merged), ["static", "x"])
+        self.assertEqual(calls, [])
+        self.assertEqual(merged["x"]["sceneId"], "x")
+
+    def test_transform_applies_to_built_and_stored_scenes(self):
+        lazy = TemplateRegistry()
+        lazy.register("x", lambda: {"sceneId": "x"})
+        reg = TemplateRegistry({"static": {"sceneId": "static"}}, transform=lambda scene: dict(scene, seen=True))
+        reg.update(lazy)
+        self.assertTrue(reg["static"]["seen"])
+        self.assertTrue(reg["x"]["seen"])
+        self.assertIs(reg["x"], reg["x"])
+
+    def test_generated_keys_match_scene_ids(self):
+        reg = template_generator.GENERATED_TEMPLATES
+        for key in ["poly_3", "poly_53", "formula_area_of_circle", "vector_gen_0", "graph_sin(x)",
+                    "deriv_x2", "sort_bubble_49", "atom_50", "algo_quicksort_0", "graph_dijkstra_19",
+                    "fractal_koch_0", "ai_neural_net_0"]:
+            with self.subTest(key=key):
+                self.assertEqual(reg[key]["sceneId"], key)
+
+if __name__ == '__main__':
+    unittest.main()
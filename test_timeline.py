@@ -0,0 +1,66 @@
+import json
+import unittest
+
+import template_generator
+from scene_codec import encode_json
+from scene_generators import GENERATORS
+from timeline import Timeline
+
+
+class TestTimeline(unittest.TestCase):
+    def test_running_clock(self):
+        timeline = Timeline(start=1.0)
+        timeline.color("a", "bar_0", "#fff", 0.5, narrative="Compare", code_line=3)
+        self.assertEqual(timeline.advance(0.5), 1.5)
+        timeline.fade("b", "bar_1", 1, 1.0)
+        timeline.wait("c", "title", 2.0, start=0.25)
+        timeline.advance(1.0)
+        self.assertEqual(timeline.actions(), [
+            {"id": "a", "objectId": "bar_0", "type": "color", "start": 1.0, "end": 1.5,
+             "params": {"color": "#fff"}, "narrative": "Compare", "codeLine": 3},
+            {"id": "b", "objectId": "bar_1", "type": "fade", "start": 1.5, "end": 2.5, "params": {"opacity": 1}},
+            {"id": "c", "objectId": "title", "type": "wait", "start": 0.25, "end": 2.25},
+        ])
+        self.assertEqual(timeline.time, 2.5)
+        self.assertEqual(len(timeline), 3)
+
+    def test_translate_axes(self):
+        timeline = Timeline()
+        timeline.translate("x", "o", 1, x=10)
+        timeline.translate("y", "o", 1, y=20)
+        timeline.translate("xy", "o", 1, x=0, y=0)
+        self.assertEqual([a["params"] for a in timeline.actions()],
+                         [{"to": {"x": 10}}, {"to": {"y": 20}}, {"to": {"x": 0, "y": 0}}])
+
+    def test_add_keeps_params(self):
+        timeline = Timeline()
+        params = {"text": "S\n0", "color": "#a6e3a1"}
+        timeline.add("init", "node_0", "color", 0.5, params)
+        timeline.add("move", "num_0", "move", 0.5)
+        self.assertIs(timeline.actions()[0]["params"], params)
+        self.assertNotIn("params", timeline.actions()[1])
+
+    def test_shared_params(self):
+        timeline = Timeline()
+        timeline.color("a", "o", "#fff", 1)
+        timeline.color("b", "o", "#fff", 1)
+        timeline.fade("c", "o", 1, 1)
+        timeline.fade("d", "o", 1.0, 1)
+        timeline.fade("e", "o", True, 1)
+        a, b, c, d, e = timeline.actions()
+        self.assertIs(a["params"], b["params"])
+        # equal values of different types keep their own params
+        self.assertEqual(encode_json(c["params"]) + encode_json(d["params"]) + encode_json(e["params"]),
+                         b'{"opacity":1}{"opacity":1.0}{"opacity":true}')
+
+    def test_generators_build_plain_json(self):
+        for key in ["bubble", "selection", "binary", "merge_sort", "floyd_warshall", "bfs", "dfs"]:
+            with self.subTest(key=key):
+                scene = GENERATORS[key].build(level="advanced", seed=7)
+                actions = json.loads(encode_json(scene))["actions"]
+                self.assertTrue(all(a["end"] >= a["start"] for a in actions))
+                self.assertLessEqual(max(a["end"] for a in actions), scene["duration"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+Timeline builder for scene actions.
+
+Generators record actions with one call each instead of writing the action
+dict out by hand:
+
+    timeline = Timeline(start=3.0)
+    timeline.color("comp_0", "bar_0", "#e74c3c", 0.6, narrative="Compare 5 and 3", code_line=5)
+    timeline.advance(0.6)
+    timeline.translate("swap_0", "bar_0", 1.2, x=120)
+    ...
+    scene["actions"] = timeline.actions()
+
+Each action starts at the running clock (`time`) unless given `start`, and
+ends `duration` later. Single-value params ({"color": ...}, {"opacity": ...})
+are shared between the actions of a timeline that use the same value, so
+treat the actions as read-only.
+"""
+
+
+class Timeline:
+    __slots__ = ("time", "_actions", "_params")
+
+    def __init__(self, start=0.0):
+        self.time = start
+        self._actions = []
+        self._params = {}  # shared single-value params dicts
+
+    def advance(self, seconds):
+        """Moves the clock on; returns the new time."""
+        self.time += seconds
+        return self.time
+
+    # The recording methods are written out in full rather than sharing
+    # helpers: they run once per action, and the calls would cost more than
+    # the dict literals they save.
+
+    def add(self, id, object_id, type, duration, params=None, start=None, narrative=None, code_line=None):
+        """Any action type; params is the action's params dict (or None for none)."""
+        if start is None:
+            start = self.time
+        action = {"id": id, "objectId": object_id, "type": type, "start": start, "end": start + duration}
+        if params is not None:
+            action["params"] = params
+        if narrative is not None:
+            action["narrative"] = narrative
+        if code_line is not None:
+            action["codeLine"] = code_line
+        self._actions.append(action)
+
+    def fade(self, id, object_id, opacity, duration, start=None, narrative=None, code_line=None):
+        if start is None:
+            start = self.time
+        # keyed by type as well: 1, 1.0 and True are equal but serialize differently
+        key = ("opacity", opacity, opacity.__class__)
+        params = self._params.get(key)
+        if params is None:
+            params = self._params[key] = {"opacity": opacity}
+        action = {"id": id, "objectId": object_id, "type": "fade", "start": start, "end": start + duration, "params": params}
+        if narrative is not None:
+            action["narrative"] = narrative
+        if code_line is not None:
+            action["codeLine"] = code_line
+        self._actions.append(action)
+
+    def color(self, id, object_id, color, duration, start=None, narrative=None, code_line=None):
+        if start is None:
+            start = self.time
+        params = self._params.get(color)
+        if params is None:
+            params = self._params[color] = {"color": color}
+        action = {"id": id, "objectId": object_id, "type": "color", "start": start, "end": start + duration, "params": params}
+        if narrative is not None:
+            action["narrative"] = narrative
+        if code_line is not None:
+            action["codeLine"] = code_line
+        self._actions.append(action)
+
+    def translate(self, id, object_id, duration, start=None, x=None, y=None, narrative=None, code_line=None):
+        """Moves to x and/or y (an axis left as None is not animated)."""
+        if start is None:
+            start = self.time
+        if y is None:
+            to = {} if x is None else {"x": x}
+        elif x is None:
+            to = {"y": y}
+        else:
+            to = {"x": x, "y": y}
+        action = {"id": id, "objectId": object_id, "type": "translate", "start": start, "end": start + duration,
+                  "params": {"to": to}}
+        if narrative is not None:
+            action["narrative"] = narrative
+        if code_line is not None:
+            action["codeLine"] = code_line
+        self._actions.append(action)
+
+    def wait(self, id, object_id, duration, start=None, narrative=None, code_line=None):
+        """An action that changes nothing (carries a narrative or code line)."""
+        if start is None:
+            start = self.time
+        action = {"id": id, "objectId": object_id, "type": "wait", "start": start, "end": start + duration}
+        if narrative is not None:
+            action["narrative"] = narrative
+        if code_line is not None:
+            action["codeLine"] = code_line
+        self._actions.append(action)
+
+    def actions(self):
+        """The recorded actions, in recording order."""
+        return self._actions
+
+    def __len__(self):
+        return len(self._actions)
+
+    def __repr__(self):
+        return f"<Timeline {len(self._actions)} actions, t={self.time:g}>"